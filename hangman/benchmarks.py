@@ -0,0 +1,319 @@
+"""Module to define the benchmark suite timing each layer of the game on its own.
+
+Each benchmark times one layer: drawing words, the model properties, a full game loop of the controller with a
+scripted view, and building the board frames with the output sent to a null sink. Benchmarks run offline, and the
+results can be written to a JSON file and compared against a baseline file from a previous run.
+"""
+
+import io
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import timeit
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional
+
+from hangman.constants import WORDS_LIST
+from hangman.controllers import HangmanGameController
+from hangman.models import HangmanGameData
+from hangman.utils import LETTER_MASKS, get_random_word
+from hangman.views import HangmanGameView
+
+DEFAULT_REPEAT = 5
+
+# Allowed slowdown of the time per call against the baseline before a benchmark is reported as a regression.
+DEFAULT_TOLERANCE = 0.25
+
+BENCHMARK_SEED = 2024
+
+BENCHMARK_SECRET_WORD = "hippopotamus"
+
+# Guess letters of the scripted game loop, with a few misses before the secret word is revealed.
+BENCHMARK_GUESSES = "ehzitxopqamus"
+
+
+class NullOutput(io.TextIOBase):
+    """Text stream discarding everything written to it, so rendering is timed without terminal I/O."""
+
+    def write(self, text: str) -> int:
+        """Discard the text.
+
+        Args:
+            text: The text to be written.
+
+        Returns:
+            int: The number of characters written.
+        """
+        return len(text)
+
+
+class ScriptedGameView(HangmanGameView):
+    """Game view entering predefined guess letters instead of prompting the player."""
+
+    def __init__(self, guesses: str, output: Optional[io.TextIOBase] = None):
+        """Create the scripted view.
+
+        Attributes:
+            guesses: The guess letters entered in order, the first letter not guessed yet is entered on each turn.
+            output: Stream to write the board to, a null sink if not given.
+        """
+        super().__init__(output=output if output is not None else NullOutput())
+        self.guesses = guesses
+
+    def get_player_guess(self, hangman_game_data: HangmanGameData) -> str:
+        """Enter the next scripted letter which has not been guessed yet."""
+        guessed_mask = hangman_game_data.guessed_mask
+        hangman_game_data.player_guess = next(
+            letter for letter in self.guesses if not guessed_mask & LETTER_MASKS[letter]
+        )
+        return hangman_game_data.player_guess
+
+    def play_again(self) -> bool:
+        """Stop after one game."""
+        return False
+
+
+class Benchmark(NamedTuple):
+    """Represent a benchmark of the suite.
+
+    Attributes:
+        setup: Callable preparing the state of the benchmark and returning the callable to be timed.
+        number: Number of calls per timing run.
+    """
+
+    setup: Callable[[], Callable[[], object]]
+    number: int
+
+
+def setup_get_random_word() -> Callable[[], object]:
+    """Prepare drawing random words from the corpus, loading the corpus before timing."""
+    rng = random.Random(BENCHMARK_SEED)
+    # WORDS_LIST is loaded on first access, which is not to be timed.
+    len(WORDS_LIST)
+    return lambda: get_random_word(rng)
+
+
+def setup_already_guessed_letters() -> Callable[[], object]:
+    """Prepare getting the already guessed letters of a game in progress."""
+    hangman_game_data = HangmanGameData(
+        secret_word=BENCHMARK_SECRET_WORD, missed_letters=list("zxq"), correct_letters=list("hiop")
+    )
+    return lambda: hangman_game_data.already_guessed_letters
+
+
+def setup_secret_word_with_correct_letters() -> Callable[[], object]:
+    """Prepare getting the revealed secret word of a game in progress."""
+    hangman_game_data = HangmanGameData(secret_word=BENCHMARK_SECRET_WORD, correct_letters=list("hiop"))
+    return lambda: hangman_game_data.secret_word_with_correct_letters
+
+
+def setup_game_loop() -> Callable[[], object]:
+    """Prepare playing a full game with the controller and a scripted view."""
+    hangman_game_view = ScriptedGameView(BENCHMARK_GUESSES)
+
+    def play_game() -> None:
+        controller = HangmanGameController(HangmanGameData(secret_word=BENCHMARK_SECRET_WORD), hangman_game_view)
+        controller.start_game()
+
+    return play_game
+
+
+def setup_render_frame() -> Callable[[], object]:
+    """Prepare building and writing the board frame of a game in progress to a null sink."""
+    hangman_game_view = HangmanGameView(output=NullOutput())
+    hangman_game_data = HangmanGameData(
+        secret_word=BENCHMARK_SECRET_WORD, missed_letters=list("zxq"), correct_letters=list("hiop")
+    )
+    return lambda: hangman_game_view.show_hangman_board(hangman_game_data)
+
+
+# Registered benchmarks by name, in the order they are run.
+BENCHMARKS: Dict[str, Benchmark] = {
+    "get_random_word": Benchmark(setup_get_random_word, number=20000),
+    "already_guessed_letters": Benchmark(setup_already_guessed_letters, number=100000),
+    "secret_word_with_correct_letters": Benchmark(setup_secret_word_with_correct_letters, number=100000),
+    "game_loop": Benchmark(setup_game_loop, number=500),
+    "render_frame": Benchmark(setup_render_frame, number=5000),
+}
+
+# The startup benchmark runs a fresh interpreter per timing run, so it is not timed with timeit like the others.
+STARTUP_BENCHMARK = "startup"
+
+BENCHMARK_NAMES = list(BENCHMARKS) + [STARTUP_BENCHMARK]
+
+# Script run by the startup benchmark, printing the seconds spent on importing the command line interface and then on
+# showing the first board of the interactive game.
+STARTUP_SCRIPT = """
+import io, time
+started = time.perf_counter()
+from hangman.cli import cli
+imported = time.perf_counter()
+from hangman.controllers import HangmanGameController
+from hangman.views import HangmanGameView
+controller = HangmanGameController(hangman_game_view=HangmanGameView(output=io.StringIO()))
+controller.hangman_game_view.show_hangman_board(controller.hangman_game_data)
+print(imported - started, time.perf_counter() - imported)
+"""
+
+
+@dataclass
+class BenchmarkResult:
+    """Represent the timings of a benchmark.
+
+    Attributes:
+        name: (str) Name of the benchmark.
+        number: (int) Number of calls per timing run.
+        repeat: (int) Number of timing runs.
+        best_seconds: (float) Time of the fastest run.
+        mean_seconds: (float) Average time of the runs.
+    """
+
+    name: str
+    number: int
+    repeat: int
+    best_seconds: float
+    mean_seconds: float
+
+    @property
+    def seconds_per_call(self) -> float:
+        """Get the time per call of the fastest run, which is the figure compared against the baseline."""
+        return self.best_seconds / self.number
+
+    def to_dict(self) -> dict:
+        """Get the timings including the time per call.
+
+        Returns:
+            dict: The timings, ready to be serialized as JSON.
+        """
+        return dict(asdict(self), seconds_per_call=self.seconds_per_call)
+
+
+def run_benchmark(name: str, repeat: int = DEFAULT_REPEAT, number: Optional[int] = None) -> BenchmarkResult:
+    """Time a registered benchmark.
+
+    Args:
+        name: Name of the benchmark in BENCHMARKS.
+        repeat: Number of timing runs.
+        number: Number of calls per timing run, the benchmark's own number if not given.
+
+    Returns:
+        BenchmarkResult: The timings of the benchmark.
+    """
+    benchmark = BENCHMARKS[name]
+    number = number or benchmark.number
+    timings = timeit.Timer(benchmark.setup()).repeat(repeat=repeat, number=number)
+    return BenchmarkResult(
+        name=name, number=number, repeat=repeat, best_seconds=min(timings), mean_seconds=sum(timings) / repeat
+    )
+
+
+def run_benchmarks(
+    names: Optional[Iterable[str]] = None, repeat: int = DEFAULT_REPEAT, number: Optional[int] = None
+) -> List[BenchmarkResult]:
+    """Time registered benchmarks one after the other.
+
+    Args:
+        names: Names of the benchmarks in BENCHMARKS, all benchmarks if not given.
+        repeat: Number of timing runs of each benchmark.
+        number: Number of calls per timing run, each benchmark's own number if not given.
+
+    Returns:
+        list[BenchmarkResult]: The timings of the benchmarks.
+    """
+    results = []
+    for name in names or BENCHMARK_NAMES:
+        if name == STARTUP_BENCHMARK:
+            results.extend(run_startup_benchmark(repeat))
+        else:
+            results.append(run_benchmark(name, repeat, number))
+    return results
+
+
+def run_startup_benchmark(repeat: int = DEFAULT_REPEAT) -> List[BenchmarkResult]:
+    """Time the cold start of the interactive game, running a fresh interpreter per timing run.
+
+    Args:
+        repeat: Number of timing runs.
+
+    Returns:
+        list[BenchmarkResult]: The timings of the whole process, of importing the command line interface, and of
+            showing the first board after the import.
+    """
+    package_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [package_root, os.environ.get("PYTHONPATH")])))
+    timings: Dict[str, List[float]] = {"startup_process": [], "startup_import": [], "startup_first_frame": []}
+    for _ in range(repeat):
+        started = time.perf_counter()
+        completed = subprocess.run(
+            [sys.executable, "-c", STARTUP_SCRIPT], env=env, check=True, capture_output=True, text=True
+        )
+        timings["startup_process"].append(time.perf_counter() - started)
+        import_seconds, first_frame_seconds = map(float, completed.stdout.split())
+        timings["startup_import"].append(import_seconds)
+        timings["startup_first_frame"].append(first_frame_seconds)
+
+    return [
+        BenchmarkResult(name=name, number=1, repeat=repeat, best_seconds=min(runs), mean_seconds=sum(runs) / repeat)
+        for name, runs in timings.items()
+    ]
+
+
+def save_results(path: str, results: List[BenchmarkResult]) -> None:
+    """Write benchmark results to a JSON file.
+
+    Args:
+        path: Path of the JSON file.
+        results: The timings of the benchmarks.
+    """
+    document = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "benchmarks": {result.name: result.to_dict() for result in results},
+    }
+    with open(path, mode="w", encoding="utf-8") as results_file:
+        json.dump(document, results_file, indent=2)
+
+
+def load_results(path: str) -> Dict[str, float]:
+    """Read the time per call of each benchmark from a JSON file written by save_results().
+
+    Args:
+        path: Path of the JSON file.
+
+    Returns:
+        dict: The time per call in seconds by benchmark name.
+    """
+    with open(path, mode="r", encoding="utf-8") as results_file:
+        document = json.load(results_file)
+    return {name: timings["seconds_per_call"] for name, timings in document["benchmarks"].items()}
+
+
+def find_regressions(
+    results: List[BenchmarkResult], baseline: Dict[str, float], tolerance: float = DEFAULT_TOLERANCE
+) -> List[str]:
+    """Compare benchmark results against a baseline.
+
+    Benchmarks missing from the baseline are not compared.
+
+    Args:
+        results: The timings of the benchmarks.
+        baseline: The time per call in seconds by benchmark name.
+        tolerance: Allowed slowdown as a ratio of the baseline, e.g. 0.25 allows 25% slower calls.
+
+    Returns:
+        list[str]: A message for each benchmark slower than allowed, empty if there is no regression.
+    """
+    regressions = []
+    for result in results:
+        baseline_seconds = baseline.get(result.name)
+        if baseline_seconds and result.seconds_per_call > baseline_seconds * (1 + tolerance):
+            slowdown = result.seconds_per_call / baseline_seconds - 1
+            regressions.append(
+                f"{result.name}: {result.seconds_per_call * 1e6:.3f} us per call, "
+                f"{slowdown:.0%} slower than the baseline {baseline_seconds * 1e6:.3f} us."
+            )
+    return regressions
@@ -0,0 +1,156 @@
+"""Module to define the command line interface of the package.
+
+Running `python -m hangman` without a command starts the interactive game. The subcommands live in the
+hangman.commands package and are only imported when invoked, so starting the game does not pay for importing the
+server, the simulation workers or the benchmark suite.
+"""
+
+import functools
+import getpass
+import importlib
+import sys
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+import click
+from click.exceptions import Abort
+
+from hangman.constants import DIFFICULTY_TIERS
+from hangman.controllers import HangmanGameController
+from hangman.instrumentation import FILE_SINKS, MetricsSink, create_file_sink
+from hangman.models import HangmanGameData
+from hangman.sampler import WordSampler
+
+if TYPE_CHECKING:
+    from hangman.leaderboard import LeaderboardWriter
+
+ERR_MSG_GAME_TERMINATED = "Game terminated by player."
+
+# Subcommands by name, with the module and the attribute defining each of them.
+LAZY_SUBCOMMANDS: Dict[str, str] = {
+    "benchmark": "hangman.commands.benchmark:benchmark_command",
+    "build-decision-tree": "hangman.commands.decision_tree:build_decision_tree_command",
+    "compile-corpus": "hangman.commands.compile_corpus:compile_corpus_command",
+    "leaderboard": "hangman.commands.leaderboard:leaderboard_command",
+    "play-script": "hangman.commands.play_script:play_script_command",
+    "serve": "hangman.commands.serve:serve_command",
+    "simulate": "hangman.commands.simulate:simulate",
+    "tournament": "hangman.commands.tournament:tournament_command",
+    "word-stats": "hangman.commands.word_stats:word_stats_command",
+}
+
+
+class LazyGroup(click.Group):
+    """Command group importing the module of a subcommand only when the subcommand is used."""
+
+    def __init__(self, *args, lazy_subcommands: Optional[Dict[str, str]] = None, **kwargs):
+        """Create the command group.
+
+        Attributes:
+            lazy_subcommands: Subcommands by name, with the import path of each in the 'module:attribute' form.
+        """
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        """Get the names of the subcommands, without importing them."""
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        """Get a subcommand, importing its module on first use."""
+        if cmd_name in self.lazy_subcommands:
+            module_name, attribute = self.lazy_subcommands[cmd_name].split(":")
+            return getattr(importlib.import_module(module_name), attribute)
+        return super().get_command(ctx, cmd_name)
+
+
+@click.group(cls=LazyGroup, lazy_subcommands=LAZY_SUBCOMMANDS, invoke_without_command=True)
+@click.option("--metrics-file", default=None, help="File to write the metrics of the interactive game to.")
+@click.option("--metrics-format", type=click.Choice(list(FILE_SINKS)), default="json", show_default=True)
+@click.option("--seed", type=int, default=None, help="Seed of the secret words of the interactive game.")
+@click.option(
+    "--difficulty", type=click.Choice(DIFFICULTY_TIERS), default=None, help="Draw the secret words of this tier only."
+)
+@click.option("--evil", is_flag=True, help="Settle the secret word as late as possible to make every guess miss.")
+@click.option("--leaderboard-db", default=None, help="Leaderboard database to record the finished games in.")
+@click.option("--player", default=None, help="Player name on the leaderboard [default: login name].")
+@click.pass_context
+def cli(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    ctx: click.Context,
+    metrics_file: str,
+    metrics_format: str,
+    seed: Optional[int],
+    difficulty: Optional[str],
+    evil: bool,
+    leaderboard_db: Optional[str],
+    player: Optional[str],
+) -> None:
+    """Hangman game. Start the interactive game when no command is given."""
+    if ctx.invoked_subcommand is None:
+        leaderboard = None
+        if leaderboard_db:
+            # SQLite is only imported when the games are recorded.
+            from hangman.leaderboard import LeaderboardWriter  # pylint: disable=import-outside-toplevel
+
+            leaderboard = LeaderboardWriter(leaderboard_db)
+        play(create_file_sink(metrics_format, metrics_file), seed, evil, leaderboard, player, difficulty)
+
+
+def get_login_name() -> str:
+    """Get the login name of the player, only looked up when the games are recorded.
+
+    Returns:
+        str: The login name.
+
+    Raises:
+        UsageError: If the login name cannot be found, e.g. in a container without a user entry.
+    """
+    try:
+        return getpass.getuser()
+    except (KeyError, OSError) as err:
+        raise click.UsageError("Cannot find the login name, give the player name with --player.") from err
+
+
+def play(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    metrics_sink: Optional[MetricsSink] = None,
+    seed: Optional[int] = None,
+    evil: bool = False,
+    leaderboard: Optional["LeaderboardWriter"] = None,
+    player: Optional[str] = None,
+    difficulty: Optional[str] = None,
+) -> None:
+    """Start the interactive game, exit with an error message if the player terminates it.
+
+    Args:
+        metrics_sink: Sink receiving the metrics of the game loop, closed when the game ends.
+        seed: Seed of the sequence of secret words, which never repeats a word before all have been played.
+        evil: Play the adversarial mode, where the drawn secret word only sets the word length.
+        leaderboard: Writer recording the finished games, closed when the game ends. Not recorded if not given.
+        player: Name of the player on the leaderboard, the login name if not given.
+        difficulty: Difficulty tier of the secret words, one of DIFFICULTY_TIERS. Any word is drawn if not given.
+    """
+    try:
+        if leaderboard and player is None:
+            player = get_login_name()
+        word_sampler = WordSampler(seed, difficulty=difficulty) if seed is not None or difficulty else None
+        game_data_class = HangmanGameData
+        if evil:
+            # NumPy is only imported by the adversarial mode.
+            from hangman.evil import EvilHangmanGameData  # pylint: disable=import-outside-toplevel
+
+            game_data_class = EvilHangmanGameData
+        controller = HangmanGameController(
+            metrics_sink=metrics_sink,
+            word_sampler=word_sampler,
+            game_data_class=game_data_class,
+            game_recorder=functools.partial(leaderboard.record_game, player) if leaderboard else None,
+        )
+        controller.start_game()
+    except (KeyboardInterrupt, Abort):
+        click.echo()
+        click.secho(ERR_MSG_GAME_TERMINATED, fg="bright_red")
+        sys.exit(1)
+    finally:
+        if metrics_sink:
+            metrics_sink.close()
+        if leaderboard:
+            leaderboard.close()
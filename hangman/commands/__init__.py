@@ -0,0 +1 @@
+"""Package of the command line subcommands, each module is only imported when its subcommand is invoked."""
@@ -0,0 +1,32 @@
+"""Module to define the benchmark subcommand."""
+
+import sys
+from typing import Tuple
+
+import click
+
+from hangman.benchmarks import BENCHMARK_NAMES, DEFAULT_REPEAT, DEFAULT_TOLERANCE, find_regressions, load_results
+from hangman.benchmarks import run_benchmarks, save_results
+
+
+@click.command("benchmark")
+@click.option("--only", "names", type=click.Choice(BENCHMARK_NAMES), multiple=True, help="Benchmark to run.")
+@click.option("--repeat", type=click.IntRange(min=1), default=DEFAULT_REPEAT, show_default=True, help="Timing runs.")
+@click.option("--output", "output_path", default=None, help="JSON file to write the results to.")
+@click.option("--baseline", "baseline_path", default=None, help="JSON file of a previous run to compare against.")
+@click.option("--tolerance", default=DEFAULT_TOLERANCE, show_default=True, help="Allowed slowdown ratio.")
+def benchmark_command(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    names: Tuple[str, ...], repeat: int, output_path: str, baseline_path: str, tolerance: float
+) -> None:
+    """Time each layer of the game, and fail if it is slower than the baseline."""
+    results = run_benchmarks(names, repeat=repeat)
+    for result in results:
+        click.echo(f"{result.name:<34}: {result.seconds_per_call * 1e6:10.3f} us per call")
+    if output_path:
+        save_results(output_path, results)
+    if baseline_path:
+        regressions = find_regressions(results, load_results(baseline_path), tolerance)
+        for regression in regressions:
+            click.secho(regression, fg="bright_red")
+        if regressions:
+            sys.exit(1)
@@ -0,0 +1,18 @@
+"""Module to define the compile-corpus subcommand."""
+
+import click
+
+from hangman.constants import WORDS_COMPILED_PATH, WORDS_SOURCE_PATH
+from hangman.corpus import compile_corpus
+
+
+@click.command("compile-corpus")
+@click.option("--source", "source_path", default=WORDS_SOURCE_PATH, show_default=True, help="Words source text file.")
+@click.option("--output", "compiled_path", default=WORDS_COMPILED_PATH, show_default=True, help="Compiled corpus file.")
+@click.option("--force", is_flag=True, help="Rebuild even if the compiled corpus is up to date.")
+def compile_corpus_command(source_path: str, compiled_path: str, force: bool) -> None:
+    """Compile the words source text file into the indexed binary corpus format."""
+    if compile_corpus(source_path, compiled_path, force=force):
+        click.echo(f"Compiled corpus written to '{compiled_path}'.")
+    else:
+        click.echo(f"Compiled corpus '{compiled_path}' is up to date.")
@@ -0,0 +1,32 @@
+"""Module to define the build-decision-tree subcommand."""
+
+import click
+
+from hangman.constants import WORDS_LIST
+from hangman.decision_tree import (
+    DECISION_TREE_CACHE_DIR_ENV,
+    build_decision_tree,
+    get_decision_tree_cache_dir,
+    get_tree_path,
+    load_decision_tree,
+)
+
+
+@click.command("build-decision-tree")
+@click.option(
+    "--cache-dir",
+    default=None,
+    help=f"Decision tree cache directory [default: ${DECISION_TREE_CACHE_DIR_ENV}, else in the user cache directory].",
+)
+@click.option("--workers", type=click.IntRange(min=1), default=None, help="Worker processes [default: CPU count].")
+@click.option("--force", is_flag=True, help="Rebuild even if the tree of the corpus is cached.")
+def build_decision_tree_command(cache_dir: str, workers: int, force: bool) -> None:
+    """Precompute the optimal guess of every game state of the corpus, resuming an interrupted build."""
+    if cache_dir is None:
+        cache_dir = get_decision_tree_cache_dir()
+    if force:
+        decision_tree = build_decision_tree(WORDS_LIST, cache_dir, workers=workers)
+    else:
+        decision_tree = load_decision_tree(WORDS_LIST, cache_dir, workers=workers)
+    tree_path = get_tree_path(cache_dir, decision_tree.digest)
+    click.echo(f"Decision tree of {len(decision_tree)} states cached in '{tree_path}'.")
@@ -0,0 +1,50 @@
+"""Module to define the leaderboard subcommand."""
+
+import sqlite3
+import time
+from typing import Optional
+
+import click
+
+from hangman.leaderboard import DEFAULT_LEADERBOARD_PATH, Leaderboard
+
+
+@click.command("leaderboard")
+@click.option("--db", "db_path", default=DEFAULT_LEADERBOARD_PATH, show_default=True, help="Leaderboard database.")
+@click.option("--top", type=click.IntRange(min=1), default=10, show_default=True, help="Number of rows to show.")
+@click.option("--player", default=None, help="Show the last games of this player instead of the leaderboard.")
+def leaderboard_command(db_path: str, top: int, player: Optional[str]) -> None:
+    """Show the players with the best total scores, or the last games of a player."""
+    try:
+        leaderboard = Leaderboard(db_path)
+    except FileNotFoundError as err:
+        raise click.ClickException(str(err)) from err
+    try:
+        show_leaderboard(leaderboard, top, player)
+    except sqlite3.DatabaseError as err:
+        raise click.ClickException(f"Cannot read the leaderboard database '{db_path}': {err}") from err
+    finally:
+        leaderboard.close()
+
+
+def show_leaderboard(leaderboard: Leaderboard, top: int, player: Optional[str]) -> None:
+    """Print the players with the best total scores, or the last games of a player.
+
+    Args:
+        leaderboard: The leaderboard to query.
+        top: Number of rows to show.
+        player: Name of the player to show the last games of, the best players are shown if not given.
+    """
+    if player is None:
+        click.echo(f"{'Rank':>4}  {'Player':<20} {'Score':>7} {'Wins':>6} {'Games':>6} {'Best':>5}")
+        for rank, standing in enumerate(leaderboard.top_players(top), start=1):
+            click.echo(
+                f"{rank:>4}  {standing.player:<20} {standing.total_score:>7} {standing.wins:>6} "
+                f"{standing.games:>6} {standing.best_score:>5}"
+            )
+        return
+    click.echo(f"{'Finished':<19}  {'Secret word':<20} {'Result':<6} {'Misses':>6} {'Score':>5}")
+    for record in leaderboard.player_games(player, top):
+        finished = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(record.finished_at))
+        result, misses = "won" if record.won else "lost", len(record.missed_letters)
+        click.echo(f"{finished:<19}  {record.secret_word:<20} {result:<6} {misses:>6} {record.score:>5}")
@@ -0,0 +1,26 @@
+"""Module to define the play-script subcommand."""
+
+import json
+from typing import TextIO
+
+import click
+
+from hangman.scripted import iter_game_results
+
+
+@click.command("play-script")
+@click.argument("script", type=click.File("r", encoding="utf-8"), default="-")
+@click.option("--seed", type=int, default=None, help="Seed for drawing the secret words which are not given.")
+def play_script_command(script: TextIO, seed: int) -> None:
+    """Play the games of a SCRIPT file (stdin by default) and print the results of each game as a JSON line.
+
+    Each line of the script is one game: either the guess letters as plain text, or a JSON object with 'guesses' and
+    an optional 'secret_word'. An invalid line is printed as an error record and the next lines are still played, the
+    command then fails once all the lines are played.
+    """
+    invalid_lines = 0
+    for game_results in iter_game_results(script, seed):
+        click.echo(json.dumps(game_results))
+        invalid_lines += "error" in game_results
+    if invalid_lines:
+        raise click.ClickException(f"{invalid_lines} invalid script line(s).")
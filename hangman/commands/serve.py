@@ -0,0 +1,45 @@
+"""Module to define the serve subcommand."""
+
+import asyncio
+
+import click
+
+from hangman.constants import DIFFICULTY_TIERS
+from hangman.leaderboard import LeaderboardWriter
+from hangman.persistence import GameJournal
+from hangman.server import DEFAULT_HOST, DEFAULT_PORT, serve
+from hangman.sessions import DEFAULT_MAX_SESSIONS, SessionStore
+
+
+@click.command("serve")
+@click.option("--host", default=DEFAULT_HOST, show_default=True, help="Interface to listen on.")
+@click.option("--port", default=DEFAULT_PORT, show_default=True, help="TCP port to listen on.")
+@click.option("--max-sessions", default=DEFAULT_MAX_SESSIONS, show_default=True, help="Sessions kept in memory.")
+@click.option("--idle-timeout", type=float, default=None, help="Seconds before an idle session is evicted.")
+@click.option("--spill-dir", default=None, help="Directory to keep evicted sessions in, so they can be resumed.")
+@click.option("--journal-dir", default=None, help="Directory to persist games in, so they survive restarts.")
+@click.option("--fsync/--no-fsync", default=True, show_default=True, help="Force journal writes to the disk.")
+@click.option("--leaderboard-db", default=None, help="Leaderboard database to record the finished games in.")
+@click.option(
+    "--difficulty", type=click.Choice(DIFFICULTY_TIERS), default=None, help="Draw the secret words of this tier only."
+)
+def serve_command(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    host: str,
+    port: int,
+    max_sessions: int,
+    idle_timeout: float,
+    spill_dir: str,
+    journal_dir: str,
+    fsync: bool,
+    leaderboard_db: str,
+    difficulty: str,
+) -> None:
+    """Host Hangman sessions for players connecting with telnet or netcat."""
+    session_store = SessionStore(max_sessions=max_sessions, idle_timeout=idle_timeout, spill_dir=spill_dir)
+    journal = GameJournal(journal_dir, fsync=fsync) if journal_dir else None
+    leaderboard = LeaderboardWriter(leaderboard_db) if leaderboard_db else None
+    click.echo(f"Serving Hangman on {host}:{port}, press Ctrl+C to stop.")
+    try:
+        asyncio.run(serve(host, port, session_store, journal, leaderboard, difficulty))
+    except KeyboardInterrupt:
+        click.echo()
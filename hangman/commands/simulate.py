@@ -0,0 +1,44 @@
+"""Module to define the simulate subcommand."""
+
+import json
+import random
+
+import click
+
+from hangman.core import BATCHED_STRATEGIES, run_batched_simulation
+from hangman.parallel import run_parallel_simulation
+from hangman.simulation import STRATEGIES
+
+
+@click.command()
+@click.option("--games", default=10000, show_default=True, help="Number of games to simulate.")
+@click.option("--strategy", type=click.Choice(sorted(STRATEGIES)), default="frequency", show_default=True)
+@click.option("--seed", type=int, default=None, help="Master seed for reproducible simulations.")
+@click.option("--workers", type=click.IntRange(min=1), default=None, help="Worker processes [default: CPU count].")
+@click.option("--json", "as_json", is_flag=True, help="Print the summary results as JSON.")
+@click.option(
+    "--batched",
+    is_flag=True,
+    help=f"Play all the games at once in NumPy arrays, in this process. Strategies: {', '.join(BATCHED_STRATEGIES)}.",
+)
+def simulate(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    games: int, strategy: str, seed: int, workers: int, as_json: bool, batched: bool
+) -> None:
+    """Simulate games with a guessing strategy and report the summary results."""
+    if seed is None:
+        seed = random.SystemRandom().getrandbits(32)
+    if batched:
+        if strategy not in BATCHED_STRATEGIES:
+            raise click.BadParameter(f"'{strategy}' has no batched version.", param_hint="--strategy")
+        summary = run_batched_simulation(games, strategy, seed)
+    else:
+        summary = run_parallel_simulation(games, strategy, seed, workers=workers)
+    if as_json:
+        click.echo(json.dumps(dict(summary.to_dict(), seed=seed)))
+        return
+    click.echo(f"Seed           : {seed}")
+    click.echo(f"Games          : {summary.games}")
+    click.echo(f"Wins / losses  : {summary.wins} / {summary.losses}")
+    click.echo(f"Win rate       : {summary.win_rate:.2%}")
+    click.echo(f"Mean misses    : {summary.mean_missed_guesses:.3f}")
+    click.echo(f"Games / second : {summary.games_per_second:,.0f}")
@@ -0,0 +1,47 @@
+"""Module to define the tournament subcommand."""
+
+import json
+import random
+from dataclasses import asdict
+from typing import Optional, Tuple
+
+import click
+
+from hangman.simulation import STRATEGIES
+from hangman.tournament import run_tournament
+
+
+@click.command("tournament")
+@click.option(
+    "--strategy",
+    "strategies",
+    type=click.Choice(sorted(STRATEGIES)),
+    multiple=True,
+    help="Strategy to enter, repeat for several [default: all registered strategies].",
+)
+@click.option("--seed", type=int, default=None, help="Master seed of the strategies drawing random letters.")
+@click.option("--workers", type=click.IntRange(min=1), default=None, help="Worker processes [default: CPU count].")
+@click.option("--csv", "csv_path", default=None, help="CSV file to write the outcome of every game to.")
+@click.option("--json", "as_json", is_flag=True, help="Print the ranking as JSON.")
+def tournament_command(
+    strategies: Tuple[str, ...], seed: Optional[int], workers: Optional[int], csv_path: Optional[str], as_json: bool
+) -> None:
+    """Play guessing strategies against every word of the corpus and rank them by win rate."""
+    if seed is None:
+        seed = random.SystemRandom().getrandbits(32)
+    results = run_tournament(strategies or sorted(STRATEGIES), seed, workers=workers)
+    if csv_path:
+        results.write_csv(csv_path)
+    standings = results.standings()
+    if as_json:
+        click.echo(json.dumps({"seed": seed, "standings": [asdict(standing) for standing in standings]}))
+        return
+    click.echo(f"Seed           : {seed}")
+    click.echo(f"Games          : {results.games}")
+    click.echo(f"Games / second : {results.games / results.elapsed_seconds if results.elapsed_seconds else 0.0:,.0f}")
+    click.echo()
+    click.echo(f"{'Rank':>4}  {'Strategy':<10} {'Games':>7} {'Win rate (95% CI)':>26} {'Mean misses (95% CI)':>22}")
+    for rank, standing in enumerate(standings, start=1):
+        win_rate = f"{standing.win_rate:7.2%} [{standing.win_rate_low:6.2%}, {standing.win_rate_high:7.2%}]"
+        misses = f"{standing.mean_missed_guesses:.3f} ± {standing.missed_guesses_margin:.3f}"
+        click.echo(f"{rank:>4}  {standing.strategy:<10} {standing.games:>7} {win_rate:>26} {misses:>22}")
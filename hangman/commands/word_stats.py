@@ -0,0 +1,63 @@
+"""Module to define the word-stats subcommand."""
+
+import itertools
+import json
+import os
+import sys
+from typing import Optional, TextIO, Tuple
+
+import click
+
+from hangman.word_stats import WordStatsAggregator, iter_game_records
+
+
+@click.command("word-stats")
+@click.argument("records", type=click.File("r", encoding="utf-8"), nargs=-1)
+@click.option(
+    "--checkpoint",
+    "checkpoint_path",
+    default=None,
+    help="Checkpoint file to resume from and update, the records it has consumed are skipped from the input.",
+)
+@click.option("--checkpoint-every", type=click.IntRange(min=1), default=100000, show_default=True, help="Games.")
+@click.option(
+    "--merge",
+    "merge_paths",
+    multiple=True,
+    help="Checkpoint file of another shard to merge into the printed statistics.",
+)
+@click.option("--total", "total_only", is_flag=True, help="Print the statistics of all games only.")
+def word_stats_command(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    records: Tuple[TextIO, ...],
+    checkpoint_path: Optional[str],
+    checkpoint_every: int,
+    merge_paths: Tuple[str, ...],
+    total_only: bool,
+) -> None:
+    """Aggregate the game results of RECORDS files (stdin by default) into statistics per secret word.
+
+    The records are the JSON lines printed by the play-script command. The statistics are printed as one JSON line per
+    secret word. The checkpoint only holds the records of this shard, the merged shards are added after it is saved.
+    """
+    if checkpoint_path and os.path.exists(checkpoint_path):
+        aggregator = WordStatsAggregator.load(checkpoint_path)
+    else:
+        aggregator = WordStatsAggregator()
+
+    game_records = iter_game_records(itertools.chain.from_iterable(records or [sys.stdin]))
+    # Skip the records counted before the checkpoint was saved, so a resumed run does not count them twice.
+    game_records = itertools.islice(game_records, aggregator.records_consumed, None)
+    while aggregator.consume(itertools.islice(game_records, checkpoint_every)):
+        if checkpoint_path:
+            aggregator.save(checkpoint_path)
+    if checkpoint_path:
+        aggregator.save(checkpoint_path)
+
+    for merge_path in merge_paths:
+        aggregator.merge(WordStatsAggregator.load(merge_path))
+
+    if total_only:
+        click.echo(json.dumps(aggregator.total().to_dict()))
+        return
+    for secret_word in sorted(aggregator.words):
+        click.echo(json.dumps({"secret_word": secret_word, **aggregator.words[secret_word].to_dict()}))
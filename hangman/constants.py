@@ -1,7 +1,9 @@
 """Module to define package level constants."""
 
 import os
-from typing import Final, List
+from typing import Final
+
+from hangman.corpus import WordsCorpus
 
 HANGMAN_PICS: Final[list] = [
     """
@@ -48,15 +50,22 @@ HANGMAN_PICS: Final[list] = [
        ===""",
 ]
 
+# The player loses the game once the last Hangman picture is reached.
+MAX_MISSED_GUESSES: Final[int] = len(HANGMAN_PICS) - 1
+
 WORDS_SOURCE_DIR: str = os.path.dirname(os.path.abspath(__file__))
 
 WORDS_SOURCE_FILENAME = "words_source.txt"
 
 WORDS_SOURCE_PATH = f"{WORDS_SOURCE_DIR}/{WORDS_SOURCE_FILENAME}"
 
-# Get a list of secret words from the words source text file in current dir.
-WORDS_LIST: List[str] = []
-with open(WORDS_SOURCE_PATH, mode="r", encoding="utf-8") as words_file:
-    lines = words_file.readlines()
-    for line in lines:
-        WORDS_LIST.extend(line.split())
+WORDS_COMPILED_FILENAME = "words_source.bin"
+
+WORDS_COMPILED_PATH = f"{WORDS_SOURCE_DIR}/{WORDS_COMPILED_FILENAME}"
+
+# Difficulty tiers of the secret words, from the words the reference solver finds with the fewest missed guesses.
+DIFFICULTY_TIERS = ("easy", "medium", "hard")
+
+# Secret words from the words source text file in current dir, loaded lazily on first use.
+# The compiled corpus file is preferred when it has been built and is up to date.
+WORDS_LIST: WordsCorpus = WordsCorpus(WORDS_SOURCE_PATH, WORDS_COMPILED_PATH)
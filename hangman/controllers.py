@@ -1,67 +1,148 @@
 """Module to define controller classes of the Model-View-Controller design pattern."""
 
-from hangman.constants import HANGMAN_PICS
+import time
+from typing import Callable, Optional, Type
+
+from hangman.constants import MAX_MISSED_GUESSES
+from hangman.instrumentation import (
+    COUNTER_GAMES,
+    COUNTER_INVALID_INPUTS,
+    COUNTER_LOSSES,
+    COUNTER_WINS,
+    PHASE_EVALUATE,
+    PHASE_INPUT_WAIT,
+    PHASE_RENDER,
+    MetricsSink,
+)
 from hangman.models import HangmanGameData
+from hangman.rules import EVENT_CORRECT_GUESS, EVENT_GAME_LOST, EVENT_GAME_WON, EVENT_MISSED_GUESS, guess_events
+from hangman.sampler import WordSampler
+from hangman.utils import letter_mask
 from hangman.views import HangmanGameView
 
 
 class HangmanGameController:
     """Controller class of managing Hangman game events."""
 
-    def __init__(
+    def __init__(  # pylint: disable=too-many-arguments,too-many-positional-arguments
         self,
-        hangman_game_data: HangmanGameData = HangmanGameData(),
-        hangman_game_view: HangmanGameView = HangmanGameView(),
+        hangman_game_data: Optional[HangmanGameData] = None,
+        hangman_game_view: Optional[HangmanGameView] = None,
+        metrics_sink: Optional[MetricsSink] = None,
+        word_sampler: Optional[WordSampler] = None,
+        game_data_class: Type[HangmanGameData] = HangmanGameData,
+        game_recorder: Optional[Callable[[HangmanGameData, bool], None]] = None,
     ):
         """Control all the events of Hangman game.
 
         Attributes:
-            hangman_game_data: Dataclass object of type HangmanGameData storing the data of the current game.
-            hangman_game_view: View object of type HangmanGameView that is responsible for UI display.
+            hangman_game_data: Dataclass object of type HangmanGameData storing the data of the current game. A new game
+                with a random secret word is created if not given.
+            hangman_game_view: View object of type HangmanGameView that is responsible for UI display. A console view is
+                created if not given.
+            metrics_sink: Sink receiving the turn phase durations and game event counts, not instrumented if not given.
+            word_sampler: Sampler drawing the secret words of the session without repeats, one seeded from the OS is
+                created by the first new game if not given. Checkpoint it to resume the secret words in another session.
+            game_data_class: Class of the data of the new games, e.g. EvilHangmanGameData for the adversarial mode.
+            game_recorder: Callable receiving each finished game and whether the player has won it, e.g. to record it on
+                the leaderboard. It must not block, since the next game waits for it.
         """
-        self.hangman_game_data = hangman_game_data
-        self.hangman_game_view = hangman_game_view
+        # The defaults are created per controller rather than as default arguments, which would draw a secret word,
+        # and so load the words corpus, as soon as this module is imported.
+        self.word_sampler = word_sampler
+        self.game_data_class = game_data_class
+        self.game_recorder = game_recorder
+        self.hangman_game_data = hangman_game_data if hangman_game_data is not None else self.new_game_data()
+        self.hangman_game_view = hangman_game_view if hangman_game_view is not None else HangmanGameView()
+        self.metrics_sink = metrics_sink
+
+    def new_game_data(self) -> HangmanGameData:
+        """Create the data of a new game with the next secret word of the sampler."""
+        if self.word_sampler is None:
+            self.word_sampler = WordSampler()
+        secret_word_index, secret_word = self.word_sampler.draw()
+        return self.game_data_class(secret_word=secret_word, secret_word_index=secret_word_index)
 
     def start_game(self) -> None:
         """Start the Hangman game."""
+        # Every timing call is skipped when the game loop is not instrumented.
+        metrics_sink = self.metrics_sink
         while True:
+            started = time.perf_counter() if metrics_sink else 0.0
             self.hangman_game_view.show_hangman_board(self.hangman_game_data)
+            if metrics_sink:
+                started = metrics_sink.observe_since(PHASE_RENDER, started)
+                invalid_inputs = self.hangman_game_view.invalid_inputs
 
             # Let the player enter a guess letter.
             player_guess = self.hangman_game_view.get_player_guess(self.hangman_game_data)
+            if metrics_sink:
+                started = metrics_sink.observe_since(PHASE_INPUT_WAIT, started)
+                metrics_sink.increment(COUNTER_INVALID_INPUTS, self.hangman_game_view.invalid_inputs - invalid_inputs)
 
-            if player_guess in self.hangman_game_data.secret_word:
-                # If guess letter is correct, save it to the correct list.
-                self.hangman_game_data.correct_letters.append(player_guess)
-                if self.is_player_won():
-                    # Check if player won the game, then show winning message.
-                    self.hangman_game_view.show_hangman_board(self.hangman_game_data)
+            player_won = self.evaluate_player_guess(player_guess)
+            if metrics_sink:
+                started = metrics_sink.observe_since(PHASE_EVALUATE, started)
+            if player_won is not None:
+                # If the guess finished the game, show the final board and then the winning or lost game message.
+                self.hangman_game_view.show_hangman_board(self.hangman_game_data)
+                if player_won:
                     self.hangman_game_view.show_player_won(self.hangman_game_data)
-                    self.hangman_game_data.game_finished = True
-            else:
-                self.hangman_game_data.missed_letters.append(player_guess)
-                if self.is_guessed_too_many_times():
-                    # Check if run out of guesses, then show lost game message.
-                    self.hangman_game_view.show_hangman_board(self.hangman_game_data)
+                else:
                     self.hangman_game_view.show_player_lost(self.hangman_game_data)
-                    self.hangman_game_data.game_finished = True
+                if self.game_recorder:
+                    self.game_recorder(self.hangman_game_data, player_won)
+                if metrics_sink:
+                    metrics_sink.observe_since(PHASE_RENDER, started)
+                    metrics_sink.increment(COUNTER_GAMES)
+                    metrics_sink.increment(COUNTER_WINS if player_won else COUNTER_LOSSES)
 
             if self.hangman_game_data.game_finished:
                 if not self.hangman_game_view.play_again():
                     # Exit the game if player doesn't want to play again.
                     break
-                # Refresh the game data if player wants to play again.
-                self.hangman_game_data = HangmanGameData()
+                # Refresh the game data if player wants to play again, the sampler never repeats a recent word.
+                self.hangman_game_data = self.new_game_data()
+
+    def evaluate_player_guess(self, player_guess: str) -> Optional[bool]:
+        """Apply a validated guess letter to the current game and check whether it has finished the game.
+
+        The guess is judged by the rules of guess_events(), as in the pure step() function and the batched games.
+
+        Args:
+            player_guess: The guess letter entered by the player.
+
+        Returns:
+            bool: True if the player has won, False if the player has run out of guesses, None if the game goes on,
+                including for a repeated guess or a finished game, which leave the game unchanged.
+        """
+        hangman_game_data = self.hangman_game_data
+        # The adversarial mode settles its secret word on each new guess letter.
+        hangman_game_data.settle_guess(player_guess)
+        events = guess_events(
+            hangman_game_data.game_finished,
+            hangman_game_data.secret_word_mask,
+            hangman_game_data.missed_mask,
+            hangman_game_data.correct_mask,
+            len(hangman_game_data.missed_letters),
+            letter_mask(player_guess),
+        )
+        if EVENT_CORRECT_GUESS in events:
+            hangman_game_data.add_correct_letter(player_guess)
+        elif EVENT_MISSED_GUESS in events:
+            hangman_game_data.add_missed_letter(player_guess)
+        if EVENT_GAME_WON in events:
+            hangman_game_data.game_finished = True
+            return True
+        if EVENT_GAME_LOST in events:
+            hangman_game_data.game_finished = True
+            return False
+        return None
 
     def is_player_won(self) -> bool:
         """Check whether the player has won the game."""
-        is_player_won = True
-        for secret_word_letter in self.hangman_game_data.secret_word:
-            if secret_word_letter not in self.hangman_game_data.correct_letters:
-                is_player_won = False
-                break
-        return is_player_won
+        return self.hangman_game_data.is_secret_word_revealed
 
     def is_guessed_too_many_times(self) -> bool:
         """Check if player has guessed too many times and lost."""
-        return len(self.hangman_game_data.missed_letters) >= (len(HANGMAN_PICS) - 1)
+        return len(self.hangman_game_data.missed_letters) >= MAX_MISSED_GUESSES
@@ -0,0 +1,251 @@
+"""Module to define the batched game core: the stepping of many games at once in NumPy arrays.
+
+BatchedGames holds the state of many games in NumPy arrays, one item per game, and applies a whole tick of guesses, one
+per game, as a few vector operations. It is the vector form of guess_events() of the rules module, which judges the
+guesses of step() and HangmanGameController, for the secret words of the letters a-z: the guesses are letter codes
+0-25, so the secret words with other characters, which could never be won, are rejected.
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional
+
+import numpy as np
+
+from hangman.constants import MAX_MISSED_GUESSES
+from hangman.simulation import LETTERS_BY_FREQUENCY, SimulationSummary
+from hangman.solver import HIDDEN_CODE, HIDDEN_LETTER, OTHER_CODE, PAD_CODE, get_corpus_solver
+from hangman.utils import ALPHABET_SIZE, ORD_A
+
+# Guess code of a game which does not guess in a tick.
+NO_GUESS = -1
+
+
+@dataclass(frozen=True)
+class StepEvents:
+    """Represent the events of a tick of guesses, one array item per game.
+
+    Attributes:
+        correct_guess: (numpy.ndarray) Whether the guess of each game was correct.
+        missed_guess: (numpy.ndarray) Whether the guess of each game was missed.
+        repeated_guess: (numpy.ndarray) Whether the guess of each game had been guessed already, and was ignored.
+        game_won: (numpy.ndarray) Whether the guess of each game won it.
+        game_lost: (numpy.ndarray) Whether the guess of each game lost it.
+    """
+
+    correct_guess: np.ndarray
+    missed_guess: np.ndarray
+    repeated_guess: np.ndarray
+    game_won: np.ndarray
+    game_lost: np.ndarray
+
+
+def get_secret_word_masks(letter_codes: np.ndarray) -> np.ndarray:
+    """Get the bit mask of the letters of each word of a letter code matrix.
+
+    Args:
+        letter_codes: The letter code of each position of each word, PAD_CODE past the end.
+
+    Returns:
+        numpy.ndarray: The bit mask of each word.
+
+    Raises:
+        ValueError: If a word has characters other than a-z.
+    """
+    if (letter_codes == OTHER_CODE).any():
+        raise ValueError("The batched games only play secret words of the letters a-z.")
+    letter_bits = np.left_shift(np.int64(1), letter_codes.astype(np.int64))
+    return np.bitwise_or.reduce(np.where(letter_codes < PAD_CODE, letter_bits, 0), axis=1)
+
+
+class BatchedGames:
+    """Hold the state of many games in NumPy arrays and apply one guess per game at once."""
+
+    def __init__(self, letter_codes: np.ndarray):
+        """Start one game per secret word.
+
+        Attributes:
+            letter_codes: (numpy.ndarray) The letter code of each position of each secret word, PAD_CODE past the end,
+                e.g. rows of the letter code matrix of the corpus solver. The games own a copy, which restart() writes
+                the new secret words into.
+            secret_word_masks: (numpy.ndarray) Bit mask of the letters of each secret word.
+            guessed_masks: (numpy.ndarray) Bit mask of the letters guessed in each game.
+            missed_guesses: (numpy.ndarray) Number of missed guesses of each game.
+            correct_guesses: (numpy.ndarray) Number of correct guesses of each game.
+            game_finished: (numpy.ndarray) Game finish indicator of each game.
+            game_won: (numpy.ndarray) Whether each game has been won.
+        """
+        self.letter_codes = np.array(letter_codes, copy=True)
+        self.secret_word_masks = get_secret_word_masks(self.letter_codes)
+        games = len(letter_codes)
+        self.guessed_masks = np.zeros(games, dtype=np.int64)
+        self.missed_guesses = np.zeros(games, dtype=np.uint8)
+        self.correct_guesses = np.zeros(games, dtype=np.uint8)
+        self.game_finished = np.zeros(games, dtype=bool)
+        self.game_won = np.zeros(games, dtype=bool)
+
+    @classmethod
+    def from_corpus(cls, rows: np.ndarray) -> "BatchedGames":
+        """Start one game per word of WORDS_LIST given by index.
+
+        Args:
+            rows: The indexes of the secret words in WORDS_LIST.
+
+        Returns:
+            BatchedGames: The games.
+        """
+        return cls(get_corpus_solver().letter_codes[rows])
+
+    def __len__(self) -> int:
+        """Get the number of games."""
+        return len(self.secret_word_masks)
+
+    def restart(self, games: np.ndarray, letter_codes: np.ndarray) -> None:
+        """Start new games in place of some games, e.g. the finished ones.
+
+        Args:
+            games: The indexes of the games to be replaced.
+            letter_codes: The letter codes of the new secret words, as wide as those of the other games.
+
+        Raises:
+            ValueError: If the letter codes are not as wide as those of the other games, or have characters other
+                than a-z.
+        """
+        if letter_codes.shape[1:] != self.letter_codes.shape[1:]:
+            raise ValueError(f"Expected letter codes of width {self.letter_codes.shape[1]}.")
+        self.secret_word_masks[games] = get_secret_word_masks(letter_codes)
+        self.letter_codes[games] = letter_codes
+        for state in (self.guessed_masks, self.missed_guesses, self.correct_guesses, self.game_finished, self.game_won):
+            state[games] = 0
+
+    def step(self, guess_codes: np.ndarray) -> StepEvents:
+        """Apply one guess to each game.
+
+        Args:
+            guess_codes: The letter code of the guess of each game, 0-25 for the letters a-z, NO_GUESS for a game which
+                does not guess. The guesses of the finished games are ignored.
+
+        Returns:
+            StepEvents: The events of the guess of each game.
+        """
+        playing = (guess_codes >= 0) & ~self.game_finished
+        guess_masks = np.where(playing, np.left_shift(np.int64(1), np.maximum(guess_codes, 0).astype(np.int64)), 0)
+        repeated_guess = playing & (self.guessed_masks & guess_masks != 0)
+        new_guess_masks = np.where(repeated_guess, 0, guess_masks)
+        correct_guess = self.secret_word_masks & new_guess_masks != 0
+        missed_guess = (new_guess_masks != 0) & ~correct_guess
+
+        self.guessed_masks |= new_guess_masks
+        self.correct_guesses += correct_guess
+        self.missed_guesses += missed_guess
+        game_won = correct_guess & (self.secret_word_masks & ~self.guessed_masks == 0)
+        game_lost = missed_guess & (self.missed_guesses >= MAX_MISSED_GUESSES)
+        self.game_won |= game_won
+        self.game_finished |= game_won | game_lost
+        return StepEvents(correct_guess, missed_guess, repeated_guess, game_won, game_lost)
+
+    def revealed_codes(self) -> np.ndarray:
+        """Get the letter codes of the secret words with HIDDEN_CODE at the positions not guessed yet.
+
+        Returns:
+            numpy.ndarray: The letter code matrix of the revealed words, PAD_CODE past the end.
+        """
+        guessed = np.right_shift(self.guessed_masks[:, np.newaxis], self.letter_codes.astype(np.int64)) & 1
+        hidden = (guessed == 0) & (self.letter_codes < PAD_CODE)
+        return np.where(hidden, HIDDEN_CODE, self.letter_codes).astype(np.uint8)
+
+    def revealed_word(self, game: int) -> str:
+        """Get the secret word of a game with HIDDEN_LETTER at the positions not guessed yet.
+
+        Args:
+            game: The index of the game.
+
+        Returns:
+            str: E.g. '_a_e_' for the secret word 'camel' after guessing 'a' and 'e'.
+        """
+        # Only the row of the game is decoded, rather than revealed_codes() of all the games.
+        guessed_mask = int(self.guessed_masks[game])
+        return "".join(
+            chr(ORD_A + code) if guessed_mask >> code & 1 else HIDDEN_LETTER
+            for code in self.letter_codes[game].tolist()
+            if code != PAD_CODE
+        )
+
+
+# Letter codes in the order of their frequency in English words.
+FREQUENCY_ORDER = np.array([ord(letter) - ORD_A for letter in LETTERS_BY_FREQUENCY], dtype=np.int64)
+
+
+def frequency_guesses(batched_games: BatchedGames, rng: np.random.Generator) -> np.ndarray:
+    """Guess the most frequent English letter which has not been guessed yet in each game.
+
+    Args:
+        batched_games: The games.
+        rng: Random number generator, not used.
+
+    Returns:
+        numpy.ndarray: The letter code of the guess of each game.
+    """
+    del rng
+    guesses = np.full(len(batched_games), NO_GUESS, dtype=np.int64)
+    # The most frequent letters are checked last, so they overwrite the less frequent ones.
+    for code in FREQUENCY_ORDER[::-1]:
+        guesses[batched_games.guessed_masks & (1 << int(code)) == 0] = code
+    return guesses
+
+
+def random_guesses(batched_games: BatchedGames, rng: np.random.Generator) -> np.ndarray:
+    """Guess a random letter which has not been guessed yet in each game.
+
+    Args:
+        batched_games: The games.
+        rng: Random number generator drawing the letters.
+
+    Returns:
+        numpy.ndarray: The letter code of the guess of each game.
+    """
+    letter_bits = np.left_shift(np.int64(1), np.arange(ALPHABET_SIZE, dtype=np.int64))
+    guessed = batched_games.guessed_masks[:, np.newaxis] & letter_bits != 0
+    # The guessed letters get keys above the random keys, so the smallest key is a random letter not guessed yet.
+    keys = rng.random((len(batched_games), ALPHABET_SIZE)) + guessed
+    return np.argmin(keys, axis=1)
+
+
+# Registered batched guessing strategies by name, each choosing the guess of every game of a tick.
+BATCHED_STRATEGIES: Dict[str, Callable[[BatchedGames, np.random.Generator], np.ndarray]] = {
+    "random": random_guesses,
+    "frequency": frequency_guesses,
+}
+
+
+def run_batched_simulation(games: int, strategy: str, seed: Optional[int] = None) -> SimulationSummary:
+    """Play games with random a-z secret words of WORDS_LIST, all at once, with a batched guessing strategy.
+
+    Args:
+        games: Number of games to be played.
+        strategy: Name of the batched guessing strategy.
+        seed: Seed of the random number generator drawing the secret words and used by the strategy.
+
+    Returns:
+        SimulationSummary: The summary results of the games.
+
+    Raises:
+        ValueError: If the strategy has no batched version.
+    """
+    if strategy not in BATCHED_STRATEGIES:
+        raise ValueError(f"Guessing strategy '{strategy}' has no batched version.")
+    start = time.perf_counter()
+    rng = np.random.default_rng(seed)
+    # The words with other characters are skipped, as the batched games cannot guess them.
+    rows = np.flatnonzero((get_corpus_solver().letter_codes != OTHER_CODE).all(axis=1))
+    batched_games = BatchedGames.from_corpus(rows[rng.integers(0, len(rows), games)])
+    next_guesses = BATCHED_STRATEGIES[strategy]
+    while not batched_games.game_finished.all():
+        batched_games.step(next_guesses(batched_games, rng))
+    return SimulationSummary(
+        games=games,
+        wins=int(np.count_nonzero(batched_games.game_won)),
+        missed_guesses=int(batched_games.missed_guesses.sum()),
+        correct_guesses=int(batched_games.correct_guesses.sum()),
+        elapsed_seconds=time.perf_counter() - start,
+    )
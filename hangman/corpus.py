@@ -0,0 +1,372 @@
+"""Module to define the word corpus classes used for drawing secret words.
+
+Two storage formats are supported:
+(1) The words source text file, where words are separated by whitespace.
+(2) The compiled corpus file, built from the text file by `python -m hangman compile-corpus`. It is laid out as a
+    fixed-size header, a table of (word count + 1) little-endian uint64 offsets and a blob of packed UTF-8 words, so a
+    word can be read by seeking straight to its offsets without parsing the rest of the file.
+
+The compiled format can also be read from any buffer, e.g. a shared memory block filled with pack_compiled_corpus(), so
+worker processes can read the words of their parent process without parsing the text file again.
+"""
+
+import hashlib
+import mmap
+import os
+import re
+import struct
+import sys
+from array import array
+from collections.abc import Sequence
+from typing import Iterable, Iterator, Optional, Tuple, Union
+
+# Words in the source file are separated by any whitespace.
+WORD_PATTERN = re.compile(rb"\S+")
+
+COMPILED_MAGIC = b"HGWC"
+
+COMPILED_VERSION = 1
+
+# Header: magic, version, word count, source file size, source file mtime in ns, SHA-256 digest of the source file.
+COMPILED_HEADER = struct.Struct("<4sIQQQ32s")
+
+COMPILED_OFFSET = struct.Struct("<Q")
+
+COMPILED_WORD_OFFSETS = struct.Struct("<QQ")
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+Buffer = Union[mmap.mmap, bytes, memoryview]
+
+
+def map_file(path: str) -> Buffer:
+    """Memory-map a file read-only.
+
+    Args:
+        path: Path of the file to be mapped.
+
+    Returns:
+        mmap: The mapped file. An empty file cannot be memory-mapped, so an empty bytes object is returned instead.
+    """
+    with open(path, mode="rb") as file_obj:
+        if not os.fstat(file_obj.fileno()).st_size:
+            return b""
+        return mmap.mmap(file_obj.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def hash_file(path: str) -> bytes:
+    """Get the SHA-256 digest of a file without reading it into memory at once.
+
+    Args:
+        path: Path of the file to be hashed.
+
+    Returns:
+        bytes: The SHA-256 digest.
+    """
+    digest = hashlib.sha256()
+    with open(path, mode="rb") as file_obj:
+        for chunk in iter(lambda: file_obj.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def corpus_digest(words: Iterable[str]) -> bytes:
+    """Hash the words of a corpus in order.
+
+    Args:
+        words: The words of the corpus.
+
+    Returns:
+        bytes: The SHA-256 digest.
+    """
+    digest = hashlib.sha256()
+    for word in words:
+        digest.update(word.encode("utf-8"))
+        digest.update(b"\n")
+    return digest.digest()
+
+
+class TextWordsCorpus(Sequence):
+    """Read-only sequence of words backed by a memory-mapped words source text file.
+
+    Nothing is read when the object is created. The file is memory-mapped and the word boundaries are indexed on first
+    use, so importing the package costs no memory for the words, and drawing a word only decodes that single word.
+    """
+
+    def __init__(self, source_path: str):
+        """Create a lazy corpus over a words source text file.
+
+        Attributes:
+            source_path: Path of the words source text file, words are separated by whitespace.
+        """
+        self.source_path = source_path
+        self._buffer: Optional[Buffer] = None
+        self._starts: Optional[array] = None
+        self._ends: Optional[array] = None
+
+    def _load(self) -> Tuple[Buffer, array, array]:
+        """Memory-map the source file and index the word boundaries if not done yet.
+
+        Returns:
+            mmap, array, array: The mapped file buffer, the start offsets and the end offsets of the words.
+        """
+        if self._starts is None:
+            starts, ends = array("Q"), array("Q")
+            buffer = map_file(self.source_path)
+            for match in WORD_PATTERN.finditer(buffer):
+                starts.append(match.start())
+                ends.append(match.end())
+            self._buffer, self._starts, self._ends = buffer, starts, ends
+        return self._buffer, self._starts, self._ends
+
+    def iter_word_bytes(self) -> Iterator[bytes]:
+        """Iterate over the UTF-8 encoded words without decoding them.
+
+        Yields:
+            bytes: The encoded words in file order.
+        """
+        buffer, starts, ends = self._load()
+        for start, end in zip(starts, ends):
+            yield buffer[start:end]
+
+    def __len__(self) -> int:
+        """Get the number of words in the corpus."""
+        return len(self._load()[1])
+
+    def __getitem__(self, idx):
+        """Get the word at the given index, or a list of words for a slice."""
+        buffer, starts, ends = self._load()
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(starts)))]
+        start, end = starts[idx], ends[idx]
+        return buffer[start:end].decode("utf-8")
+
+
+class CompiledWordsCorpus(Sequence):
+    """Read-only sequence of words backed by a memory-mapped compiled corpus file, or by a buffer in that format.
+
+    Each lookup reads two offsets from the offset table and decodes one word from the blob, so random access is O(1)
+    and no Python object is created for the words which are not drawn.
+    """
+
+    def __init__(self, compiled_path: str = "", buffer: Optional[Buffer] = None):
+        """Create a lazy corpus over a compiled corpus file or buffer.
+
+        Attributes:
+            compiled_path: Path of the compiled corpus file built by compile_corpus(), not used if a buffer is given.
+        """
+        self.compiled_path = compiled_path
+        self._buffer: Optional[Buffer] = buffer
+        self._header: Optional[tuple] = None
+
+    def _load(self) -> Tuple[Buffer, tuple]:
+        """Memory-map the compiled file unless a buffer was given, and validate its header if not done yet.
+
+        Returns:
+            mmap, tuple: The mapped file or the given buffer, and the unpacked header.
+
+        Raises:
+            ValueError: If the file or buffer is not a compiled corpus of the supported version.
+        """
+        if self._header is None:
+            buffer = map_file(self.compiled_path) if self._buffer is None else self._buffer
+            header = read_compiled_header(buffer)
+            if header is None:
+                raise ValueError(f"'{self.compiled_path}' is not a compiled corpus of version {COMPILED_VERSION}.")
+            self._buffer, self._header = buffer, header
+        return self._buffer, self._header
+
+    @property
+    def source_digest(self) -> bytes:
+        """Get the SHA-256 digest of the words source text file the corpus was compiled from."""
+        return self._load()[1][5]
+
+    def __len__(self) -> int:
+        """Get the number of words in the corpus."""
+        return self._load()[1][2]
+
+    def __getitem__(self, idx):
+        """Get the word at the given index, or a list of words for a slice."""
+        buffer, header = self._load()
+        word_count = header[2]
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(word_count))]
+        if idx < 0:
+            idx += word_count
+        if not 0 <= idx < word_count:
+            raise IndexError("corpus index out of range")
+        start, end = COMPILED_WORD_OFFSETS.unpack_from(buffer, COMPILED_HEADER.size + idx * COMPILED_OFFSET.size)
+        # str() decodes the slices of bytes, mmap and memoryview buffers alike.
+        return str(buffer[start:end], "utf-8")
+
+
+class WordsCorpus(Sequence):
+    """Read-only sequence of words which picks the fastest available storage on first use.
+
+    The compiled corpus file is used when it is up to date with the words source text file, otherwise the text file is
+    memory-mapped and indexed directly.
+    """
+
+    def __init__(self, source_path: str, compiled_path: Optional[str] = None):
+        """Create a lazy corpus over a words source text file and its optional compiled corpus file.
+
+        Attributes:
+            source_path: Path of the words source text file, words are separated by whitespace.
+            compiled_path: Path of the compiled corpus file built from the source file, if any.
+        """
+        self.source_path = source_path
+        self.compiled_path = compiled_path
+        self._words: Optional[Sequence] = None
+
+    def _load(self) -> Sequence:
+        """Choose and create the storage backend if not done yet.
+
+        Returns:
+            Sequence: The compiled corpus if it is up to date, otherwise the text corpus.
+        """
+        if self._words is None:
+            if self.compiled_path and is_compiled_corpus_current(self.source_path, self.compiled_path):
+                self._words = CompiledWordsCorpus(self.compiled_path)
+            else:
+                self._words = TextWordsCorpus(self.source_path)
+        return self._words
+
+    def attach(self, words: Sequence) -> None:
+        """Use a storage backend created elsewhere, e.g. a compiled corpus over a shared memory block.
+
+        Args:
+            words: The words of the source file.
+        """
+        self._words = words
+
+    @property
+    def is_loaded(self) -> bool:
+        """Check whether the storage backend has been chosen."""
+        return self._words is not None
+
+    @property
+    def is_compiled(self) -> bool:
+        """Check whether the words are read from the compiled corpus file."""
+        return isinstance(self._load(), CompiledWordsCorpus)
+
+    def __len__(self) -> int:
+        """Get the number of words in the corpus."""
+        return len(self._load())
+
+    def __getitem__(self, idx):
+        """Get the word at the given index, or a list of words for a slice."""
+        return self._load()[idx]
+
+
+def read_compiled_header(buffer: Buffer) -> Optional[tuple]:
+    """Read and validate the header of a compiled corpus.
+
+    Args:
+        buffer: The content of the compiled corpus file.
+
+    Returns:
+        tuple: The unpacked header, or None if the buffer is not a compiled corpus of the supported version.
+    """
+    if len(buffer) < COMPILED_HEADER.size:
+        return None
+    header = COMPILED_HEADER.unpack_from(buffer, 0)
+    if header[0] != COMPILED_MAGIC or header[1] != COMPILED_VERSION:
+        return None
+    return header
+
+
+def is_compiled_corpus_current(source_path: str, compiled_path: str) -> bool:
+    """Check whether a compiled corpus file was built from the current content of the words source text file.
+
+    The source file size and mtime are compared first, the source file is only hashed when they differ. If its hash
+    still matches, e.g. after the source file was checked out again, the header of the compiled file is stamped with the
+    new size and mtime, so the next processes skip the hash.
+
+    Args:
+        source_path: Path of the words source text file.
+        compiled_path: Path of the compiled corpus file.
+
+    Returns:
+        bool: True if the compiled corpus file exists and matches the source file.
+    """
+    if not os.path.exists(compiled_path):
+        return False
+    with open(compiled_path, mode="rb") as compiled_file:
+        header = read_compiled_header(compiled_file.read(COMPILED_HEADER.size))
+    if header is None:
+        return False
+    source_stat = os.stat(source_path)
+    if (header[3], header[4]) == (source_stat.st_size, source_stat.st_mtime_ns):
+        return True
+    if header[5] != hash_file(source_path):
+        return False
+    try:
+        with open(compiled_path, mode="r+b") as compiled_file:
+            compiled_file.write(
+                COMPILED_HEADER.pack(*header[:3], source_stat.st_size, source_stat.st_mtime_ns, header[5])
+            )
+    except OSError:
+        # The stamp only saves the next hash, the compiled file is current either way.
+        pass
+    return True
+
+
+def pack_compiled_corpus(
+    words: Sequence, source_size: int = 0, source_mtime_ns: int = 0, source_digest: bytes = b""
+) -> Iterator[bytes]:
+    """Lay out words in the compiled corpus format.
+
+    Args:
+        words: The UTF-8 encoded words.
+        source_size: Size of the words source text file the words are read from.
+        source_mtime_ns: Modification time of the words source text file in nanoseconds.
+        source_digest: SHA-256 digest of the words source text file.
+
+    Yields:
+        bytes: The header, the offset table and then the words, to be written one after the other.
+    """
+    offsets = array("Q")
+    offset = COMPILED_HEADER.size + (len(words) + 1) * COMPILED_OFFSET.size
+    offsets.append(offset)
+    for word in words:
+        offset += len(word)
+        offsets.append(offset)
+    if sys.byteorder != "little":
+        offsets.byteswap()
+
+    yield COMPILED_HEADER.pack(
+        COMPILED_MAGIC, COMPILED_VERSION, len(words), source_size, source_mtime_ns, source_digest
+    )
+    yield offsets.tobytes()
+    yield from words
+
+
+def compile_corpus(source_path: str, compiled_path: str, force: bool = False) -> bool:
+    """Build the compiled corpus file from the words source text file.
+
+    The build is incremental: an existing compiled file is reused unless the hash of the source file has changed.
+
+    Args:
+        source_path: Path of the words source text file.
+        compiled_path: Path of the compiled corpus file to be written.
+        force: Rebuild the compiled file even if it is up to date.
+
+    Returns:
+        bool: True if the compiled file was (re)built, False if the existing one was reused.
+    """
+    if not force and is_compiled_corpus_current(source_path, compiled_path):
+        return False
+
+    source_stat = os.stat(source_path)
+    words = TextWordsCorpus(source_path)
+    chunks = pack_compiled_corpus(
+        list(words.iter_word_bytes()), source_stat.st_size, source_stat.st_mtime_ns, hash_file(source_path)
+    )
+
+    # Write to a temporary file first, so a reader never sees a partially written corpus. The temporary file is unique
+    # per process, so concurrent builds do not write into each other's file.
+    tmp_path = f"{compiled_path}.{os.getpid()}.tmp"
+    with open(tmp_path, mode="wb") as compiled_file:
+        compiled_file.writelines(chunks)
+    os.replace(tmp_path, compiled_path)
+    return True
@@ -0,0 +1,616 @@
+"""Module to define the precomputed decision tree of the optimal guesses for a corpus.
+
+For a fixed corpus, the candidate words of a game only depend on its revealed pattern and its missed letters, and so
+does the best next guess. The tree is built per word length: the guess of each set of candidates is the letter which
+minimizes the total number of missed guesses over the candidates, solved exactly by recursing on the candidates split
+by the positions of the letter. The exact search is exponential in the number of candidates, so larger sets of
+candidates take the letter which best splits them instead, and only the small subtrees are solved exactly. The guesses
+along the way of every word are then stored by state key, so a hint is a single dictionary lookup.
+
+The word lengths are solved in parallel, and each solved length is saved as a part file in a parts directory of the
+build process right away, so an interrupted build resumes from the lengths already solved by any build. The finished
+tree is stored as one compressed file named after the corpus hash in the user cache directory, so it is rebuilt
+whenever the corpus changes. The tree can also be packed into NumPy arrays of a hash table of the state keys, so worker
+processes look the guesses up in place in a shared memory block.
+"""
+
+import functools
+import glob
+import multiprocessing
+import os
+import shutil
+import struct
+import zlib
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from hangman.constants import WORDS_LIST
+from hangman.corpus import corpus_digest
+from hangman.models import HangmanGameData
+from hangman.solver import HIDDEN_LETTER
+from hangman.utils import get_user_cache_dir
+from hangman.word_index import LengthBucket, count_rows, iter_rows
+
+TREE_MAGIC = b"HGDT"
+
+TREE_VERSION = 1
+
+# Tree file header: magic, format version, SHA-256 digest of the corpus, number of states.
+TREE_HEADER = struct.Struct("<4sI32sI")
+
+# Environment variable of the cache directory, the decision_trees directory of the user cache directory if not set.
+DECISION_TREE_CACHE_DIR_ENV = "HANGMAN_DECISION_TREE_DIR"
+
+# Largest number of candidates solved exactly, the search takes seconds from about 40 candidates, growing exponentially.
+EXACT_SEARCH_MAX_CANDIDATES = 8
+
+# Separator of the revealed pattern and the missed letters in a state key, and of a state key and its guess.
+KEY_SEPARATOR = ":"
+
+ENTRY_SEPARATOR = "\t"
+
+# Tree read from the block shared by the parent process, attached in the worker processes by hangman.shared_corpus.
+_attached_tree: Optional["DecisionTree"] = None  # pylint: disable=invalid-name
+
+
+def state_key(revealed_letters: Sequence[str], missed_letters: Iterable[str]) -> str:
+    """Get the key of a game state, which does not depend on the guessing order.
+
+    Args:
+        revealed_letters: The letter at each position of the secret word, HIDDEN_LETTER if not revealed yet.
+        missed_letters: The letters which are not in the secret word.
+
+    Returns:
+        str: The revealed pattern and the sorted missed letters, e.g. '_a_:eo'.
+    """
+    return f"{''.join(revealed_letters)}{KEY_SEPARATOR}{''.join(sorted(missed_letters))}"
+
+
+def best_split(letter_split: Tuple[int, str, Dict[int, int]]) -> Tuple[int, int, str]:
+    """Get the sort key of the letter which best splits the candidates, like CandidateWordSolver.next_letter().
+
+    Args:
+        letter_split: The candidates without the letter, the letter, and the candidate rows by positions of the letter.
+
+    Returns:
+        tuple: The sum of the squared split sizes, i.e. the expected number of candidates left, then the candidates
+            without the letter, then the letter.
+    """
+    misses, letter, splits = letter_split
+    return sum(count_rows(split_rows) ** 2 for split_rows in splits.values()), misses, letter
+
+
+class LengthPolicyBuilder:
+    """Solve the optimal guesses of the words of one length."""
+
+    def __init__(self, words: Sequence[str]):
+        """Create the builder.
+
+        Attributes:
+            bucket: The index of the words.
+        """
+        self.bucket = LengthBucket(words)
+        # Best letter and total missed guesses by set of candidate rows, the same sets are reached in many orders.
+        self._solved: Dict[int, Tuple[Optional[str], int]] = {}
+
+    def solve(self, rows: int) -> Tuple[Optional[str], int]:
+        """Find the guess minimizing the total number of missed guesses needed to find each candidate.
+
+        A letter in none of the candidates is a sure miss, and a letter at the same positions in all of them does not
+        tell them apart, so only the letters splitting the candidates are tried. They are tried from the fewest
+        candidates without the letter, which are missed guesses on their own, so the search stops as soon as no letter
+        left can beat the best one. Ties go to the letter tried first, then to the first in alphabetical order.
+
+        Above EXACT_SEARCH_MAX_CANDIDATES candidates, only the letter which best splits them is tried, see
+        best_split().
+
+        Args:
+            rows: The bit set of the candidate rows.
+
+        Returns:
+            str, int: The letter, None if the candidates cannot be told apart, and the total missed guesses.
+        """
+        solved = self._solved.get(rows)
+        if solved is not None:
+            return solved
+
+        best_letter, best_misses = None, 0
+        candidates = count_rows(rows)
+        if candidates > 1:
+            letter_splits = []
+            for letter in self.bucket.letter_patterns:
+                splits = self.split(rows, letter)
+                if len(splits) > 1:
+                    letter_splits.append((count_rows(splits.get(0, 0)), letter, splits))
+            if candidates > EXACT_SEARCH_MAX_CANDIDATES and letter_splits:
+                letter_splits = [min(letter_splits, key=best_split)]
+            for misses, letter, splits in sorted(letter_splits):
+                if best_letter is not None and misses >= best_misses:
+                    break
+                for split_rows in splits.values():
+                    misses += self.solve(split_rows)[1]
+                    if best_letter is not None and misses >= best_misses:
+                        break
+                else:
+                    best_letter, best_misses = letter, misses
+        self._solved[rows] = best_letter, best_misses
+        return best_letter, best_misses
+
+    def split(self, rows: int, letter: str) -> Dict[int, int]:
+        """Split candidates by the positions of a letter.
+
+        Args:
+            rows: The bit set of the candidate rows.
+            letter: The guessed letter.
+
+        Returns:
+            dict: The non-empty bit sets of rows by the positions mask of the letter, 0 for the words without it.
+        """
+        splits = {0: rows & ~self.bucket.letter_rows.get(letter, 0)}
+        for mask, pattern_rows in self.bucket.letter_patterns.get(letter, {}).items():
+            splits[mask] = rows & pattern_rows
+        return {mask: split_rows for mask, split_rows in splits.items() if split_rows}
+
+    def build(self) -> List[Tuple[str, str]]:
+        """Walk the optimal guesses from the start of a game until every word is found.
+
+        Once a single candidate is left, its hidden letters are guessed in alphabetical order.
+
+        Returns:
+            list: The state key and the guess of every state on the way.
+        """
+        entries: List[Tuple[str, str]] = []
+        length = len(self.bucket.words[0]) if self.bucket.words else 0
+        pending = [([HIDDEN_LETTER] * length, "", self.bucket.all_rows)]
+        while pending:
+            revealed_letters, missed_letters, rows = pending.pop()
+            letter, _ = self.solve(rows)
+            if letter is None:
+                # The candidates are all the same word.
+                word = self.bucket.words[next(iter_rows(rows))]
+                for guess in sorted(set(word) - set(revealed_letters)):
+                    entries.append((state_key(revealed_letters, missed_letters), guess))
+                    revealed_letters = [char if char == guess else shown for char, shown in zip(word, revealed_letters)]
+                continue
+
+            entries.append((state_key(revealed_letters, missed_letters), letter))
+            for mask, split_rows in self.split(rows, letter).items():
+                if mask:
+                    revealed = [letter if mask >> pos & 1 else shown for pos, shown in enumerate(revealed_letters)]
+                    pending.append((revealed, missed_letters, split_rows))
+                else:
+                    pending.append((revealed_letters, missed_letters + letter, split_rows))
+        return entries
+
+
+def build_length_policy(words: List[str]) -> List[Tuple[str, str]]:
+    """Build the states and guesses of the words of one length, this is run in the worker processes.
+
+    Args:
+        words: The distinct words of the length.
+
+    Returns:
+        list: The state key and the guess of every state.
+    """
+    return LengthPolicyBuilder(words).build()
+
+
+def encode_entries(entries: Iterable[Tuple[str, str]]) -> bytes:
+    """Encode the states and guesses as compressed text lines, sorted so the shared key prefixes compress well."""
+    lines = sorted(f"{key}{ENTRY_SEPARATOR}{letter}\n" for key, letter in entries)
+    return zlib.compress("".join(lines).encode("utf-8"), 9)
+
+
+def decode_entries(data: bytes) -> Dict[str, str]:
+    """Decode the states and guesses encoded by encode_entries()."""
+    policy = {}
+    for line in zlib.decompress(data).decode("utf-8").splitlines():
+        key, letter = line.split(ENTRY_SEPARATOR)
+        policy[key] = letter
+    return policy
+
+
+def _write_atomically(path: str, data: bytes) -> None:
+    """Write a file through a temporary file, so readers never see it partially written."""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, mode="wb") as tmp_file:
+        tmp_file.write(data)
+    os.replace(tmp_path, path)
+
+
+class PackedPolicy(Mapping):
+    """Look up the guess of a state key in NumPy arrays, e.g. read in place from a shared memory block.
+
+    The state keys are the keys of an open addressing hash table with linear probing, hashed with CRC-32 so every
+    process finds them in the same slots. The arrays are read through memory views, which are faster to index.
+    """
+
+    def __init__(self, state_keys: np.ndarray, guesses: np.ndarray, slots: np.ndarray):
+        """Use the arrays of the states and guesses without copying them.
+
+        Attributes:
+            state_keys: The UTF-8 encoded state keys in ascending order.
+            guesses: The code point of the guess of each state key.
+            slots: The index of the state key in each slot of the hash table, -1 for the empty slots. The number of
+                slots is a power of two.
+        """
+        self.state_keys = state_keys
+        self.guesses = guesses
+        self.slots = slots
+        self._key_width = state_keys.itemsize
+        self._key_bytes = memoryview(state_keys.view(np.uint8))
+        self._guess_codes = memoryview(guesses)
+        self._slot_indexes = memoryview(slots)
+
+    @classmethod
+    def pack(cls, policy: Mapping[str, str]) -> "PackedPolicy":
+        """Pack the states and guesses of a policy into arrays.
+
+        Args:
+            policy: The guess by state key.
+
+        Returns:
+            PackedPolicy: The packed policy.
+        """
+        entries = sorted((key.encode("utf-8"), letter) for key, letter in policy.items())
+        key_width = max((len(key) for key, _ in entries), default=1)
+        # At least twice as many slots as state keys keeps the probe sequences short.
+        slot_mask = (1 << (2 * len(entries)).bit_length()) - 1
+        slots = np.full(slot_mask + 1, -1, dtype=np.int32)
+        for index, (key, _) in enumerate(entries):
+            slot = zlib.crc32(key) & slot_mask
+            while slots[slot] >= 0:
+                slot = (slot + 1) & slot_mask
+            slots[slot] = index
+        state_keys = np.array([key for key, _ in entries], dtype=f"S{key_width}")
+        return cls(state_keys, np.array([ord(letter) for _, letter in entries], dtype=np.uint32), slots)
+
+    def __getitem__(self, key: str) -> str:
+        """Get the guess of a state key."""
+        key_bytes = key.encode("utf-8")
+        key_width = self._key_width
+        if len(key_bytes) <= key_width:
+            # The state keys are padded with null bytes to the width of the array.
+            padded_key = key_bytes.ljust(key_width, b"\0")
+            slot_mask = len(self._slot_indexes) - 1
+            slot = zlib.crc32(key_bytes) & slot_mask
+            index = self._slot_indexes[slot]
+            while index >= 0:
+                start = index * key_width
+                end = start + key_width
+                if self._key_bytes[start:end] == padded_key:
+                    return chr(self._guess_codes[index])
+                slot = (slot + 1) & slot_mask
+                index = self._slot_indexes[slot]
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the state keys in ascending order."""
+        return (key.decode("utf-8") for key in self.state_keys.tolist())
+
+    def __len__(self) -> int:
+        """Get the number of states."""
+        return len(self.state_keys)
+
+
+class DecisionTree:
+    """Look up the precomputed optimal guess of a game state."""
+
+    def __init__(self, policy: Mapping[str, str], digest: bytes):
+        """Create the decision tree.
+
+        Attributes:
+            policy: The guess by state key, a dictionary or a PackedPolicy.
+            digest: SHA-256 digest of the corpus the tree was built for.
+        """
+        self.policy = policy
+        self.digest = digest
+
+    def __len__(self) -> int:
+        """Get the number of states."""
+        return len(self.policy)
+
+    def lookup(self, revealed_letters: Sequence[str], missed_letters: Iterable[str]) -> Optional[str]:
+        """Get the guess of a game state.
+
+        Args:
+            revealed_letters: The letter at each position of the secret word, HIDDEN_LETTER if not revealed yet.
+            missed_letters: The letters which are not in the secret word.
+
+        Returns:
+            str: The letter, None if the state is not in the tree, e.g. after guesses the tree would not make.
+        """
+        return self.policy.get(state_key(revealed_letters, missed_letters))
+
+    def next_letter(self, hangman_game_data: HangmanGameData) -> Optional[str]:
+        """Get the guess of a game.
+
+        Args:
+            hangman_game_data: The data object of the game, only the revealed letters and missed letters are used.
+
+        Returns:
+            str: The letter, None if the state of the game is not in the tree.
+        """
+        return self.lookup(hangman_game_data.revealed_letters, hangman_game_data.missed_letters)
+
+    def to_bytes(self) -> bytes:
+        """Serialize the tree in the format of the tree files.
+
+        Returns:
+            bytes: The header and the compressed entries.
+        """
+        header = TREE_HEADER.pack(TREE_MAGIC, TREE_VERSION, self.digest, len(self.policy))
+        return header + encode_entries(self.policy.items())
+
+    @classmethod
+    def from_bytes(cls, data: bytes, source: str = "data") -> "DecisionTree":
+        """Load a tree serialized by to_bytes().
+
+        Args:
+            data: The serialized tree.
+            source: Description of where the data comes from, for the error messages.
+
+        Returns:
+            DecisionTree: The tree.
+
+        Raises:
+            ValueError: If the data is not a tree of the supported version.
+        """
+        if len(data) < TREE_HEADER.size:
+            raise ValueError(f"Decision tree {source} is truncated.")
+        magic, version, digest, states = TREE_HEADER.unpack_from(data)
+        if magic != TREE_MAGIC or version != TREE_VERSION:
+            raise ValueError(f"Unsupported decision tree {source}.")
+        header_size = TREE_HEADER.size
+        policy = decode_entries(data[header_size:])
+        if len(policy) != states:
+            raise ValueError(f"Decision tree {source} is corrupted.")
+        return cls(policy, digest)
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        """Pack the tree into NumPy arrays, e.g. to be copied into a shared memory block.
+
+        Returns:
+            dict: The arrays by name.
+        """
+        policy = self.policy if isinstance(self.policy, PackedPolicy) else PackedPolicy.pack(self.policy)
+        return {
+            "state_keys": policy.state_keys,
+            "guesses": policy.guesses,
+            "slots": policy.slots,
+            "digest": np.frombuffer(self.digest, dtype=np.uint8),
+        }
+
+    @classmethod
+    def from_arrays(cls, arrays: Mapping[str, np.ndarray]) -> "DecisionTree":
+        """Use the arrays of to_arrays() as the tree, without copying them.
+
+        Args:
+            arrays: The arrays by name.
+
+        Returns:
+            DecisionTree: The tree with a PackedPolicy.
+        """
+        return cls(PackedPolicy(arrays["state_keys"], arrays["guesses"], arrays["slots"]), arrays["digest"].tobytes())
+
+    def save(self, path: str) -> None:
+        """Write the tree to a file atomically.
+
+        Args:
+            path: Path of the tree file.
+        """
+        _write_atomically(path, self.to_bytes())
+
+    @classmethod
+    def load(cls, path: str) -> "DecisionTree":
+        """Read a tree file written by save().
+
+        Args:
+            path: Path of the tree file.
+
+        Returns:
+            DecisionTree: The tree.
+
+        Raises:
+            ValueError: If the file is not a tree file of the supported version.
+        """
+        with open(path, mode="rb") as tree_file:
+            data = tree_file.read()
+        return cls.from_bytes(data, f"file '{path}'")
+
+
+def get_decision_tree_cache_dir() -> str:
+    """Get the default decision tree cache directory.
+
+    Returns:
+        str: The directory of the HANGMAN_DECISION_TREE_DIR environment variable if set, else the hangman/decision_trees
+            directory of the user cache directory, i.e. %LOCALAPPDATA% on Windows and $XDG_CACHE_HOME or ~/.cache
+            elsewhere.
+    """
+    return get_user_cache_dir("decision_trees", DECISION_TREE_CACHE_DIR_ENV)
+
+
+def get_tree_path(cache_dir: str, digest: bytes) -> str:
+    """Get the path of the cached tree of a corpus.
+
+    Args:
+        cache_dir: The cache directory.
+        digest: SHA-256 digest of the corpus.
+
+    Returns:
+        str: The path of the tree file.
+    """
+    return os.path.join(cache_dir, f"{digest.hex()}.tree")
+
+
+def _iter_solved_lengths(
+    words_by_length: Dict[int, List[str]], workers: Optional[int]
+) -> Iterator[Tuple[int, List[Tuple[str, str]]]]:
+    """Solve the word lengths across a process pool, yielding each length as soon as it is solved.
+
+    Args:
+        words_by_length: The distinct words of each length to be solved.
+        workers: Number of worker processes, the number of CPUs if not given. 1 solves all lengths in this process.
+
+    Yields:
+        int, list: The length, and the state key and the guess of every state of its words.
+    """
+    # The largest buckets first, so the slowest ones do not start last.
+    lengths = sorted(words_by_length, key=lambda length: len(words_by_length[length]), reverse=True)
+    buckets = [words_by_length[length] for length in lengths]
+    if workers == 1 or len(buckets) <= 1:
+        yield from zip(lengths, map(build_length_policy, buckets))
+    else:
+        with multiprocessing.Pool(workers) as pool:
+            yield from zip(lengths, pool.imap(build_length_policy, buckets))
+
+
+def _read_part(path: str) -> Optional[bytes]:
+    """Read a part file, which another build may remove at any time.
+
+    Args:
+        path: Path of the part file.
+
+    Returns:
+        bytes: The encoded entries of the part, None if there is no such file.
+    """
+    try:
+        with open(path, mode="rb") as part_file:
+            return part_file.read()
+    except FileNotFoundError:
+        return None
+
+
+def _save_part(parts_dir: str, length: int, data: bytes) -> None:
+    """Save the entries of a solved word length, unless the parts directory has been removed in the meantime.
+
+    A concurrent build of the same corpus removes all the parts directories once it has saved the tree, and the part
+    files are only needed to resume an interrupted build, so this build carries on without them.
+
+    Args:
+        parts_dir: The parts directory of this build.
+        length: The word length.
+        data: The encoded entries of the length.
+    """
+    try:
+        _write_atomically(os.path.join(parts_dir, f"{length}.part"), data)
+    except FileNotFoundError:
+        pass
+
+
+def _load_part(parts_pattern: str, parts_dir: str, length: int) -> Optional[bytes]:
+    """Find the part file of a word length in the parts directories of the builds of the corpus.
+
+    The part of another build is copied into the parts directory of this build, so this build can still be resumed
+    once the other build has removed its directory.
+
+    Args:
+        parts_pattern: The glob pattern of the parts directories of the corpus.
+        parts_dir: The parts directory of this build.
+        length: The word length.
+
+    Returns:
+        bytes: The encoded entries of the length, None if no build has solved it yet.
+    """
+    for solved_parts_dir in glob.glob(parts_pattern):
+        data = _read_part(os.path.join(solved_parts_dir, f"{length}.part"))
+        if data is not None:
+            if solved_parts_dir != parts_dir:
+                _save_part(parts_dir, length, data)
+            return data
+    return None
+
+
+def build_decision_tree(
+    words: Iterable[str], cache_dir: Optional[str] = None, workers: Optional[int] = None
+) -> DecisionTree:
+    """Build the decision tree of a corpus, resuming from the word lengths solved by interrupted builds.
+
+    Each build process saves its part files in its own parts directory, and reads the part files of the other builds of
+    the corpus, so concurrent builds never write into or remove a directory another build is using.
+
+    Args:
+        words: The words of the corpus.
+        cache_dir: Directory of the tree and of the parts directories, created if missing. The directory of
+            get_decision_tree_cache_dir() if not given.
+        workers: Number of worker processes, the number of CPUs if not given. 1 solves all lengths in this process.
+
+    Returns:
+        DecisionTree: The tree, the parts directories of the corpus are removed once it is saved.
+    """
+    if cache_dir is None:
+        cache_dir = get_decision_tree_cache_dir()
+    words = list(words)
+    digest = corpus_digest(words)
+    words_by_length: Dict[int, List[str]] = {}
+    for word in dict.fromkeys(words):
+        words_by_length.setdefault(len(word), []).append(word)
+
+    parts_pattern = os.path.join(glob.escape(cache_dir), f"{digest.hex()}.*.parts")
+    parts_dir = os.path.join(cache_dir, f"{digest.hex()}.{os.getpid()}.parts")
+    os.makedirs(parts_dir, exist_ok=True)
+    policy: Dict[str, str] = {}
+    pending_words: Dict[int, List[str]] = {}
+    for length in sorted(words_by_length):
+        data = _load_part(parts_pattern, parts_dir, length)
+        if data is None:
+            pending_words[length] = words_by_length[length]
+        else:
+            policy.update(decode_entries(data))
+
+    for length, entries in _iter_solved_lengths(pending_words, workers):
+        _save_part(parts_dir, length, encode_entries(entries))
+        policy.update(entries)
+
+    decision_tree = DecisionTree(policy, digest)
+    decision_tree.save(get_tree_path(cache_dir, digest))
+    for solved_parts_dir in glob.glob(parts_pattern):
+        shutil.rmtree(solved_parts_dir, ignore_errors=True)
+    return decision_tree
+
+
+def load_decision_tree(
+    words: Sequence[str], cache_dir: Optional[str] = None, workers: Optional[int] = None
+) -> DecisionTree:
+    """Load the cached decision tree of a corpus, building it first if the corpus has none.
+
+    Args:
+        words: The words of the corpus.
+        cache_dir: The cache directory, the directory of get_decision_tree_cache_dir() if not given.
+        workers: Number of worker processes of the build, the number of CPUs if not given.
+
+    Returns:
+        DecisionTree: The tree.
+    """
+    if cache_dir is None:
+        cache_dir = get_decision_tree_cache_dir()
+    tree_path = get_tree_path(cache_dir, corpus_digest(words))
+    if os.path.exists(tree_path):
+        try:
+            return DecisionTree.load(tree_path)
+        except ValueError:
+            pass
+    return build_decision_tree(words, cache_dir, workers=workers)
+
+
+@functools.lru_cache(maxsize=None)
+def get_corpus_decision_tree() -> DecisionTree:
+    """Get the decision tree of the WORDS_LIST constant, loaded once per process on first use unless one is attached.
+
+    The tree is built in this process if it is not cached yet, so simulation workers do not start process pools.
+    """
+    if _attached_tree is not None:
+        return _attached_tree
+    return load_decision_tree(WORDS_LIST, workers=1)
+
+
+def attach_corpus_decision_tree(decision_tree: Optional[DecisionTree]) -> None:
+    """Use a tree loaded elsewhere as the decision tree of the WORDS_LIST constant.
+
+    Args:
+        decision_tree: The tree, e.g. read from the block shared by the parent process. None loads the tree again.
+    """
+    global _attached_tree  # pylint: disable=global-statement
+    _attached_tree = decision_tree
+    get_corpus_decision_tree.cache_clear()
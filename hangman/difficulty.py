@@ -0,0 +1,237 @@
+"""Module to define the difficulty scores of the corpus words and the difficulty tiers to draw secret words from.
+
+The difficulty of a word is the number of missed guesses of a reference solver finding it: the solver guesses the
+letter contained in the most corpus words still consistent with the game, the same as the index simulation strategy.
+It is deterministic, so the score is the exact expected number of misses under that solver.
+
+The scores are cached in a sidecar file of the words source file in the user cache directory, which is rebuilt when
+the hash of the words source file changes. The hash is only computed when the size or mtime of the source file differ
+from those stamped in the sidecar file. The words are then split into tiers of equal size by score, and each tier keeps
+the indexes of its words in an array, so drawing a word of a tier is a single random index.
+"""
+
+import functools
+import hashlib
+import os
+import random
+import struct
+import warnings
+from array import array
+from typing import Dict, Iterable, Optional, Sequence
+
+from hangman.constants import DIFFICULTY_TIERS, MAX_MISSED_GUESSES, WORDS_LIST, WORDS_SOURCE_PATH
+from hangman.corpus import hash_file
+from hangman.utils import LETTER_MASKS, get_user_cache_dir
+from hangman.word_index import WordIndex
+
+DIFFICULTY_MAGIC = b"HGDS"
+
+DIFFICULTY_VERSION = 2
+
+# Difficulty file header: magic, format version, number of words, size, mtime in nanoseconds and SHA-256 digest of the
+# words source file.
+DIFFICULTY_HEADER = struct.Struct("<4sIQQQ32s")
+
+# Environment variable overriding the directory of the difficulty sidecar files.
+DIFFICULTY_CACHE_DIR_ENV = "HANGMAN_DIFFICULTY_DIR"
+
+
+def score_word(word_index: WordIndex, word: str) -> int:
+    """Count the missed guesses of the reference solver finding a word.
+
+    Args:
+        word_index: The index of the corpus the solver draws its candidates from.
+        word: The secret word.
+
+    Returns:
+        int: The number of missed guesses, MAX_MISSED_GUESSES if the solver loses the game.
+    """
+    candidate_set = word_index.candidate_set(len(word))
+    guessed_mask = missed = 0
+    hidden_letters = set(word)
+    while hidden_letters and missed < MAX_MISSED_GUESSES:
+        letter = candidate_set.best_letter(guessed_mask)
+        if letter is None:
+            # The word is not in the corpus and no candidate is left, guess the remaining letters in order.
+            letter = next(letter for letter, mask in LETTER_MASKS.items() if not guessed_mask & mask)
+        guessed_mask |= LETTER_MASKS[letter]
+        positions = [position for position, char in enumerate(word) if char == letter]
+        candidate_set.narrow(letter, positions)
+        if positions:
+            hidden_letters.discard(letter)
+        else:
+            missed += 1
+    return missed
+
+
+def score_words(words: Sequence[str]) -> array:
+    """Score the difficulty of every word of a corpus.
+
+    Args:
+        words: The words of the corpus.
+
+    Returns:
+        array: The number of missed guesses of the reference solver for each word, in corpus order.
+    """
+    word_index = WordIndex(words)
+    return array("B", (score_word(word_index, word) for word in words))
+
+
+def get_difficulty_path(source_path: str, cache_dir: Optional[str] = None) -> str:
+    """Get the path of the difficulty sidecar file of a words source file.
+
+    Args:
+        source_path: Path of the words source file.
+        cache_dir: The cache directory. The directory of the HANGMAN_DIFFICULTY_DIR environment variable if not given,
+            else the hangman/difficulty directory of the user cache directory.
+
+    Returns:
+        str: The path of the sidecar file, named by the hash of the absolute path of the source file, so the sidecar
+            file is found without reading the source file.
+    """
+    if cache_dir is None:
+        cache_dir = get_user_cache_dir("difficulty", DIFFICULTY_CACHE_DIR_ENV)
+    source_key = hashlib.sha256(os.path.abspath(source_path).encode()).hexdigest()[:32]
+    return os.path.join(cache_dir, f"{source_key}.difficulty")
+
+
+def save_difficulty_scores(path: str, source_path: str, scores: array) -> None:
+    """Write the scores of a corpus to a sidecar file atomically, creating its directory if missing.
+
+    Args:
+        path: Path of the sidecar file.
+        source_path: Path of the words source file the scores were computed from.
+        scores: The score of each word.
+    """
+    source_stat = os.stat(source_path)
+    header = DIFFICULTY_HEADER.pack(
+        DIFFICULTY_MAGIC,
+        DIFFICULTY_VERSION,
+        len(scores),
+        source_stat.st_size,
+        source_stat.st_mtime_ns,
+        hash_file(source_path),
+    )
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    # The temporary file is unique per process, so concurrent processes scoring the same corpus do not collide.
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, mode="wb") as scores_file:
+            scores_file.write(header)
+            scores_file.write(scores.tobytes())
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def load_difficulty_scores(path: str, source_path: str) -> Optional[array]:
+    """Read the scores of a corpus from a sidecar file.
+
+    The size and mtime of the source file are compared first, the source file is only hashed when they differ. If its
+    hash still matches, e.g. after the source file was copied, the sidecar file is stamped with the new size and mtime,
+    so the next processes skip the hash.
+
+    Args:
+        path: Path of the sidecar file.
+        source_path: Path of the current words source file.
+
+    Returns:
+        array: The score of each word, None if the file is missing, of another format or computed from another corpus.
+    """
+    if not os.path.exists(path):
+        return None
+    with open(path, mode="rb") as scores_file:
+        data = scores_file.read()
+    if len(data) < DIFFICULTY_HEADER.size:
+        return None
+    magic, version, words, source_size, source_mtime_ns, digest = DIFFICULTY_HEADER.unpack_from(data)
+    header_size = DIFFICULTY_HEADER.size
+    if (magic, version) != (DIFFICULTY_MAGIC, DIFFICULTY_VERSION) or len(data) != header_size + words:
+        return None
+    source_stat = os.stat(source_path)
+    if (source_size, source_mtime_ns) != (source_stat.st_size, source_stat.st_mtime_ns):
+        if digest != hash_file(source_path):
+            return None
+        header = DIFFICULTY_HEADER.pack(magic, version, words, source_stat.st_size, source_stat.st_mtime_ns, digest)
+        try:
+            with open(path, mode="r+b") as scores_file:
+                scores_file.write(header)
+        except OSError:
+            # The stamp only saves the next hash, the scores are read either way.
+            pass
+    return array("B", data[header_size:])
+
+
+class DifficultyTiers:  # pylint: disable=too-few-public-methods
+    """Draw the indexes of the corpus words by difficulty tier."""
+
+    def __init__(self, scores: Iterable[int], tiers: Sequence[str] = DIFFICULTY_TIERS):
+        """Split the words into tiers of equal size, from the lowest scores to the highest.
+
+        Attributes:
+            scores: The difficulty score of each word.
+            tier_rows: The indexes of the words of each tier.
+        """
+        self.scores = array("B", scores)
+        self.tier_rows: Dict[str, array] = {}
+        # Words of equal score keep their corpus order, so the tiers are the same for the same corpus.
+        ranked_rows = sorted(range(len(self.scores)), key=self.scores.__getitem__)
+        for position, tier in enumerate(tiers):
+            start = position * len(ranked_rows) // len(tiers)
+            end = (position + 1) * len(ranked_rows) // len(tiers)
+            self.tier_rows[tier] = array("L", ranked_rows[start:end])
+
+    def draw(self, tier: str, rng: Optional[random.Random] = None) -> int:
+        """Draw the index of a random word of a tier.
+
+        Args:
+            tier: One of the tier names.
+            rng: Random number generator to draw with. The global random module state is used if not given.
+
+        Returns:
+            int: The index of the word in the corpus.
+
+        Raises:
+            ValueError: If the tier is unknown or has no word.
+        """
+        rows = self.tier_rows.get(tier)
+        if not rows:
+            raise ValueError(f"No word of difficulty '{tier}', expected one of {', '.join(self.tier_rows)}.")
+        return rows[(rng or random).randrange(len(rows))]
+
+
+def get_difficulty_tiers(words: Sequence[str]) -> DifficultyTiers:
+    """Get the difficulty tiers of any words, the cached tiers of the WORDS_LIST constant for the corpus itself.
+
+    Args:
+        words: The words.
+
+    Returns:
+        DifficultyTiers: The tiers of the indexes of the words.
+    """
+    if words is WORDS_LIST:
+        return get_corpus_difficulty_tiers()
+    return DifficultyTiers(score_words(words))
+
+
+@functools.lru_cache(maxsize=None)
+def get_corpus_difficulty_tiers() -> DifficultyTiers:
+    """Get the difficulty tiers of the WORDS_LIST constant, built once per process on first use.
+
+    The scores are read from the sidecar file when it matches the words source file, otherwise they are computed and
+    the sidecar file is written for the next processes. A warning is emitted if it cannot be written, since every
+    process then scores the corpus again.
+    """
+    path = get_difficulty_path(WORDS_SOURCE_PATH)
+    scores = load_difficulty_scores(path, WORDS_SOURCE_PATH)
+    if scores is None:
+        scores = score_words(WORDS_LIST)
+        try:
+            save_difficulty_scores(path, WORDS_SOURCE_PATH, scores)
+        except OSError as error:
+            warnings.warn(
+                f"The difficulty scores could not be cached in '{path}', so each process scores the corpus: {error}",
+                RuntimeWarning,
+            )
+    return DifficultyTiers(scores)
@@ -0,0 +1,202 @@
+"""Module to define the adversarial ("evil") game mode, where the secret word is only settled as late as possible.
+
+The game keeps every corpus word of the secret word length which is consistent with the guesses so far. After each
+new guess, the candidates are split into families by the positions of the guessed letter in them, and the largest
+family is kept, so the guess is a miss whenever most candidates do not contain the letter.
+
+The positions of each letter a-z in each word of a length are encoded once as integer bit masks, one array per letter.
+A turn then takes the masks of the guessed letter for the candidates, counts the families with one pass over them and
+keeps the indexes of the largest family, so no Python object is created per candidate word. The positions of the other
+letters, which share one letter code in the solver, and those of the words longer than MAX_INTEGER_POSITIONS are found
+in the code points of the candidates instead, and their families are counted by their positions packed into bytes.
+"""
+
+import functools
+from dataclasses import dataclass, field
+from typing import Optional
+
+import numpy as np
+
+from hangman.models import HangmanGameData
+from hangman.solver import (
+    HIDDEN_CODE,
+    MAX_INTEGER_POSITIONS,
+    OTHER_CODE,
+    CandidateWordSolver,
+    get_corpus_solver,
+    get_letter_code,
+)
+
+# Longest words whose families are counted in an array indexed by position mask, the masks of longer words are sorted.
+MAX_BINCOUNT_LENGTH = 16
+
+
+class LetterPositionMasks:  # pylint: disable=too-few-public-methods
+    """Positions of every letter in the words of a length, encoded as bit masks."""
+
+    def __init__(self, solver: CandidateWordSolver, length: int):
+        """Encode the letter positions of the words of a length.
+
+        Attributes:
+            solver: The solver holding the letter code matrix of the words.
+            rows: (numpy.ndarray) The indexes in the solver of the words of the length.
+            masks: (Optional[numpy.ndarray]) The bit mask of the positions of each letter code in each word, by letter
+                code then by word, 0 if the word does not contain the letter. None for words longer than
+                MAX_INTEGER_POSITIONS, whose masks do not fit in an integer array.
+        """
+        self.solver = solver
+        self.rows = solver.rows_of_length(length)
+        self.length = length
+        self.masks: Optional[np.ndarray] = None
+        if length > MAX_INTEGER_POSITIONS:
+            return
+        dtype = np.uint16 if length <= 16 else np.uint32 if length <= 32 else np.uint64
+        self.masks = np.zeros((HIDDEN_CODE + 1, len(self.rows)), dtype=dtype)
+        words = np.arange(len(self.rows))
+        letter_codes = solver.letter_codes[self.rows]
+        # The letter code matrix is only as wide as the longest word, there is no position to encode without words.
+        for position in range(length if len(self.rows) else 0):
+            # Each word is indexed once per position, so the fancy indexed update sets every bit.
+            self.masks[letter_codes[:, position], words] |= dtype(1 << position)
+
+    def letter_positions(self, letter: str, candidates: Optional[np.ndarray]) -> np.ndarray:
+        """Find the positions of a letter in the candidates from their code points.
+
+        Args:
+            letter: A single character.
+            candidates: The indexes of the candidates in the words of the length, None for all of them.
+
+        Returns:
+            numpy.ndarray: Whether each candidate has the letter at each position, one row per candidate.
+        """
+        words = self.solver.words[self.rows if candidates is None else self.rows.take(candidates)]
+        # The fixed-width unicode array is a matrix of code points padded with zeros, 4 bytes per character.
+        code_points = words.view(np.uint32).reshape(len(words), words.dtype.itemsize // 4)
+        return code_points[:, : self.length] == ord(letter)
+
+
+@functools.lru_cache(maxsize=64)
+def get_letter_position_masks(solver: CandidateWordSolver, length: int) -> LetterPositionMasks:
+    """Get the letter position masks of the words of a length, encoded once per solver and length.
+
+    Args:
+        solver: The solver holding the words.
+        length: The word length.
+
+    Returns:
+        LetterPositionMasks: The masks.
+    """
+    return LetterPositionMasks(solver, length)
+
+
+class WordFamilies:
+    """Track the candidate secret words of an evil game, keeping the largest family after each guess."""
+
+    def __init__(self, solver: CandidateWordSolver, length: int):
+        """Start with all the words of a length.
+
+        Attributes:
+            position_masks: The letter position masks of the words of the length.
+            candidates: (numpy.ndarray) The indexes of the candidates in the words of the length, None for all of them.
+        """
+        self.position_masks = get_letter_position_masks(solver, length)
+        self.candidates: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        """Get the number of candidate words."""
+        return len(self.position_masks.rows) if self.candidates is None else len(self.candidates)
+
+    def keep_largest_family(self, letter: str) -> int:
+        """Keep the candidates of the largest family of a guess, preferring the family without the letter on a tie.
+
+        Args:
+            letter: The guessed letter.
+
+        Returns:
+            int: The bit mask of the positions of the letter in the kept family, 0 if it is the family without it.
+        """
+        if not self:
+            return 0
+        letter_code = get_letter_code(letter)
+        if letter_code == OTHER_CODE or self.position_masks.masks is None:
+            return self._keep_largest_family_of_positions(letter)
+        masks = self.position_masks.masks[letter_code]
+        if self.candidates is not None:
+            masks = masks.take(self.candidates)
+        # The families are ordered by mask, so argmax prefers the smallest mask, i.e. the family without the letter.
+        if self.position_masks.length <= MAX_BINCOUNT_LENGTH:
+            family_mask = int(np.argmax(np.bincount(masks)))
+        else:
+            family_masks, family_sizes = np.unique(masks, return_counts=True)
+            family_mask = int(family_masks[np.argmax(family_sizes)])
+        kept = np.flatnonzero(masks == family_mask)
+        self.candidates = kept if self.candidates is None else self.candidates.take(kept)
+        return family_mask
+
+    def _keep_largest_family_of_positions(self, letter: str) -> int:
+        """Keep the largest family of a guess from the positions of the letter in the code points of the candidates.
+
+        Args:
+            letter: The guessed letter.
+
+        Returns:
+            int: The bit mask of the positions of the letter in the kept family, 0 if it is the family without it.
+        """
+        is_letter = self.position_masks.letter_positions(letter, self.candidates)
+        if not is_letter.shape[1]:
+            return 0
+        packed_positions = np.ascontiguousarray(np.packbits(is_letter, axis=1))
+        # The packed positions without the letter are all zero bytes, the smallest key, so argmax prefers that family.
+        _, families, family_sizes = np.unique(
+            packed_positions.view(f"V{packed_positions.shape[1]}").ravel(), return_inverse=True, return_counts=True
+        )
+        kept = np.flatnonzero(families.ravel() == np.argmax(family_sizes))
+        family_mask = sum(1 << int(position) for position in np.flatnonzero(is_letter[kept[0]]))
+        self.candidates = kept if self.candidates is None else self.candidates.take(kept)
+        return family_mask
+
+    @property
+    def representative(self) -> Optional[int]:
+        """Get the index in the solver of the first candidate, None if there is no candidate."""
+        if not self:
+            return None
+        return int(self.position_masks.rows[0 if self.candidates is None else self.candidates[0]])
+
+
+@dataclass
+class EvilHangmanGameData(HangmanGameData):
+    """Represent a Hangman game whose secret word changes to the largest family of candidates on each new guess.
+
+    The controller settles each guess before judging it, and the secret word is always one of the candidates, so it is
+    consistent with all the guesses and the controller checks the guesses and the end of the game exactly as for a fixed
+    secret word.
+
+    Attributes:
+        word_families: (WordFamilies) The candidate secret words, all the corpus words of the length of the drawn secret
+            word if not given.
+    """
+
+    word_families: Optional[WordFamilies] = field(default=None, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Draw the secret word if not given, and start with the corpus words of its length as candidates."""
+        super().__post_init__()
+        if self.word_families is None:
+            self.word_families = WordFamilies(get_corpus_solver(), len(self.secret_word))
+
+    def settle_guess(self, letter: str) -> None:
+        """Keep the largest family of a new guess letter, and move the secret word to it.
+
+        Settling a letter again keeps every candidate, as they all have the letter at the same positions.
+
+        Args:
+            letter: A single character.
+        """
+        if self.game_finished or self.is_letter_guessed(letter):
+            return
+        self.word_families.keep_largest_family(letter)
+        representative = self.word_families.representative
+        if representative is not None and representative != self.secret_word_index:
+            # Assigning the secret word rebuilds the guess state for the new representative.
+            self.secret_word_index = representative
+            self.secret_word = str(self.word_families.position_masks.solver.words[representative])
@@ -0,0 +1,258 @@
+"""Module to define the optional instrumentation of the game loop.
+
+The controller times each phase of a turn and counts the game events into a metrics sink. Sinks only update counters
+in memory on the game loop, and the file sinks write their snapshots from a background thread, so writing metrics
+never blocks a turn. Without a sink, the controller skips all timing calls.
+"""
+
+import bisect
+import json
+import os
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+PHASE_RENDER = "render"
+
+PHASE_INPUT_WAIT = "input_wait"
+
+PHASE_EVALUATE = "evaluate"
+
+TURN_PHASES = (PHASE_RENDER, PHASE_INPUT_WAIT, PHASE_EVALUATE)
+
+COUNTER_GAMES = "games"
+
+COUNTER_WINS = "wins"
+
+COUNTER_LOSSES = "losses"
+
+COUNTER_INVALID_INPUTS = "invalid_inputs"
+
+COUNTERS = (COUNTER_GAMES, COUNTER_WINS, COUNTER_LOSSES, COUNTER_INVALID_INPUTS)
+
+# Upper bounds in seconds of the latency histogram buckets, from rendering in microseconds to players thinking.
+LATENCY_BUCKETS = (0.00001, 0.0001, 0.001, 0.01, 0.1, 1.0, 10.0, 60.0)
+
+DEFAULT_FLUSH_INTERVAL = 5.0
+
+METRICS_PREFIX = "hangman"
+
+
+class LatencyHistogram:
+    """Count observed latencies into buckets, like a Prometheus histogram."""
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        """Create an empty histogram.
+
+        Attributes:
+            buckets: Upper bounds of the buckets in seconds, in ascending order.
+            bucket_counts: Number of observations per bucket, the last one counting those above all bounds.
+            count: Number of observations.
+            sum_seconds: Sum of the observed latencies.
+        """
+        self.buckets = buckets
+        self.bucket_counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum_seconds = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """Count one observed latency.
+
+        Args:
+            seconds: The latency.
+        """
+        self.bucket_counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.sum_seconds += seconds
+
+    def cumulative_counts(self) -> List[Tuple[str, int]]:
+        """Get the number of observations less than or equal to each bound, ending with the '+Inf' bound.
+
+        Returns:
+            list: The bound as text and the cumulative count of each bucket.
+        """
+        bounds = [repr(bound) for bound in self.buckets] + ["+Inf"]
+        cumulative, total = [], 0
+        for bound, bucket_count in zip(bounds, self.bucket_counts):
+            total += bucket_count
+            cumulative.append((bound, total))
+        return cumulative
+
+    def to_dict(self) -> dict:
+        """Get the histogram, ready to be serialized as JSON."""
+        return {"count": self.count, "sum_seconds": self.sum_seconds, "buckets": dict(self.cumulative_counts())}
+
+
+class MetricsSink:
+    """Base class of the sinks receiving the metrics of the game loop. It discards everything."""
+
+    def observe(self, phase: str, seconds: float) -> None:
+        """Record the duration of a turn phase.
+
+        Args:
+            phase: One of TURN_PHASES.
+            seconds: The duration of the phase.
+        """
+
+    def observe_since(self, phase: str, started: float) -> float:
+        """Record the duration of a turn phase which started at a time.perf_counter() mark.
+
+        Args:
+            phase: One of TURN_PHASES.
+            started: The time.perf_counter() value when the phase started.
+
+        Returns:
+            float: The time.perf_counter() value when the phase ended, which is when the next phase starts.
+        """
+        now = time.perf_counter()
+        self.observe(phase, now - started)
+        return now
+
+    def increment(self, counter: str, amount: int = 1) -> None:
+        """Increase a game event counter.
+
+        Args:
+            counter: One of COUNTERS.
+            amount: The increase.
+        """
+
+    def close(self) -> None:
+        """Release the resources of the sink."""
+
+
+class HistogramSink(MetricsSink):
+    """Keep the metrics in memory, as one latency histogram per turn phase and the event counters."""
+
+    def __init__(self):
+        """Create a sink with empty metrics.
+
+        Attributes:
+            histograms: The latency histogram of each turn phase.
+            counters: The game event counters.
+        """
+        self.histograms: Dict[str, LatencyHistogram] = {phase: LatencyHistogram() for phase in TURN_PHASES}
+        self.counters: Dict[str, int] = dict.fromkeys(COUNTERS, 0)
+        # Guard the metrics against a background thread taking a snapshot in the middle of an update.
+        self._lock = threading.Lock()
+
+    def observe(self, phase: str, seconds: float) -> None:
+        """Count the duration of a turn phase into its histogram."""
+        with self._lock:
+            self.histograms[phase].observe(seconds)
+
+    def increment(self, counter: str, amount: int = 1) -> None:
+        """Increase a game event counter."""
+        with self._lock:
+            self.counters[counter] += amount
+
+    def snapshot(self) -> dict:
+        """Get a consistent copy of the metrics.
+
+        Returns:
+            dict: The counters and the histogram of each turn phase, ready to be serialized as JSON.
+        """
+        with self._lock:
+            return {
+                "counters": dict(self.counters),
+                "phases": {phase: histogram.to_dict() for phase, histogram in self.histograms.items()},
+            }
+
+
+class PeriodicFileSink(HistogramSink):
+    """Keep the metrics in memory and write them to a file from a background thread at a fixed interval.
+
+    The file is replaced atomically, so readers never see a partially written snapshot. The last snapshot is written
+    when the sink is closed.
+    """
+
+    def __init__(self, path: str, flush_interval: float = DEFAULT_FLUSH_INTERVAL):
+        """Create the sink and start its writer thread.
+
+        Attributes:
+            path: Path of the metrics file.
+            flush_interval: Seconds between two writes of the file.
+        """
+        super().__init__()
+        self.path = path
+        self.flush_interval = flush_interval
+        self._closed = threading.Event()
+        self._writer = threading.Thread(target=self._write_periodically, name="hangman-metrics", daemon=True)
+        self._writer.start()
+
+    def render(self, snapshot: dict) -> str:
+        """Format a snapshot of the metrics as the file content.
+
+        Args:
+            snapshot: The metrics returned by snapshot().
+
+        Returns:
+            str: The file content.
+        """
+        raise NotImplementedError
+
+    def write(self) -> None:
+        """Write the current metrics to the file."""
+        content = self.render(self.snapshot())
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, mode="w", encoding="utf-8") as metrics_file:
+            metrics_file.write(content)
+        os.replace(tmp_path, self.path)
+
+    def _write_periodically(self) -> None:
+        """Write the metrics at the flush interval until the sink is closed."""
+        while not self._closed.wait(self.flush_interval):
+            self.write()
+
+    def close(self) -> None:
+        """Stop the writer thread and write the last snapshot."""
+        self._closed.set()
+        self._writer.join()
+        self.write()
+
+
+class JsonFileSink(PeriodicFileSink):
+    """Write the metrics to a JSON file at a fixed interval."""
+
+    def render(self, snapshot: dict) -> str:
+        """Format the metrics as JSON."""
+        return json.dumps(snapshot, indent=2)
+
+
+class PrometheusFileSink(PeriodicFileSink):
+    """Write the metrics to a file in the Prometheus text format at a fixed interval, e.g. for a node exporter."""
+
+    def render(self, snapshot: dict) -> str:
+        """Format the metrics in the Prometheus text exposition format."""
+        lines = []
+        for counter, value in snapshot["counters"].items():
+            name = f"{METRICS_PREFIX}_{counter}_total"
+            lines += [f"# TYPE {name} counter", f"{name} {value}"]
+
+        name = f"{METRICS_PREFIX}_turn_phase_seconds"
+        lines.append(f"# TYPE {name} histogram")
+        for phase, histogram in snapshot["phases"].items():
+            for bound, cumulative_count in histogram["buckets"].items():
+                lines.append(f'{name}_bucket{{phase="{phase}",le="{bound}"}} {cumulative_count}')
+            lines.append(f'{name}_sum{{phase="{phase}"}} {histogram["sum_seconds"]}')
+            lines.append(f'{name}_count{{phase="{phase}"}} {histogram["count"]}')
+        return "\n".join(lines) + "\n"
+
+
+# Registered file sinks by format name, each is created with the path of the metrics file.
+FILE_SINKS = {
+    "json": JsonFileSink,
+    "prometheus": PrometheusFileSink,
+}
+
+
+def create_file_sink(metrics_format: str, path: Optional[str]) -> Optional[MetricsSink]:
+    """Create a file sink for the metrics of the game loop.
+
+    Args:
+        metrics_format: One of the format names in FILE_SINKS.
+        path: Path of the metrics file, no sink is created if not given.
+
+    Returns:
+        MetricsSink: The sink, None if no path is given.
+    """
+    return FILE_SINKS[metrics_format](path) if path else None
@@ -0,0 +1,347 @@
+"""Module to define the SQLite leaderboard and history of finished Hangman games.
+
+Finished games are queued in memory and written by a background thread, which takes every game queued while it was
+writing the previous batch and writes them in one transaction. Recording a game is a queue put, so the game loop and
+the server never wait on the disk, and the number of transactions drops as the load grows.
+
+Each batch appends the games to the games table and updates the totals of their players in the players table in the
+same transaction. The leaderboard is then an index scan of the players table, and the history of a player an index
+range scan of the games table, whatever the number of games recorded.
+"""
+
+import os
+import pathlib
+import queue
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import List, Optional
+
+from hangman.constants import MAX_MISSED_GUESSES
+from hangman.models import HangmanGameData
+
+DEFAULT_LEADERBOARD_PATH = "hangman_leaderboard.db"
+
+DEFAULT_BATCH_SIZE = 512
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    player TEXT NOT NULL,
+    secret_word TEXT NOT NULL,
+    missed_letters TEXT NOT NULL,
+    correct_letters TEXT NOT NULL,
+    won INTEGER NOT NULL,
+    score INTEGER NOT NULL,
+    finished_at REAL NOT NULL
+);
+-- The entries of an index end with the rowid, so this index also orders the games of a player by recording order.
+CREATE INDEX IF NOT EXISTS games_by_player ON games (player);
+CREATE TABLE IF NOT EXISTS players (
+    player TEXT PRIMARY KEY,
+    games INTEGER NOT NULL,
+    wins INTEGER NOT NULL,
+    total_score INTEGER NOT NULL,
+    best_score INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS players_by_score ON players (total_score DESC, wins DESC, player);
+"""
+
+INSERT_GAME = """
+INSERT INTO games (player, secret_word, missed_letters, correct_letters, won, score, finished_at)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+UPDATE_PLAYER = """
+INSERT INTO players (player, games, wins, total_score, best_score) VALUES (?, 1, ?, ?, ?)
+ON CONFLICT (player) DO UPDATE SET
+    games = games + 1,
+    wins = wins + excluded.wins,
+    total_score = total_score + excluded.total_score,
+    best_score = max(best_score, excluded.best_score)
+"""
+
+SELECT_TOP_PLAYERS = """
+SELECT player, games, wins, total_score, best_score FROM players
+ORDER BY total_score DESC, wins DESC, player LIMIT ?
+"""
+
+SELECT_PLAYER_GAMES = """
+SELECT player, secret_word, missed_letters, correct_letters, won, finished_at FROM games
+WHERE player = ? ORDER BY id DESC LIMIT ?
+"""
+
+
+def score_game(secret_word: str, missed_letters: str, won: bool) -> int:
+    """Score a finished game: the distinct letters of the secret word plus the misses left, nothing for a loss.
+
+    Args:
+        secret_word: The secret word of the game.
+        missed_letters: The missed letters of the game.
+        won: Whether the player has won the game.
+
+    Returns:
+        int: The score.
+    """
+    return len(set(secret_word)) + MAX_MISSED_GUESSES - len(missed_letters) if won else 0
+
+
+@dataclass(frozen=True)
+class GameRecord:
+    """Represent a finished game in the history.
+
+    Attributes:
+        player: (str) Name of the player.
+        secret_word: (str) The secret word of the game.
+        missed_letters: (str) The missed letters in guessing order.
+        correct_letters: (str) The correct letters in guessing order.
+        won: (bool) Whether the player has won the game.
+        finished_at: (float) Time the game finished at, in seconds since the epoch.
+    """
+
+    player: str
+    secret_word: str
+    missed_letters: str
+    correct_letters: str
+    won: bool
+    finished_at: float
+
+    @classmethod
+    def from_game(cls, player: str, hangman_game_data: HangmanGameData, won: bool) -> "GameRecord":
+        """Copy the outcome of a finished game, the data object may be reused for the next game.
+
+        Args:
+            player: Name of the player.
+            hangman_game_data: The data object of the finished game.
+            won: Whether the player has won the game.
+
+        Returns:
+            GameRecord: The record.
+        """
+        return cls(
+            player,
+            hangman_game_data.secret_word,
+            "".join(hangman_game_data.missed_letters),
+            "".join(hangman_game_data.correct_letters),
+            won,
+            time.time(),
+        )
+
+    @property
+    def score(self) -> int:
+        """Get the score of the game."""
+        return score_game(self.secret_word, self.missed_letters, self.won)
+
+
+@dataclass(frozen=True)
+class PlayerStanding:
+    """Represent the totals of a player on the leaderboard.
+
+    Attributes:
+        player: (str) Name of the player.
+        games: (int) Number of finished games.
+        wins: (int) Number of games won.
+        total_score: (int) Sum of the scores of the games.
+        best_score: (int) Best score of a game.
+    """
+
+    player: str
+    games: int
+    wins: int
+    total_score: int
+    best_score: int
+
+
+def connect(path: str) -> sqlite3.Connection:
+    """Open a leaderboard database and create its tables if missing.
+
+    The database is put in write-ahead log mode, so reading the leaderboard does not block the writer.
+
+    Args:
+        path: Path of the database file.
+
+    Returns:
+        Connection: The connection.
+    """
+    connection = sqlite3.connect(path, check_same_thread=False)
+    connection.execute("PRAGMA journal_mode = WAL")
+    # In write-ahead log mode, a commit can be lost by a power failure but never corrupts the database.
+    connection.execute("PRAGMA synchronous = NORMAL")
+    connection.executescript(SCHEMA)
+    return connection
+
+
+def connect_read_only(path: str) -> sqlite3.Connection:
+    """Open an existing leaderboard database for queries only, so a mistyped path does not create an empty database.
+
+    Args:
+        path: Path of the database file.
+
+    Returns:
+        Connection: The read-only connection.
+
+    Raises:
+        FileNotFoundError: If there is no database file at the path.
+    """
+    if not os.path.isfile(path):
+        raise FileNotFoundError(f"No leaderboard database at '{path}'.")
+    uri = f"{pathlib.Path(os.path.abspath(path)).as_uri()}?mode=ro"
+    return sqlite3.connect(uri, uri=True, check_same_thread=False)
+
+
+def write_games(connection: sqlite3.Connection, records: List[GameRecord]) -> None:
+    """Append finished games to the history and update the totals of their players, in one transaction.
+
+    Args:
+        connection: The connection to the leaderboard database.
+        records: The finished games.
+    """
+    with connection:
+        connection.executemany(
+            INSERT_GAME,
+            [
+                (
+                    record.player,
+                    record.secret_word,
+                    record.missed_letters,
+                    record.correct_letters,
+                    record.won,
+                    record.score,
+                    record.finished_at,
+                )
+                for record in records
+            ],
+        )
+        connection.executemany(
+            UPDATE_PLAYER, [(record.player, record.won, record.score, record.score) for record in records]
+        )
+
+
+class LeaderboardWriter:  # pylint: disable=too-many-instance-attributes
+    """Record finished games from a background thread, batching the games queued meanwhile in one transaction."""
+
+    def __init__(self, path: str = DEFAULT_LEADERBOARD_PATH, batch_size: int = DEFAULT_BATCH_SIZE):
+        """Create the database if missing and start the writer thread.
+
+        Attributes:
+            path: Path of the database file.
+            batch_size: Maximum number of games written in one transaction.
+            failed_games: Number of games which could not be written, e.g. because the disk is full.
+        """
+        self.path = path
+        self.batch_size = batch_size
+        self.failed_games = 0
+        self._closed = False
+        # Held while a game is queued and while closing, so no game is queued behind the stop marker of close().
+        self._lock = threading.Lock()
+        # The tables are created before returning, so an unusable path fails here rather than in the writer thread.
+        self._connection = connect(path)
+        self._queue: "queue.Queue[Optional[GameRecord]]" = queue.Queue()
+        self._writer = threading.Thread(target=self._write_batches, name="hangman-leaderboard", daemon=True)
+        self._writer.start()
+
+    def record_game(self, player: str, hangman_game_data: HangmanGameData, won: bool) -> None:
+        """Queue a finished game to be written, without waiting for the disk.
+
+        Args:
+            player: Name of the player.
+            hangman_game_data: The data object of the finished game.
+            won: Whether the player has won the game.
+
+        Raises:
+            ValueError: If the writer is closed, since the game could not be written anymore.
+        """
+        record = GameRecord.from_game(player, hangman_game_data, won)
+        with self._lock:
+            if self._closed:
+                raise ValueError("Cannot record a game on a closed leaderboard writer.")
+            self._queue.put(record)
+
+    def _next_batch(self) -> List[Optional[GameRecord]]:
+        """Wait for a queued game, then take the games queued after it, up to the batch size."""
+        batch = [self._queue.get()]
+        while len(batch) < self.batch_size and batch[-1] is not None:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _write_batches(self) -> None:
+        """Write the queued games in batches until the writer is closed."""
+        while True:
+            batch = self._next_batch()
+            records = [record for record in batch if record is not None]
+            try:
+                if records:
+                    write_games(self._connection, records)
+            except sqlite3.Error:
+                self.failed_games += len(records)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            if len(records) < len(batch):
+                return
+
+    def flush(self) -> None:
+        """Wait until the games queued so far are written."""
+        self._queue.join()
+
+    def close(self) -> None:
+        """Write the queued games, then stop the writer thread and close the database. Closing again does nothing."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(None)
+        self._writer.join()
+        self._connection.close()
+
+
+class Leaderboard:
+    """Query the leaderboard and the history of the players."""
+
+    def __init__(self, path: str = DEFAULT_LEADERBOARD_PATH):
+        """Open the existing database read-only.
+
+        Attributes:
+            path: Path of the database file.
+
+        Raises:
+            FileNotFoundError: If there is no database file at the path.
+        """
+        self.path = path
+        self._connection = connect_read_only(path)
+
+    def top_players(self, limit: int = 10) -> List[PlayerStanding]:
+        """Get the players with the best total scores.
+
+        Args:
+            limit: Maximum number of players.
+
+        Returns:
+            list[PlayerStanding]: The players from the best total score down, ties broken by wins then name.
+        """
+        return [PlayerStanding(*row) for row in self._connection.execute(SELECT_TOP_PLAYERS, (limit,))]
+
+    def player_games(self, player: str, limit: int = 10) -> List[GameRecord]:
+        """Get the last games of a player.
+
+        Args:
+            player: Name of the player.
+            limit: Maximum number of games.
+
+        Returns:
+            list[GameRecord]: The games from the most recent one back.
+        """
+        return [
+            GameRecord(name, secret_word, missed_letters, correct_letters, bool(won), finished_at)
+            for name, secret_word, missed_letters, correct_letters, won, finished_at in self._connection.execute(
+                SELECT_PLAYER_GAMES, (player, limit)
+            )
+        ]
+
+    def close(self) -> None:
+        """Close the database."""
+        self._connection.close()
@@ -1,13 +1,40 @@
 """Module to define model classes of the Model-View-Controller design pattern."""
 
 from dataclasses import dataclass, field
-from typing import List
+from typing import Any, Dict, List, Optional
 
-from hangman.utils import get_random_word
+from hangman.utils import draw_random_word, letter_mask, letters_mask
+
+
+class GuessStateField:  # pylint: disable=too-few-public-methods
+    """Data descriptor of a HangmanGameData field which the guess state is built from.
+
+    Assigning the field rebuilds the bit masks and the revealed letters buffer. The descriptor has no __get__, so
+    reading the field still finds the value in the instance dict at plain attribute speed.
+    """
+
+    def __init__(self, name: str):
+        """Intercept the assignments of a field.
+
+        Attributes:
+            name: Name of the field.
+        """
+        self.name = name
+
+    def __set__(self, instance: "HangmanGameData", value: Any) -> None:
+        """Set the field, and rebuild the guess state if it has already been built by __post_init__.
+
+        Args:
+            instance: The game data.
+            value: New value of the field.
+        """
+        instance.__dict__[self.name] = value
+        if "secret_word_mask" in instance.__dict__:
+            instance.refresh_guess_state()
 
 
 @dataclass
-class HangmanGameData:
+class HangmanGameData:  # pylint: disable=too-many-instance-attributes
     """Represent the information of a Hangman game.
 
     Reasons of using dataclass:
@@ -16,17 +43,138 @@ class HangmanGameData:
 
     Attributes:
         player_guess: (str) The current letter guessed by player.
-        secret_word: (str) Random generated secret word of the current game.
+        secret_word: (str) Random generated secret word of the current game, drawn from WORDS_LIST if None.
         missed_letters: (List[str]) List of missed letters of the current game.
         correct_letters: (List[str]) List of correct letters of the current game.
         game_finished: (bool) Game finish indicator.
+        secret_word_index: (int) Index of the secret word in WORDS_LIST, -1 if unknown.
+        secret_word_mask: (int) Bit mask of the letters in the secret word.
+        missed_mask: (int) Bit mask of the missed letters.
+        correct_mask: (int) Bit mask of the correct letters.
+
+    The letter lists keep the guessing order for display, while the bit masks make the win and duplicate guess checks
+    single integer operations, and the revealed letters buffer is only updated at the positions of a new correct
+    letter. Use add_missed_letter() and add_correct_letter() to keep them in sync. Assigning the secret word or a letter
+    list rebuilds the guess state, while changing a letter list in place requires calling refresh_guess_state().
     """
 
     player_guess: str = field(default="")
-    secret_word: str = field(default_factory=get_random_word)
+    secret_word: Optional[str] = field(default=None)
     missed_letters: List[str] = field(default_factory=list)
     correct_letters: List[str] = field(default_factory=list)
     game_finished: bool = field(default=False)
+    secret_word_index: int = field(default=-1, compare=False)
+    secret_word_mask: int = field(default=0, init=False, repr=False, compare=False)
+    missed_mask: int = field(default=0, init=False, repr=False, compare=False)
+    correct_mask: int = field(default=0, init=False, repr=False, compare=False)
+    _letter_positions: Dict[str, List[int]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _revealed_letters: List[str] = field(default_factory=list, init=False, repr=False, compare=False)
+    _revealed_text: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Draw the secret word if not given, then build the guess state from the secret word and letter lists."""
+        if self.secret_word is None:
+            self.secret_word_index, self.secret_word = draw_random_word()
+        self.refresh_guess_state()
+
+    def refresh_guess_state(self) -> None:
+        """Rebuild the bit masks and the revealed letters buffer from the secret word and letter lists."""
+        self.secret_word_mask = letters_mask(self.secret_word)
+        self.missed_mask = letters_mask(self.missed_letters)
+        self.correct_mask = letters_mask(self.correct_letters)
+
+        # Index the positions of each letter, so a correct guess only touches the positions of that letter.
+        self._letter_positions = {}
+        for idx, secret_word_letter in enumerate(self.secret_word):
+            self._letter_positions.setdefault(secret_word_letter, []).append(idx)
+        self._revealed_letters = ["_"] * len(self.secret_word)
+        for correct_letter in set(self.correct_letters):
+            self._reveal_letter(correct_letter)
+
+    def reset(self, secret_word: str, secret_word_index: int = -1) -> None:
+        """Start a new game in this data object, which is cheaper than creating one per game in the simulations.
+
+        Args:
+            secret_word: Secret word of the new game.
+            secret_word_index: Index of the secret word in WORDS_LIST, -1 if unknown.
+        """
+        self.player_guess = ""
+        self.game_finished = False
+        self.secret_word_index = secret_word_index
+        # New lists, as the caller may keep those of the previous game. They are put in the instance dict directly, so
+        # the guess state is only rebuilt once, by the assignment of the secret word.
+        self.__dict__["missed_letters"] = []
+        self.__dict__["correct_letters"] = []
+        self.secret_word = secret_word
+
+    def _reveal_letter(self, letter: str) -> None:
+        """Show a letter at its positions in the revealed letters buffer and drop the cached text.
+
+        Args:
+            letter: The correct letter.
+        """
+        for idx in self._letter_positions.get(letter, ()):
+            self._revealed_letters[idx] = letter
+        self._revealed_text = None
+
+    @property
+    def guessed_mask(self) -> int:
+        """Get the bit mask of all letters that have been guessed by the player."""
+        return self.missed_mask | self.correct_mask
+
+    @property
+    def is_secret_word_revealed(self) -> bool:
+        """Check whether every letter of the secret word has been guessed correctly."""
+        return not self.secret_word_mask & ~self.correct_mask
+
+    def is_letter_guessed(self, letter: str) -> bool:
+        """Check whether a letter has already been guessed by the player.
+
+        Args:
+            letter: A single character.
+
+        Returns:
+            bool: True if the letter is one of the missed or correct letters.
+        """
+        return bool(self.guessed_mask & letter_mask(letter))
+
+    def settle_guess(self, letter: str) -> None:
+        """Prepare the game for a guess letter before the guess is judged, nothing to do for a fixed secret word.
+
+        Args:
+            letter: A single character.
+        """
+        del letter
+
+    def is_letter_in_secret_word(self, letter: str) -> bool:
+        """Check whether a letter occurs in the secret word.
+
+        Args:
+            letter: A single character.
+
+        Returns:
+            bool: True if the letter occurs in the secret word.
+        """
+        return bool(self.secret_word_mask & letter_mask(letter))
+
+    def add_missed_letter(self, letter: str) -> None:
+        """Save a missed letter to the missed letters list and mask.
+
+        Args:
+            letter: The missed letter.
+        """
+        self.missed_letters.append(letter)
+        self.missed_mask |= letter_mask(letter)
+
+    def add_correct_letter(self, letter: str) -> None:
+        """Save a correct letter to the correct letters list and mask.
+
+        Args:
+            letter: The correct letter.
+        """
+        self.correct_letters.append(letter)
+        self.correct_mask |= letter_mask(letter)
+        self._reveal_letter(letter)
 
     @property
     def already_guessed_letters(self) -> List[str]:
@@ -37,6 +185,15 @@ class HangmanGameData:
         """
         return list(set(self.missed_letters + self.correct_letters))
 
+    @property
+    def revealed_letters(self) -> List[str]:
+        """Get the letter at each position of the secret word, '_' at the positions which have not been revealed yet.
+
+        Returns:
+            list[str]: The revealed letters, e.g. ['_', 'a', 'm', 'e', '_'] for 'camel' with correct letters 'a, e, m'.
+        """
+        return list(self._revealed_letters)
+
     @property
     def secret_word_with_correct_letters(self) -> str:
         """Combining the secret word with correct guessed letters.
@@ -44,12 +201,12 @@ class HangmanGameData:
         Returns:
             str: E.g. secret word is 'camel', correct guessed letters are 'a, e, m', then result will be '_ a m e _'.
         """
-        blanks = "_" * len(self.secret_word)
+        if self._revealed_text is None:
+            # Join the revealed letters with spaces in between, and cache the result until the next correct guess.
+            self._revealed_text = " ".join(self._revealed_letters)
+        return self._revealed_text
 
-        # Replace blanks with correctly guessed letters.
-        for idx, secret_word_letter in enumerate(self.secret_word):
-            if secret_word_letter in self.correct_letters:
-                blanks = f"{blanks[:idx]}{secret_word_letter}{blanks[idx + 1:]}"
 
-        # Return the secret word with spaces in between each letter.
-        return " ".join(blanks)
+# Installed after the dataclass is built, which keeps the default values of the fields for __init__.
+for _field_name in ("secret_word", "missed_letters", "correct_letters"):
+    setattr(HangmanGameData, _field_name, GuessStateField(_field_name))
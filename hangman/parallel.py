@@ -0,0 +1,118 @@
+"""Module to define the multi-core runner of simulated Hangman games.
+
+The games are split into fixed-size chunks, and every chunk is played by its own HeadlessGameEngine seeded from the
+master seed and the chunk index. The chunking does not depend on the number of workers, so the results for a master
+seed are identical whether the chunks are played in one process or spread over a process pool.
+"""
+
+import hashlib
+import multiprocessing
+import time
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+from hangman.shared_corpus import SharedCorpus, attach_shared_corpus
+from hangman.simulation import STRATEGIES, HeadlessGameEngine, SimulationSummary
+
+DEFAULT_CHUNK_SIZE = 1000
+
+
+@dataclass(frozen=True)
+class SimulationChunk:
+    """Represent a batch of games to be played by one worker.
+
+    Attributes:
+        index: (int) Position of the chunk in the simulation.
+        games: (int) Number of games in the chunk.
+        seed: (int) Seed of the random number generator of the chunk.
+        strategy: (str) Name of the registered guessing strategy.
+    """
+
+    index: int
+    games: int
+    seed: int
+    strategy: str
+
+
+def derive_seed(master_seed: int, chunk_index: int) -> int:
+    """Derive the seed of a chunk from the master seed.
+
+    Args:
+        master_seed: Seed of the whole simulation.
+        chunk_index: Position of the chunk in the simulation.
+
+    Returns:
+        int: A 64-bit seed which is independent of the seeds of the other chunks.
+    """
+    digest = hashlib.sha256(f"{master_seed}:{chunk_index}".encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "little")
+
+
+def iter_chunks(games: int, strategy: str, master_seed: int, chunk_size: int) -> Iterator[SimulationChunk]:
+    """Split the games of a simulation into chunks.
+
+    Args:
+        games: Total number of games to be played.
+        strategy: Name of the registered guessing strategy.
+        master_seed: Seed of the whole simulation.
+        chunk_size: Maximum number of games per chunk.
+
+    Yields:
+        SimulationChunk: The chunks in order.
+    """
+    for index, start in enumerate(range(0, games, chunk_size)):
+        yield SimulationChunk(index, min(chunk_size, games - start), derive_seed(master_seed, index), strategy)
+
+
+def run_chunk(chunk: SimulationChunk) -> SimulationSummary:
+    """Play the games of a chunk, this is run in the worker processes.
+
+    Args:
+        chunk: The chunk to be played.
+
+    Returns:
+        SimulationSummary: The summary results of the chunk.
+    """
+    return HeadlessGameEngine(STRATEGIES[chunk.strategy], seed=chunk.seed).run(chunk.games)
+
+
+def run_parallel_simulation(
+    games: int,
+    strategy: str,
+    master_seed: int,
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> SimulationSummary:
+    """Play simulated games across a process pool and merge the results as the chunks finish.
+
+    Args:
+        games: Total number of games to be played.
+        strategy: Name of the registered guessing strategy.
+        master_seed: Seed of the whole simulation.
+        workers: Number of worker processes, the number of CPUs if not given. 1 plays all chunks in this process.
+        chunk_size: Maximum number of games per chunk.
+
+    Returns:
+        SimulationSummary: The summary results of all games, elapsed_seconds is the wall-clock time of the run.
+
+    Raises:
+        ValueError: If the strategy is not registered.
+    """
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Unknown guessing strategy '{strategy}'.")
+
+    summary = SimulationSummary()
+    start = time.perf_counter()
+    chunks = iter_chunks(games, strategy, master_seed, chunk_size)
+    if workers == 1:
+        for chunk_summary in map(run_chunk, chunks):
+            summary.merge(chunk_summary)
+    else:
+        # The workers read the corpus, and the solver, index or decision tree the strategy uses, from shared memory.
+        with SharedCorpus.for_strategies([STRATEGIES[strategy]]) as shared_corpus, multiprocessing.Pool(
+            workers, initializer=attach_shared_corpus, initargs=(shared_corpus.handle,)
+        ) as pool:
+            for chunk_summary in pool.imap(run_chunk, chunks):
+                summary.merge(chunk_summary)
+    summary.elapsed_seconds = time.perf_counter() - start
+    return summary
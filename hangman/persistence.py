@@ -0,0 +1,432 @@
+"""Module to define the compact binary snapshots and the append-only journal of Hangman games.
+
+A snapshot stores the secret word with its index in WORDS_LIST (-1 if it is not in the corpus), the game flags and the
+guessed letters in guessing order. The bit masks and the revealed letters are rebuilt from them when the snapshot is
+decoded, and the index is only kept if it still points to the same word.
+
+The journal records new games, guesses and removed games by session id. Records are buffered and written in batches,
+and restore() rebuilds the games from the last checkpoint file plus the journal written after it. Both files start with
+a header record holding the checkpoint generation and the corpus digest: a journal of an older generation than the
+checkpoint has already been folded into it and is skipped, and the word indexes of a file written for another corpus
+are ignored.
+"""
+
+import os
+import struct
+import time
+from typing import BinaryIO, Dict, Iterator, Mapping, Optional, Sequence, Tuple
+
+from hangman.constants import WORDS_LIST
+from hangman.corpus import corpus_digest
+from hangman.controllers import HangmanGameController
+from hangman.models import HangmanGameData
+from hangman.views import HangmanGameView
+
+SNAPSHOT_VERSION = 2
+
+# Snapshot header: version, flags, index of the secret word in the corpus (-1 if the word is not in the corpus).
+SNAPSHOT_HEADER = struct.Struct("<BBq")
+
+SNAPSHOT_FLAG_GAME_FINISHED = 0x01
+
+# Length prefix of the strings in a snapshot: the secret word, the missed letters and the correct letters.
+STRING_LENGTH = struct.Struct("<H")
+
+# Journal record header: record type, length of the session id, length of the payload.
+RECORD_HEADER = struct.Struct("<BBI")
+
+RECORD_NEW_GAME = 1
+
+RECORD_GUESS = 2
+
+RECORD_REMOVED = 3
+
+RECORD_FILE_HEADER = 4
+
+# Payload of the file header record: checkpoint generation, SHA-256 digest of the corpus.
+FILE_HEADER = struct.Struct("<Q32s")
+
+JOURNAL_FILENAME = "journal.bin"
+
+CHECKPOINT_FILENAME = "checkpoint.bin"
+
+DEFAULT_BATCH_SIZE = 256
+
+DEFAULT_FLUSH_INTERVAL = 1.0
+
+DEFAULT_CHECKPOINT_RECORDS = 65536
+
+DEFAULT_CHECKPOINT_INTERVAL = 300.0
+
+
+def _pack_string(text: str) -> bytes:
+    """Encode a string with its length prefix."""
+    encoded = text.encode("utf-8")
+    return STRING_LENGTH.pack(len(encoded)) + encoded
+
+
+def _unpack_string(data: bytes, offset: int) -> Tuple[str, int]:
+    """Decode a string with its length prefix.
+
+    Returns:
+        str, int: The string and the offset after it.
+    """
+    (length,) = STRING_LENGTH.unpack_from(data, offset)
+    start = offset + STRING_LENGTH.size
+    end = start + length
+    return data[start:end].decode("utf-8"), end
+
+
+def encode_snapshot(hangman_game_data: HangmanGameData, words: Sequence[str] = WORDS_LIST) -> bytes:
+    """Encode a game into a compact binary snapshot.
+
+    Args:
+        hangman_game_data: The data object of the game.
+        words: The corpus the secret word index refers to.
+
+    Returns:
+        bytes: The snapshot.
+    """
+    word_index = hangman_game_data.secret_word_index
+    if not (0 <= word_index < len(words) and words[word_index] == hangman_game_data.secret_word):
+        word_index = -1
+    flags = SNAPSHOT_FLAG_GAME_FINISHED if hangman_game_data.game_finished else 0
+    return b"".join(
+        (
+            SNAPSHOT_HEADER.pack(SNAPSHOT_VERSION, flags, word_index),
+            _pack_string(hangman_game_data.secret_word),
+            _pack_string("".join(hangman_game_data.missed_letters)),
+            _pack_string("".join(hangman_game_data.correct_letters)),
+        )
+    )
+
+
+def decode_snapshot(data: bytes, words: Sequence[str] = WORDS_LIST) -> HangmanGameData:
+    """Decode a game from a binary snapshot.
+
+    The secret word index is dropped if it does not point to the secret word in the given corpus, e.g. when the corpus
+    has changed since the snapshot was written.
+
+    Args:
+        data: The snapshot.
+        words: The corpus the secret word index refers to.
+
+    Returns:
+        HangmanGameData: The data object of the game.
+
+    Raises:
+        ValueError: If the snapshot version is not supported.
+    """
+    version, flags, word_index = SNAPSHOT_HEADER.unpack_from(data, 0)
+    if version != SNAPSHOT_VERSION:
+        raise ValueError(f"Unsupported snapshot version {version}.")
+    secret_word, offset = _unpack_string(data, SNAPSHOT_HEADER.size)
+    missed_letters, offset = _unpack_string(data, offset)
+    correct_letters, offset = _unpack_string(data, offset)
+    if not (0 <= word_index < len(words) and words[word_index] == secret_word):
+        word_index = -1
+    return HangmanGameData(
+        secret_word=secret_word,
+        missed_letters=list(missed_letters),
+        correct_letters=list(correct_letters),
+        game_finished=bool(flags & SNAPSHOT_FLAG_GAME_FINISHED),
+        secret_word_index=word_index,
+    )
+
+
+def encode_record(record_type: int, session_id: str, payload: bytes = b"") -> bytes:
+    """Encode a journal record.
+
+    Args:
+        record_type: One of RECORD_NEW_GAME, RECORD_GUESS, RECORD_REMOVED and RECORD_FILE_HEADER.
+        session_id: The session id the record belongs to, empty for the file header.
+        payload: The snapshot of a new game, the guess letter, or the file header.
+
+    Returns:
+        bytes: The record.
+    """
+    encoded_id = session_id.encode("utf-8")
+    return RECORD_HEADER.pack(record_type, len(encoded_id), len(payload)) + encoded_id + payload
+
+
+def iter_records(journal_file: BinaryIO) -> Iterator[Tuple[int, str, bytes]]:
+    """Read the records of a journal file.
+
+    A truncated record at the end of the file, left by a crash in the middle of a write, is ignored.
+
+    Args:
+        journal_file: The journal file opened in binary mode.
+
+    Yields:
+        int, str, bytes: The record type, the session id and the payload of each record.
+    """
+    while True:
+        header = journal_file.read(RECORD_HEADER.size)
+        if len(header) < RECORD_HEADER.size:
+            return
+        record_type, id_length, payload_length = RECORD_HEADER.unpack(header)
+        body = journal_file.read(id_length + payload_length)
+        if len(body) < id_length + payload_length:
+            return
+        yield record_type, body[:id_length].decode("utf-8"), body[id_length:]
+
+
+def read_file_header(persisted_file: BinaryIO) -> Tuple[int, Optional[bytes]]:
+    """Read the header record at the start of a checkpoint or journal file.
+
+    Args:
+        persisted_file: The file opened in binary mode, positioned at its start. It is left positioned after the header,
+            or at its start if it has no header.
+
+    Returns:
+        int, bytes: The checkpoint generation and the corpus digest, 0 and None if the file has no header.
+    """
+    first_record = next(iter_records(persisted_file), None)
+    if first_record is None or first_record[0] != RECORD_FILE_HEADER:
+        persisted_file.seek(0)
+        return 0, None
+    return FILE_HEADER.unpack(first_record[2])
+
+
+class GameJournal:  # pylint: disable=too-many-instance-attributes
+    """Persist games to a directory as a checkpoint file plus an append-only journal.
+
+    Records are buffered in memory and written in one batch once batch_size records are pending or flush_interval
+    seconds have passed since the last write, so a busy server does not write to disk for each guess. A checkpoint is
+    due once checkpoint_records records have been journaled or checkpoint_interval seconds have passed since the last
+    one, which bounds the journal replayed by restore().
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        directory: str,
+        words: Sequence[str] = WORDS_LIST,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        fsync: bool = True,
+        checkpoint_records: int = DEFAULT_CHECKPOINT_RECORDS,
+        checkpoint_interval: float = DEFAULT_CHECKPOINT_INTERVAL,
+    ):
+        """Open the journal in a directory.
+
+        Attributes:
+            directory: Directory of the checkpoint and journal files, created if missing.
+            words: The corpus the secret word indexes refer to.
+            batch_size: Number of pending records which triggers a write.
+            flush_interval: Seconds after the last write which trigger a write on the next record.
+            fsync: Whether to force each write to the disk with os.fsync().
+            checkpoint_records: Number of records journaled since the last checkpoint which make a checkpoint due.
+            checkpoint_interval: Seconds after the last checkpoint which make a checkpoint due.
+        """
+        self.directory = directory
+        self.words = words
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.fsync = fsync
+        self.journal_path = os.path.join(directory, JOURNAL_FILENAME)
+        self.checkpoint_path = os.path.join(directory, CHECKPOINT_FILENAME)
+        self.checkpoint_records = checkpoint_records
+        self.checkpoint_interval = checkpoint_interval
+        # The corpus is only hashed once a file header is written or a file is restored, see corpus_digest.
+        self._corpus_digest: Optional[bytes] = None
+        self._pending = bytearray()
+        self._pending_records = 0
+        self._last_flush = time.monotonic()
+        self._journaled_records = 0
+        self._last_checkpoint = self._last_flush
+        os.makedirs(directory, exist_ok=True)
+        self.generation = self._read_generation(self.checkpoint_path)
+        if os.path.exists(self.journal_path) and self._read_generation(self.journal_path) == self.generation:
+            self._journal_file: BinaryIO = open(self.journal_path, mode="ab")  # pylint: disable=consider-using-with
+        else:
+            # Missing, or left over from before the last checkpoint by a crash, and so already in the checkpoint.
+            self._journal_file = self._start_journal()
+
+    @property
+    def corpus_digest(self) -> bytes:
+        """Get the digest of the corpus the secret word indexes refer to, hashed on first use."""
+        if self._corpus_digest is None:
+            self._corpus_digest = corpus_digest(self.words)
+        return self._corpus_digest
+
+    @staticmethod
+    def _read_generation(path: str) -> int:
+        """Read the checkpoint generation of a checkpoint or journal file.
+
+        Args:
+            path: Path of the file.
+
+        Returns:
+            int: The generation, 0 if the file is missing or has no header.
+        """
+        if not os.path.exists(path):
+            return 0
+        with open(path, mode="rb") as persisted_file:
+            return read_file_header(persisted_file)[0]
+
+    def _file_header(self) -> bytes:
+        """Encode the header record of the files of the current checkpoint generation."""
+        return encode_record(RECORD_FILE_HEADER, "", FILE_HEADER.pack(self.generation, self.corpus_digest))
+
+    def _write_atomically(self, path: str, records: Iterator[bytes]) -> None:
+        """Write a file through a temporary file, which replaces the file once it is complete.
+
+        Args:
+            path: Path of the file.
+            records: The encoded records to be written after the file header.
+        """
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, mode="wb") as persisted_file:
+            persisted_file.write(self._file_header())
+            for record in records:
+                persisted_file.write(record)
+            persisted_file.flush()
+            if self.fsync:
+                os.fsync(persisted_file.fileno())
+        os.replace(tmp_path, path)
+
+    def _start_journal(self) -> BinaryIO:
+        """Replace the journal file by an empty one of the current checkpoint generation.
+
+        Returns:
+            BinaryIO: The new journal file opened for appending.
+        """
+        self._write_atomically(self.journal_path, iter(()))
+        return open(self.journal_path, mode="ab")  # pylint: disable=consider-using-with
+
+    def _append(self, record: bytes) -> None:
+        """Buffer a record and write the batch if it is due.
+
+        Args:
+            record: The encoded record.
+        """
+        self._pending += record
+        self._pending_records += 1
+        self._journaled_records += 1
+        if self._pending_records >= self.batch_size or time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def record_new_game(self, session_id: str, hangman_game_data: HangmanGameData) -> None:
+        """Record the start of a game.
+
+        Args:
+            session_id: The session id of the game.
+            hangman_game_data: The data object of the new game.
+        """
+        self._append(encode_record(RECORD_NEW_GAME, session_id, encode_snapshot(hangman_game_data, self.words)))
+
+    def record_guess(self, session_id: str, player_guess: str) -> None:
+        """Record a validated guess letter.
+
+        Args:
+            session_id: The session id of the game.
+            player_guess: The guess letter.
+        """
+        self._append(encode_record(RECORD_GUESS, session_id, player_guess.encode("utf-8")))
+
+    def record_removed(self, session_id: str) -> None:
+        """Record that a game is no longer needed.
+
+        Args:
+            session_id: The session id of the game.
+        """
+        self._append(encode_record(RECORD_REMOVED, session_id))
+
+    def flush(self) -> None:
+        """Write the pending records to the journal file."""
+        if self._pending:
+            self._journal_file.write(self._pending)
+            self._journal_file.flush()
+            if self.fsync:
+                os.fsync(self._journal_file.fileno())
+            self._pending.clear()
+            self._pending_records = 0
+        self._last_flush = time.monotonic()
+
+    def is_checkpoint_due(self) -> bool:
+        """Check whether the journal has grown enough since the last checkpoint to fold it into a new one.
+
+        Returns:
+            bool: True if checkpoint_records records have been journaled, or checkpoint_interval seconds have passed
+                with at least one record journaled, since the last checkpoint.
+        """
+        if not self._journaled_records:
+            return False
+        return (
+            self._journaled_records >= self.checkpoint_records
+            or time.monotonic() - self._last_checkpoint >= self.checkpoint_interval
+        )
+
+    def checkpoint(self, games: Mapping[str, HangmanGameData]) -> None:
+        """Write the snapshots of all games to the checkpoint file of a new generation and start a new, empty journal.
+
+        A crash after the checkpoint file is replaced but before the journal is, leaves a journal of the previous
+        generation, which restore() skips since its records are already in the checkpoint.
+
+        Args:
+            games: The games to be kept by session id.
+        """
+        self.flush()
+        self.generation += 1
+        self._write_atomically(
+            self.checkpoint_path,
+            (
+                encode_record(RECORD_NEW_GAME, session_id, encode_snapshot(hangman_game_data, self.words))
+                for session_id, hangman_game_data in games.items()
+            ),
+        )
+        self._journal_file.close()
+        self._journal_file = self._start_journal()
+        self._journaled_records = 0
+        self._last_checkpoint = time.monotonic()
+
+    def restore(self) -> Dict[str, HangmanGameData]:
+        """Rebuild the games from the checkpoint file and the journal.
+
+        Returns:
+            dict: The games by session id.
+        """
+        self.flush()
+        games: Dict[str, HangmanGameData] = {}
+        hangman_game_view = HangmanGameView()
+        checkpoint_generation = 0
+        for path in (self.checkpoint_path, self.journal_path):
+            if not os.path.exists(path):
+                continue
+            with open(path, mode="rb") as persisted_file:
+                generation, digest = read_file_header(persisted_file)
+                if path == self.checkpoint_path:
+                    checkpoint_generation = generation
+                elif generation < checkpoint_generation:
+                    continue
+                # The word indexes of a file written for another corpus point to other words.
+                words = self.words if digest in (None, self.corpus_digest) else ()
+                for record_type, session_id, payload in iter_records(persisted_file):
+                    if record_type == RECORD_NEW_GAME:
+                        games[session_id] = decode_snapshot(payload, words)
+                    elif record_type == RECORD_REMOVED:
+                        games.pop(session_id, None)
+                    elif record_type == RECORD_GUESS and session_id in games:
+                        self._replay_guess(games[session_id], payload.decode("utf-8"), hangman_game_view)
+        return games
+
+    @staticmethod
+    def _replay_guess(
+        hangman_game_data: HangmanGameData, player_guess: str, hangman_game_view: HangmanGameView
+    ) -> None:
+        """Replay a journaled guess through the game rules, which also restores the game finish indicator.
+
+        Args:
+            hangman_game_data: The data object of the game.
+            player_guess: The guess letter.
+            hangman_game_view: The view of the controller applying the guess.
+        """
+        # A guess which is already in the game has been counted by the snapshot, and must not count twice.
+        if hangman_game_data.game_finished or hangman_game_data.is_letter_guessed(player_guess):
+            return
+        HangmanGameController(hangman_game_data, hangman_game_view).evaluate_player_guess(player_guess)
+
+    def close(self) -> None:
+        """Write the pending records and close the journal file."""
+        self.flush()
+        self._journal_file.close()
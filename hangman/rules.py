@@ -0,0 +1,179 @@
+"""Module to define the rules of a game: the judging of a guess, and the pure transition function of one game.
+
+guess_events() judges a guess from the bit masks of a game, and is the only definition of the rules: step() applies it
+to an immutable GameState, HangmanGameController applies it to the data of the current game, and the BatchedGames of
+the core module is its vector form. A guess is correct if its letter occurs in the secret word, the game is won once
+every letter of the secret word is guessed, and lost after MAX_MISSED_GUESSES missed guesses. Any single character
+can be guessed, so the secret words may have letters other than a-z.
+
+This module does not depend on NumPy, so the interactive game can import it without slowing down its start.
+"""
+
+from dataclasses import dataclass
+from typing import Tuple
+
+from hangman.constants import MAX_MISSED_GUESSES
+from hangman.models import HangmanGameData
+from hangman.utils import letter_mask, letters_mask
+
+EVENT_CORRECT_GUESS = "correct_guess"
+
+EVENT_MISSED_GUESS = "missed_guess"
+
+EVENT_REPEATED_GUESS = "repeated_guess"
+
+EVENT_GAME_WON = "game_won"
+
+EVENT_GAME_LOST = "game_lost"
+
+# Event of a guess made after the end of the game, which leaves the state unchanged.
+EVENT_GAME_OVER = "game_over"
+
+
+def guess_events(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    game_finished: bool,
+    secret_word_mask: int,
+    missed_mask: int,
+    correct_mask: int,
+    missed_guesses: int,
+    guess_mask: int,
+) -> Tuple[str, ...]:
+    """Judge a guess from the state of a game.
+
+    Args:
+        game_finished: Game finish indicator.
+        secret_word_mask: Bit mask of the letters in the secret word.
+        missed_mask: Bit mask of the missed letters.
+        correct_mask: Bit mask of the correct letters.
+        missed_guesses: Number of missed guesses.
+        guess_mask: Bit mask of the guess letter.
+
+    Returns:
+        tuple[str, ...]: EVENT_CORRECT_GUESS or EVENT_MISSED_GUESS, followed by EVENT_GAME_WON or EVENT_GAME_LOST if the
+            guess finishes the game. EVENT_REPEATED_GUESS for a letter which has been guessed already, and
+            EVENT_GAME_OVER for a finished game, where the guess must be ignored.
+    """
+    if game_finished:
+        return (EVENT_GAME_OVER,)
+    if (missed_mask | correct_mask) & guess_mask:
+        return (EVENT_REPEATED_GUESS,)
+    if secret_word_mask & guess_mask:
+        if secret_word_mask & ~(correct_mask | guess_mask):
+            return (EVENT_CORRECT_GUESS,)
+        return (EVENT_CORRECT_GUESS, EVENT_GAME_WON)
+    if missed_guesses + 1 >= MAX_MISSED_GUESSES:
+        return (EVENT_MISSED_GUESS, EVENT_GAME_LOST)
+    return (EVENT_MISSED_GUESS,)
+
+
+@dataclass(frozen=True)
+class GameState:  # pylint: disable=too-many-instance-attributes
+    """Represent the immutable state of a game.
+
+    Attributes:
+        secret_word: (str) The secret word.
+        missed_letters: (Tuple[str, ...]) Missed letters in guessing order.
+        correct_letters: (Tuple[str, ...]) Correct letters in guessing order.
+        game_finished: (bool) Game finish indicator.
+        secret_word_mask: (int) Bit mask of the letters in the secret word, computed if not given.
+        missed_mask: (int) Bit mask of the missed letters, computed if not given.
+        correct_mask: (int) Bit mask of the correct letters, computed if not given.
+    """
+
+    secret_word: str
+    missed_letters: Tuple[str, ...] = ()
+    correct_letters: Tuple[str, ...] = ()
+    game_finished: bool = False
+    secret_word_mask: int = 0
+    missed_mask: int = 0
+    correct_mask: int = 0
+
+    def __post_init__(self) -> None:
+        """Compute the bit masks which are not given."""
+        # The masks are only empty without letters, so an empty mask with letters has to be computed.
+        for mask_name, letters in (
+            ("secret_word_mask", self.secret_word),
+            ("missed_mask", self.missed_letters),
+            ("correct_mask", self.correct_letters),
+        ):
+            if letters and not getattr(self, mask_name):
+                object.__setattr__(self, mask_name, letters_mask(letters))
+
+    @classmethod
+    def from_game_data(cls, hangman_game_data: HangmanGameData) -> "GameState":
+        """Copy the state of a game data object.
+
+        Args:
+            hangman_game_data: The data object of the game.
+
+        Returns:
+            GameState: The state of the game.
+        """
+        return cls(
+            hangman_game_data.secret_word,
+            tuple(hangman_game_data.missed_letters),
+            tuple(hangman_game_data.correct_letters),
+            hangman_game_data.game_finished,
+            hangman_game_data.secret_word_mask,
+            hangman_game_data.missed_mask,
+            hangman_game_data.correct_mask,
+        )
+
+    def to_game_data(self) -> HangmanGameData:
+        """Create a game data object in this state, e.g. for rendering it with the view.
+
+        Returns:
+            HangmanGameData: The data object of the game.
+        """
+        return HangmanGameData(
+            secret_word=self.secret_word,
+            missed_letters=list(self.missed_letters),
+            correct_letters=list(self.correct_letters),
+            game_finished=self.game_finished,
+        )
+
+
+def step(state: GameState, guess: str) -> Tuple[GameState, Tuple[str, ...]]:
+    """Apply a guess letter to a game.
+
+    Args:
+        state: The state of the game.
+        guess: A single character.
+
+    Returns:
+        GameState, tuple[str, ...]: The state after the guess, and the events of the guess from guess_events(). The
+            state is returned unchanged for a repeated guess and for a finished game.
+    """
+    guess_mask = letter_mask(guess)
+    events = guess_events(
+        state.game_finished,
+        state.secret_word_mask,
+        state.missed_mask,
+        state.correct_mask,
+        len(state.missed_letters),
+        guess_mask,
+    )
+    game_finished = EVENT_GAME_WON in events or EVENT_GAME_LOST in events
+    if EVENT_CORRECT_GUESS in events:
+        next_state = GameState(
+            state.secret_word,
+            state.missed_letters,
+            state.correct_letters + (guess,),
+            game_finished,
+            state.secret_word_mask,
+            state.missed_mask,
+            state.correct_mask | guess_mask,
+        )
+    elif EVENT_MISSED_GUESS in events:
+        next_state = GameState(
+            state.secret_word,
+            state.missed_letters + (guess,),
+            state.correct_letters,
+            game_finished,
+            state.secret_word_mask,
+            state.missed_mask | guess_mask,
+            state.correct_mask,
+        )
+    else:
+        next_state = state
+    return next_state, events
@@ -0,0 +1,179 @@
+"""Module to define the non-repeating secret word sampler of a game session.
+
+The sampler walks a pseudo-random permutation of the corpus indexes: the draw at a position is the image of the
+position by a keyed Feistel network over the smallest even number of bits covering the corpus, cycle-walking the images
+which fall outside of the corpus until one falls inside. Each draw is O(1) on average, no shuffled copy of the corpus is
+ever built, and the whole state of a session is its seed and position, so it is checkpointed and resumed for free.
+
+Once every word has been drawn, the next round walks a new permutation keyed from the seed and the round number. A
+sampler of a difficulty tier permutes the indexes of the words of the tier instead of the whole corpus.
+"""
+
+import hashlib
+import random
+import struct
+from typing import Optional, Sequence, Tuple
+
+from hangman.constants import WORDS_LIST
+
+# The key material of a permutation is read as one 64-bit key per Feistel round.
+ROUND_KEYS = struct.Struct("<4Q")
+
+# Multiplier of the Feistel round function, the 64-bit golden ratio.
+ROUND_MULTIPLIER = 0x9E3779B97F4A7C15
+
+MASK_64 = (1 << 64) - 1
+
+
+class FeistelPermutation:  # pylint: disable=too-few-public-methods
+    """Bijection of the integers in [0, size) computed on the fly from 32 bytes of key material."""
+
+    def __init__(self, size: int, key: bytes):
+        """Create the permutation.
+
+        Attributes:
+            size: The number of integers permuted.
+
+        Raises:
+            ValueError: If the size is not positive.
+        """
+        if size <= 0:
+            raise ValueError("Cannot permute an empty range.")
+        self.size = size
+        # Each half holds at least one bit, so there is always something to shuffle.
+        self._half_bits = max(1, ((size - 1).bit_length() + 1) // 2)
+        self._half_mask = (1 << self._half_bits) - 1
+        self._round_keys = ROUND_KEYS.unpack_from(key)
+
+    def _encrypt(self, value: int) -> int:
+        """Map an integer of the whole Feistel domain to another one, bijectively."""
+        left, right = value >> self._half_bits, value & self._half_mask
+        for round_key in self._round_keys:
+            mixed = ((right ^ round_key) * ROUND_MULTIPLIER) & MASK_64
+            left, right = right, left ^ (mixed >> 32) & self._half_mask
+        return left << self._half_bits | right
+
+    def __getitem__(self, idx: int) -> int:
+        """Get the image of an integer in [0, size), which is also in [0, size)."""
+        value = self._encrypt(idx)
+        # The domain is less than 4 times the size, so fewer than 4 steps are expected.
+        while value >= self.size:
+            value = self._encrypt(value)
+        return value
+
+
+def derive_round_key(seed: int, round_number: int) -> bytes:
+    """Derive the key of the permutation of a round of draws.
+
+    Args:
+        seed: Seed of the sampler.
+        round_number: Number of the round, counting from 0.
+
+    Returns:
+        bytes: 32 bytes of key material.
+    """
+    return hashlib.sha256(f"{seed}:{round_number}".encode("utf-8")).digest()
+
+
+class WordSampler:
+    """Draw secret words without repeating any before the whole corpus has been drawn."""
+
+    def __init__(
+        self,
+        seed: Optional[int] = None,
+        position: int = 0,
+        words: Sequence[str] = WORDS_LIST,
+        difficulty: Optional[str] = None,
+    ):
+        """Create a sampler, the corpus is only loaded by the first draw.
+
+        Attributes:
+            seed: Seed of the sequence of draws, a random one is drawn from the OS if not given.
+            position: Number of words drawn so far.
+            words: The words to draw from.
+            difficulty: Difficulty tier to draw from, one of DIFFICULTY_TIERS. Any word is drawn if not given.
+        """
+        self.seed = seed if seed is not None else random.SystemRandom().getrandbits(64)
+        self.position = position
+        self.words = words
+        self.difficulty = difficulty
+        self._permutation: Optional[FeistelPermutation] = None
+        self._round_number = -1
+        self._tier_rows: Optional[Sequence[int]] = None
+
+    def _draw_rows(self) -> Sequence[int]:
+        """Get the indexes of the words to draw from.
+
+        Returns:
+            Sequence[int]: The indexes of the words of the difficulty tier, the range of all indexes if not given.
+
+        Raises:
+            ValueError: If the difficulty tier is unknown or has no word.
+        """
+        if self.difficulty is None:
+            return range(len(self.words))
+        if self._tier_rows is None:
+            # Imported here, so the difficulty scores are only loaded by the sessions drawing by difficulty.
+            # pylint: disable-next=import-outside-toplevel,cyclic-import
+            from hangman.difficulty import get_difficulty_tiers
+
+            tier_rows = get_difficulty_tiers(self.words).tier_rows
+            if not tier_rows.get(self.difficulty):
+                raise ValueError(f"No word of difficulty '{self.difficulty}', expected one of {', '.join(tier_rows)}.")
+            self._tier_rows = tier_rows[self.difficulty]
+        return self._tier_rows
+
+    def draw_index(self) -> int:
+        """Draw the index of the next word.
+
+        Returns:
+            int: The index of the word in the words of the sampler.
+
+        Raises:
+            ValueError: If there is no word to draw, or the difficulty tier is unknown or has no word.
+        """
+        rows = self._draw_rows()
+        size = len(rows)
+        if not size:
+            raise ValueError("Cannot draw a word from an empty corpus.")
+        round_number, round_position = divmod(self.position, size)
+        if self._permutation is None or round_number != self._round_number or self._permutation.size != size:
+            self._permutation = FeistelPermutation(size, derive_round_key(self.seed, round_number))
+            self._round_number = round_number
+        self.position += 1
+        return rows[self._permutation[round_position]]
+
+    def draw(self) -> Tuple[int, str]:
+        """Draw the next word.
+
+        Returns:
+            int, str: The index of the word in the words of the sampler, and the word.
+        """
+        idx = self.draw_index()
+        return idx, self.words[idx]
+
+    def checkpoint(self) -> dict:
+        """Get the state of the sampler, ready to be serialized as JSON.
+
+        Returns:
+            dict: The seed, the position and the difficulty tier.
+        """
+        return {"seed": self.seed, "position": self.position, "difficulty": self.difficulty}
+
+    @classmethod
+    def from_checkpoint(cls, checkpoint: dict, words: Sequence[str] = WORDS_LIST) -> "WordSampler":
+        """Resume a sampler from its state.
+
+        Args:
+            checkpoint: The state returned by checkpoint().
+            words: The words to draw from, the same as those of the checkpointed sampler.
+
+        Returns:
+            WordSampler: The sampler, drawing the words the checkpointed sampler would have drawn next.
+        """
+        return cls(
+            seed=checkpoint["seed"],
+            position=checkpoint["position"],
+            words=words,
+            difficulty=checkpoint.get("difficulty"),
+        )
@@ -0,0 +1,155 @@
+"""Module to define the non-interactive play mode replaying scripted guesses through the game rules.
+
+Each input line describes one game, either as plain text where each character is one guess, or as a JSON object
+like {"guesses": "etaoin", "secret_word": "camel"}, where guesses may also be a list of entries and the secret word is
+optional. The games are parsed, played and reported one at a time, so input of any size is handled in constant memory.
+A line which cannot be parsed is reported as an error record of its game, and the following lines are still played.
+"""
+
+import json
+import random
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, List, Optional
+
+from hangman.controllers import HangmanGameController
+from hangman.models import HangmanGameData
+from hangman.utils import draw_random_word
+from hangman.views import HangmanGameView
+
+
+@dataclass
+class ScriptedGame:
+    """Represent the input of a scripted game.
+
+    Attributes:
+        guesses: (List[str]) The entries of the player in order, invalid ones are rejected as in the interactive game.
+        secret_word: (str) Secret word of the game, drawn at random if empty.
+        line_number: (int) Number of the input line describing the game.
+        error: (str) Why the input line could not be parsed, empty for a valid game.
+    """
+
+    guesses: List[str] = field(default_factory=list)
+    secret_word: str = ""
+    line_number: int = 0
+    error: str = ""
+
+
+def parse_scripted_game(line: str, line_number: int = 0) -> ScriptedGame:
+    """Parse one input line describing a game.
+
+    Args:
+        line: The input line, without surrounding whitespace.
+        line_number: Number of the input line, for the error messages.
+
+    Returns:
+        ScriptedGame: The input of the game.
+
+    Raises:
+        ValueError: If the line is not a valid JSON object or plain text game.
+    """
+    if not line.startswith("{"):
+        return ScriptedGame(guesses=list(line), line_number=line_number)
+
+    try:
+        game = json.loads(line)
+    except json.JSONDecodeError as err:
+        raise ValueError(f"Line {line_number}: invalid JSON ({err.msg}).") from err
+    guesses = game.get("guesses", [])
+    secret_word = game.get("secret_word") or ""
+    if not isinstance(guesses, (str, list)) or not all(isinstance(guess, str) for guess in guesses):
+        raise ValueError(f"Line {line_number}: guesses must be a string or a list of strings.")
+    if not isinstance(secret_word, str):
+        raise ValueError(f"Line {line_number}: secret_word must be a string.")
+    return ScriptedGame(guesses=list(guesses), secret_word=secret_word.lower(), line_number=line_number)
+
+
+def iter_scripted_games(lines: Iterable[str]) -> Iterator[ScriptedGame]:
+    """Parse the input lines one at a time, skipping blank lines.
+
+    Args:
+        lines: The input lines, e.g. an open file.
+
+    Yields:
+        ScriptedGame: The input of each game, with the error message of a line which is not a valid game.
+    """
+    for line_number, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield parse_scripted_game(line, line_number)
+        except ValueError as err:
+            yield ScriptedGame(line_number=line_number, error=str(err))
+
+
+class ScriptedGamePlayer:  # pylint: disable=too-few-public-methods
+    """Play scripted games through HangmanGameController without prompting or rendering anything."""
+
+    def __init__(self, seed: Optional[int] = None):
+        """Create a scripted game player.
+
+        Attributes:
+            rng: Random number generator drawing the secret words which are not given.
+            hangman_game_view: View object of type HangmanGameView validating the guesses.
+        """
+        self.rng = random.Random(seed)
+        self.hangman_game_view = HangmanGameView()
+
+    def play(self, scripted_game: ScriptedGame) -> dict:
+        """Play a game until it is finished or the scripted guesses run out.
+
+        Args:
+            scripted_game: The input of the game.
+
+        Returns:
+            dict: The results of the game, ready to be serialized as JSON. 'won' is None if the game is unfinished. Only
+                the line number and the error message for an input line which is not a valid game.
+        """
+        if scripted_game.error:
+            return {"line": scripted_game.line_number, "error": scripted_game.error}
+        if scripted_game.secret_word:
+            hangman_game_data = HangmanGameData(secret_word=scripted_game.secret_word)
+        else:
+            secret_word_index, secret_word = draw_random_word(self.rng)
+            hangman_game_data = HangmanGameData(secret_word=secret_word, secret_word_index=secret_word_index)
+        controller = HangmanGameController(hangman_game_data, self.hangman_game_view)
+
+        player_won = None
+        invalid_guesses = []
+        guesses_used = 0
+        for guess in scripted_game.guesses:
+            if player_won is not None:
+                break
+            guesses_used += 1
+            hangman_game_data.player_guess = guess.lower()
+            input_err, _ = self.hangman_game_view.validate_player_guess(hangman_game_data)
+            if input_err:
+                invalid_guesses.append(guess)
+            else:
+                player_won = controller.evaluate_player_guess(hangman_game_data.player_guess)
+
+        return {
+            "line": scripted_game.line_number,
+            "secret_word": hangman_game_data.secret_word,
+            "won": player_won,
+            "missed_letters": "".join(hangman_game_data.missed_letters),
+            "correct_letters": "".join(hangman_game_data.correct_letters),
+            "invalid_guesses": invalid_guesses,
+            "guesses_used": guesses_used,
+            "revealed": hangman_game_data.secret_word_with_correct_letters,
+        }
+
+
+def iter_game_results(lines: Iterable[str], seed: Optional[int] = None) -> Iterator[dict]:
+    """Play the games described by the input lines one at a time.
+
+    Args:
+        lines: The input lines, e.g. an open file.
+        seed: Seed of the random number generator drawing the secret words which are not given.
+
+    Yields:
+        dict: The results of each game.
+    """
+    scripted_game_player = ScriptedGamePlayer(seed)
+    for scripted_game in iter_scripted_games(lines):
+        yield scripted_game_player.play(scripted_game)
@@ -0,0 +1,344 @@
+"""Module to define the asyncio game server hosting many concurrent Hangman sessions in one process.
+
+The protocol is line based and works with telnet or netcat: the server sends the board and a prompt, the player
+replies with one line per guess. After a game is finished, a reply starting with 'y' starts a new game and anything
+else closes the connection.
+"""
+
+import asyncio
+import functools
+from typing import Callable, Optional, Set, Tuple
+
+from hangman.controllers import HangmanGameController
+from hangman.leaderboard import LeaderboardWriter
+from hangman.models import HangmanGameData
+from hangman.persistence import GameJournal
+from hangman.sampler import WordSampler
+from hangman.sessions import SessionStore
+from hangman.views import PROMPT_GUESS, PROMPT_PLAY_AGAIN, HangmanGameView
+
+DEFAULT_HOST = "127.0.0.1"
+
+DEFAULT_PORT = 8023
+
+# Limit of the read buffer of each connection, which also bounds the length of a line sent by a player.
+MAX_LINE_LENGTH = 256
+
+NEWLINE = "\r\n"
+
+MSG_BYE = "Bye!"
+
+MSG_LINE_TOO_LONG = "Input line too long."
+
+MSG_SESSION_EXPIRED = "Your session has expired, starting a new game."
+
+MSG_UNKNOWN_SESSION = "Unknown session id."
+
+MSG_SESSION_IN_USE = "This session is being played by another connection."
+
+# Command for switching the connection to a previous session.
+CMD_RESUME = "resume "
+
+
+class HangmanGameServer:  # pylint: disable=too-many-instance-attributes
+    """Serve Hangman sessions to players connected over TCP."""
+
+    def __init__(
+        self,
+        sampler_factory: Callable[[], WordSampler] = WordSampler,
+        hangman_game_view: Optional[HangmanGameView] = None,
+        session_store: Optional[SessionStore] = None,
+        journal: Optional[GameJournal] = None,
+        leaderboard: Optional[LeaderboardWriter] = None,
+    ):
+        """Create a game server.
+
+        Attributes:
+            sampler_factory: Callable creating the sampler of each connected player, which draws the secret words of
+                the player's games without repeats.
+            hangman_game_view: View object of type HangmanGameView for building the messages, shared by all sessions.
+            session_store: Store keeping the games by session id, so players can resume them after reconnecting.
+            journal: Journal persisting the games, so they survive server restarts. Not persisted if not given.
+            leaderboard: Writer recording the finished games with the session id as player name. Not recorded if not
+                given.
+            active_sessions: Number of players currently connected.
+            connected_sessions: The session ids played by the connected players, which no other connection may resume.
+            server: The listening asyncio server once started.
+        """
+        self.sampler_factory = sampler_factory
+        self.hangman_game_view = hangman_game_view or HangmanGameView()
+        self.session_store = session_store if session_store is not None else SessionStore()
+        self.journal = journal
+        self.leaderboard = leaderboard
+        self.active_sessions = 0
+        self.connected_sessions: Set[str] = set()
+        self.server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> asyncio.AbstractServer:
+        """Start listening for players.
+
+        Args:
+            host: Interface to listen on.
+            port: TCP port to listen on, 0 picks a free port.
+
+        Returns:
+            AbstractServer: The listening asyncio server.
+        """
+        if self.journal:
+            # Bring back the games of the previous run before accepting players.
+            for session_id, hangman_game_data in self.journal.restore().items():
+                self.session_store.put(session_id, hangman_game_data)
+        self.server = await asyncio.start_server(self.handle_client, host, port, limit=MAX_LINE_LENGTH)
+        return self.server
+
+    async def flush_journal_periodically(self) -> None:
+        """Write the pending journal records at the journal's flush interval, until cancelled.
+
+        The games kept in memory are checkpointed whenever a checkpoint is due, so the journal does not grow for the
+        whole lifetime of the server, and a restart only replays the records journaled since the last checkpoint.
+        """
+        while self.journal:
+            await asyncio.sleep(self.journal.flush_interval)
+            if self.journal.is_checkpoint_due():
+                self.journal.checkpoint(dict(self.session_store.items()))
+            else:
+                self.journal.flush()
+
+    def close_journal(self) -> None:
+        """Checkpoint the games kept in memory and close the journal."""
+        if self.journal:
+            self.journal.checkpoint(dict(self.session_store.items()))
+            self.journal.close()
+
+    @property
+    def port(self) -> int:
+        """Get the TCP port the server is listening on."""
+        return self.server.sockets[0].getsockname()[1]
+
+    def new_game(self, word_sampler: Optional[WordSampler] = None) -> HangmanGameData:
+        """Create the data object of a new game with a freshly drawn secret word.
+
+        Args:
+            word_sampler: The sampler of the player, a new one from the sampler factory if not given.
+
+        Returns:
+            HangmanGameData: The data object of the game, with the index of its secret word in the corpus.
+        """
+        secret_word_index, secret_word = (word_sampler or self.sampler_factory()).draw()
+        return HangmanGameData(secret_word=secret_word, secret_word_index=secret_word_index)
+
+    def start_new_game(
+        self, word_sampler: WordSampler, session_id: Optional[str] = None
+    ) -> Tuple[str, HangmanGameData]:
+        """Start a new game and keep it in the session store.
+
+        Args:
+            word_sampler: The sampler of the player.
+            session_id: The session id to start the game in, a new session is created if not given.
+
+        Returns:
+            str, HangmanGameData: The session id and the data object of the new game.
+        """
+        hangman_game_data = self.new_game(word_sampler)
+        if session_id is None:
+            session_id = self.session_store.create(hangman_game_data)
+        else:
+            self.session_store.put(session_id, hangman_game_data)
+        if self.journal:
+            self.journal.record_new_game(session_id, hangman_game_data)
+        return session_id, hangman_game_data
+
+    def remove_session(self, session_id: str) -> None:
+        """Remove a session which is no longer needed from the session store and the journal.
+
+        Args:
+            session_id: The session id.
+        """
+        self.session_store.remove(session_id)
+        if self.journal:
+            self.journal.record_removed(session_id)
+
+    def render_board(self, hangman_game_data: HangmanGameData) -> str:
+        """Get the Hangman board as plain text.
+
+        Args:
+            hangman_game_data: The data object for retrieving the Hangman game data.
+
+        Returns:
+            str: The board lines ending with a newline.
+        """
+        lines = [
+            " H A N G M A N ",
+            self.hangman_game_view.get_hangman_pic(hangman_game_data),
+            self.hangman_game_view.get_missed_letters_message(hangman_game_data),
+            self.hangman_game_view.get_secret_word_with_correct_letters_message(hangman_game_data),
+            "",
+        ]
+        # The Hangman pictures contain line breaks as well, convert them all to the protocol newline.
+        return "\n".join(lines).replace("\n", NEWLINE)
+
+    def play_turn(self, controller: HangmanGameController, player_guess: str, session_id: Optional[str] = None) -> str:
+        """Apply one line entered by the player to the session's game.
+
+        Args:
+            controller: The controller of the session's game.
+            player_guess: The line entered by the player, stripped and lowercased.
+            session_id: The session id of the game, for recording the guess in the journal.
+
+        Returns:
+            str: The reply to be sent to the player.
+        """
+        hangman_game_data = controller.hangman_game_data
+        hangman_game_data.player_guess = player_guess
+        input_err, err_msg = self.hangman_game_view.validate_player_guess(hangman_game_data)
+        if input_err:
+            return f"{self.render_board(hangman_game_data)}{err_msg}{NEWLINE}{PROMPT_GUESS}"
+
+        if self.journal and session_id:
+            self.journal.record_guess(session_id, player_guess)
+        player_won = controller.evaluate_player_guess(player_guess)
+        reply = self.render_board(hangman_game_data)
+        if player_won is None:
+            return f"{reply}{PROMPT_GUESS}"
+        if self.leaderboard and session_id:
+            self.leaderboard.record_game(session_id, hangman_game_data, player_won)
+        if player_won:
+            reply += self.hangman_game_view.get_player_won_message(hangman_game_data) + NEWLINE
+        else:
+            reply += self.hangman_game_view.get_player_lost_message_first_line(hangman_game_data) + NEWLINE
+            reply += self.hangman_game_view.get_player_lost_message_second_line(hangman_game_data) + NEWLINE
+        return f"{reply}{PROMPT_PLAY_AGAIN}"
+
+    def render_resumed_game(self, hangman_game_data: HangmanGameData) -> str:
+        """Get the board and the prompt of a game which is continued.
+
+        Args:
+            hangman_game_data: The data object of the game.
+
+        Returns:
+            str: The reply to be sent to the player.
+        """
+        prompt = PROMPT_PLAY_AGAIN if hangman_game_data.game_finished else PROMPT_GUESS
+        return f"{self.render_board(hangman_game_data)}{prompt}"
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve one connected player until the player quits or disconnects.
+
+        Args:
+            reader: Stream of the lines sent by the player.
+            writer: Stream to the player.
+        """
+        self.active_sessions += 1
+        try:
+            await self.play_session(reader, writer)
+        except ValueError:
+            # The player sent a line longer than the read buffer.
+            writer.write(f"{NEWLINE}{MSG_LINE_TOO_LONG}{NEWLINE}".encode("utf-8"))
+        except ConnectionError:
+            pass
+        finally:
+            self.active_sessions -= 1
+            writer.close()
+
+    async def play_session(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Play games with one connected player.
+
+        Args:
+            reader: Stream of the lines sent by the player.
+            writer: Stream to the player.
+        """
+        # The games of a player never repeat a word before the whole corpus has been played.
+        word_sampler = self.sampler_factory()
+        session_id, hangman_game_data = self.start_new_game(word_sampler)
+        controller = HangmanGameController(hangman_game_data, self.hangman_game_view)
+        reply = (
+            f"Session id: {session_id}{NEWLINE}"
+            f"Enter '{CMD_RESUME}<session id>' to continue a previous game.{NEWLINE}"
+            f"{self.render_board(controller.hangman_game_data)}{PROMPT_GUESS}"
+        )
+        self.connected_sessions.add(session_id)
+        try:
+            while True:
+                writer.write(reply.encode("utf-8"))
+                await writer.drain()
+
+                line = await reader.readline()
+                if not line:
+                    # The player disconnected, the session stays in the store so it can be resumed.
+                    break
+                player_input = line.decode("utf-8", errors="replace").strip().lower()
+
+                # Mark the session as recently used, it may have been evicted while the player was idle.
+                hangman_game_data = self.session_store.get(session_id)
+                if hangman_game_data is None:
+                    _, controller.hangman_game_data = self.start_new_game(word_sampler, session_id)
+                    reply = f"{MSG_SESSION_EXPIRED}{NEWLINE}{self.render_resumed_game(controller.hangman_game_data)}"
+                    continue
+                controller.hangman_game_data = hangman_game_data
+
+                if player_input.startswith(CMD_RESUME):
+                    resumed_id = player_input.split(maxsplit=1)[1]
+                    if resumed_id != session_id and resumed_id in self.connected_sessions:
+                        reply = f"{MSG_SESSION_IN_USE}{NEWLINE}{self.render_resumed_game(hangman_game_data)}"
+                        continue
+                    resumed_game_data = self.session_store.get(resumed_id)
+                    if resumed_game_data is None:
+                        reply = f"{MSG_UNKNOWN_SESSION}{NEWLINE}{self.render_resumed_game(hangman_game_data)}"
+                        continue
+                    if resumed_id != session_id:
+                        # The game this connection started is abandoned for the resumed one, so it is not kept.
+                        self.remove_session(session_id)
+                        self.connected_sessions.discard(session_id)
+                        self.connected_sessions.add(resumed_id)
+                    session_id, controller.hangman_game_data = resumed_id, resumed_game_data
+                    reply = self.render_resumed_game(resumed_game_data)
+                elif not hangman_game_data.game_finished:
+                    reply = self.play_turn(controller, player_input, session_id)
+                elif player_input.startswith("y"):
+                    # Refresh the game data if player wants to play again.
+                    _, controller.hangman_game_data = self.start_new_game(word_sampler, session_id)
+                    reply = self.render_resumed_game(controller.hangman_game_data)
+                else:
+                    self.remove_session(session_id)
+                    writer.write(f"{MSG_BYE}{NEWLINE}".encode("utf-8"))
+                    await writer.drain()
+                    break
+        finally:
+            # Another connection may resume the session from now on, if it is still in the store.
+            self.connected_sessions.discard(session_id)
+
+
+async def serve(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    session_store: Optional[SessionStore] = None,
+    journal: Optional[GameJournal] = None,
+    leaderboard: Optional[LeaderboardWriter] = None,
+    difficulty: Optional[str] = None,
+) -> None:
+    """Run a game server until cancelled.
+
+    Args:
+        host: Interface to listen on.
+        port: TCP port to listen on.
+        session_store: Store keeping the games by session id, an in-memory store with default limits if not given.
+        journal: Journal persisting the games, games are not persisted if not given.
+        leaderboard: Writer recording the finished games, closed when the server stops. Not recorded if not given.
+        difficulty: Difficulty tier of the secret words, one of DIFFICULTY_TIERS. Any word is drawn if not given.
+    """
+    game_server = HangmanGameServer(
+        sampler_factory=functools.partial(WordSampler, difficulty=difficulty),
+        session_store=session_store,
+        journal=journal,
+        leaderboard=leaderboard,
+    )
+    server = await game_server.start(host, port)
+    flush_task = asyncio.ensure_future(game_server.flush_journal_periodically())
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        flush_task.cancel()
+        game_server.close_journal()
+        if leaderboard:
+            leaderboard.close()
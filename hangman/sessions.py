@@ -0,0 +1,214 @@
+"""Module to define the bounded store of in-flight game sessions hosted by the server."""
+
+import os
+import re
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Iterator, Optional, Tuple
+
+from hangman.models import HangmanGameData
+from hangman.persistence import decode_snapshot, encode_snapshot
+
+DEFAULT_MAX_SESSIONS = 10000
+
+# Session ids are used as spill file names, so they are restricted to characters which are safe in paths.
+SESSION_ID_PATTERN = re.compile(r"[0-9A-Za-z_-]{1,64}")
+
+
+@dataclass
+class SessionStoreStats:
+    """Represent the counters of a session store.
+
+    Attributes:
+        lru_evictions: (int) Sessions evicted because the store was full.
+        idle_evictions: (int) Sessions evicted because they were idle for too long.
+        spilled: (int) Evicted sessions written to the spill directory.
+        resumed: (int) Sessions loaded back from the spill directory.
+    """
+
+    lru_evictions: int = 0
+    idle_evictions: int = 0
+    spilled: int = 0
+    resumed: int = 0
+
+
+class SessionStore:
+    """Keep game sessions by session id, evicting by least-recent use and by idle timeout.
+
+    Evicted sessions are dropped, or written to the spill directory if one is given, in which case get() loads them
+    back transparently so the player can resume the game.
+    """
+
+    def __init__(
+        self,
+        max_sessions: int = DEFAULT_MAX_SESSIONS,
+        idle_timeout: Optional[float] = None,
+        spill_dir: Optional[str] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Create a session store.
+
+        Attributes:
+            max_sessions: Maximum number of sessions kept in memory.
+            idle_timeout: Seconds after the last access when a session is evicted, never if not given.
+            spill_dir: Directory to write evicted sessions to, evicted sessions are dropped if not given.
+            clock: Callable returning the current time in seconds.
+            stats: The eviction counters of the store.
+        """
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self.spill_dir = spill_dir
+        self.clock = clock
+        self.stats = SessionStoreStats()
+        # Sessions ordered from the least to the most recently used, with their last access time.
+        self._sessions: "OrderedDict[str, Tuple[HangmanGameData, float]]" = OrderedDict()
+        if spill_dir:
+            os.makedirs(spill_dir, exist_ok=True)
+
+    def __len__(self) -> int:
+        """Get the number of sessions kept in memory."""
+        return len(self._sessions)
+
+    def __contains__(self, session_id: str) -> bool:
+        """Check whether a session is kept in memory."""
+        return session_id in self._sessions
+
+    def items(self) -> Iterator[Tuple[str, HangmanGameData]]:
+        """Iterate over the sessions kept in memory without marking them as used.
+
+        Yields:
+            str, HangmanGameData: The session id and the data object of each session's game.
+        """
+        for session_id, (hangman_game_data, _) in self._sessions.items():
+            yield session_id, hangman_game_data
+
+    def create(self, hangman_game_data: HangmanGameData) -> str:
+        """Add a new session with a generated session id.
+
+        Args:
+            hangman_game_data: The data object of the session's game.
+
+        Returns:
+            str: The session id.
+        """
+        session_id = uuid.uuid4().hex
+        self.put(session_id, hangman_game_data)
+        return session_id
+
+    def put(self, session_id: str, hangman_game_data: HangmanGameData) -> None:
+        """Add or replace a session, evicting idle and least recently used sessions as needed.
+
+        Args:
+            session_id: The session id.
+            hangman_game_data: The data object of the session's game.
+
+        Raises:
+            ValueError: If the session id contains characters which are not allowed.
+        """
+        if not SESSION_ID_PATTERN.fullmatch(session_id):
+            raise ValueError(f"Invalid session id '{session_id}'.")
+        self.evict_idle()
+        self._sessions[session_id] = (hangman_game_data, self.clock())
+        self._sessions.move_to_end(session_id)
+        while len(self._sessions) > self.max_sessions:
+            oldest_id = next(iter(self._sessions))
+            self._evict(oldest_id)
+            self.stats.lru_evictions += 1
+
+    def get(self, session_id: str) -> Optional[HangmanGameData]:
+        """Get the game of a session and mark the session as most recently used.
+
+        Args:
+            session_id: The session id.
+
+        Returns:
+            HangmanGameData: The data object of the session's game, None if the session is unknown or dropped.
+        """
+        self.evict_idle()
+        if session_id in self._sessions:
+            hangman_game_data = self._sessions[session_id][0]
+            self._sessions[session_id] = (hangman_game_data, self.clock())
+            self._sessions.move_to_end(session_id)
+            return hangman_game_data
+
+        hangman_game_data = self._load_spilled(session_id)
+        if hangman_game_data is not None:
+            self.stats.resumed += 1
+            self.put(session_id, hangman_game_data)
+        return hangman_game_data
+
+    def remove(self, session_id: str) -> None:
+        """Remove a session from memory and from the spill directory.
+
+        Args:
+            session_id: The session id.
+        """
+        self._sessions.pop(session_id, None)
+        spill_path = self._spill_path(session_id)
+        if spill_path and os.path.exists(spill_path):
+            os.remove(spill_path)
+
+    def evict_idle(self) -> int:
+        """Evict the sessions which have not been accessed within the idle timeout.
+
+        Returns:
+            int: Number of sessions evicted.
+        """
+        if self.idle_timeout is None:
+            return 0
+        deadline = self.clock() - self.idle_timeout
+        evicted = 0
+        # Sessions are ordered by last access, so the scan stops at the first session which is still fresh.
+        while self._sessions:
+            oldest_id, (_, last_access) = next(iter(self._sessions.items()))
+            if last_access > deadline:
+                break
+            self._evict(oldest_id)
+            evicted += 1
+        self.stats.idle_evictions += evicted
+        return evicted
+
+    def _evict(self, session_id: str) -> None:
+        """Remove a session from memory, writing it to the spill directory if one is given.
+
+        Args:
+            session_id: The session id.
+        """
+        hangman_game_data, _ = self._sessions.pop(session_id)
+        spill_path = self._spill_path(session_id)
+        if spill_path:
+            with open(spill_path, mode="wb") as spill_file:
+                spill_file.write(encode_snapshot(hangman_game_data))
+            self.stats.spilled += 1
+
+    def _load_spilled(self, session_id: str) -> Optional[HangmanGameData]:
+        """Load an evicted session from the spill directory and remove its spill file.
+
+        Args:
+            session_id: The session id.
+
+        Returns:
+            HangmanGameData: The data object of the session's game, None if the session was not spilled.
+        """
+        spill_path = self._spill_path(session_id)
+        if not spill_path or not os.path.exists(spill_path):
+            return None
+        with open(spill_path, mode="rb") as spill_file:
+            snapshot = spill_file.read()
+        os.remove(spill_path)
+        return decode_snapshot(snapshot)
+
+    def _spill_path(self, session_id: str) -> Optional[str]:
+        """Get the spill file path of a session.
+
+        Args:
+            session_id: The session id.
+
+        Returns:
+            str: The path, None if no spill directory is given or the session id is not allowed.
+        """
+        if not self.spill_dir or not SESSION_ID_PATTERN.fullmatch(session_id):
+            return None
+        return os.path.join(self.spill_dir, f"{session_id}.snap")
@@ -0,0 +1,241 @@
+"""Module to define the corpus shared by a parent process with its worker processes.
+
+The parent process lays out the words of WORDS_LIST in the compiled corpus format, followed by the matrices of the
+corpus solver, and the packed arrays of the corpus index and of the decision tree if needed, in one shared memory block.
+The worker processes attach to the block by name: WORDS_LIST reads its words straight from the block, and the solver,
+the index and the tree are built over NumPy arrays viewing it. So no worker parses the words source file, builds the
+index or reads the tree cache, nothing is copied or deserialized, and the memory use of the corpus and its structures
+does not grow with the number of workers.
+"""
+
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+import numpy as np
+
+from hangman.constants import WORDS_LIST
+from hangman.corpus import CompiledWordsCorpus, pack_compiled_corpus
+from hangman.decision_tree import DecisionTree, attach_corpus_decision_tree, load_decision_tree
+from hangman.solver import SOLVER_ARRAYS, CandidateWordSolver, attach_corpus_solver, get_corpus_solver
+from hangman.word_index import WordIndex, attach_corpus_index, get_corpus_index
+
+# Alignment of the solver matrices in the block, the cache line size.
+ARRAY_ALIGNMENT = 64
+
+# Name prefixes of the arrays of the packed corpus index and decision tree in the block.
+WORD_INDEX_PREFIX = "word_index:"
+
+DECISION_TREE_PREFIX = "decision_tree:"
+
+# Shared memory blocks attached by this process, kept open for the lifetime of the process since the corpus reads them.
+_ATTACHED_BLOCKS: List[shared_memory.SharedMemory] = []
+
+
+@dataclass(frozen=True)
+class SharedArray:
+    """Represent the location of a NumPy array in a shared memory block.
+
+    Attributes:
+        name: (str) Name of the array, the attribute name of a solver matrix or the prefixed name of a packed array.
+        dtype: (str) NumPy data type of the array.
+        shape: (Tuple[int, ...]) Shape of the array.
+        offset: (int) Offset of the array in the block.
+    """
+
+    name: str
+    dtype: str
+    shape: Tuple[int, ...]
+    offset: int
+
+
+@dataclass(frozen=True)
+class SharedCorpusHandle:
+    """Represent what a worker process needs to attach to a shared corpus, it is small and picklable.
+
+    Attributes:
+        block_name: (str) Name of the shared memory block.
+        corpus_size: (int) Size of the compiled corpus at the start of the block.
+        arrays: (Tuple[SharedArray, ...]) Location of the solver matrices in the block, empty if not shared.
+        word_index: (Tuple[SharedArray, ...]) Location of the arrays of the packed corpus index, empty if not shared.
+        decision_tree: (Tuple[SharedArray, ...]) Location of the arrays of the packed decision tree, empty if not
+            shared.
+    """
+
+    block_name: str
+    corpus_size: int
+    arrays: Tuple[SharedArray, ...] = ()
+    word_index: Tuple[SharedArray, ...] = ()
+    decision_tree: Tuple[SharedArray, ...] = ()
+
+
+class SharedCorpus:
+    """Own the shared memory block of a corpus, the block is removed when the shared corpus is closed."""
+
+    def __init__(
+        self,
+        words: Sequence[str] = WORDS_LIST,
+        include_solver: bool = False,
+        include_index: bool = False,
+        include_decision_tree: bool = False,
+    ):
+        """Copy a corpus, and optionally the matrices of its solver, its index and its tree, into a new shared block.
+
+        The decision tree is built with all the CPUs if it is not cached yet, before any worker needs it.
+
+        Attributes:
+            block: The shared memory block.
+            handle: The handle to be passed to the worker processes.
+        """
+        chunks = list(pack_compiled_corpus([word.encode("utf-8") for word in words]))
+        corpus_size = sum(map(len, chunks))
+        matrices = shared_matrices(words, include_solver, include_index, include_decision_tree)
+        arrays = layout_arrays(matrices, corpus_size)
+        size = arrays[-1].offset + matrices[arrays[-1].name].nbytes if arrays else corpus_size
+        self.block = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        start = 0
+        for chunk in chunks:
+            end = start + len(chunk)
+            self.block.buf[start:end] = chunk
+            start = end
+        for shared_array in arrays:
+            view_array(self.block, shared_array)[...] = matrices[shared_array.name]
+        self.handle = SharedCorpusHandle(
+            self.block.name,
+            corpus_size,
+            tuple(shared_array for shared_array in arrays if shared_array.name in SOLVER_ARRAYS),
+            tuple(shared_array for shared_array in arrays if shared_array.name.startswith(WORD_INDEX_PREFIX)),
+            tuple(shared_array for shared_array in arrays if shared_array.name.startswith(DECISION_TREE_PREFIX)),
+        )
+
+    @classmethod
+    def for_strategies(cls, strategy_classes: Iterable[type]) -> "SharedCorpus":
+        """Share WORDS_LIST with the structures some guessing strategies read.
+
+        Args:
+            strategy_classes: The strategy classes, sharing the solver, the index and the decision tree when their
+                uses_corpus_solver, uses_corpus_index and uses_corpus_decision_tree class attributes are set.
+
+        Returns:
+            SharedCorpus: The shared corpus.
+        """
+        strategy_classes = list(strategy_classes)
+
+        def used(attribute: str) -> bool:
+            return any(getattr(strategy_class, attribute, False) for strategy_class in strategy_classes)
+
+        return cls(
+            include_solver=used("uses_corpus_solver"),
+            include_index=used("uses_corpus_index"),
+            include_decision_tree=used("uses_corpus_decision_tree"),
+        )
+
+    def close(self) -> None:
+        """Release and remove the shared memory block, once the worker processes are done."""
+        self.block.close()
+        self.block.unlink()
+
+    def __enter__(self) -> "SharedCorpus":
+        """Use the shared corpus as a context manager closing it on exit."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Close the shared corpus."""
+        self.close()
+
+
+def shared_matrices(
+    words: Sequence[str], include_solver: bool, include_index: bool, include_decision_tree: bool
+) -> Dict[str, np.ndarray]:
+    """Get the arrays to be copied into the block after the corpus.
+
+    Args:
+        words: The words of the corpus.
+        include_solver: Whether to include the matrices of the solver.
+        include_index: Whether to include the packed index.
+        include_decision_tree: Whether to include the packed decision tree.
+
+    Returns:
+        dict: The arrays by name, those of the packed structures prefixed.
+    """
+    matrices: Dict[str, np.ndarray] = {}
+    if include_solver:
+        solver = get_corpus_solver() if words is WORDS_LIST else CandidateWordSolver(words)
+        matrices.update((name, np.ascontiguousarray(getattr(solver, name))) for name in SOLVER_ARRAYS)
+    if include_index:
+        word_index = get_corpus_index() if words is WORDS_LIST else WordIndex(words)
+        matrices.update((WORD_INDEX_PREFIX + name, array) for name, array in word_index.to_arrays().items())
+    if include_decision_tree:
+        tree_arrays = load_decision_tree(words).to_arrays()
+        matrices.update((DECISION_TREE_PREFIX + name, array) for name, array in tree_arrays.items())
+    return matrices
+
+
+def layout_arrays(matrices: Dict[str, np.ndarray], start: int) -> List[SharedArray]:
+    """Place arrays one after the other in a shared memory block, each aligned to ARRAY_ALIGNMENT.
+
+    Args:
+        matrices: The arrays by name.
+        start: Offset of the first free byte in the block.
+
+    Returns:
+        list[SharedArray]: The location of each array.
+    """
+    arrays = []
+    for name, matrix in matrices.items():
+        offset = -(-start // ARRAY_ALIGNMENT) * ARRAY_ALIGNMENT
+        arrays.append(SharedArray(name, matrix.dtype.str, matrix.shape, offset))
+        start = offset + matrix.nbytes
+    return arrays
+
+
+def view_array(block: shared_memory.SharedMemory, shared_array: SharedArray) -> np.ndarray:
+    """Get a NumPy array over a shared memory block without copying it.
+
+    Args:
+        block: The shared memory block.
+        shared_array: The location of the array in the block.
+
+    Returns:
+        numpy.ndarray: The array.
+    """
+    return np.ndarray(shared_array.shape, dtype=shared_array.dtype, buffer=block.buf, offset=shared_array.offset)
+
+
+def view_arrays(
+    block: shared_memory.SharedMemory, shared_arrays: Iterable[SharedArray], prefix: str
+) -> Dict[str, np.ndarray]:
+    """Get the NumPy arrays of a packed structure over a shared memory block without copying them.
+
+    Args:
+        block: The shared memory block.
+        shared_arrays: The location of the arrays in the block.
+        prefix: The name prefix of the arrays of the structure.
+
+    Returns:
+        dict: The arrays by name, without the prefix.
+    """
+    start = len(prefix)
+    return {shared_array.name[start:]: view_array(block, shared_array) for shared_array in shared_arrays}
+
+
+def attach_shared_corpus(handle: SharedCorpusHandle) -> None:
+    """Read WORDS_LIST, and the corpus solver, index and decision tree if shared, from the block of a shared corpus.
+
+    This is the initializer of the worker processes, the block stays attached until the process exits.
+
+    Args:
+        handle: The handle of the shared corpus.
+    """
+    block = shared_memory.SharedMemory(name=handle.block_name)
+    _ATTACHED_BLOCKS.append(block)
+    corpus_size = handle.corpus_size
+    WORDS_LIST.attach(CompiledWordsCorpus(buffer=block.buf[:corpus_size]))
+    if handle.arrays:
+        arrays = {shared_array.name: view_array(block, shared_array) for shared_array in handle.arrays}
+        attach_corpus_solver(CandidateWordSolver.from_arrays(arrays))
+    if handle.word_index:
+        attach_corpus_index(WordIndex.from_arrays(view_arrays(block, handle.word_index, WORD_INDEX_PREFIX)))
+    if handle.decision_tree:
+        tree_arrays = view_arrays(block, handle.decision_tree, DECISION_TREE_PREFIX)
+        attach_corpus_decision_tree(DecisionTree.from_arrays(tree_arrays))
@@ -0,0 +1,302 @@
+"""Module to define the headless game engine for simulating Hangman games without a terminal.
+
+The engine drives HangmanGameController with guessing strategies instead of a player, so the game rules are exactly
+the same as the interactive game, but no board is rendered and no prompt blocks the game loop.
+"""
+
+import random
+import string
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Callable, Dict, Iterator, List, Optional, Sequence
+
+from hangman.controllers import HangmanGameController
+from hangman.decision_tree import get_corpus_decision_tree
+from hangman.models import HangmanGameData
+from hangman.solver import get_corpus_solver
+from hangman.word_index import GameCandidates, get_corpus_index
+from hangman.utils import LETTER_MASKS, get_random_word
+from hangman.views import HangmanGameView
+
+# English letters ordered by their frequency in dictionary words.
+LETTERS_BY_FREQUENCY = "esiarntolcdupmghbyfvkwzxqj"
+
+
+class GuessingStrategy:  # pylint: disable=too-few-public-methods
+    """Base class of the strategies guessing letters on behalf of the player."""
+
+    def __init__(self, rng: random.Random):
+        """Create a guessing strategy.
+
+        Attributes:
+            rng: Random number generator of the simulation, strategies must not use the global random module state.
+        """
+        self.rng = rng
+
+    def next_guess(self, hangman_game_data: HangmanGameData) -> str:
+        """Choose the next guess letter.
+
+        Args:
+            hangman_game_data: The data object of the current game.
+
+        Returns:
+            str: A single lowercase letter which has not been guessed yet.
+        """
+        raise NotImplementedError
+
+
+class RandomLetterStrategy(GuessingStrategy):  # pylint: disable=too-few-public-methods
+    """Guess a random letter which has not been guessed yet."""
+
+    def next_guess(self, hangman_game_data: HangmanGameData) -> str:
+        """Choose a random letter which has not been guessed yet."""
+        guessed_mask = hangman_game_data.guessed_mask
+        return self.rng.choice([letter for letter in string.ascii_lowercase if not guessed_mask & LETTER_MASKS[letter]])
+
+
+class LetterFrequencyStrategy(GuessingStrategy):  # pylint: disable=too-few-public-methods
+    """Guess letters in the order of their frequency in English words."""
+
+    def next_guess(self, hangman_game_data: HangmanGameData) -> str:
+        """Choose the most frequent English letter which has not been guessed yet."""
+        guessed_mask = hangman_game_data.guessed_mask
+        return next(letter for letter in LETTERS_BY_FREQUENCY if not guessed_mask & LETTER_MASKS[letter])
+
+
+class CandidateSolverStrategy(LetterFrequencyStrategy):  # pylint: disable=too-few-public-methods
+    """Guess the letter which best splits the corpus words which are still consistent with the game."""
+
+    # The simulation workers attach to the solver matrices of the parent process instead of building their own.
+    uses_corpus_solver = True
+
+    def next_guess(self, hangman_game_data: HangmanGameData) -> str:
+        """Choose the letter suggested by the corpus solver, or the most frequent English letter if it has none."""
+        return get_corpus_solver().next_letter(hangman_game_data) or super().next_guess(hangman_game_data)
+
+
+class IndexedCandidateStrategy(LetterFrequencyStrategy):  # pylint: disable=too-few-public-methods
+    """Guess the letter in the most candidates, narrowing the candidates with the corpus index after each guess."""
+
+    # The simulation workers load the corpus index shared by the parent process instead of building their own.
+    uses_corpus_index = True
+
+    def __init__(self, rng: random.Random):
+        """Create the strategy.
+
+        Attributes:
+            rng: Random number generator of the simulation.
+        """
+        super().__init__(rng)
+        self._game_candidates: Optional[GameCandidates] = None
+
+    def next_guess(self, hangman_game_data: HangmanGameData) -> str:
+        """Choose the letter contained in the most candidates, or the most frequent English letter if there is none."""
+        # The game data of a new game may be the reset game data of the previous game, which has no guess yet.
+        if (
+            self._game_candidates is None
+            or self._game_candidates.hangman_game_data is not hangman_game_data
+            or not hangman_game_data.guessed_mask
+        ):
+            self._game_candidates = GameCandidates(get_corpus_index(), hangman_game_data)
+        candidate_set = self._game_candidates.update()
+        return candidate_set.best_letter(hangman_game_data.guessed_mask) or super().next_guess(hangman_game_data)
+
+
+class DecisionTreeStrategy(IndexedCandidateStrategy):  # pylint: disable=too-few-public-methods
+    """Guess the letter of the precomputed decision tree of the corpus, minimizing the expected missed guesses."""
+
+    # The simulation workers load the decision tree shared by the parent process instead of reading the cache.
+    uses_corpus_decision_tree = True
+
+    def next_guess(self, hangman_game_data: HangmanGameData) -> str:
+        """Look up the guess of the game state, or guess like IndexedCandidateStrategy if the tree has no such state."""
+        return get_corpus_decision_tree().next_letter(hangman_game_data) or super().next_guess(hangman_game_data)
+
+
+# Registered guessing strategies by name, each is created with the random number generator of the simulation.
+STRATEGIES: Dict[str, Callable[[random.Random], GuessingStrategy]] = {
+    "random": RandomLetterStrategy,
+    "frequency": LetterFrequencyStrategy,
+    "solver": CandidateSolverStrategy,
+    "index": IndexedCandidateStrategy,
+    "tree": DecisionTreeStrategy,
+}
+
+
+@dataclass
+class GameResult:
+    """Represent the outcome of a simulated game.
+
+    Attributes:
+        secret_word: (str) Secret word of the game.
+        won: (bool) Whether the strategy has won the game.
+        missed_letters: (List[str]) Missed letters in the order they were guessed.
+        correct_letters: (List[str]) Correct letters in the order they were guessed.
+    """
+
+    secret_word: str
+    won: bool
+    missed_letters: List[str] = field(default_factory=list)
+    correct_letters: List[str] = field(default_factory=list)
+
+
+@dataclass
+class SimulationSummary:
+    """Represent the summary results of simulated games.
+
+    Attributes:
+        games: (int) Number of games played.
+        wins: (int) Number of games won.
+        missed_guesses: (int) Total number of missed guesses over all games.
+        correct_guesses: (int) Total number of correct guesses over all games.
+        elapsed_seconds: (float) Wall-clock time spent on playing the games.
+    """
+
+    games: int = 0
+    wins: int = 0
+    missed_guesses: int = 0
+    correct_guesses: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def losses(self) -> int:
+        """Get the number of games lost."""
+        return self.games - self.wins
+
+    @property
+    def win_rate(self) -> float:
+        """Get the ratio of games won, 0 if no game was played."""
+        return self.wins / self.games if self.games else 0.0
+
+    @property
+    def mean_missed_guesses(self) -> float:
+        """Get the average number of missed guesses per game, 0 if no game was played."""
+        return self.missed_guesses / self.games if self.games else 0.0
+
+    @property
+    def games_per_second(self) -> float:
+        """Get the simulation throughput, 0 if no time was measured."""
+        return self.games / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    def add(self, game_result: GameResult) -> None:
+        """Count the outcome of one game into the summary.
+
+        Args:
+            game_result: The outcome of the game.
+        """
+        self.games += 1
+        self.wins += game_result.won
+        self.missed_guesses += len(game_result.missed_letters)
+        self.correct_guesses += len(game_result.correct_letters)
+
+    def merge(self, other: "SimulationSummary") -> None:
+        """Merge the summary of another batch of games into this summary.
+
+        Args:
+            other: The summary to be merged.
+        """
+        self.games += other.games
+        self.wins += other.wins
+        self.missed_guesses += other.missed_guesses
+        self.correct_guesses += other.correct_guesses
+        self.elapsed_seconds += other.elapsed_seconds
+
+    def to_dict(self) -> dict:
+        """Get the summary results including the derived figures.
+
+        Returns:
+            dict: The summary results, ready to be serialized as JSON.
+        """
+        summary = asdict(self)
+        summary.update(
+            losses=self.losses,
+            win_rate=self.win_rate,
+            mean_missed_guesses=self.mean_missed_guesses,
+            games_per_second=self.games_per_second,
+        )
+        return summary
+
+
+class HeadlessGameEngine:
+    """Play Hangman games with a guessing strategy at full CPU speed."""
+
+    def __init__(
+        self,
+        strategy_factory: Callable[[random.Random], GuessingStrategy],
+        seed: Optional[int] = None,
+        words: Optional[Sequence[str]] = None,
+    ):
+        """Create a headless game engine.
+
+        Attributes:
+            strategy_factory: Callable creating the guessing strategy with the random number generator of the engine.
+            seed: Seed of the random number generator drawing the secret words and used by the strategy.
+            words: The words to draw the secret words from. The WORDS_LIST constant is used if not given.
+        """
+        self.rng = random.Random(seed)
+        self.strategy = strategy_factory(self.rng)
+        self.words = words
+        self.hangman_game_view = HangmanGameView()
+
+    def draw_secret_word(self) -> str:
+        """Draw a random secret word with the random number generator of the engine."""
+        if self.words is None:
+            return get_random_word(self.rng)
+        return self.words[self.rng.randrange(len(self.words))]
+
+    def play_game(self, secret_word: str) -> GameResult:
+        """Play one game until the strategy wins or runs out of guesses.
+
+        Args:
+            secret_word: Secret word of the game.
+
+        Returns:
+            GameResult: The outcome of the game.
+
+        Raises:
+            ValueError: If the strategy makes a guess which the player is not allowed to enter.
+        """
+        hangman_game_data = HangmanGameData(secret_word=secret_word)
+        controller = HangmanGameController(hangman_game_data, self.hangman_game_view)
+        player_won = None
+        while player_won is None:
+            hangman_game_data.player_guess = self.strategy.next_guess(hangman_game_data)
+            input_err, err_msg = self.hangman_game_view.validate_player_guess(hangman_game_data)
+            if input_err:
+                raise ValueError(f"Invalid guess [{hangman_game_data.player_guess}] by strategy: {err_msg}")
+            player_won = controller.evaluate_player_guess(hangman_game_data.player_guess)
+
+        return GameResult(
+            secret_word=secret_word,
+            won=player_won,
+            missed_letters=hangman_game_data.missed_letters,
+            correct_letters=hangman_game_data.correct_letters,
+        )
+
+    def iter_games(self, games: int) -> Iterator[GameResult]:
+        """Play games with randomly drawn secret words.
+
+        Args:
+            games: Number of games to be played.
+
+        Yields:
+            GameResult: The outcome of each game.
+        """
+        for _ in range(games):
+            yield self.play_game(self.draw_secret_word())
+
+    def run(self, games: int) -> SimulationSummary:
+        """Play games with randomly drawn secret words and summarize the outcomes.
+
+        Args:
+            games: Number of games to be played.
+
+        Returns:
+            SimulationSummary: The summary results of the games.
+        """
+        summary = SimulationSummary()
+        start = time.perf_counter()
+        for game_result in self.iter_games(games):
+            summary.add(game_result)
+        summary.elapsed_seconds = time.perf_counter() - start
+        return summary
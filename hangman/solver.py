@@ -0,0 +1,273 @@
+"""Module to define the vectorized solver suggesting the next guess letter from the corpus words.
+
+The solver keeps the corpus words as NumPy arrays: a words-by-positions matrix of letter codes and a words-by-letters
+presence matrix. The words still consistent with a game, i.e. with its revealed letters and its missed letters, are
+found with batched array comparisons, and so are the letter counts over them, without Python loops over the words.
+
+The suggested guess is the letter which best splits the candidates: the candidates are split into families by the
+positions of the letter in them, and the letter leaving the fewest candidates on average is suggested.
+"""
+
+import functools
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from hangman.constants import WORDS_LIST
+from hangman.models import HangmanGameData
+from hangman.utils import ALPHABET_SIZE, ORD_A
+
+# Letter codes 0-25 are the letters a-z, followed by the codes of any other character and of the positions past the
+# end of a word.
+OTHER_CODE = ALPHABET_SIZE
+
+PAD_CODE = ALPHABET_SIZE + 1
+
+# Code of a position which is not revealed yet, it never occurs in the words.
+HIDDEN_CODE = ALPHABET_SIZE + 2
+
+HIDDEN_LETTER = "_"
+
+ALPHABET_MASK = (1 << ALPHABET_SIZE) - 1
+
+# Longest words whose letter positions are encoded as one 64-bit integer per word, longer ones are packed into bytes.
+MAX_INTEGER_POSITIONS = 64
+
+POSITION_BITS = np.left_shift(np.uint64(1), np.arange(MAX_INTEGER_POSITIONS, dtype=np.uint64))
+
+# Attributes of a solver holding its matrices, the rest of its state is rebuilt from them.
+SOLVER_ARRAYS = ("words", "lengths", "letter_codes", "letter_presence")
+
+# Solver over the matrices shared by the parent process, attached in the worker processes by hangman.shared_corpus.
+_attached_solver: Optional["CandidateWordSolver"] = None  # pylint: disable=invalid-name
+
+
+def sum_squared_family_sizes(codes: np.ndarray, letter_codes: np.ndarray) -> np.ndarray:
+    """Split words into families by the positions of each of some letters, and sum the squared family sizes per letter.
+
+    The words without the letter form a family as well. Divided by the number of words, the sum is the expected number
+    of words left after guessing the letter.
+
+    Args:
+        codes: The letter code of each position of each word, one row per word.
+        letter_codes: The codes of the letters to split the words by.
+
+    Returns:
+        numpy.ndarray: The sum of the squared family sizes of each letter.
+    """
+    words, length = codes.shape
+    if length > MAX_INTEGER_POSITIONS:
+        # The positions of each word are packed into bytes, and the families of each letter are counted in turn.
+        sums = []
+        for letter_code in letter_codes:
+            packed = np.ascontiguousarray(np.packbits(codes == letter_code, axis=1))
+            family_sizes = np.unique(packed.view(f"V{packed.shape[1]}").ravel(), return_counts=True)[1]
+            sums.append(float(np.square(family_sizes, dtype=np.float64).sum()))
+        return np.array(sums)
+
+    # The positions of each letter in each word as a bit mask, one column per letter.
+    masks = np.zeros((words, len(letter_codes)), dtype=np.uint64)
+    for position in range(length):
+        masks[codes[:, position, np.newaxis] == letter_codes] |= POSITION_BITS[position]
+    # Sort each column, so each family of a letter is a run of equal masks, and number the runs column by column.
+    masks.sort(axis=0)
+    new_family = np.ones(masks.shape, dtype=bool)
+    new_family[1:] = masks[1:] != masks[:-1]
+    family_sizes = np.bincount(np.cumsum(new_family.T.ravel()) - 1)
+    family_letters = np.repeat(np.arange(len(letter_codes)), np.count_nonzero(new_family, axis=0))
+    return np.bincount(family_letters, weights=np.square(family_sizes, dtype=np.float64), minlength=len(letter_codes))
+
+
+def get_letter_code(letter: str) -> int:
+    """Get the code of a letter in the solver matrices.
+
+    Args:
+        letter: A single character.
+
+    Returns:
+        int: 0-25 for the letters a-z, OTHER_CODE for any other character.
+    """
+    code = ord(letter) - ORD_A
+    return code if 0 <= code < ALPHABET_SIZE else OTHER_CODE
+
+
+class CandidateWordSolver:
+    """Find the words consistent with a game, and the letter which best splits them."""
+
+    def __init__(self, words: Sequence[str]):
+        """Build the solver matrices of a word list.
+
+        Attributes:
+            words: (numpy.ndarray) The words as a fixed-width unicode array.
+            lengths: (numpy.ndarray) The length of each word.
+            letter_codes: (numpy.ndarray) The letter code of each position of each word, PAD_CODE past the end.
+            letter_presence: (numpy.ndarray) Whether each word contains each of the letters a-z.
+        """
+        self.words = np.array(list(words), dtype=str)
+        # The fixed-width unicode array is a matrix of code points padded with zeros, 4 bytes per character.
+        code_points = self.words.view(np.uint32).reshape(len(self.words), self.words.dtype.itemsize // 4)
+        self.lengths = np.count_nonzero(code_points, axis=1)
+
+        codes = code_points.astype(np.int64) - ORD_A
+        is_alphabet = (codes >= 0) & (codes < ALPHABET_SIZE)
+        letter_codes = np.where(code_points == 0, PAD_CODE, OTHER_CODE)
+        letter_codes[is_alphabet] = codes[is_alphabet]
+        self.letter_codes = letter_codes.astype(np.uint8)
+
+        presence = np.zeros((len(self.words), PAD_CODE + 1), dtype=bool)
+        presence[np.arange(len(self.words))[:, np.newaxis], self.letter_codes] = True
+        self.letter_presence = presence[:, :ALPHABET_SIZE]
+        self._rows_by_length: Dict[int, np.ndarray] = {}
+
+    @classmethod
+    def from_arrays(cls, arrays: Dict[str, np.ndarray]) -> "CandidateWordSolver":
+        """Create a solver over matrices built by another solver, e.g. in a shared memory block, without copying them.
+
+        Args:
+            arrays: The SOLVER_ARRAYS attributes of the other solver by name.
+
+        Returns:
+            CandidateWordSolver: The solver.
+        """
+        solver = cls.__new__(cls)
+        for name in SOLVER_ARRAYS:
+            setattr(solver, name, arrays[name])
+        solver._rows_by_length = {}
+        return solver
+
+    def __len__(self) -> int:
+        """Get the number of words."""
+        return len(self.words)
+
+    def rows_of_length(self, length: int) -> np.ndarray:
+        """Get the indexes of the words of a length, computed once per length.
+
+        Args:
+            length: The word length.
+
+        Returns:
+            numpy.ndarray: The indexes of the words.
+        """
+        rows = self._rows_by_length.get(length)
+        if rows is None:
+            rows = self._rows_by_length[length] = np.flatnonzero(self.lengths == length)
+        return rows
+
+    def candidate_rows(self, revealed_letters: Sequence[str], missed_letters: Sequence[str]) -> np.ndarray:
+        """Get the indexes of the words consistent with the revealed letters and the missed letters.
+
+        Args:
+            revealed_letters: The letter at each position of the secret word, HIDDEN_LETTER if not revealed yet.
+            missed_letters: The letters which are not in the secret word.
+
+        Returns:
+            numpy.ndarray: The indexes of the candidate words.
+        """
+        length = len(revealed_letters)
+        rows = self.rows_of_length(length)
+        if rows.size == 0:
+            return rows
+        codes = self.letter_codes[rows, :length]
+        revealed_codes = np.array(
+            [HIDDEN_CODE if letter == HIDDEN_LETTER else get_letter_code(letter) for letter in revealed_letters],
+            dtype=np.uint8,
+        )
+        shown = revealed_codes != HIDDEN_CODE
+
+        # The revealed positions must hold the revealed letters.
+        consistent = np.all(codes[:, shown] == revealed_codes[shown], axis=1)
+        # A correct letter is revealed at all of its positions, so the hidden positions cannot hold any of them.
+        is_correct_code = np.zeros(HIDDEN_CODE + 1, dtype=bool)
+        is_correct_code[revealed_codes[shown]] = True
+        consistent &= ~np.any(is_correct_code[codes[:, ~shown]], axis=1)
+        # The words cannot contain any missed letter.
+        missed_codes = [code for code in map(get_letter_code, missed_letters) if code != OTHER_CODE]
+        if missed_codes:
+            consistent &= ~np.any(self.letter_presence[np.ix_(rows, missed_codes)], axis=1)
+        return rows[consistent]
+
+    def candidates(self, hangman_game_data: HangmanGameData) -> List[str]:
+        """Get the words consistent with a game.
+
+        Args:
+            hangman_game_data: The data object of the game, only the revealed letters and missed letters are used.
+
+        Returns:
+            list[str]: The candidate words.
+        """
+        return self.words[self._game_candidate_rows(hangman_game_data)].tolist()
+
+    def letter_counts(self, hangman_game_data: HangmanGameData) -> np.ndarray:
+        """Count the candidate words of a game containing each letter which has not been guessed yet.
+
+        Args:
+            hangman_game_data: The data object of the game.
+
+        Returns:
+            numpy.ndarray: The number of candidate words containing each of the letters a-z, 0 for guessed letters.
+        """
+        return self._count_letters(self._game_candidate_rows(hangman_game_data), hangman_game_data.guessed_mask)
+
+    def next_letter(self, hangman_game_data: HangmanGameData) -> Optional[str]:
+        """Suggest the letter which best splits the candidate words of a game.
+
+        A guess splits the candidates into families by the positions of the letter in them, the family of the words
+        without the letter included, and only the family of the secret word is left. The suggested letter minimizes
+        the expected number of candidates left, i.e. the sum of the squared family sizes, and a tie goes to the letter
+        contained in the most candidates, which is the most likely correct guess.
+
+        Args:
+            hangman_game_data: The data object of the game.
+
+        Returns:
+            str: The letter, None if no candidate word contains a letter which has not been guessed yet, e.g. when the
+                secret word is not in the corpus.
+        """
+        rows = self._game_candidate_rows(hangman_game_data)
+        counts = self._count_letters(rows, hangman_game_data.guessed_mask)
+        letter_codes = np.flatnonzero(counts)
+        if not letter_codes.size:
+            return None
+        if len(rows) > 1:
+            codes = self.letter_codes[rows, : len(hangman_game_data.revealed_letters)]
+            scores = sum_squared_family_sizes(codes, letter_codes.astype(np.uint8))
+            # Sort by the expected candidates left first, then by the most candidates containing the letter.
+            letter_codes = letter_codes[np.lexsort((-counts[letter_codes], scores))]
+        return chr(ORD_A + int(letter_codes[0]))
+
+    def _count_letters(self, rows: np.ndarray, guessed_mask: int) -> np.ndarray:
+        """Count the words containing each letter which has not been guessed yet.
+
+        Args:
+            rows: The indexes of the words.
+            guessed_mask: The bit mask of the guessed letters.
+
+        Returns:
+            numpy.ndarray: The number of words containing each of the letters a-z, 0 for guessed letters.
+        """
+        counts = np.count_nonzero(self.letter_presence[rows], axis=0)
+        counts[((guessed_mask & ALPHABET_MASK) >> np.arange(ALPHABET_SIZE)) & 1 == 1] = 0
+        return counts
+
+    def _game_candidate_rows(self, hangman_game_data: HangmanGameData) -> np.ndarray:
+        """Get the indexes of the words consistent with a game."""
+        return self.candidate_rows(hangman_game_data.revealed_letters, hangman_game_data.missed_letters)
+
+
+@functools.lru_cache(maxsize=None)
+def get_corpus_solver() -> CandidateWordSolver:
+    """Get the solver of the WORDS_LIST constant, built once per process on first use unless one is attached."""
+    if _attached_solver is not None:
+        return _attached_solver
+    return CandidateWordSolver(WORDS_LIST)
+
+
+def attach_corpus_solver(solver: Optional[CandidateWordSolver]) -> None:
+    """Use a solver built elsewhere as the solver of the WORDS_LIST constant.
+
+    Args:
+        solver: The solver, e.g. over the matrices shared by the parent process. None builds the solver again.
+    """
+    global _attached_solver  # pylint: disable=global-statement
+    _attached_solver = solver
+    get_corpus_solver.cache_clear()
@@ -0,0 +1,299 @@
+"""Module to define the tournament playing registered guessing strategies against every word of the corpus.
+
+Every strategy plays one game per word of WORDS_LIST. The words are split into fixed-size chunks per strategy, and each
+chunk is played by a worker process with one controller whose game data is reset for each word, so a game costs the
+strategy guesses and the controller rules only. The outcome of each game is written into NumPy columns indexed by word,
+and the strategies are ranked by win rate with confidence intervals.
+
+The random number generator of a chunk is seeded from the master seed and the chunk position, and not from the
+strategy, so the strategies drawing random letters are compared on the same random numbers.
+"""
+
+import csv
+import math
+import multiprocessing
+import random
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from hangman.constants import WORDS_LIST
+from hangman.controllers import HangmanGameController
+from hangman.models import HangmanGameData
+from hangman.parallel import derive_seed
+from hangman.shared_corpus import SharedCorpus, attach_shared_corpus
+from hangman.simulation import STRATEGIES
+from hangman.utils import LETTER_MASKS
+from hangman.views import HangmanGameView
+
+DEFAULT_CHUNK_SIZE = 1000
+
+# Two-sided 95% quantile of the standard normal distribution.
+CONFIDENCE_Z = 1.959963984540054
+
+
+@dataclass(frozen=True)
+class TournamentChunk:
+    """Represent the words a strategy plays in one worker.
+
+    Attributes:
+        index: (int) Position of the chunk among the chunks of the strategy.
+        strategy: (str) Name of the registered guessing strategy.
+        start: (int) Index of the first word of the chunk in WORDS_LIST.
+        stop: (int) Index after the last word of the chunk in WORDS_LIST.
+        seed: (int) Seed of the random number generator of the chunk.
+    """
+
+    index: int
+    strategy: str
+    start: int
+    stop: int
+    seed: int
+
+
+@dataclass(frozen=True)
+class ChunkResults:
+    """Represent the outcome of the games of a chunk, one array item per word.
+
+    Attributes:
+        chunk: (TournamentChunk) The chunk played.
+        won: (numpy.ndarray) Whether the strategy has won each game.
+        missed_guesses: (numpy.ndarray) Number of missed guesses of each game.
+        correct_guesses: (numpy.ndarray) Number of correct guesses of each game.
+    """
+
+    chunk: TournamentChunk
+    won: np.ndarray
+    missed_guesses: np.ndarray
+    correct_guesses: np.ndarray
+
+
+def iter_tournament_chunks(
+    strategies: Sequence[str], words: int, master_seed: int, chunk_size: int
+) -> Iterator[TournamentChunk]:
+    """Split the games of a tournament into chunks.
+
+    Args:
+        strategies: Names of the registered guessing strategies.
+        words: Number of words in the corpus.
+        master_seed: Seed of the whole tournament.
+        chunk_size: Maximum number of words per chunk.
+
+    Yields:
+        TournamentChunk: The chunks of each strategy in turn.
+    """
+    for strategy in strategies:
+        for index, start in enumerate(range(0, words, chunk_size)):
+            yield TournamentChunk(
+                index, strategy, start, min(start + chunk_size, words), derive_seed(master_seed, index)
+            )
+
+
+def play_tournament_chunk(chunk: TournamentChunk) -> ChunkResults:
+    """Play the words of a chunk with its strategy, this is run in the worker processes.
+
+    Args:
+        chunk: The chunk to be played.
+
+    Returns:
+        ChunkResults: The outcome of each game.
+
+    Raises:
+        ValueError: If the strategy guesses something else than a letter which has not been guessed yet.
+    """
+    strategy = STRATEGIES[chunk.strategy](random.Random(chunk.seed))
+    games = chunk.stop - chunk.start
+    won = np.zeros(games, dtype=bool)
+    missed_guesses = np.zeros(games, dtype=np.uint8)
+    correct_guesses = np.zeros(games, dtype=np.uint8)
+    hangman_game_data: Optional[HangmanGameData] = None
+    controller: Optional[HangmanGameController] = None
+    for game, word_index in enumerate(range(chunk.start, chunk.stop)):
+        if hangman_game_data is None:
+            hangman_game_data = HangmanGameData(secret_word=WORDS_LIST[word_index], secret_word_index=word_index)
+            controller = HangmanGameController(hangman_game_data, HangmanGameView())
+        else:
+            hangman_game_data.reset(WORDS_LIST[word_index], word_index)
+        player_won = None
+        while player_won is None:
+            player_guess = strategy.next_guess(hangman_game_data)
+            # The mask of anything else than a letter is 0, and so is the mask of a letter which has been guessed.
+            if not LETTER_MASKS.get(player_guess, 0) & ~hangman_game_data.guessed_mask:
+                raise ValueError(f"Invalid guess [{player_guess}] by strategy {chunk.strategy}.")
+            player_won = controller.evaluate_player_guess(player_guess)
+        won[game] = player_won
+        missed_guesses[game] = len(hangman_game_data.missed_letters)
+        correct_guesses[game] = len(hangman_game_data.correct_letters)
+    return ChunkResults(chunk, won, missed_guesses, correct_guesses)
+
+
+def wilson_interval(successes: int, trials: int, z: float = CONFIDENCE_Z) -> Tuple[float, float]:
+    """Get the Wilson score confidence interval of a proportion, which stays within [0, 1] for few trials.
+
+    Args:
+        successes: Number of successes.
+        trials: Number of trials.
+        z: Quantile of the standard normal distribution of the confidence level.
+
+    Returns:
+        float, float: The lower and upper bounds, (0, 1) if there is no trial.
+    """
+    if not trials:
+        return 0.0, 1.0
+    proportion = successes / trials
+    denominator = 1 + z * z / trials
+    center = (proportion + z * z / (2 * trials)) / denominator
+    margin = z * math.sqrt(proportion * (1 - proportion) / trials + z * z / (4 * trials * trials)) / denominator
+    return max(0.0, center - margin), min(1.0, center + margin)
+
+
+@dataclass(frozen=True)
+class StrategyStanding:  # pylint: disable=too-many-instance-attributes
+    """Represent the results of a strategy in the tournament.
+
+    Attributes:
+        strategy: (str) Name of the strategy.
+        games: (int) Number of games played.
+        wins: (int) Number of games won.
+        win_rate: (float) Ratio of games won.
+        win_rate_low: (float) Lower bound of the 95% confidence interval of the win rate.
+        win_rate_high: (float) Upper bound of the 95% confidence interval of the win rate.
+        mean_missed_guesses: (float) Average number of missed guesses per game.
+        missed_guesses_margin: (float) Half width of the 95% confidence interval of the average missed guesses.
+    """
+
+    strategy: str
+    games: int
+    wins: int
+    win_rate: float
+    win_rate_low: float
+    win_rate_high: float
+    mean_missed_guesses: float
+    missed_guesses_margin: float
+
+
+class TournamentResults:
+    """Hold the outcome of every game of a tournament in columns, one array per strategy and column."""
+
+    def __init__(self, strategies: Sequence[str], words: int):
+        """Allocate the columns of the games of each strategy, indexed by word.
+
+        Attributes:
+            won: Whether each strategy has won the game of each word.
+            missed_guesses: Number of missed guesses of each strategy for each word.
+            correct_guesses: Number of correct guesses of each strategy for each word.
+            elapsed_seconds: Wall-clock time spent on playing the games.
+        """
+        self.won: Dict[str, np.ndarray] = {strategy: np.zeros(words, dtype=bool) for strategy in strategies}
+        self.missed_guesses: Dict[str, np.ndarray] = {
+            strategy: np.zeros(words, dtype=np.uint8) for strategy in strategies
+        }
+        self.correct_guesses: Dict[str, np.ndarray] = {
+            strategy: np.zeros(words, dtype=np.uint8) for strategy in strategies
+        }
+        self.elapsed_seconds = 0.0
+
+    @property
+    def games(self) -> int:
+        """Get the number of games played by all the strategies."""
+        return sum(len(won) for won in self.won.values())
+
+    def add(self, chunk_results: ChunkResults) -> None:
+        """Copy the outcome of the games of a chunk into the columns.
+
+        Args:
+            chunk_results: The outcome of the games of the chunk.
+        """
+        chunk = chunk_results.chunk
+        start, stop = chunk.start, chunk.stop
+        self.won[chunk.strategy][start:stop] = chunk_results.won
+        self.missed_guesses[chunk.strategy][start:stop] = chunk_results.missed_guesses
+        self.correct_guesses[chunk.strategy][start:stop] = chunk_results.correct_guesses
+
+    def standings(self) -> List[StrategyStanding]:
+        """Rank the strategies by win rate, then by fewest missed guesses.
+
+        Returns:
+            list[StrategyStanding]: The results of the strategies, best first.
+        """
+        standings = []
+        for strategy, won in self.won.items():
+            games, wins = len(won), int(np.count_nonzero(won))
+            missed_guesses = self.missed_guesses[strategy]
+            mean_missed_guesses = float(missed_guesses.mean()) if games else 0.0
+            missed_guesses_margin = 0.0
+            if games > 1:
+                missed_guesses_margin = CONFIDENCE_Z * float(missed_guesses.std(ddof=1)) / math.sqrt(games)
+            standings.append(
+                StrategyStanding(
+                    strategy,
+                    games,
+                    wins,
+                    wins / games if games else 0.0,
+                    *wilson_interval(wins, games),
+                    mean_missed_guesses,
+                    missed_guesses_margin,
+                )
+            )
+        return sorted(standings, key=lambda standing: (-standing.win_rate, standing.mean_missed_guesses))
+
+    def write_csv(self, path: str, words: Sequence[str] = WORDS_LIST) -> None:
+        """Write the outcome of every game as one CSV row.
+
+        Args:
+            path: Path of the CSV file.
+            words: The corpus the games were played on.
+        """
+        with open(path, mode="w", encoding="utf-8", newline="") as csv_file:
+            writer = csv.writer(csv_file)
+            writer.writerow(["strategy", "word_index", "secret_word", "won", "missed_guesses", "correct_guesses"])
+            for strategy, won in self.won.items():
+                columns = zip(
+                    won.tolist(), self.missed_guesses[strategy].tolist(), self.correct_guesses[strategy].tolist()
+                )
+                for word_index, (game_won, missed, correct) in enumerate(columns):
+                    writer.writerow([strategy, word_index, words[word_index], int(game_won), missed, correct])
+
+
+def run_tournament(
+    strategies: Sequence[str],
+    master_seed: int,
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> TournamentResults:
+    """Play every registered strategy given against every word of WORDS_LIST across a process pool.
+
+    Args:
+        strategies: Names of the registered guessing strategies.
+        master_seed: Seed of the whole tournament.
+        workers: Number of worker processes, the number of CPUs if not given. 1 plays all chunks in this process.
+        chunk_size: Maximum number of words per chunk.
+
+    Returns:
+        TournamentResults: The outcome of every game, elapsed_seconds is the wall-clock time of the run.
+
+    Raises:
+        ValueError: If a strategy is not registered.
+    """
+    unknown = [strategy for strategy in strategies if strategy not in STRATEGIES]
+    if unknown:
+        raise ValueError(f"Unknown guessing strategies {', '.join(unknown)}.")
+
+    start = time.perf_counter()
+    results = TournamentResults(strategies, len(WORDS_LIST))
+    chunks = iter_tournament_chunks(strategies, len(WORDS_LIST), master_seed, chunk_size)
+    if workers == 1:
+        for chunk_results in map(play_tournament_chunk, chunks):
+            results.add(chunk_results)
+    else:
+        # The workers read the corpus, and the solver, index or decision tree the strategies use, from shared memory.
+        strategy_classes = [STRATEGIES[strategy] for strategy in strategies]
+        with SharedCorpus.for_strategies(strategy_classes) as shared_corpus, multiprocessing.Pool(
+            workers, initializer=attach_shared_corpus, initargs=(shared_corpus.handle,)
+        ) as pool:
+            for chunk_results in pool.imap_unordered(play_tournament_chunk, chunks):
+                results.add(chunk_results)
+    results.elapsed_seconds = time.perf_counter() - start
+    return results
@@ -1,15 +1,103 @@
 """Module to define package level functions."""
 
+import os
 import random
+from typing import Iterable, Optional, Tuple
 
 from hangman.constants import WORDS_LIST
 
+ALPHABET_SIZE = 26
 
-def get_random_word() -> str:
+ORD_A = ord("a")
+
+# Precomputed bit masks of the letters a-z.
+LETTER_MASKS = {chr(ORD_A + code): 1 << code for code in range(ALPHABET_SIZE)}
+
+
+def draw_random_word(rng: Optional[random.Random] = None, difficulty: Optional[str] = None) -> Tuple[int, str]:
+    """Draw a random word and its index from the WORDS_LIST constant.
+
+    Args:
+        rng: Random number generator to draw with. The global random module state is used if not given.
+        difficulty: Difficulty tier to draw from, one of DIFFICULTY_TIERS. Any word is drawn if not given.
+
+    Returns:
+        int, str: The index of the random word in the WORDS_LIST constant, and the random word.
+
+    Raises:
+        ValueError: If the difficulty tier is unknown.
+    """
+    if difficulty:
+        # Imported here, so the difficulty scores are only loaded by the games drawing by difficulty.
+        # pylint: disable-next=import-outside-toplevel,cyclic-import
+        from hangman.difficulty import get_corpus_difficulty_tiers
+
+        idx = get_corpus_difficulty_tiers().draw(difficulty, rng)
+    else:
+        idx = (rng or random).randint(0, len(WORDS_LIST) - 1)
+    return idx, WORDS_LIST[idx]
+
+
+def get_random_word(rng: Optional[random.Random] = None, difficulty: Optional[str] = None) -> str:
     """Get a random word from the WORDS_LIST constant.
 
+    Args:
+        rng: Random number generator to draw with. The global random module state is used if not given.
+        difficulty: Difficulty tier to draw from, one of DIFFICULTY_TIERS. Any word is drawn if not given.
+
     Returns:
         str: The random word from the WORDS_LIST constant.
     """
-    idx = random.randint(0, len(WORDS_LIST) - 1)
-    return WORDS_LIST[idx]
+    return draw_random_word(rng, difficulty)[1]
+
+
+def letter_mask(letter: str) -> int:
+    """Get the bit mask of a letter.
+
+    Letters a-z are mapped to bits 0-25, so the masks of ordinary words fit in 26 bits. Any other character is mapped
+    to a bit above them, so masks remain exact for accented letters as well.
+
+    Args:
+        letter: A single character.
+
+    Returns:
+        int: The integer with only the bit of the letter set.
+    """
+    mask = LETTER_MASKS.get(letter)
+    return mask if mask is not None else 1 << (ord(letter) + ALPHABET_SIZE)
+
+
+def letters_mask(letters: Iterable[str]) -> int:
+    """Get the bit mask of a set of letters.
+
+    Args:
+        letters: The letters, duplicates are allowed.
+
+    Returns:
+        int: The integer with the bits of all the letters set.
+    """
+    mask = 0
+    for letter in letters:
+        mask |= letter_mask(letter)
+    return mask
+
+
+def get_user_cache_dir(name: str, env_var: str) -> str:
+    """Get a cache directory of the package.
+
+    Args:
+        name: Name of the cache directory in the hangman directory of the user cache directory.
+        env_var: Name of the environment variable overriding the cache directory.
+
+    Returns:
+        str: The directory of the environment variable if set, else the hangman/<name> directory of the user cache
+            directory, i.e. %LOCALAPPDATA% on Windows and $XDG_CACHE_HOME or ~/.cache elsewhere.
+    """
+    cache_dir = os.environ.get(env_var)
+    if cache_dir:
+        return cache_dir
+    if os.name == "nt":
+        user_cache_dir = os.environ.get("LOCALAPPDATA") or os.path.expanduser(os.path.join("~", "AppData", "Local"))
+    else:
+        user_cache_dir = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser(os.path.join("~", ".cache"))
+    return os.path.join(user_cache_dir, "hangman", name)
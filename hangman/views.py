@@ -1,25 +1,104 @@
 """Module to define view functions of the Model-View-Controller design pattern."""
 
-from typing import Tuple
+import functools
+import sys
+from itertools import zip_longest
+from typing import List, Optional, TextIO, Tuple
 
 import click
 
 from hangman.constants import HANGMAN_PICS
 from hangman.models import HangmanGameData
 
+# ANSI sequences for clearing the screen and moving the cursor home (as click.clear() does), clearing the current line,
+# and clearing from the cursor to the end of the screen.
+ANSI_CLEAR_SCREEN = "\033[2J\033[1;1H"
+
+ANSI_CLEAR_LINE = "\033[2K"
+
+ANSI_CLEAR_BELOW = "\033[J"
+
+PROMPT_GUESS = "Please enter a guess letter: "
+
+PROMPT_PLAY_AGAIN = "Do you want to play again? [y/n]: "
+
+
+def ansi_move_cursor(row: int) -> str:
+    """Get the ANSI sequence moving the cursor to the start of a row, counting from 1."""
+    return f"\033[{row};1H"
+
+
+@functools.lru_cache(maxsize=None)
+def get_styled_hangman_pics() -> Tuple[Tuple[str, ...], ...]:
+    """Get the lines of each Hangman picture with the ANSI styles applied, built once and then cached.
+
+    Each line is styled on its own, so a single line can be redrawn without breaking the styles of the others.
+
+    Returns:
+        tuple: The styled lines of each Hangman picture, in the order of HANGMAN_PICS.
+    """
+    return tuple(
+        tuple(click.style(line, fg="bright_red", bold=True) for line in pic.split("\n")) for pic in HANGMAN_PICS
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def get_styled_board_title() -> str:
+    """Get the Hangman board title with the ANSI styles applied, built once and then cached."""
+    return click.style(" H A N G M A N ", fg="white", bg="green", bold=True)
+
 
 class HangmanGameView:
     """View class of Hangman game."""
 
+    def __init__(self, diff_mode: bool = False, output: Optional[TextIO] = None):
+        """Display the Hangman game on a console.
+
+        Each board refresh is composed into one frame and written to the output in one write. In diff mode, only the
+        lines changed since the previous frame are redrawn when the output is a terminal.
+
+        Attributes:
+            diff_mode: Whether to redraw only the changed lines of the board.
+            output: Stream to write the board to, the standard output if not given.
+            invalid_inputs: Number of invalid guesses entered by the player.
+        """
+        self.diff_mode = diff_mode
+        self.output = output
+        self.invalid_inputs = 0
+        self._last_frame_lines: List[str] = []
+
+    def is_output_terminal(self) -> bool:
+        """Check whether the board is written to a terminal, which is when the screen can be cleared."""
+        isatty = getattr(self.output or sys.stdout, "isatty", None)
+        return bool(isatty and isatty())
+
     def clear_screen(self) -> None:
         """Clear console. Just in case we need to change the way of clearing screen."""
         click.clear()
 
+    def _prompt(self, text: str) -> str:
+        """Write a prompt to the output of the board and read the line entered by the player.
+
+        The prompt is written in one write like the board frames, rather than by click.prompt() to the standard output,
+        so it follows the board even when the board is written to another stream.
+
+        Args:
+            text: The prompt, including any blank line before it.
+
+        Returns:
+            str: The line entered by the player, empty if the player only pressed enter.
+
+        Raises:
+            click.Abort: If the input ends or the player interrupts it.
+        """
+        click.echo(text, file=self.output, nl=False)
+        return click.prompt("", default="", show_default=False, prompt_suffix="")
+
     def validate_player_guess(self, hangman_game_data: HangmanGameData) -> Tuple[bool, str]:
         """Validate guess letter entered by player.
 
         Args:
-            hangman_game_data: HangmanGameData data object for getting the guess letter and already_guessed_letters.
+            hangman_game_data: HangmanGameData data object for getting the guess letter and already guessed letters.
 
         Returns:
             bool, str: The bool indicates if the input letter is invalid. The str is the error message respectively.
@@ -29,7 +108,7 @@ class HangmanGameView:
 
         if len(guess_letter) != 1:
             input_err, err_msg = True, "Please enter one letter."
-        elif guess_letter in hangman_game_data.already_guessed_letters:
+        elif hangman_game_data.is_letter_guessed(guess_letter):
             input_err, err_msg = True, f"You have already guessed the letter [{guess_letter}]. Please choose again."
         elif not guess_letter.isalpha():
             input_err, err_msg = True, "Please enter an alphabet letter (a-z/A-Z)."
@@ -47,18 +126,15 @@ class HangmanGameView:
         """
         input_err = False
         while True:
-            if not input_err:
-                # Print a blank line in order to fix the position of the subsequent strings.
-                click.secho()
-
-            # Capture and validate player's input.
-            hangman_game_data.player_guess = click.prompt("Please enter a guess letter", default="").lower()
+            # Capture and validate player's input. After a valid board, a blank line fixes the position of the prompt
+            # on the line of the error messages.
+            hangman_game_data.player_guess = self._prompt(PROMPT_GUESS if input_err else f"\n{PROMPT_GUESS}").lower()
             input_err, err_msg = self.validate_player_guess(hangman_game_data)
 
             if input_err:
+                self.invalid_inputs += 1
                 # On input error, refresh the board so that the error message can always be displayed on the fixed line.
-                self.show_hangman_board(hangman_game_data)
-                click.secho(err_msg, fg="bright_red")
+                self.show_hangman_board(hangman_game_data, click.style(err_msg, fg="bright_red"))
             else:
                 # Otherwise the guess was captured, we can then exit the loop and function.
                 break
@@ -71,11 +147,14 @@ class HangmanGameView:
         Returns:
             bool: True if the player wants to play again, and vice versa.
         """
-        return click.prompt("Do you want to play again? [y/n]").lower().startswith("y")
+        answer = ""
+        while not answer:
+            answer = self._prompt(PROMPT_PLAY_AGAIN)
+        return answer.lower().startswith("y")
 
     def show_hangman_board_title(self) -> None:
         """Show Hangman board title to console."""
-        click.secho(" H A N G M A N ", fg="white", bg="green", bold=True)
+        click.echo(get_styled_board_title(), file=self.output)
 
     def get_hangman_pic(self, hangman_game_data: HangmanGameData) -> str:
         """Get Hangman picture according to the number of missed guesses.
@@ -94,7 +173,7 @@ class HangmanGameView:
         Args:
             hangman_game_data: The data object for retrieving the number of missed letters.
         """
-        click.secho(self.get_hangman_pic(hangman_game_data), fg="bright_red", bold=True)
+        click.secho(self.get_hangman_pic(hangman_game_data), file=self.output, fg="bright_red", bold=True)
 
     def get_missed_letters_message(self, hangman_game_data: HangmanGameData) -> str:
         """Get missed letters message.
@@ -110,7 +189,7 @@ class HangmanGameView:
         Args:
             hangman_game_data: The data object for retrieving the missed letters.
         """
-        click.secho(self.get_missed_letters_message(hangman_game_data))
+        click.secho(self.get_missed_letters_message(hangman_game_data), file=self.output)
 
     def get_secret_word_with_correct_letters_message(self, hangman_game_data: HangmanGameData) -> str:
         """Get correct guesses message.
@@ -126,19 +205,61 @@ class HangmanGameView:
         Args:
             hangman_game_data: The data object for retrieving the combination of secret word and correct letters.
         """
-        click.secho(self.get_secret_word_with_correct_letters_message(hangman_game_data))
+        click.secho(self.get_secret_word_with_correct_letters_message(hangman_game_data), file=self.output)
+
+    def get_hangman_board_lines(self, hangman_game_data: HangmanGameData) -> List[str]:
+        """Get the styled lines of the Hangman board.
 
-    def show_hangman_board(self, hangman_game_data: HangmanGameData) -> None:
-        """Show Hangman board to console.
+        Args:
+            hangman_game_data: The data object for retrieving the Hangman game data.
+
+        Returns:
+            list[str]: The lines of the board title, Hangman picture, missed letters and correct letters.
+        """
+        lines = [get_styled_board_title()]
+        lines.extend(get_styled_hangman_pics()[len(hangman_game_data.missed_letters)])
+        lines.append(self.get_missed_letters_message(hangman_game_data))
+        lines.append(self.get_secret_word_with_correct_letters_message(hangman_game_data))
+        return lines
+
+    def build_frame(self, lines: List[str]) -> str:
+        """Compose the lines of a board refresh into one string to be written to the output.
+
+        Args:
+            lines: The lines of the board.
+
+        Returns:
+            str: The frame including the ANSI sequences for clearing the screen or redrawing the changed lines.
+        """
+        frame = "".join(f"{line}\n" for line in lines)
+        if not self.is_output_terminal():
+            # The screen cannot be cleared when the output is redirected, e.g. to a file.
+            return frame
+        if not (self.diff_mode and self._last_frame_lines):
+            return f"{ANSI_CLEAR_SCREEN}{frame}"
+
+        # Redraw the changed lines only, then clear everything below the board, e.g. the previous prompt.
+        parts = [
+            f"{ansi_move_cursor(row)}{ANSI_CLEAR_LINE}{line or ''}"
+            for row, (line, last_line) in enumerate(zip_longest(lines, self._last_frame_lines), start=1)
+            if line != last_line
+        ]
+        parts.append(f"{ansi_move_cursor(len(lines) + 1)}{ANSI_CLEAR_BELOW}")
+        return "".join(parts)
+
+    def show_hangman_board(self, hangman_game_data: HangmanGameData, message: str = "") -> None:
+        """Show Hangman board to console in a single write.
 
         Args:
             hangman_game_data: The data object for retrieving the Hangman game data.
+            message: Optional styled message to be shown below the board.
         """
-        self.clear_screen()
-        self.show_hangman_board_title()
-        self.show_hangman_pic(hangman_game_data)
-        self.show_missed_letters(hangman_game_data)
-        self.show_secret_word_with_correct_letters(hangman_game_data)
+        lines = self.get_hangman_board_lines(hangman_game_data)
+        if message:
+            lines.append(message)
+        frame = self.build_frame(lines)
+        self._last_frame_lines = lines
+        click.echo(frame, file=self.output, nl=False)
 
     def get_player_won_message(self, hangman_game_data: HangmanGameData) -> str:
         """Get player won message.
@@ -157,7 +278,7 @@ class HangmanGameView:
         Args:
             hangman_game_data: The data object for retrieving the secret word.
         """
-        click.secho(self.get_player_won_message(hangman_game_data), fg="bright_green")
+        click.secho(self.get_player_won_message(hangman_game_data), file=self.output, fg="bright_green")
 
     def get_player_lost_message_first_line(self, hangman_game_data: HangmanGameData) -> str:
         """Get first line of player lost message.
@@ -191,5 +312,5 @@ class HangmanGameView:
         Args:
             hangman_game_data: The data object for retrieving the numbers of missed letters and correct letters.
         """
-        click.secho(self.get_player_lost_message_first_line(hangman_game_data), fg="bright_red")
-        click.secho(self.get_player_lost_message_second_line(hangman_game_data))
+        click.secho(self.get_player_lost_message_first_line(hangman_game_data), file=self.output, fg="bright_red")
+        click.secho(self.get_player_lost_message_second_line(hangman_game_data), file=self.output)
@@ -0,0 +1,525 @@
+"""Module to define the positional inverted index of the corpus words.
+
+The words are bucketed by length. Within a bucket, each word is a row, and every set of rows is an integer bit set, the
+same representation as the letter masks of HangmanGameData. The bucket keeps the posting list of each (position,
+letter) pair and, for each letter, the rows by the exact positions the letter occupies, where the positions 0 are the
+words without the letter. A guess then narrows the candidates with a single AND of bit sets instead of a scan.
+
+A bucket can also be packed into NumPy arrays, its bit sets as rows of bytes, so worker processes read the index in
+place from a shared memory block. The packed bucket converts a bit set to an integer on each lookup, and combines the
+rows of a letter at exact positions from the posting lists, so it holds no bit set of its own.
+"""
+
+import functools
+import sys
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from hangman.constants import WORDS_LIST
+from hangman.models import HangmanGameData
+from hangman.solver import MAX_INTEGER_POSITIONS, POSITION_BITS
+from hangman.utils import LETTER_MASKS
+
+HAS_BIT_COUNT = sys.version_info >= (3, 10)
+
+# Separator of the word length and the array name in the names of the arrays of a packed index.
+ARRAY_NAME_SEPARATOR = "/"
+
+# Index read from the block shared by the parent process, attached in the worker processes by hangman.shared_corpus.
+_attached_index: Optional["WordIndex"] = None  # pylint: disable=invalid-name
+
+
+def positions_mask(positions: Iterable[int]) -> int:
+    """Get the bit mask of a set of positions in a word.
+
+    Args:
+        positions: The positions, counting from 0.
+
+    Returns:
+        int: The integer with the bits of all the positions set.
+    """
+    mask = 0
+    for position in positions:
+        mask |= 1 << position
+    return mask
+
+
+def rows_bit_set(rows: np.ndarray) -> int:
+    """Build the bit set of rows at once.
+
+    Setting the bits one by one on a Python integer copies the growing integer for each row, which is quadratic in the
+    number of rows. The bits are set in a boolean array instead, which is packed into the bytes of the integer.
+
+    Args:
+        rows: The rows in ascending order.
+
+    Returns:
+        int: The integer with the bits of all the rows set.
+    """
+    if not len(rows):  # pylint: disable=use-implicit-booleaness-not-len
+        return 0
+    bits = np.zeros(rows[-1] + 1, dtype=bool)
+    bits[rows] = True
+    return int.from_bytes(np.packbits(bits, bitorder="little").tobytes(), "little")
+
+
+def group_rows(keys: np.ndarray) -> Tuple[np.ndarray, List[np.ndarray]]:
+    """Group the rows of an array by their key.
+
+    Args:
+        keys: The key of each row.
+
+    Returns:
+        numpy.ndarray, list[numpy.ndarray]: The distinct keys in ascending order, and the rows of each key in ascending
+            order.
+    """
+    # A stable sort keeps the rows of each key in ascending order.
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+    starts = np.flatnonzero(sorted_keys[1:] != sorted_keys[:-1]) + 1
+    return sorted_keys[np.concatenate(([0], starts))], np.split(order, starts)
+
+
+def iter_rows(rows: int) -> Iterator[int]:
+    """Iterate over the rows of a bit set in ascending order.
+
+    Args:
+        rows: The bit set.
+
+    Yields:
+        int: The row of each set bit.
+    """
+    while rows:
+        lowest_bit = rows & -rows
+        yield lowest_bit.bit_length() - 1
+        rows ^= lowest_bit
+
+
+def count_rows(rows: int) -> int:
+    """Count the rows of a bit set."""
+    # int.bit_count() is only available from Python 3.10, and is much faster than counting the digits of bin().
+    if HAS_BIT_COUNT:
+        return rows.bit_count()
+    return bin(rows).count("1")
+
+
+class LengthBucket:
+    """Index the words of one length."""
+
+    def __init__(self, words: Sequence[str]):
+        """Build the posting lists of the words.
+
+        Attributes:
+            words: The words of the bucket, the row of a word is its position in this list.
+            all_rows: The bit set of all rows.
+            postings: The rows by (position, letter) pair.
+            letter_rows: The rows of the words containing each letter.
+            letter_patterns: For each letter, the rows by the mask of the exact positions of the letter in the word.
+        """
+        self.words = list(words)
+        self.all_rows = (1 << len(self.words)) - 1
+        self.postings: Dict[Tuple[int, str], int] = {}
+        self.letter_rows: Dict[str, int] = {}
+        self.letter_patterns: Dict[str, Dict[int, int]] = {}
+        # The words of a bucket all have the same length, so they form a matrix of code points, one row per word.
+        length = len(self.words[0]) if self.words else 0
+        if not length:
+            return
+        code_points = np.array(self.words, dtype=f"U{length}").view(np.uint32).reshape(len(self.words), length)
+        for position in range(length):
+            letter_codes, posting_rows = group_rows(code_points[:, position])
+            for letter_code, rows in zip(letter_codes.tolist(), posting_rows):
+                self.postings[(position, chr(letter_code))] = rows_bit_set(rows)
+
+        for letter_code in np.unique(code_points).tolist():
+            letter = chr(letter_code)
+            is_letter = code_points == letter_code
+            rows = np.flatnonzero(is_letter.any(axis=1))
+            self.letter_rows[letter] = rows_bit_set(rows)
+            if length <= MAX_INTEGER_POSITIONS:
+                masks, pattern_rows = group_rows(
+                    (is_letter[rows] * POSITION_BITS[:length]).sum(axis=1, dtype=np.uint64)
+                )
+                self.letter_patterns[letter] = {
+                    mask: rows_bit_set(rows[pattern]) for mask, pattern in zip(masks.tolist(), pattern_rows)
+                }
+                continue
+            # The positions of longer words are packed into bytes, and the mask is built from the first word of a group.
+            packed_positions = np.ascontiguousarray(np.packbits(is_letter[rows], axis=1))
+            _, pattern_rows = group_rows(packed_positions.view(f"V{packed_positions.shape[1]}").ravel())
+            self.letter_patterns[letter] = {
+                positions_mask(np.flatnonzero(is_letter[rows[pattern[0]]]).tolist()): rows_bit_set(rows[pattern])
+                for pattern in pattern_rows
+            }
+
+    def rows_with_letter_at(self, letter: str, positions: Iterable[int]) -> int:
+        """Get the rows having a letter at exactly the given positions, the words without the letter if none is given.
+
+        Args:
+            letter: The guessed letter.
+            positions: The positions of the letter in the secret word.
+
+        Returns:
+            int: The bit set of the rows.
+        """
+        mask = positions_mask(positions)
+        if not mask:
+            return self.all_rows & ~self.letter_rows.get(letter, 0)
+        return self.letter_patterns.get(letter, {}).get(mask, 0)
+
+    def query(self, letters_at: Mapping[int, str], excluded_letters: Iterable[str] = ()) -> int:
+        """Get the rows with letters at some positions which do not contain any excluded letter.
+
+        Args:
+            letters_at: The letter by position.
+            excluded_letters: The letters the words must not contain.
+
+        Returns:
+            int: The bit set of the rows.
+        """
+        rows = self.all_rows
+        for position, letter in letters_at.items():
+            rows &= self.postings.get((position, letter), 0)
+        for letter in excluded_letters:
+            rows &= ~self.letter_rows.get(letter, 0)
+        return rows
+
+    def rows_with_letter(self, letter: str) -> int:
+        """Get the rows of the words containing a letter."""
+        return self.letter_rows.get(letter, 0)
+
+    def best_letter(self, rows: int, guessed_mask: int) -> Optional[str]:
+        """Get the letter a-z contained in the most words of some rows which has not been guessed yet.
+
+        Args:
+            rows: The bit set of the rows.
+            guessed_mask: The bit mask of the guessed letters.
+
+        Returns:
+            str: The letter, None if no word of the rows contains a letter which has not been guessed yet.
+        """
+        best_letter, best_count = None, 0
+        # Letters are visited in alphabetical order, so ties go to the first letter like the NumPy solver.
+        for letter, mask in LETTER_MASKS.items():
+            if guessed_mask & mask:
+                continue
+            letter_count = count_rows(rows & self.letter_rows.get(letter, 0))
+            if letter_count > best_count:
+                best_letter, best_count = letter, letter_count
+        return best_letter
+
+    def words_of(self, rows: int) -> List[str]:
+        """Get the words of the rows of a bit set."""
+        return [self.words[row] for row in iter_rows(rows)]
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        """Pack the bucket into the arrays of a PackedLengthBucket.
+
+        Returns:
+            dict: The arrays by name. The bit sets of the letters come first, in the order of the letters, followed by
+                the posting lists. The bit sets of the exact positions of the letters are left out.
+        """
+        letters = sorted(self.letter_rows)
+        columns = {letter: column for column, letter in enumerate(letters)}
+        bit_sets = [self.letter_rows[letter] for letter in letters]
+        length = len(self.words[0]) if self.words else 0
+        posting_slots = np.full((length, len(letters)), -1, dtype=np.int32)
+        for (position, letter), rows in self.postings.items():
+            posting_slots[position, columns[letter]] = len(bit_sets)
+            bit_sets.append(rows)
+        row_bytes = -(-len(self.words) // 8)
+        packed_bit_sets = b"".join(rows.to_bytes(row_bytes, "little") for rows in bit_sets)
+        return {
+            "words": np.array(self.words, dtype=f"U{max(length, 1)}"),
+            "letters": np.array([ord(letter) for letter in letters], dtype=np.uint32),
+            "bit_sets": np.frombuffer(packed_bit_sets, dtype=np.uint8).reshape(len(bit_sets), row_bytes),
+            "posting_slots": posting_slots,
+        }
+
+
+class PackedLengthBucket:  # pylint: disable=too-many-instance-attributes
+    """Index the words of one length in NumPy arrays, e.g. read in place from a shared memory block."""
+
+    def __init__(self, arrays: Mapping[str, np.ndarray]):
+        """Use the arrays of LengthBucket.to_arrays() without copying them.
+
+        Attributes:
+            word_array: The words of the bucket, the row of a word is its position in this array.
+            bit_sets: The bytes of each bit set in little-endian order, those of the letters first.
+            posting_slots: The bit set of each position and letter, -1 if no word has the letter at the position.
+            all_rows: The bit set of all rows.
+        """
+        self.word_array = arrays["words"]
+        self.bit_sets = arrays["bit_sets"]
+        self.posting_slots = arrays["posting_slots"]
+        self.all_rows = (1 << len(self.word_array)) - 1
+        # A bucket has a few dozen letters and positions at most, so the slots of their bit sets are kept in small
+        # Python containers, and the bit sets are read through a flat memory view, which is faster to slice.
+        self._letter_columns = {chr(code): column for column, code in enumerate(arrays["letters"].tolist())}
+        self._slots_by_position = self.posting_slots.tolist()
+        self._row_bytes = self.bit_sets.shape[1]
+        self._bit_set_bytes = memoryview(self.bit_sets.reshape(-1))
+        # The letters are in code point order, so the letters a-z are in alphabetical order.
+        self._guess_letters = [
+            (letter, LETTER_MASKS[letter], slice(column * self._row_bytes, (column + 1) * self._row_bytes))
+            for letter, column in self._letter_columns.items()
+            if letter in LETTER_MASKS
+        ]
+
+    @property
+    def words(self) -> List[str]:
+        """Get the words of the bucket."""
+        return self.word_array.tolist()
+
+    def _bit_set(self, slot: int) -> int:
+        """Read a bit set, the empty bit set for the slot -1."""
+        if slot < 0:
+            return 0
+        start = slot * self._row_bytes
+        end = start + self._row_bytes
+        return int.from_bytes(self._bit_set_bytes[start:end], "little")
+
+    def _posting(self, position: int, letter: str) -> int:
+        """Read the rows having a letter at a position."""
+        column = self._letter_columns.get(letter)
+        return 0 if column is None else self._bit_set(self._slots_by_position[position][column])
+
+    def rows_with_letter(self, letter: str) -> int:
+        """Get the rows of the words containing a letter."""
+        # The bit sets of the letters come first, so the column of a letter is also the slot of its bit set.
+        column = self._letter_columns.get(letter)
+        return 0 if column is None else self._bit_set(column)
+
+    def best_letter(self, rows: int, guessed_mask: int) -> Optional[str]:
+        """Get the letter a-z contained in the most words of some rows which has not been guessed yet.
+
+        Args:
+            rows: The bit set of the rows.
+            guessed_mask: The bit mask of the guessed letters.
+
+        Returns:
+            str: The letter, None if no word of the rows contains a letter which has not been guessed yet.
+        """
+        best_letter, best_count = None, 0
+        bit_set_bytes = self._bit_set_bytes
+        # The bit sets are read inline, as this runs for every letter of every guess. Ties go to the first letter.
+        for letter, mask, bit_set_slice in self._guess_letters:
+            if guessed_mask & mask:
+                continue
+            letter_count = count_rows(rows & int.from_bytes(bit_set_bytes[bit_set_slice], "little"))
+            if letter_count > best_count:
+                best_letter, best_count = letter, letter_count
+        return best_letter
+
+    def rows_with_letter_at(self, letter: str, positions: Iterable[int]) -> int:
+        """Get the rows having a letter at exactly the given positions, the words without the letter if none is given.
+
+        Args:
+            letter: The guessed letter.
+            positions: The positions of the letter in the secret word.
+
+        Returns:
+            int: The bit set of the rows.
+        """
+        mask = positions_mask(positions)
+        rows = self.rows_with_letter(letter)
+        if not mask:
+            return self.all_rows & ~rows
+        for position in range(len(self.posting_slots)):
+            posting = self._posting(position, letter)
+            rows &= posting if mask >> position & 1 else ~posting
+        return rows
+
+    def query(self, letters_at: Mapping[int, str], excluded_letters: Iterable[str] = ()) -> int:
+        """Get the rows with letters at some positions which do not contain any excluded letter.
+
+        Args:
+            letters_at: The letter by position.
+            excluded_letters: The letters the words must not contain.
+
+        Returns:
+            int: The bit set of the rows.
+        """
+        rows = self.all_rows
+        for position, letter in letters_at.items():
+            rows &= self._posting(position, letter) if 0 <= position < len(self.posting_slots) else 0
+        for letter in excluded_letters:
+            rows &= ~self.rows_with_letter(letter)
+        return rows
+
+    def words_of(self, rows: int) -> List[str]:
+        """Get the words of the rows of a bit set."""
+        word_array = self.word_array
+        return [str(word_array[row]) for row in iter_rows(rows)]
+
+
+class WordIndex:
+    """Positional inverted index of a word list, bucketed by word length."""
+
+    def __init__(self, words: Iterable[str]):
+        """Build the index.
+
+        Attributes:
+            buckets: The index of the words of each length.
+        """
+        words_by_length: Dict[int, List[str]] = {}
+        for word in words:
+            words_by_length.setdefault(len(word), []).append(word)
+        self.buckets: Dict[int, Union[LengthBucket, PackedLengthBucket]] = {
+            length: LengthBucket(bucket_words) for length, bucket_words in words_by_length.items()
+        }
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        """Pack the buckets into NumPy arrays, e.g. to be copied into a shared memory block.
+
+        Returns:
+            dict: The arrays of each bucket, named by the word length and the array name, e.g. '5/bit_sets'.
+        """
+        return {
+            f"{length}{ARRAY_NAME_SEPARATOR}{name}": array
+            for length, bucket in self.buckets.items()
+            for name, array in bucket.to_arrays().items()
+        }
+
+    @classmethod
+    def from_arrays(cls, arrays: Mapping[str, np.ndarray]) -> "WordIndex":
+        """Use the arrays of to_arrays() as the index, without copying them.
+
+        Args:
+            arrays: The arrays by name.
+
+        Returns:
+            WordIndex: The index of packed buckets.
+        """
+        arrays_by_length: Dict[int, Dict[str, np.ndarray]] = {}
+        for name, array in arrays.items():
+            length, array_name = name.split(ARRAY_NAME_SEPARATOR)
+            arrays_by_length.setdefault(int(length), {})[array_name] = array
+        word_index = cls([])
+        word_index.buckets = {
+            length: PackedLengthBucket(bucket_arrays) for length, bucket_arrays in arrays_by_length.items()
+        }
+        return word_index
+
+    def query(self, length: int, letters_at: Mapping[int, str], excluded_letters: Iterable[str] = ()) -> List[str]:
+        """Get the words of a length with letters at some positions which do not contain any excluded letter.
+
+        Args:
+            length: The word length.
+            letters_at: The letter by position.
+            excluded_letters: The letters the words must not contain.
+
+        Returns:
+            list[str]: The words in corpus order.
+        """
+        bucket = self.buckets.get(length)
+        if bucket is None:
+            return []
+        return bucket.words_of(bucket.query(letters_at, excluded_letters))
+
+    def candidate_set(self, length: int) -> "CandidateSet":
+        """Get the candidates of a new game with a secret word of a length, i.e. all the words of that length."""
+        bucket = self.buckets.get(length) or LengthBucket([])
+        return CandidateSet(bucket, bucket.all_rows)
+
+
+class CandidateSet:
+    """Represent the words still consistent with a game, narrowed incrementally after each guess."""
+
+    def __init__(self, bucket: Union[LengthBucket, PackedLengthBucket], rows: int):
+        """Create a candidate set.
+
+        Attributes:
+            bucket: The index of the words of the secret word length.
+            rows: The bit set of the candidate rows.
+        """
+        self.bucket = bucket
+        self.rows = rows
+
+    def __len__(self) -> int:
+        """Get the number of candidate words."""
+        return count_rows(self.rows)
+
+    @property
+    def words(self) -> List[str]:
+        """Get the candidate words in corpus order."""
+        return self.bucket.words_of(self.rows)
+
+    def narrow(self, letter: str, positions: Iterable[int] = ()) -> None:
+        """Keep the candidates consistent with a guess.
+
+        Args:
+            letter: The guessed letter.
+            positions: The positions where the letter was revealed, none for a missed letter.
+        """
+        self.rows &= self.bucket.rows_with_letter_at(letter, positions)
+
+    def best_letter(self, guessed_mask: int) -> Optional[str]:
+        """Get the letter contained in the most candidate words which has not been guessed yet.
+
+        Args:
+            guessed_mask: The bit mask of the guessed letters.
+
+        Returns:
+            str: The letter, None if no candidate word contains a letter which has not been guessed yet.
+        """
+        return self.bucket.best_letter(self.rows, guessed_mask)
+
+
+class GameCandidates:  # pylint: disable=too-few-public-methods
+    """Track the candidate words of a game, narrowing them with the guesses made since the last update."""
+
+    def __init__(self, word_index: WordIndex, hangman_game_data: HangmanGameData):
+        """Start tracking a game.
+
+        Attributes:
+            hangman_game_data: The data object of the game.
+            candidate_set: The candidates after the guesses applied so far.
+        """
+        self.hangman_game_data = hangman_game_data
+        self.candidate_set = word_index.candidate_set(len(hangman_game_data.secret_word))
+        self._applied_missed = 0
+        self._applied_correct = 0
+
+    def update(self) -> CandidateSet:
+        """Narrow the candidates with the guesses made since the last update.
+
+        Only the revealed letters and the missed letters of the game are used, never the secret word itself.
+
+        Returns:
+            CandidateSet: The candidates consistent with all the guesses of the game.
+        """
+        hangman_game_data = self.hangman_game_data
+        applied_missed, applied_correct = self._applied_missed, self._applied_correct
+        for letter in hangman_game_data.missed_letters[applied_missed:]:
+            self.candidate_set.narrow(letter)
+        self._applied_missed = len(hangman_game_data.missed_letters)
+
+        new_correct_letters = hangman_game_data.correct_letters[applied_correct:]
+        if new_correct_letters:
+            revealed_letters = hangman_game_data.revealed_letters
+            for letter in new_correct_letters:
+                positions = [position for position, revealed in enumerate(revealed_letters) if revealed == letter]
+                self.candidate_set.narrow(letter, positions)
+            self._applied_correct = len(hangman_game_data.correct_letters)
+        return self.candidate_set
+
+
+@functools.lru_cache(maxsize=None)
+def get_corpus_index() -> WordIndex:
+    """Get the index of the WORDS_LIST constant, built once per process on first use unless one is attached."""
+    if _attached_index is not None:
+        return _attached_index
+    return WordIndex(WORDS_LIST)
+
+
+def attach_corpus_index(word_index: Optional[WordIndex]) -> None:
+    """Use an index built elsewhere as the index of the WORDS_LIST constant.
+
+    Args:
+        word_index: The index, e.g. read from the block shared by the parent process. None builds the index again.
+    """
+    global _attached_index  # pylint: disable=global-statement
+    _attached_index = word_index
+    get_corpus_index.cache_clear()
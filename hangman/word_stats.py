@@ -0,0 +1,273 @@
+"""Module to define the streaming aggregator of per-word game statistics.
+
+The aggregator keeps a fixed-size record per secret word: the games, the wins, and the distributions of the missed
+guesses and of the guess counts. Its memory grows with the number of distinct secret words only, never with the number
+of games. Aggregators of different shards can be merged, and saved to and loaded from checkpoint files. A checkpoint
+also holds the number of records consumed from the input, so a run resumed on the same input skips them.
+"""
+
+import json
+import os
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Sequence
+
+from hangman.constants import MAX_MISSED_GUESSES
+from hangman.utils import ALPHABET_SIZE, letters_mask
+
+CHECKPOINT_VERSION = 2
+
+# Checkpoints of version 1 have no consumed records count, which is taken as 0.
+SUPPORTED_CHECKPOINT_VERSIONS = (1, CHECKPOINT_VERSION)
+
+# Each letter can only be guessed once, so a game has at most one guess per letter of the alphabet.
+MAX_GUESS_COUNT = ALPHABET_SIZE
+
+
+class GameRecord(NamedTuple):
+    """Represent the outcome of a game read from a JSON line, with the same fields as HangmanGameData.
+
+    Attributes:
+        secret_word: Secret word of the game.
+        missed_letters: Missed letters of the game.
+        correct_letters: Correct letters of the game.
+    """
+
+    secret_word: str
+    missed_letters: Sequence[str]
+    correct_letters: Sequence[str]
+
+
+def _histogram_quantile(histogram: List[int], quantile: float) -> int:
+    """Get the smallest value whose cumulative count reaches a quantile of the total count.
+
+    Args:
+        histogram: The count of each value, indexed by value.
+        quantile: The quantile between 0 and 1.
+
+    Returns:
+        int: The value, 0 if the histogram is empty.
+    """
+    target = quantile * sum(histogram)
+    cumulative = 0
+    for value, count in enumerate(histogram):
+        cumulative += count
+        if count and cumulative >= target:
+            return value
+    return 0
+
+
+@dataclass
+class WordStats:
+    """Represent the running statistics of the games of one secret word.
+
+    The guess counts are small integers, so they are kept as a full histogram and the quantiles are exact.
+
+    Attributes:
+        games: (int) Number of games.
+        wins: (int) Number of games won.
+        missed_counts: (List[int]) Number of games by number of missed guesses.
+        guess_counts: (List[int]) Number of games by number of guesses, missed and correct.
+    """
+
+    games: int = 0
+    wins: int = 0
+    missed_counts: List[int] = field(default_factory=lambda: [0] * (MAX_MISSED_GUESSES + 1))
+    guess_counts: List[int] = field(default_factory=lambda: [0] * (MAX_GUESS_COUNT + 1))
+
+    @property
+    def win_rate(self) -> float:
+        """Get the ratio of games won, 0 if no game was played."""
+        return self.wins / self.games if self.games else 0.0
+
+    @property
+    def mean_missed_guesses(self) -> float:
+        """Get the average number of missed guesses per game, 0 if no game was played."""
+        total = sum(missed * count for missed, count in enumerate(self.missed_counts))
+        return total / self.games if self.games else 0.0
+
+    @property
+    def mean_guesses(self) -> float:
+        """Get the average number of guesses per game, 0 if no game was played."""
+        total = sum(guesses * count for guesses, count in enumerate(self.guess_counts))
+        return total / self.games if self.games else 0.0
+
+    def guesses_quantile(self, quantile: float) -> int:
+        """Get a quantile of the number of guesses per game, e.g. 0.5 for the median.
+
+        Args:
+            quantile: The quantile between 0 and 1.
+
+        Returns:
+            int: The number of guesses, 0 if no game was played.
+        """
+        return _histogram_quantile(self.guess_counts, quantile)
+
+    def add(self, won: bool, missed_guesses: int, correct_guesses: int) -> None:
+        """Count the outcome of one game.
+
+        Args:
+            won: Whether the game was won.
+            missed_guesses: Number of missed guesses of the game.
+            correct_guesses: Number of correct guesses of the game.
+        """
+        self.games += 1
+        self.wins += won
+        self.missed_counts[min(missed_guesses, MAX_MISSED_GUESSES)] += 1
+        self.guess_counts[min(missed_guesses + correct_guesses, MAX_GUESS_COUNT)] += 1
+
+    def merge(self, other: "WordStats") -> None:
+        """Merge the statistics of another shard into these statistics.
+
+        Args:
+            other: The statistics to be merged.
+        """
+        self.games += other.games
+        self.wins += other.wins
+        for missed, count in enumerate(other.missed_counts):
+            self.missed_counts[missed] += count
+        for guesses, count in enumerate(other.guess_counts):
+            self.guess_counts[guesses] += count
+
+    def to_dict(self) -> dict:
+        """Get the derived statistics.
+
+        Returns:
+            dict: The statistics, ready to be serialized as JSON.
+        """
+        return {
+            "games": self.games,
+            "wins": self.wins,
+            "win_rate": self.win_rate,
+            "mean_missed_guesses": self.mean_missed_guesses,
+            "mean_guesses": self.mean_guesses,
+            "guesses_p50": self.guesses_quantile(0.5),
+            "guesses_p90": self.guesses_quantile(0.9),
+            "guesses_p99": self.guesses_quantile(0.99),
+        }
+
+
+class WordStatsAggregator:
+    """Aggregate streams of game outcomes into running statistics per secret word."""
+
+    def __init__(self):
+        """Create an empty aggregator.
+
+        Attributes:
+            words: The statistics of each secret word.
+            records_consumed: Number of records counted by consume(), i.e. the offset to resume reading the input at.
+        """
+        self.words: Dict[str, WordStats] = {}
+        self.records_consumed = 0
+
+    def __len__(self) -> int:
+        """Get the number of distinct secret words."""
+        return len(self.words)
+
+    def add(self, secret_word: str, missed_letters: Sequence[str], correct_letters: Sequence[str]) -> None:
+        """Count the outcome of one finished game.
+
+        Args:
+            secret_word: Secret word of the game.
+            missed_letters: Missed letters of the game.
+            correct_letters: Correct letters of the game.
+        """
+        won = not letters_mask(secret_word) & ~letters_mask(correct_letters)
+        word_stats = self.words.get(secret_word)
+        if word_stats is None:
+            word_stats = self.words[secret_word] = WordStats()
+        word_stats.add(won, len(missed_letters), len(correct_letters))
+
+    def consume(self, records: Iterable) -> int:
+        """Count the outcomes of a stream of finished games.
+
+        Args:
+            records: Objects with secret_word, missed_letters and correct_letters, like HangmanGameData, GameResult or
+                GameRecord.
+
+        Returns:
+            int: Number of games counted.
+        """
+        games = 0
+        for record in records:
+            self.add(record.secret_word, record.missed_letters, record.correct_letters)
+            games += 1
+        self.records_consumed += games
+        return games
+
+    def merge(self, other: "WordStatsAggregator") -> None:
+        """Merge the statistics of another shard into this aggregator.
+
+        The records consumed by the other shard were read from another input, so they are not added to the offset of
+        this aggregator.
+
+        Args:
+            other: The aggregator to be merged.
+        """
+        for secret_word, other_stats in other.words.items():
+            self.words.setdefault(secret_word, WordStats()).merge(other_stats)
+
+    def total(self) -> WordStats:
+        """Get the statistics of all games, whatever the secret word."""
+        total = WordStats()
+        for word_stats in self.words.values():
+            total.merge(word_stats)
+        return total
+
+    def save(self, path: str) -> None:
+        """Write the statistics to a checkpoint file, replacing it atomically.
+
+        Args:
+            path: Path of the checkpoint file.
+        """
+        checkpoint = {
+            "version": CHECKPOINT_VERSION,
+            "records_consumed": self.records_consumed,
+            "words": {
+                secret_word: [word_stats.games, word_stats.wins, word_stats.missed_counts, word_stats.guess_counts]
+                for secret_word, word_stats in self.words.items()
+            },
+        }
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, mode="w", encoding="utf-8") as checkpoint_file:
+            json.dump(checkpoint, checkpoint_file, separators=(",", ":"))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "WordStatsAggregator":
+        """Read the statistics from a checkpoint file written by save().
+
+        Args:
+            path: Path of the checkpoint file.
+
+        Returns:
+            WordStatsAggregator: The aggregator.
+
+        Raises:
+            ValueError: If the checkpoint version is not supported.
+        """
+        with open(path, mode="r", encoding="utf-8") as checkpoint_file:
+            checkpoint = json.load(checkpoint_file)
+        if checkpoint.get("version") not in SUPPORTED_CHECKPOINT_VERSIONS:
+            raise ValueError(f"Unsupported word statistics checkpoint version {checkpoint.get('version')}.")
+        aggregator = cls()
+        aggregator.records_consumed = checkpoint.get("records_consumed", 0)
+        for secret_word, (games, wins, missed_counts, guess_counts) in checkpoint["words"].items():
+            aggregator.words[secret_word] = WordStats(games, wins, missed_counts, guess_counts)
+        return aggregator
+
+
+def iter_game_records(lines: Iterable[str]) -> Iterator[GameRecord]:
+    """Read game outcomes from JSON lines, e.g. the output of the play-script command, skipping unfinished games.
+
+    Args:
+        lines: The JSON lines.
+
+    Yields:
+        GameRecord: The outcome of each finished game.
+    """
+    for line in lines:
+        if not line.strip():
+            continue
+        game = json.loads(line)
+        if game.get("won", False) is not None:
+            yield GameRecord(game["secret_word"], game["missed_letters"], game["correct_letters"])
@@ -0,0 +1,18 @@
+"""Module to define the fixtures shared by the tests."""
+
+import pytest
+
+from hangman.decision_tree import DECISION_TREE_CACHE_DIR_ENV
+from hangman.difficulty import DIFFICULTY_CACHE_DIR_ENV
+
+
+@pytest.fixture(autouse=True)
+def temporary_cache_dirs(tmp_path_factory, monkeypatch) -> None:
+    """Keep the cache files written by the tests out of the user cache directory.
+
+    Args:
+        tmp_path_factory: Factory of temporary directories provided by pytest.
+        monkeypatch: Fixture for patching the environment variables.
+    """
+    monkeypatch.setenv(DECISION_TREE_CACHE_DIR_ENV, str(tmp_path_factory.mktemp("decision_trees")))
+    monkeypatch.setenv(DIFFICULTY_CACHE_DIR_ENV, str(tmp_path_factory.mktemp("difficulty")))
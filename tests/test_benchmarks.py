@@ -0,0 +1,117 @@
+"""Module for testing the benchmarks module."""
+
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from hangman.benchmarks import (
+    BENCHMARK_GUESSES,
+    BENCHMARK_SECRET_WORD,
+    BENCHMARKS,
+    STARTUP_BENCHMARK,
+    BenchmarkResult,
+    NullOutput,
+    ScriptedGameView,
+    find_regressions,
+    load_results,
+    run_benchmarks,
+    save_results,
+)
+from hangman.cli import cli
+from hangman.controllers import HangmanGameController
+from hangman.models import HangmanGameData
+
+
+@pytest.fixture(name="benchmark_result")
+def fixture_benchmark_result() -> BenchmarkResult:
+    """Get the timings of a benchmark with 1 microsecond per call.
+
+    Returns:
+        BenchmarkResult: The timings.
+    """
+    return BenchmarkResult(name="game_loop", number=1000, repeat=3, best_seconds=0.001, mean_seconds=0.002)
+
+
+class TestBenchmarks:
+    """Unit test the benchmark suite."""
+
+    def test_scripted_game_view(self) -> None:
+        """Test the scripted view plays the benchmark game to a win without writing anything out."""
+        output = NullOutput()
+        hangman_game_data = HangmanGameData(secret_word=BENCHMARK_SECRET_WORD)
+        HangmanGameController(hangman_game_data, ScriptedGameView(BENCHMARK_GUESSES, output)).start_game()
+
+        assert hangman_game_data.game_finished
+        assert hangman_game_data.is_secret_word_revealed
+        assert hangman_game_data.missed_letters == ["e", "z", "x", "q"]
+
+    def test_run_benchmarks(self) -> None:
+        """Test each registered benchmark is timed."""
+        results = run_benchmarks(list(BENCHMARKS), repeat=2, number=3)
+        assert [result.name for result in results] == list(BENCHMARKS)
+        assert all(result.number == 3 and result.repeat == 2 for result in results)
+        assert all(0 < result.best_seconds <= result.mean_seconds for result in results)
+
+    def test_run_startup_benchmark(self) -> None:
+        """Test the startup benchmark times the process, the import and the first board of fresh interpreters."""
+        results = run_benchmarks([STARTUP_BENCHMARK], repeat=1)
+        assert [result.name for result in results] == ["startup_process", "startup_import", "startup_first_frame"]
+        process_seconds, import_seconds, first_frame_seconds = (result.best_seconds for result in results)
+        assert 0 < import_seconds + first_frame_seconds < process_seconds
+
+    def test_save_and_load_results(self, tmp_path, benchmark_result: BenchmarkResult) -> None:
+        """Test the time per call of each benchmark is read back from the JSON file.
+
+        Args:
+            tmp_path: The pytest built-in temporary directory fixture.
+            benchmark_result: The timings of a benchmark.
+        """
+        path = str(tmp_path / "results.json")
+        save_results(path, [benchmark_result])
+        assert load_results(path) == {"game_loop": pytest.approx(1e-6)}
+
+    @pytest.mark.parametrize(
+        "baseline_seconds, expected_regressions",
+        [
+            (1e-6, 0),
+            (0.9e-6, 0),
+            (0.7e-6, 1),
+        ],
+    )
+    def test_find_regressions(
+        self, benchmark_result: BenchmarkResult, baseline_seconds: float, expected_regressions: int
+    ) -> None:
+        """Test benchmarks slower than the baseline by more than the tolerance are reported.
+
+        Args:
+            benchmark_result: The timings of a benchmark with 1 microsecond per call.
+            baseline_seconds: The time per call of the baseline.
+            expected_regressions: The expected number of regressions with the default tolerance of 25%.
+        """
+        assert len(find_regressions([benchmark_result], {"game_loop": baseline_seconds})) == expected_regressions
+
+    def test_find_regressions_new_benchmark(self, benchmark_result: BenchmarkResult) -> None:
+        """Test benchmarks missing from the baseline are not compared."""
+        assert not find_regressions([benchmark_result], {"render_frame": 1e-9})
+
+    def test_benchmark_command(self, tmp_path) -> None:
+        """Test the benchmark command writes the results and fails against a much faster baseline.
+
+        Args:
+            tmp_path: The pytest built-in temporary directory fixture.
+        """
+        output_path = tmp_path / "results.json"
+        args = ["benchmark", "--only", "already_guessed_letters", "--repeat", "1"]
+        result = CliRunner().invoke(cli, args + ["--output", str(output_path)])
+        assert result.exit_code == 0
+        assert "already_guessed_letters" in result.output
+
+        document = json.loads(output_path.read_text(encoding="utf-8"))
+        document["benchmarks"]["already_guessed_letters"]["seconds_per_call"] /= 100
+        baseline_path = tmp_path / "baseline.json"
+        baseline_path.write_text(json.dumps(document), encoding="utf-8")
+
+        result = CliRunner().invoke(cli, args + ["--baseline", str(baseline_path)])
+        assert result.exit_code == 1
+        assert "slower than the baseline" in result.output
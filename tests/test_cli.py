@@ -0,0 +1,113 @@
+"""Module for testing the cli module."""
+
+import json
+import subprocess
+import sys
+from unittest import mock
+
+from click.testing import CliRunner
+
+from hangman.cli import cli
+
+
+class TestCli:
+    """Unit test the command line interface."""
+
+    def test_default_command_starts_game(self) -> None:
+        """Test the game is started when no command is given."""
+        with mock.patch("hangman.cli.HangmanGameController") as mock_controller:
+            result = CliRunner().invoke(cli, [])
+        assert result.exit_code == 0
+        mock_controller.return_value.start_game.assert_called_once_with()
+
+    def test_evil_mode(self) -> None:
+        """Test the evil flag starts the game with the adversarial game data."""
+        with mock.patch("hangman.cli.HangmanGameController") as mock_controller:
+            result = CliRunner().invoke(cli, ["--evil"])
+        assert result.exit_code == 0
+        assert mock_controller.call_args.kwargs["game_data_class"].__name__ == "EvilHangmanGameData"
+
+    def test_difficulty(self) -> None:
+        """Test the difficulty option draws the secret words of the tier, and unknown tiers are rejected."""
+        with mock.patch("hangman.cli.HangmanGameController") as mock_controller:
+            result = CliRunner().invoke(cli, ["--difficulty", "easy"])
+        assert result.exit_code == 0
+        assert mock_controller.call_args.kwargs["word_sampler"].difficulty == "easy"
+        assert CliRunner().invoke(cli, ["--difficulty", "nightmare"]).exit_code == 2
+
+    def test_leaderboard_recording(self, tmp_path) -> None:
+        """Test the leaderboard database option records the finished games of the player.
+
+        Args:
+            tmp_path: The pytest built-in temporary directory fixture.
+        """
+        db_path = str(tmp_path / "leaderboard.db")
+        with mock.patch("hangman.cli.HangmanGameController") as mock_controller:
+            result = CliRunner().invoke(cli, ["--leaderboard-db", db_path, "--player", "ann"])
+        assert result.exit_code == 0
+        assert mock_controller.call_args.kwargs["game_recorder"].args == ("ann",)
+
+    def test_without_login_name(self, tmp_path) -> None:
+        """Test the login name is only looked up to record the games of a player without a name.
+
+        Args:
+            tmp_path: The pytest built-in temporary directory fixture.
+        """
+        db_path = str(tmp_path / "leaderboard.db")
+        with mock.patch("getpass.getuser", side_effect=KeyError("getpwuid(): uid not found")), mock.patch(
+            "hangman.cli.HangmanGameController"
+        ) as mock_controller:
+            assert CliRunner().invoke(cli, ["compile-corpus", "--help"]).exit_code == 0
+            assert CliRunner().invoke(cli, ["--leaderboard-db", db_path, "--player", "ann"]).exit_code == 0
+            result = CliRunner().invoke(cli, ["--leaderboard-db", db_path])
+        assert result.exit_code == 2
+        assert "--player" in result.output
+        mock_controller.return_value.start_game.assert_called_once_with()
+
+    def test_default_command_terminated_by_player(self) -> None:
+        """Test the game exits with an error message when the player terminates it."""
+        with mock.patch("hangman.cli.HangmanGameController") as mock_controller:
+            mock_controller.return_value.start_game.side_effect = KeyboardInterrupt
+            result = CliRunner().invoke(cli, [])
+        assert result.exit_code == 1
+        assert "Game terminated by player." in result.output
+
+    def test_compile_corpus(self, tmp_path) -> None:
+        """Test the compile-corpus command builds the compiled file once.
+
+        Args:
+            tmp_path: The pytest built-in temporary directory fixture.
+        """
+        source_path = tmp_path / "words_source.txt"
+        source_path.write_text("ant bat", encoding="utf-8")
+        args = ["compile-corpus", "--source", str(source_path), "--output", str(tmp_path / "words_source.bin")]
+
+        result = CliRunner().invoke(cli, args)
+        assert result.exit_code == 0
+        assert "Compiled corpus written to" in result.output
+
+        result = CliRunner().invoke(cli, args)
+        assert result.exit_code == 0
+        assert "is up to date" in result.output
+
+    def test_simulate(self) -> None:
+        """Test the simulate command prints the summary results as JSON."""
+        with mock.patch("hangman.utils.WORDS_LIST", ["ant", "bat"]):
+            result = CliRunner().invoke(cli, ["simulate", "--games", "10", "--seed", "1", "--workers", "1", "--json"])
+        assert result.exit_code == 0
+        assert json.loads(result.output)["games"] == 10
+
+    def test_import_is_lazy(self) -> None:
+        """Test importing the command line interface neither imports the subcommands nor loads the words corpus."""
+        script = (
+            "import sys; import hangman.cli; from hangman.constants import WORDS_LIST; "
+            "print(WORDS_LIST.is_loaded, 'asyncio' in sys.modules, 'hangman.commands.serve' in sys.modules)"
+        )
+        completed = subprocess.run([sys.executable, "-c", script], check=True, capture_output=True, text=True)
+        assert completed.stdout.split() == ["False", "False", "False"]
+
+    def test_subcommand_listed(self) -> None:
+        """Test the lazily imported subcommands are listed in the help."""
+        result = CliRunner().invoke(cli, ["--help"])
+        assert result.exit_code == 0
+        assert all(name in result.output for name in ("benchmark", "compile-corpus", "serve", "simulate"))
@@ -9,6 +9,7 @@ import pytest
 from hangman.models import HangmanGameData
 from hangman.views import HangmanGameView
 from hangman.controllers import HangmanGameController
+from hangman.sampler import WordSampler
 
 
 class TestHangmanGameController:
@@ -150,7 +151,11 @@ class TestHangmanGameController:
         with mock.patch("hangman.utils.WORDS_LIST", [secret_word]):
             # Init game data object and controller, then start the game.
             hangman_game_data = HangmanGameData()
-            hangman_game_controller = HangmanGameController(hangman_game_data, mock_hangman_game_view)
+            # The second round draws its secret word from the sampler of the controller.
+            word_sampler = WordSampler(seed=0, words=[secret_word])
+            hangman_game_controller = HangmanGameController(
+                hangman_game_data, mock_hangman_game_view, word_sampler=word_sampler
+            )
             hangman_game_controller.start_game()
 
             # Assert the first round game (player win),
@@ -164,3 +169,10 @@ class TestHangmanGameController:
             hangman_game_data.missed_letters = missed_letters
             hangman_game_data.correct_letters = []
             assert mock_hangman_game_view.show_player_lost.mock_calls == [call(hangman_game_data)]
+
+    def test_default_game_per_controller(self) -> None:
+        """Test each controller created without arguments gets its own game and view."""
+        first_controller, second_controller = HangmanGameController(), HangmanGameController()
+        assert first_controller.hangman_game_data is not second_controller.hangman_game_data
+        assert first_controller.hangman_game_view is not second_controller.hangman_game_view
+        assert first_controller.hangman_game_data.secret_word
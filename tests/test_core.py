@@ -0,0 +1,149 @@
+"""Module for testing the core module."""
+
+import random
+import string
+
+import numpy as np
+import pytest
+from click.testing import CliRunner
+
+from hangman.cli import cli
+from hangman.constants import MAX_MISSED_GUESSES
+from hangman.controllers import HangmanGameController
+from hangman.core import NO_GUESS, BatchedGames, frequency_guesses, random_guesses, run_batched_simulation
+from hangman.models import HangmanGameData
+from hangman.rules import EVENT_GAME_LOST, EVENT_GAME_WON, EVENT_REPEATED_GUESS, GameState, step
+from hangman.simulation import LetterFrequencyStrategy
+from hangman.solver import CandidateWordSolver
+from hangman.views import HangmanGameView
+
+WORDS = ["ant", "baboon", "camel", "zebra", "jazz"]
+
+
+def encode_guesses(letters: str) -> np.ndarray:
+    """Get the letter codes of guesses.
+
+    Args:
+        letters: One guess letter per game, '-' for no guess.
+
+    Returns:
+        numpy.ndarray: The letter codes.
+    """
+    return np.array([NO_GUESS if letter == "-" else ord(letter) - ord("a") for letter in letters])
+
+
+class TestBatchedGames:
+    """Unit test the BatchedGames class."""
+
+    @pytest.fixture(name="batched_games")
+    def fixture_batched_games(self) -> BatchedGames:
+        """Provide one game per test word.
+
+        Returns:
+            BatchedGames: The games.
+        """
+        return BatchedGames(CandidateWordSolver(WORDS).letter_codes)
+
+    def test_step(self, batched_games: BatchedGames) -> None:
+        """Test the events of a tick of guesses and the revealed words.
+
+        Args:
+            batched_games: The games from fixture.
+        """
+        events = batched_games.step(encode_guesses("aaxz-"))
+        assert events.correct_guess.tolist() == [True, True, False, True, False]
+        assert events.missed_guess.tolist() == [False, False, True, False, False]
+        assert [batched_games.revealed_word(game) for game in range(5)] == ["a__", "_a____", "_____", "z____", "____"]
+
+        events = batched_games.step(encode_guesses("aaaaa"))
+        assert events.repeated_guess.tolist() == [True, True, False, False, False]
+        assert batched_games.missed_guesses.tolist() == [0, 0, 1, 0, 0]
+
+        batched_games.step(encode_guesses("n---j"))
+        events = batched_games.step(encode_guesses("t---z"))
+        assert events.game_won.tolist() == [True, False, False, False, True]
+        assert batched_games.game_finished.tolist() == [True, False, False, False, True]
+        events = batched_games.step(encode_guesses("b----"))
+        assert not events.correct_guess.any()
+
+    def test_same_rules_as_step(self, batched_games: BatchedGames) -> None:
+        """Test random guesses lead to the same games in batch as with step().
+
+        Args:
+            batched_games: The games from fixture.
+        """
+        rng = random.Random(1)
+        states = [GameState(secret_word) for secret_word in WORDS]
+        for _ in range(30):
+            letters = "".join(rng.choice(string.ascii_lowercase) for _ in WORDS)
+            events = batched_games.step(encode_guesses(letters))
+            for game, letter in enumerate(letters):
+                states[game], game_events = step(states[game], letter)
+                assert events.game_won[game] == (EVENT_GAME_WON in game_events)
+                assert events.game_lost[game] == (EVENT_GAME_LOST in game_events)
+                assert events.repeated_guess[game] == (EVENT_REPEATED_GUESS in game_events)
+        assert batched_games.game_finished.tolist() == [state.game_finished for state in states]
+        assert batched_games.missed_guesses.tolist() == [len(state.missed_letters) for state in states]
+        assert batched_games.correct_guesses.tolist() == [len(state.correct_letters) for state in states]
+
+    def test_restart(self, batched_games: BatchedGames) -> None:
+        """Test finished games are replaced by new ones, of the same letter code width only.
+
+        Args:
+            batched_games: The games from fixture.
+        """
+        batched_games.step(encode_guesses("a----"))
+        batched_games.restart(np.array([0]), batched_games.letter_codes[[3]])
+        assert batched_games.revealed_word(0) == "_____"
+        assert batched_games.missed_guesses[0] == 0
+        with pytest.raises(ValueError):
+            batched_games.restart(np.array([0]), CandidateWordSolver(["ant"]).letter_codes)
+
+    def test_restart_keeps_source_letter_codes(self) -> None:
+        """Test restarting games does not write into the letter codes the games were started from."""
+        letter_codes = CandidateWordSolver(WORDS).letter_codes
+        source = letter_codes.copy()
+        batched_games = BatchedGames(letter_codes)
+        batched_games.restart(np.array([0, 1]), letter_codes[[4, 4]])
+        assert np.array_equal(letter_codes, source)
+        assert batched_games.revealed_word(1) == "____"
+
+    def test_other_characters_rejected(self) -> None:
+        """Test the secret words with characters other than a-z are rejected, as the batched guesses never win them."""
+        with pytest.raises(ValueError):
+            BatchedGames(CandidateWordSolver(["café"]).letter_codes)
+        batched_games = BatchedGames(CandidateWordSolver(["cafe"]).letter_codes)
+        with pytest.raises(ValueError):
+            batched_games.restart(np.array([0]), CandidateWordSolver(["éclat"]).letter_codes[:, :4])
+        assert batched_games.revealed_word(0) == "____"
+
+    def test_batched_strategies(self, batched_games: BatchedGames) -> None:
+        """Test the batched strategies guess like the headless ones, letters which have not been guessed yet.
+
+        Args:
+            batched_games: The games from fixture.
+        """
+        batched_games.step(encode_guesses("esiar"))
+        rng = np.random.default_rng(0)
+        guesses = frequency_guesses(batched_games, rng)
+        frequency_strategy = LetterFrequencyStrategy(random.Random(0))
+        for game, secret_word in enumerate(WORDS):
+            hangman_game_data = HangmanGameData(secret_word=secret_word)
+            HangmanGameController(hangman_game_data, HangmanGameView()).evaluate_player_guess("esiar"[game])
+            assert chr(ord("a") + guesses[game]) == frequency_strategy.next_guess(hangman_game_data)
+
+        for _ in range(10):
+            guesses = random_guesses(batched_games, rng)
+            assert not batched_games.step(guesses).repeated_guess.any()
+
+    def test_run_batched_simulation(self) -> None:
+        """Test the batched simulation summary, and that the strategies without batched version are rejected."""
+        summary = run_batched_simulation(500, "frequency", seed=3)
+        assert summary.games == 500
+        assert summary.wins + summary.losses == 500
+        assert summary.missed_guesses >= summary.losses * MAX_MISSED_GUESSES
+        with pytest.raises(ValueError):
+            run_batched_simulation(10, "index")
+
+        result = CliRunner().invoke(cli, ["simulate", "--batched", "--games", "50", "--seed", "1", "--json"])
+        assert result.exit_code == 0
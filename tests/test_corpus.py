@@ -0,0 +1,156 @@
+"""Module for testing the corpus module."""
+
+import os
+
+import pytest
+
+from hangman import corpus
+from hangman.corpus import CompiledWordsCorpus, WordsCorpus, compile_corpus, hash_file, pack_compiled_corpus
+
+
+class TestWordsCorpus:
+    """Unit test the WordsCorpus class."""
+
+    @pytest.fixture
+    def source_path(self, tmp_path) -> str:
+        """Provide a words source text file for unit testing.
+
+        Args:
+            tmp_path: The pytest built-in temporary directory fixture.
+
+        Returns:
+            str: Path of the words source text file.
+        """
+        path = tmp_path / "words_source.txt"
+        path.write_text("ant baboon\n  camel\tdog \n", encoding="utf-8")
+        return str(path)
+
+    def test_lazy_loading(self, source_path: str) -> None:
+        """Test the source file is only mapped and indexed on first use.
+
+        Args:
+            source_path: The words source text file from fixture.
+        """
+        under_test = WordsCorpus(source_path)
+        assert under_test.is_loaded is False
+        assert len(under_test) == 4
+        assert under_test.is_loaded is True
+
+    def test_getitem(self, source_path: str) -> None:
+        """Test words are retrieved by index and slice like a list.
+
+        Args:
+            source_path: The words source text file from fixture.
+        """
+        under_test = WordsCorpus(source_path)
+        assert under_test[0] == "ant"
+        assert under_test[-1] == "dog"
+        assert under_test[1:3] == ["baboon", "camel"]
+        assert list(under_test) == ["ant", "baboon", "camel", "dog"]
+        assert "camel" in under_test
+
+    def test_empty_source_file(self, tmp_path) -> None:
+        """Test an empty source file results in an empty corpus.
+
+        Args:
+            tmp_path: The pytest built-in temporary directory fixture.
+        """
+        path = tmp_path / "empty.txt"
+        path.write_text("", encoding="utf-8")
+        assert len(WordsCorpus(str(path))) == 0
+
+
+class TestCompiledWordsCorpus:
+    """Unit test the compiled corpus format."""
+
+    @pytest.fixture
+    def source_path(self, tmp_path) -> str:
+        """Provide a words source text file for unit testing.
+
+        Args:
+            tmp_path: The pytest built-in temporary directory fixture.
+
+        Returns:
+            str: Path of the words source text file.
+        """
+        path = tmp_path / "words_source.txt"
+        path.write_text("ant baboon\ncamel café\n", encoding="utf-8")
+        return str(path)
+
+    def test_compile_and_read(self, source_path: str, tmp_path) -> None:
+        """Test the compiled corpus returns the same words as the source file.
+
+        Args:
+            source_path: The words source text file from fixture.
+            tmp_path: The pytest built-in temporary directory fixture.
+        """
+        compiled_path = str(tmp_path / "words_source.bin")
+        assert compile_corpus(source_path, compiled_path) is True
+
+        under_test = CompiledWordsCorpus(compiled_path)
+        assert list(under_test) == ["ant", "baboon", "camel", "café"]
+        assert under_test[-1] == "café"
+        assert under_test.source_digest == hash_file(source_path)
+        with pytest.raises(IndexError):
+            under_test[4]  # pylint: disable=pointless-statement
+
+    def test_read_buffer(self) -> None:
+        """Test the compiled corpus format is read from a buffer packed in memory."""
+        packed = b"".join(pack_compiled_corpus([word.encode("utf-8") for word in ["ant", "café"]]))
+        under_test = CompiledWordsCorpus(buffer=memoryview(packed))
+        assert list(under_test) == ["ant", "café"]
+        with pytest.raises(ValueError):
+            len(CompiledWordsCorpus(buffer=packed[4:]))
+
+    def test_compile_is_incremental(self, source_path: str, tmp_path, monkeypatch) -> None:
+        """Test the compiled corpus is only rebuilt when the source file content changes.
+
+        Args:
+            source_path: The words source text file from fixture.
+            tmp_path: The pytest built-in temporary directory fixture.
+            monkeypatch: Fixture for patching the module attributes.
+        """
+        compiled_path = str(tmp_path / "words_source.bin")
+        assert compile_corpus(source_path, compiled_path) is True
+        assert compile_corpus(source_path, compiled_path) is False
+        assert compile_corpus(source_path, compiled_path, force=True) is True
+
+        # Touching the file without changing the content keeps the compiled corpus up to date, and hashes it once.
+        os.utime(source_path, ns=(0, 0))
+        hashed = []
+        monkeypatch.setattr(corpus, "hash_file", lambda path: hashed.append(path) or hash_file(path))
+        assert compile_corpus(source_path, compiled_path) is False
+        assert compile_corpus(source_path, compiled_path) is False
+        assert hashed == [source_path]
+        assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")]
+
+        with open(source_path, mode="a", encoding="utf-8") as source_file:
+            source_file.write("dog\n")
+        assert compile_corpus(source_path, compiled_path) is True
+        assert len(CompiledWordsCorpus(compiled_path)) == 5
+
+    def test_words_corpus_prefers_compiled(self, source_path: str, tmp_path) -> None:
+        """Test WordsCorpus reads from the compiled corpus only when it is up to date.
+
+        Args:
+            source_path: The words source text file from fixture.
+            tmp_path: The pytest built-in temporary directory fixture.
+        """
+        compiled_path = str(tmp_path / "words_source.bin")
+        assert WordsCorpus(source_path, compiled_path).is_compiled is False
+
+        compile_corpus(source_path, compiled_path)
+        under_test = WordsCorpus(source_path, compiled_path)
+        assert under_test.is_compiled is True
+        assert list(under_test) == ["ant", "baboon", "camel", "café"]
+
+    def test_invalid_compiled_file(self, tmp_path) -> None:
+        """Test reading a file which is not a compiled corpus raises ValueError.
+
+        Args:
+            tmp_path: The pytest built-in temporary directory fixture.
+        """
+        path = tmp_path / "invalid.bin"
+        path.write_bytes(b"not a corpus")
+        with pytest.raises(ValueError):
+            len(CompiledWordsCorpus(str(path)))
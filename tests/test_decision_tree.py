@@ -0,0 +1,262 @@
+"""Module for testing the decision_tree module."""
+
+import os
+import shutil
+
+import pytest
+from click.testing import CliRunner
+
+from hangman import decision_tree as decision_tree_module
+from hangman.cli import cli
+from hangman.decision_tree import (
+    DECISION_TREE_CACHE_DIR_ENV,
+    EXACT_SEARCH_MAX_CANDIDATES,
+    DecisionTree,
+    LengthPolicyBuilder,
+    PackedPolicy,
+    build_decision_tree,
+    corpus_digest,
+    encode_entries,
+    get_decision_tree_cache_dir,
+    get_tree_path,
+    load_decision_tree,
+    state_key,
+)
+from hangman.models import HangmanGameData
+from hangman.simulation import DecisionTreeStrategy, HeadlessGameEngine, IndexedCandidateStrategy
+from hangman.word_index import WordIndex
+
+WORDS = ["bat", "cat", "hat", "tab", "ant", "bee", "camel", "tact", "bat"]
+
+
+@pytest.fixture(name="decision_tree")
+def fixture_decision_tree(tmp_path) -> DecisionTree:
+    """Get the decision tree of a few short words, built in a temporary cache directory.
+
+    Args:
+        tmp_path: Temporary directory provided by pytest.
+
+    Returns:
+        DecisionTree: The tree.
+    """
+    return build_decision_tree(WORDS, str(tmp_path), workers=1)
+
+
+def play_with_tree(decision_tree: DecisionTree, secret_word: str) -> HangmanGameData:
+    """Guess the letters of the tree until the secret word is revealed.
+
+    Args:
+        decision_tree: The tree.
+        secret_word: Secret word of the game.
+
+    Returns:
+        HangmanGameData: The data object of the finished game.
+    """
+    hangman_game_data = HangmanGameData(secret_word=secret_word)
+    while "_" in hangman_game_data.secret_word_with_correct_letters:
+        letter = decision_tree.next_letter(hangman_game_data)
+        assert letter is not None
+        if hangman_game_data.is_letter_in_secret_word(letter):
+            hangman_game_data.add_correct_letter(letter)
+        else:
+            hangman_game_data.add_missed_letter(letter)
+    return hangman_game_data
+
+
+class TestLengthPolicyBuilder:
+    """Unit test the LengthPolicyBuilder class."""
+
+    def test_state_key(self) -> None:
+        """Test the state key does not depend on the order of the missed letters."""
+        assert state_key(["_", "a", "_"], "oe") == state_key("_a_", ["e", "o"]) == "_a_:eo"
+
+    def test_solve(self) -> None:
+        """Test the guess minimizing the total missed guesses beats the most frequent letter."""
+        builder = LengthPolicyBuilder(["bear", "clam", "crow"])
+        # 'a' is in the most words but at the same position in 'bear' and 'clam', while 'r' is at different positions in
+        # 'bear' and 'crow', so it tells the three words apart at once.
+        assert builder.solve(builder.bucket.all_rows) == ("r", 1)
+
+    def test_identical_words(self) -> None:
+        """Test candidates which cannot be told apart need no guess."""
+        builder = LengthPolicyBuilder(["bat", "bat"])
+        assert builder.solve(builder.bucket.all_rows) == (None, 0)
+        assert [letter for _, letter in builder.build()] == ["a", "b", "t"]
+
+    def test_best_split_above_exact_search(self) -> None:
+        """Test the guess of too many candidates to search exactly is the letter which best splits them."""
+        words = [f"{first}{second}" for first in "abcdefgh" for second in "ijklmnop"] + ["zz"]
+        assert len(words) > EXACT_SEARCH_MAX_CANDIDATES
+        builder = LengthPolicyBuilder(words)
+        # Every letter but 'z' splits off 8 candidates, 'z' only one.
+        letter, total_misses = builder.solve(builder.bucket.all_rows)
+        assert letter == "a"
+        decision_tree = DecisionTree(dict(builder.build()), corpus_digest(words))
+        assert sum(len(play_with_tree(decision_tree, word).missed_letters) for word in words) == total_misses
+
+
+class TestDecisionTree:
+    """Unit test the DecisionTree class."""
+
+    def test_play_every_word(self, decision_tree: DecisionTree) -> None:
+        """Test following the tree finds every word with the optimal total missed guesses.
+
+        Args:
+            decision_tree: The tree of a few short words.
+        """
+        builder = LengthPolicyBuilder(["bat", "cat", "hat", "tab", "ant", "bee"])
+        total_misses = sum(len(play_with_tree(decision_tree, word).missed_letters) for word in builder.bucket.words)
+        assert total_misses == builder.solve(builder.bucket.all_rows)[1]
+        assert not play_with_tree(decision_tree, "camel").missed_letters
+
+    def test_unknown_state(self, decision_tree: DecisionTree) -> None:
+        """Test a state the tree never reaches has no guess.
+
+        Args:
+            decision_tree: The tree of a few short words.
+        """
+        assert decision_tree.lookup("___", "xyz") is None
+        assert decision_tree.lookup("_______", "") is None
+
+    def test_packed_tree(self, decision_tree: DecisionTree) -> None:
+        """Test the tree read from its packed arrays has the same guesses, without copying the arrays.
+
+        Args:
+            decision_tree: The tree of a few short words.
+        """
+        arrays = decision_tree.to_arrays()
+        packed_tree = DecisionTree.from_arrays(arrays)
+        assert isinstance(packed_tree.policy, PackedPolicy)
+        assert packed_tree.policy.state_keys is arrays["state_keys"]
+        assert dict(packed_tree.policy) == decision_tree.policy
+        assert packed_tree.digest == decision_tree.digest
+        assert packed_tree.lookup("___", "xyz") is None
+        assert packed_tree.lookup("_" * 50, "") is None
+        assert not play_with_tree(packed_tree, "camel").missed_letters
+        assert DecisionTree.from_bytes(packed_tree.to_bytes()).policy == decision_tree.policy
+
+    def test_save_load(self, decision_tree: DecisionTree, tmp_path) -> None:
+        """Test the tree is cached by corpus hash, and a file of another format is rejected.
+
+        Args:
+            decision_tree: The tree of a few short words.
+            tmp_path: Temporary directory provided by pytest.
+        """
+        tree_path = get_tree_path(str(tmp_path), corpus_digest(WORDS))
+        assert os.listdir(tmp_path) == [os.path.basename(tree_path)]
+        loaded_tree = DecisionTree.load(tree_path)
+        assert loaded_tree.policy == decision_tree.policy
+        assert loaded_tree.digest == corpus_digest(WORDS)
+
+        bad_path = tmp_path / "bad.tree"
+        bad_path.write_bytes(b"HGWC" + bytes(40))
+        with pytest.raises(ValueError):
+            DecisionTree.load(str(bad_path))
+
+
+class TestBuildDecisionTree:
+    """Unit test building and loading the cached decision tree."""
+
+    def test_resume(self, tmp_path) -> None:
+        """Test an interrupted build reuses the solved word lengths and removes the part files when done.
+
+        Args:
+            tmp_path: Temporary directory provided by pytest.
+        """
+        parts_dir = tmp_path / f"{corpus_digest(WORDS).hex()}.1.parts"
+        parts_dir.mkdir()
+        (parts_dir / "5.part").write_bytes(encode_entries([("_____:", "z")]))
+        decision_tree = build_decision_tree(WORDS, str(tmp_path), workers=1)
+        assert decision_tree.lookup("_____", "") == "z"
+        assert decision_tree.lookup("___", "") == "a"
+        assert os.listdir(tmp_path) == [os.path.basename(get_tree_path(str(tmp_path), corpus_digest(WORDS)))]
+
+    def test_concurrent_build(self, decision_tree: DecisionTree, tmp_path, monkeypatch) -> None:
+        """Test a build carries on when a concurrent build of the corpus removes the parts directories.
+
+        Args:
+            decision_tree: The tree of a few short words.
+            tmp_path: Temporary directory provided by pytest.
+            monkeypatch: Fixture for patching the module attributes.
+        """
+        iter_solved_lengths = decision_tree_module._iter_solved_lengths  # pylint: disable=protected-access
+
+        def finish_other_build(words_by_length, workers):
+            for length, entries in iter_solved_lengths(words_by_length, workers):
+                # The other build saves the tree and removes the parts directories, including this one.
+                for parts_dir in tmp_path.glob("*.parts"):
+                    shutil.rmtree(parts_dir)
+                yield length, entries
+
+        monkeypatch.setattr(decision_tree_module, "_iter_solved_lengths", finish_other_build)
+        assert build_decision_tree(WORDS, str(tmp_path), workers=1).policy == decision_tree.policy
+        assert not list(tmp_path.glob("*.parts"))
+
+    def test_cache_dir(self, tmp_path, monkeypatch) -> None:
+        """Test the default cache directory is in the user cache directory, unless set by the environment variable.
+
+        Args:
+            tmp_path: Temporary directory provided by pytest.
+            monkeypatch: Fixture for patching the module attributes.
+        """
+        monkeypatch.delenv(DECISION_TREE_CACHE_DIR_ENV, raising=False)
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        monkeypatch.setenv("LOCALAPPDATA", str(tmp_path))
+        assert get_decision_tree_cache_dir() == os.path.join(str(tmp_path), "hangman", "decision_trees")
+        monkeypatch.setenv(DECISION_TREE_CACHE_DIR_ENV, str(tmp_path / "trees"))
+        assert get_decision_tree_cache_dir() == str(tmp_path / "trees")
+
+    def test_parallel_build(self, decision_tree: DecisionTree, tmp_path) -> None:
+        """Test the tree built across worker processes is the same as the one built in this process.
+
+        Args:
+            decision_tree: The tree of a few short words.
+            tmp_path: Temporary directory provided by pytest.
+        """
+        assert build_decision_tree(WORDS, str(tmp_path / "parallel"), workers=2).policy == decision_tree.policy
+
+    def test_load_cached(self, decision_tree: DecisionTree, tmp_path, monkeypatch) -> None:
+        """Test the cached tree is loaded without building it again.
+
+        Args:
+            decision_tree: The tree of a few short words.
+            tmp_path: Temporary directory provided by pytest.
+            monkeypatch: Fixture for patching the module attributes.
+        """
+
+        def fail_build(*args, **kwargs):
+            raise AssertionError("The tree should not be built again.")
+
+        monkeypatch.setattr(decision_tree_module, "build_decision_tree", fail_build)
+        assert load_decision_tree(WORDS, str(tmp_path)).policy == decision_tree.policy
+
+    def test_command(self, tmp_path) -> None:
+        """Test the build-decision-tree command caches the tree of the corpus.
+
+        Args:
+            tmp_path: Temporary directory provided by pytest.
+        """
+        result = CliRunner().invoke(cli, ["build-decision-tree", "--cache-dir", str(tmp_path), "--workers", "1"])
+        assert result.exit_code == 0
+        assert "states cached in" in result.output
+        assert len(os.listdir(tmp_path)) == 1
+
+
+class TestDecisionTreeStrategy:  # pylint: disable=too-few-public-methods
+    """Unit test the DecisionTreeStrategy class."""
+
+    def test_fewer_misses(self, decision_tree: DecisionTree, monkeypatch) -> None:
+        """Test the tree strategy misses no more than the most frequent candidate letter over all words.
+
+        Args:
+            decision_tree: The tree of a few short words.
+            monkeypatch: Fixture for patching the module attributes.
+        """
+        monkeypatch.setattr("hangman.simulation.get_corpus_decision_tree", lambda: decision_tree)
+        word_index = WordIndex(WORDS)
+        monkeypatch.setattr("hangman.simulation.get_corpus_index", lambda: word_index)
+        tree_misses = index_misses = 0
+        for word in WORDS:
+            tree_misses += len(HeadlessGameEngine(DecisionTreeStrategy).play_game(word).missed_letters)
+            index_misses += len(HeadlessGameEngine(IndexedCandidateStrategy).play_game(word).missed_letters)
+        assert tree_misses <= index_misses
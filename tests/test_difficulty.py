@@ -0,0 +1,149 @@
+"""Module for testing the difficulty module."""
+
+import os
+import random
+from array import array
+
+import pytest
+
+from hangman import difficulty
+from hangman.constants import MAX_MISSED_GUESSES, WORDS_LIST, WORDS_SOURCE_PATH
+from hangman.corpus import hash_file
+from hangman.difficulty import (
+    DIFFICULTY_CACHE_DIR_ENV,
+    DIFFICULTY_TIERS,
+    DifficultyTiers,
+    get_difficulty_path,
+    load_difficulty_scores,
+    save_difficulty_scores,
+    score_word,
+    score_words,
+)
+from hangman.utils import get_random_word
+from hangman.word_index import WordIndex
+
+WORDS = ["bear", "clam", "crow", "bat", "cat", "hat", "tab", "ant", "bee"]
+
+
+class TestScores:
+    """Unit test scoring the words and caching the scores."""
+
+    def test_score_words(self) -> None:
+        """Test each word is scored by the missed guesses of the reference solver."""
+        scores = score_words(WORDS)
+        # 'a' is guessed first for the 4-letter words, 'clam' and 'bear' are then told apart by 'b', 'crow' by 'c'.
+        assert scores.tolist()[:3] == [0, 1, 1]
+        assert len(scores) == len(WORDS)
+
+    def test_score_unknown_word(self) -> None:
+        """Test a word which is not in the corpus is scored too, at most as a lost game."""
+        assert score_word(WordIndex(WORDS), "jinx") <= MAX_MISSED_GUESSES
+        assert score_word(WordIndex(WORDS), "fuzzy") == MAX_MISSED_GUESSES
+
+    def test_save_load(self, tmp_path) -> None:
+        """Test the scores are read back only for the corpus they were computed from.
+
+        Args:
+            tmp_path: Temporary directory provided by pytest.
+        """
+        source_path = tmp_path / "words.txt"
+        source_path.write_text("bat\ncat\nhat\n")
+        path = get_difficulty_path(str(source_path), str(tmp_path / "cache"))
+        assert load_difficulty_scores(path, str(source_path)) is None
+        save_difficulty_scores(path, str(source_path), array("B", [0, 2, 1]))
+        assert load_difficulty_scores(path, str(source_path)) == array("B", [0, 2, 1])
+        assert os.listdir(tmp_path / "cache") == [os.path.basename(path)]
+        source_path.write_text("bat\ncat\nrat\n")
+        assert load_difficulty_scores(path, str(source_path)) is None
+
+    def test_load_restamps_touched_source(self, tmp_path, monkeypatch) -> None:
+        """Test a source file of the same content with another mtime is hashed once, and then stamped in the sidecar.
+
+        Args:
+            tmp_path: Temporary directory provided by pytest.
+            monkeypatch: Fixture for patching the module attributes.
+        """
+        source_path = tmp_path / "words.txt"
+        source_path.write_text("bat\ncat\nhat\n")
+        path = get_difficulty_path(str(source_path), str(tmp_path))
+        save_difficulty_scores(path, str(source_path), array("B", [0, 2, 1]))
+        os.utime(source_path, ns=(0, 0))
+        hashed = []
+        monkeypatch.setattr(
+            difficulty, "hash_file", lambda hashed_path: hashed.append(hashed_path) or hash_file(hashed_path)
+        )
+        assert load_difficulty_scores(path, str(source_path)) == array("B", [0, 2, 1])
+        assert load_difficulty_scores(path, str(source_path)) == array("B", [0, 2, 1])
+        assert hashed == [str(source_path)]
+
+    def test_get_difficulty_path(self, tmp_path, monkeypatch) -> None:
+        """Test the sidecar files are in the directory of the environment variable, one per source file.
+
+        Args:
+            tmp_path: Temporary directory provided by pytest.
+            monkeypatch: Fixture for patching the environment variables.
+        """
+        monkeypatch.setenv(DIFFICULTY_CACHE_DIR_ENV, str(tmp_path))
+        path = get_difficulty_path("words.txt")
+        assert os.path.dirname(path) == str(tmp_path)
+        assert get_difficulty_path(os.path.abspath("words.txt")) == path
+        assert get_difficulty_path("other_words.txt") != path
+
+
+class TestDifficultyTiers:
+    """Unit test the DifficultyTiers class."""
+
+    def test_tiers(self) -> None:
+        """Test the words are split into tiers of equal size from the lowest scores to the highest."""
+        tiers = DifficultyTiers([3, 0, 2, 0, 1, 5])
+        assert {tier: rows.tolist() for tier, rows in tiers.tier_rows.items()} == {
+            "easy": [1, 3],
+            "medium": [4, 2],
+            "hard": [0, 5],
+        }
+        rng = random.Random(7)
+        assert {tiers.draw("hard", rng) for _ in range(50)} == {0, 5}
+
+    def test_unknown_tier(self) -> None:
+        """Test drawing from an unknown or empty tier is rejected."""
+        with pytest.raises(ValueError):
+            DifficultyTiers([1, 2, 3]).draw("expert")
+        with pytest.raises(ValueError):
+            DifficultyTiers([1]).draw("easy")
+
+    def test_get_random_word_by_difficulty(self, tmp_path, monkeypatch) -> None:
+        """Test get_random_word() draws the words of a tier of the corpus, and caches the scores in the sidecar file.
+
+        Args:
+            tmp_path: Temporary directory provided by pytest.
+            monkeypatch: Fixture for patching the environment variables.
+        """
+        monkeypatch.setenv(DIFFICULTY_CACHE_DIR_ENV, str(tmp_path))
+        sidecar_path = get_difficulty_path(WORDS_SOURCE_PATH)
+        difficulty.get_corpus_difficulty_tiers.cache_clear()
+        try:
+            tiers = difficulty.get_corpus_difficulty_tiers()
+            assert os.path.exists(sidecar_path)
+            for tier in DIFFICULTY_TIERS:
+                tier_words = {WORDS_LIST[row] for row in tiers.tier_rows[tier]}
+                assert {get_random_word(random.Random(seed), tier) for seed in range(20)} <= tier_words
+        finally:
+            difficulty.get_corpus_difficulty_tiers.cache_clear()
+
+    def test_unwritable_cache_warns(self, tmp_path, monkeypatch) -> None:
+        """Test a sidecar file which cannot be written is reported rather than silently scored again by every process.
+
+        Args:
+            tmp_path: Temporary directory provided by pytest.
+            monkeypatch: Fixture for patching the environment variables.
+        """
+        # A file in place of the cache directory makes the sidecar file unwritable.
+        (tmp_path / "cache").write_text("")
+        monkeypatch.setenv(DIFFICULTY_CACHE_DIR_ENV, str(tmp_path / "cache"))
+        difficulty.get_corpus_difficulty_tiers.cache_clear()
+        try:
+            with pytest.warns(RuntimeWarning, match="could not be cached"):
+                tiers = difficulty.get_corpus_difficulty_tiers()
+            assert sum(len(rows) for rows in tiers.tier_rows.values()) == len(WORDS_LIST)
+        finally:
+            difficulty.get_corpus_difficulty_tiers.cache_clear()
@@ -0,0 +1,155 @@
+"""Module for testing the evil module."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from hangman.controllers import HangmanGameController
+from hangman.evil import EvilHangmanGameData, WordFamilies
+from hangman.sampler import WordSampler
+from hangman.solver import CandidateWordSolver
+from hangman.views import HangmanGameView
+
+WORDS = ["ally", "beta", "cool", "deal", "else", "flew", "good", "hope", "pizza"]
+
+
+@pytest.fixture(name="solver")
+def fixture_solver() -> CandidateWordSolver:
+    """Provide a solver over the test words.
+
+    Returns:
+        CandidateWordSolver: The solver.
+    """
+    return CandidateWordSolver(WORDS)
+
+
+class TestWordFamilies:
+    """Unit test the WordFamilies class."""
+
+    def test_keep_largest_family(self, solver: CandidateWordSolver) -> None:
+        """Test the largest family is kept and its position mask returned.
+
+        Args:
+            solver: The solver from fixture.
+        """
+        word_families = WordFamilies(solver, 4)
+        assert len(word_families) == 8
+        # 'e' splits the words into _e__ (beta, deal), e__e (else), __e_ (flew), ___e (hope) and the others (4).
+        assert word_families.keep_largest_family("e") == 0
+        candidates = solver.words[word_families.position_masks.rows[word_families.candidates]]
+        assert candidates.tolist() == ["ally", "cool", "good"]
+
+    def test_tie_prefers_miss(self, solver: CandidateWordSolver) -> None:
+        """Test the family without the letter wins a tie.
+
+        Args:
+            solver: The solver from fixture.
+        """
+        word_families = WordFamilies(solver, 4)
+        word_families.keep_largest_family("e")
+        # 'o' splits ally, cool, good into _oo_ (cool, good) and ally, so the largest family contains the letter, then
+        # 'c' splits cool and good into a tie.
+        assert word_families.keep_largest_family("o") == 0b0110
+        assert word_families.keep_largest_family("c") == 0
+        assert solver.words[word_families.representative] == "good"
+
+    def test_long_words_and_unknown_length(self) -> None:
+        """Test the families of words longer than the bin count limit, and a length without words."""
+        long_words = ["a" * 20, "b" * 20, "ab" * 10]
+        word_families = WordFamilies(CandidateWordSolver(long_words), 20)
+        assert word_families.keep_largest_family("a") == 0
+        assert word_families.keep_largest_family("b") == (1 << 20) - 1
+        assert word_families.representative == 1
+
+        empty_families = WordFamilies(CandidateWordSolver(long_words), 5)
+        assert empty_families.keep_largest_family("a") == 0
+        assert empty_families.representative is None
+
+    def test_letters_other_than_a_z(self) -> None:
+        """Test a guess other than a-z is split by its own positions, not by those of any other such letter."""
+        word_families = WordFamilies(CandidateWordSolver(["café", "cafü", "cafe", "déjà"]), 4)
+        # 'é' splits the words into ___é (café), _é__ (déjà) and the others (2), whereas 'ü' and 'à' would have been
+        # counted as 'é' too.
+        assert word_families.keep_largest_family("é") == 0
+        position_masks = word_families.position_masks
+        assert position_masks.solver.words[position_masks.rows[word_families.candidates]].tolist() == ["cafü", "cafe"]
+        assert word_families.keep_largest_family("ü") == 0
+        assert word_families.position_masks.solver.words[word_families.representative] == "cafe"
+
+    def test_words_longer_than_integer_masks(self) -> None:
+        """Test the families of words longer than the positions of an integer mask."""
+        long_words = ["a" * 70, "b" * 70, "ab" * 35, "ba" * 35, "ab" * 35]
+        word_families = WordFamilies(CandidateWordSolver(long_words), 70)
+        assert word_families.position_masks.masks is None
+        # 'a' splits the words into all a, no a, ab (2) and ba, so the words ab are kept.
+        assert word_families.keep_largest_family("a") == sum(1 << position for position in range(0, 70, 2))
+        assert word_families.representative == 2
+        assert len(word_families) == 2
+        assert word_families.keep_largest_family("z") == 0
+        assert len(word_families) == 2
+
+
+class TestEvilHangmanGameData:
+    """Unit test the EvilHangmanGameData class."""
+
+    def test_secret_word_follows_largest_family(self, solver: CandidateWordSolver) -> None:
+        """Test the secret word moves to the kept family and stays consistent with the guesses.
+
+        Args:
+            solver: The solver from fixture.
+        """
+        hangman_game_data = EvilHangmanGameData(secret_word="hope", word_families=WordFamilies(solver, 4))
+        # Checking a letter does not settle it.
+        assert hangman_game_data.is_letter_in_secret_word("e")
+        assert hangman_game_data.secret_word == "hope"
+        hangman_game_data.settle_guess("e")
+        assert not hangman_game_data.is_letter_in_secret_word("e")
+        assert hangman_game_data.secret_word in ("ally", "cool", "good")
+        hangman_game_data.add_missed_letter("e")
+
+        hangman_game_data.settle_guess("o")
+        # Settling the same guess again keeps the same candidates.
+        hangman_game_data.settle_guess("o")
+        assert len(hangman_game_data.word_families) == 2
+        assert hangman_game_data.is_letter_in_secret_word("o")
+        hangman_game_data.add_correct_letter("o")
+        assert hangman_game_data.secret_word_with_correct_letters.replace(" ", "") == "_oo_"
+        assert hangman_game_data.secret_word in ("cool", "good")
+
+    def test_corpus_families(self) -> None:
+        """Test the candidates are the corpus words of the length of the drawn secret word by default."""
+        hangman_game_data = EvilHangmanGameData()
+        assert len(hangman_game_data.word_families) > 0
+        position_masks = hangman_game_data.word_families.position_masks
+        length = len(hangman_game_data.secret_word)
+        assert all(len(word) == length for word in position_masks.solver.words[position_masks.rows])
+
+
+class TestEvilGame:
+    """Integration test the evil mode with the game controller."""
+
+    def test_player_loses_against_every_word(self, solver: CandidateWordSolver) -> None:
+        """Test a player guessing the letters of a word loses when the adversary can dodge them.
+
+        Args:
+            solver: The solver from fixture.
+        """
+        mock_hangman_game_view = Mock(spec=HangmanGameView)
+        mock_hangman_game_view.get_player_guess.side_effect = list("hope") + list("abcdfgijk")
+        mock_hangman_game_view.play_again.return_value = False
+        hangman_game_data = EvilHangmanGameData(secret_word="hope", word_families=WordFamilies(solver, 4))
+        hangman_game_controller = HangmanGameController(
+            hangman_game_data, mock_hangman_game_view, word_sampler=WordSampler(seed=0, words=["hope"])
+        )
+        hangman_game_controller.start_game()
+        mock_hangman_game_view.show_player_lost.assert_called_once_with(hangman_game_data)
+        assert hangman_game_data.secret_word != "hope"
+
+    def test_new_games_are_evil(self) -> None:
+        """Test the controller creates the new games with the given game data class."""
+        hangman_game_controller = HangmanGameController(
+            hangman_game_view=Mock(spec=HangmanGameView),
+            word_sampler=WordSampler(seed=0),
+            game_data_class=EvilHangmanGameData,
+        )
+        assert isinstance(hangman_game_controller.hangman_game_data, EvilHangmanGameData)
@@ -0,0 +1,149 @@
+"""Module for testing the instrumentation module."""
+
+import json
+from unittest import mock
+
+import pytest
+from click.testing import CliRunner
+
+from hangman.benchmarks import BENCHMARK_GUESSES, BENCHMARK_SECRET_WORD, ScriptedGameView
+from hangman.cli import cli
+from hangman.controllers import HangmanGameController
+from hangman.instrumentation import (
+    COUNTERS,
+    PHASE_EVALUATE,
+    PHASE_INPUT_WAIT,
+    PHASE_RENDER,
+    TURN_PHASES,
+    HistogramSink,
+    JsonFileSink,
+    LatencyHistogram,
+    PrometheusFileSink,
+)
+from hangman.models import HangmanGameData
+
+
+class InvalidFirstInputView(ScriptedGameView):
+    """Scripted view counting one invalid input before each guess, as if the player mistyped every time."""
+
+    def get_player_guess(self, hangman_game_data: HangmanGameData) -> str:
+        """Count an invalid input, then enter the next scripted letter."""
+        self.invalid_inputs += 1
+        return super().get_player_guess(hangman_game_data)
+
+
+@pytest.fixture(name="histogram_sink")
+def fixture_histogram_sink() -> HistogramSink:
+    """Get an in-memory sink with the metrics of one turn and one won game.
+
+    Returns:
+        HistogramSink: The sink.
+    """
+    histogram_sink = HistogramSink()
+    histogram_sink.observe(PHASE_RENDER, 0.00005)
+    histogram_sink.observe(PHASE_INPUT_WAIT, 2.0)
+    histogram_sink.observe(PHASE_EVALUATE, 0.000001)
+    histogram_sink.increment("games")
+    histogram_sink.increment("wins")
+    return histogram_sink
+
+
+class TestLatencyHistogram:  # pylint: disable=too-few-public-methods
+    """Unit test the LatencyHistogram class."""
+
+    def test_observe(self) -> None:
+        """Test latencies are counted into the buckets of their upper bounds."""
+        histogram = LatencyHistogram(buckets=(0.1, 1.0))
+        for seconds in (0.05, 0.1, 0.5, 3.0):
+            histogram.observe(seconds)
+
+        assert histogram.count == 4
+        assert histogram.sum_seconds == pytest.approx(3.65)
+        assert histogram.cumulative_counts() == [("0.1", 2), ("1.0", 3), ("+Inf", 4)]
+
+
+class TestMetricsSinks:
+    """Unit test the metrics sinks."""
+
+    def test_snapshot(self, histogram_sink: HistogramSink) -> None:
+        """Test the snapshot contains the counters and the histogram of each phase.
+
+        Args:
+            histogram_sink: An in-memory sink with the metrics of one turn and one won game.
+        """
+        snapshot = histogram_sink.snapshot()
+        assert snapshot["counters"] == {"games": 1, "wins": 1, "losses": 0, "invalid_inputs": 0}
+        assert list(snapshot["phases"]) == list(TURN_PHASES)
+        assert snapshot["phases"][PHASE_INPUT_WAIT]["buckets"]["1.0"] == 0
+        assert snapshot["phases"][PHASE_INPUT_WAIT]["buckets"]["10.0"] == 1
+
+    def test_json_file_sink(self, tmp_path) -> None:
+        """Test the last snapshot is written to the JSON file when the sink is closed.
+
+        Args:
+            tmp_path: The pytest built-in temporary directory fixture.
+        """
+        path = tmp_path / "metrics.json"
+        json_file_sink = JsonFileSink(str(path), flush_interval=60)
+        json_file_sink.increment("losses", 2)
+        json_file_sink.close()
+
+        assert json.loads(path.read_text(encoding="utf-8"))["counters"]["losses"] == 2
+
+    def test_prometheus_file_sink_render(self, tmp_path, histogram_sink: HistogramSink) -> None:
+        """Test the metrics are formatted as Prometheus counters and histograms.
+
+        Args:
+            tmp_path: The pytest built-in temporary directory fixture.
+            histogram_sink: An in-memory sink with the metrics of one turn and one won game.
+        """
+        prometheus_file_sink = PrometheusFileSink(str(tmp_path / "metrics.prom"), flush_interval=60)
+        lines = prometheus_file_sink.render(histogram_sink.snapshot()).splitlines()
+        prometheus_file_sink.close()
+
+        assert "# TYPE hangman_games_total counter" in lines
+        assert "hangman_wins_total 1" in lines
+        assert "# TYPE hangman_turn_phase_seconds histogram" in lines
+        assert 'hangman_turn_phase_seconds_bucket{phase="render",le="0.0001"} 1' in lines
+        assert 'hangman_turn_phase_seconds_bucket{phase="render",le="+Inf"} 1' in lines
+        assert 'hangman_turn_phase_seconds_count{phase="evaluate"} 1' in lines
+
+
+class TestControllerInstrumentation:
+    """Unit test the instrumentation of the HangmanGameController game loop."""
+
+    def test_start_game_instrumented(self) -> None:
+        """Test each turn phase is timed and the game events are counted."""
+        histogram_sink = HistogramSink()
+        hangman_game_data = HangmanGameData(secret_word=BENCHMARK_SECRET_WORD)
+        hangman_game_view = InvalidFirstInputView(BENCHMARK_GUESSES)
+        HangmanGameController(hangman_game_data, hangman_game_view, histogram_sink).start_game()
+
+        turns = len(hangman_game_data.missed_letters) + len(hangman_game_data.correct_letters)
+        snapshot = histogram_sink.snapshot()
+        assert snapshot["counters"] == {"games": 1, "wins": 1, "losses": 0, "invalid_inputs": turns}
+        assert snapshot["phases"][PHASE_INPUT_WAIT]["count"] == turns
+        assert snapshot["phases"][PHASE_EVALUATE]["count"] == turns
+        # The board is rendered once per turn, plus the final board.
+        assert snapshot["phases"][PHASE_RENDER]["count"] == turns + 1
+
+    def test_start_game_not_instrumented(self) -> None:
+        """Test the game loop does not read the clock without a metrics sink."""
+        hangman_game_data = HangmanGameData(secret_word=BENCHMARK_SECRET_WORD)
+        with mock.patch("hangman.controllers.time.perf_counter") as mock_perf_counter:
+            HangmanGameController(hangman_game_data, ScriptedGameView(BENCHMARK_GUESSES)).start_game()
+        assert hangman_game_data.game_finished
+        mock_perf_counter.assert_not_called()
+
+    def test_cli_metrics_file(self, tmp_path) -> None:
+        """Test the interactive game writes its metrics to the file given on the command line.
+
+        Args:
+            tmp_path: The pytest built-in temporary directory fixture.
+        """
+        path = tmp_path / "metrics.prom"
+        with mock.patch("hangman.cli.HangmanGameController") as mock_controller:
+            result = CliRunner().invoke(cli, ["--metrics-file", str(path), "--metrics-format", "prometheus"])
+        assert result.exit_code == 0
+        assert isinstance(mock_controller.call_args.kwargs["metrics_sink"], PrometheusFileSink)
+        assert all(f"hangman_{counter}_total 0" in path.read_text(encoding="utf-8") for counter in COUNTERS)
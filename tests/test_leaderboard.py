@@ -0,0 +1,180 @@
+"""Module for testing the leaderboard module."""
+
+import os
+import threading
+from unittest import mock
+from unittest.mock import Mock
+
+import pytest
+from click.testing import CliRunner
+
+from hangman.cli import cli
+from hangman.constants import MAX_MISSED_GUESSES
+from hangman.controllers import HangmanGameController
+from hangman.leaderboard import Leaderboard, LeaderboardWriter, score_game
+from hangman.models import HangmanGameData
+from hangman.sampler import WordSampler
+from hangman.views import HangmanGameView
+
+
+@pytest.fixture(name="db_path")
+def fixture_db_path(tmp_path) -> str:
+    """Provide the path of a new leaderboard database.
+
+    Args:
+        tmp_path: The pytest built-in temporary directory fixture.
+
+    Returns:
+        str: The path.
+    """
+    return str(tmp_path / "leaderboard.db")
+
+
+def finished_game(secret_word: str, missed_letters: str, won: bool) -> HangmanGameData:
+    """Create the data object of a finished game.
+
+    Args:
+        secret_word: The secret word.
+        missed_letters: The missed letters.
+        won: Whether all the letters of the secret word were guessed.
+
+    Returns:
+        HangmanGameData: The data object.
+    """
+    correct_letters = list(dict.fromkeys(secret_word)) if won else []
+    return HangmanGameData(
+        secret_word=secret_word,
+        missed_letters=list(missed_letters),
+        correct_letters=correct_letters,
+        game_finished=True,
+    )
+
+
+class TestLeaderboard:
+    """Unit test the LeaderboardWriter and Leaderboard classes."""
+
+    def test_score_game(self) -> None:
+        """Test a won game scores its distinct letters plus the misses left, and a lost game nothing."""
+        assert score_game("camel", "xz", won=True) == 5 + MAX_MISSED_GUESSES - 2
+        assert score_game("camel", "xyzqvw", won=False) == 0
+
+    def test_top_players_and_history(self, db_path: str) -> None:
+        """Test the totals of the players and their last games.
+
+        Args:
+            db_path: The database path from fixture.
+        """
+        writer = LeaderboardWriter(db_path)
+        writer.record_game("ann", finished_game("camel", "x", won=True), True)
+        writer.record_game("bob", finished_game("ant", "", won=True), True)
+        writer.record_game("ann", finished_game("baboon", "uvwxyz", won=False), False)
+        writer.record_game("cid", finished_game("ant", "uvwxyz", won=False), False)
+        writer.close()
+
+        leaderboard = Leaderboard(db_path)
+        standings = leaderboard.top_players(limit=2)
+        assert [(standing.player, standing.games, standing.wins) for standing in standings] == [
+            ("ann", 2, 1),
+            ("bob", 1, 1),
+        ]
+        assert standings[0].total_score == standings[0].best_score == score_game("camel", "x", won=True)
+
+        games = leaderboard.player_games("ann")
+        assert [(game.secret_word, game.won, game.missed_letters) for game in games] == [
+            ("baboon", False, "uvwxyz"),
+            ("camel", True, "x"),
+        ]
+        assert leaderboard.player_games("nobody") == []
+        leaderboard.close()
+
+    def test_batched_writes(self, db_path: str) -> None:
+        """Test the games queued while the writer is busy are written together, and flush() waits for them.
+
+        Args:
+            db_path: The database path from fixture.
+        """
+        batch_sizes = []
+        release = threading.Event()
+
+        def write_slowly(_connection, records) -> None:
+            # The first batch waits, so the next games are queued while the writer is busy.
+            release.wait()
+            batch_sizes.append(len(records))
+
+        writer = LeaderboardWriter(db_path, batch_size=100)
+        with mock.patch("hangman.leaderboard.write_games", side_effect=write_slowly):
+            for _ in range(250):
+                writer.record_game("ann", finished_game("ant", "", won=True), True)
+            release.set()
+            writer.flush()
+        writer.close()
+        assert sum(batch_sizes) == 250
+        assert max(batch_sizes) == 100
+        assert len(batch_sizes) <= 4
+
+    def test_record_after_close(self, db_path: str) -> None:
+        """Test a game recorded after the writer is closed is rejected rather than silently lost.
+
+        Args:
+            db_path: The database path from fixture.
+        """
+        writer = LeaderboardWriter(db_path)
+        writer.record_game("ann", finished_game("ant", "", won=True), True)
+        writer.close()
+        with pytest.raises(ValueError):
+            writer.record_game("ann", finished_game("camel", "", won=True), True)
+        writer.close()
+        leaderboard = Leaderboard(db_path)
+        assert [game.secret_word for game in leaderboard.player_games("ann")] == ["ant"]
+        leaderboard.close()
+
+    def test_controller_records_games(self, db_path: str) -> None:
+        """Test the controller passes each finished game to the recorder.
+
+        Args:
+            db_path: The database path from fixture.
+        """
+        mock_hangman_game_view = Mock(spec=HangmanGameView)
+        mock_hangman_game_view.get_player_guess.side_effect = ["a", "n", "t", "x", "y", "z", "q", "v", "w"]
+        mock_hangman_game_view.play_again.side_effect = [True, False]
+        writer = LeaderboardWriter(db_path)
+        hangman_game_controller = HangmanGameController(
+            HangmanGameData(secret_word="ant"),
+            mock_hangman_game_view,
+            word_sampler=WordSampler(seed=0, words=["ant"]),
+            game_recorder=lambda hangman_game_data, won: writer.record_game("ann", hangman_game_data, won),
+        )
+        hangman_game_controller.start_game()
+        writer.close()
+        assert [game.won for game in Leaderboard(db_path).player_games("ann")] == [False, True]
+
+    def test_leaderboard_command(self, db_path: str) -> None:
+        """Test the leaderboard command prints the standings and the history of a player.
+
+        Args:
+            db_path: The database path from fixture.
+        """
+        writer = LeaderboardWriter(db_path)
+        writer.record_game("ann", finished_game("camel", "", won=True), True)
+        writer.close()
+
+        result = CliRunner().invoke(cli, ["leaderboard", "--db", db_path])
+        assert result.exit_code == 0
+        assert result.output.splitlines()[1].split() == ["1", "ann", "11", "1", "1", "11"]
+
+        result = CliRunner().invoke(cli, ["leaderboard", "--db", db_path, "--player", "ann"])
+        assert result.exit_code == 0
+        assert result.output.splitlines()[1].split()[2:] == ["camel", "won", "0", "11"]
+
+    def test_leaderboard_command_missing_database(self, db_path: str) -> None:
+        """Test the leaderboard command reports a missing database instead of creating an empty one.
+
+        Args:
+            db_path: The database path from fixture.
+        """
+        result = CliRunner().invoke(cli, ["leaderboard", "--db", db_path])
+        assert result.exit_code == 1
+        assert "No leaderboard database" in result.output
+        assert not os.path.exists(db_path)
+        with pytest.raises(FileNotFoundError):
+            Leaderboard(db_path)
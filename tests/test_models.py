@@ -5,6 +5,7 @@ from typing import List
 import pytest
 
 from hangman.models import HangmanGameData
+from hangman.utils import letters_mask
 
 
 class TestHangmanGameData:
@@ -60,3 +61,114 @@ class TestHangmanGameData:
             under_test: The to be tested HangmanGameData object from predefined fixture.
         """
         assert under_test.secret_word_with_correct_letters == "_ e s _"
+
+    def test_letter_masks(self, under_test: HangmanGameData) -> None:
+        """Test the bit masks are built from the secret word and letter lists.
+
+        Args:
+            under_test: The to be tested HangmanGameData object from predefined fixture.
+        """
+        assert under_test.secret_word_mask == letters_mask("tes")
+        assert under_test.missed_mask == letters_mask("azh")
+        assert under_test.correct_mask == letters_mask("es")
+        assert under_test.guessed_mask == letters_mask("azhes")
+
+    def test_is_letter_guessed(self, under_test: HangmanGameData) -> None:
+        """Test the duplicate guess check against the guessed letters mask.
+
+        Args:
+            under_test: The to be tested HangmanGameData object from predefined fixture.
+        """
+        assert under_test.is_letter_guessed("a") is True
+        assert under_test.is_letter_guessed("s") is True
+        assert under_test.is_letter_guessed("t") is False
+
+    def test_settle_guess(self, under_test: HangmanGameData) -> None:
+        """Test settling a guess leaves a game with a fixed secret word unchanged.
+
+        Args:
+            under_test: The to be tested HangmanGameData object from predefined fixture.
+        """
+        before = HangmanGameData(
+            secret_word=under_test.secret_word,
+            missed_letters=list(under_test.missed_letters),
+            correct_letters=list(under_test.correct_letters),
+        )
+        under_test.settle_guess("t")
+        assert under_test == before
+
+    def test_add_letters(self, under_test: HangmanGameData) -> None:
+        """Test adding letters keeps the lists and the masks in sync.
+
+        Args:
+            under_test: The to be tested HangmanGameData object from predefined fixture.
+        """
+        assert under_test.is_letter_in_secret_word("t") is True
+        assert under_test.is_secret_word_revealed is False
+
+        under_test.add_missed_letter("b")
+        under_test.add_correct_letter("t")
+        assert under_test.missed_letters == ["a", "z", "h", "b"]
+        assert under_test.correct_letters == ["e", "s", "t"]
+        assert under_test.missed_mask == letters_mask("azhb")
+        assert under_test.is_secret_word_revealed is True
+
+    def test_refresh_guess_state(self, under_test: HangmanGameData) -> None:
+        """Test the guess state is rebuilt after the lists are changed directly.
+
+        Args:
+            under_test: The to be tested HangmanGameData object from predefined fixture.
+        """
+        under_test.correct_letters.append("t")
+        under_test.refresh_guess_state()
+        assert under_test.is_secret_word_revealed is True
+        assert under_test.secret_word_with_correct_letters == "t e s t"
+
+    def test_secret_word_with_correct_letters_incremental(self) -> None:
+        """Test the revealed pattern is updated by new correct letters, including repeated letters."""
+        under_test = HangmanGameData(secret_word="banana")
+        assert under_test.secret_word_with_correct_letters == "_ _ _ _ _ _"
+        under_test.add_correct_letter("a")
+        assert under_test.secret_word_with_correct_letters == "_ a _ a _ a"
+        under_test.add_missed_letter("z")
+        under_test.add_correct_letter("n")
+        assert under_test.secret_word_with_correct_letters == "_ a n a n a"
+
+    def test_assignment_refreshes_guess_state(self, under_test: HangmanGameData) -> None:
+        """Test replacing the secret word or a letter list rebuilds the masks and the revealed letters.
+
+        Args:
+            under_test: The to be tested HangmanGameData object from predefined fixture.
+        """
+        under_test.correct_letters = ["t", "e", "s"]
+        assert under_test.is_secret_word_revealed is True
+        assert under_test.secret_word_with_correct_letters == "t e s t"
+
+        under_test.secret_word = "tests"
+        assert under_test.secret_word_with_correct_letters == "t e s t s"
+        under_test.missed_letters = []
+        assert under_test.missed_mask == 0
+        assert under_test.is_letter_guessed("a") is False
+
+    def test_reset(self, under_test: HangmanGameData) -> None:
+        """Test resetting the game data starts a new game, leaving the letter lists of the previous game unchanged.
+
+        Args:
+            under_test: The to be tested HangmanGameData object from predefined fixture.
+        """
+        under_test.game_finished = True
+        previous_missed_letters = under_test.missed_letters
+        under_test.reset("camel", 3)
+        assert under_test == HangmanGameData(secret_word="camel")
+        assert under_test.secret_word_index == 3
+        assert under_test.guessed_mask == 0
+        assert under_test.secret_word_with_correct_letters == "_ _ _ _ _"
+        assert previous_missed_letters == ["a", "z", "h"]
+
+    def test_secret_word_drawn_only_if_none(self) -> None:
+        """Test an empty secret word is kept as is, and only a missing one is drawn from the corpus."""
+        under_test = HangmanGameData(secret_word="")
+        assert under_test.secret_word == ""
+        assert under_test.secret_word_index == -1
+        assert under_test.is_secret_word_revealed is True
+        assert HangmanGameData().secret_word
@@ -0,0 +1,32 @@
+"""Module for testing the parallel module."""
+
+import pytest
+
+from hangman.parallel import derive_seed, iter_chunks, run_parallel_simulation
+
+
+class TestParallel:
+    """Unit test the parallel simulation runner."""
+
+    def test_iter_chunks(self) -> None:
+        """Test the games are split into fixed-size chunks with distinct seeds."""
+        chunks = list(iter_chunks(games=25, strategy="random", master_seed=3, chunk_size=10))
+        assert [chunk.games for chunk in chunks] == [10, 10, 5]
+        assert [chunk.seed for chunk in chunks] == [derive_seed(3, idx) for idx in range(3)]
+        assert len({chunk.seed for chunk in chunks}) == 3
+
+    def test_results_independent_of_worker_count(self) -> None:
+        """Test the same master seed produces identical results with one or several workers."""
+        in_process = run_parallel_simulation(120, "random", master_seed=11, workers=1, chunk_size=25)
+        pooled = run_parallel_simulation(120, "random", master_seed=11, workers=2, chunk_size=25)
+        assert in_process.games == pooled.games == 120
+        assert (in_process.wins, in_process.missed_guesses, in_process.correct_guesses) == (
+            pooled.wins,
+            pooled.missed_guesses,
+            pooled.correct_guesses,
+        )
+
+    def test_unknown_strategy(self) -> None:
+        """Test an unknown strategy name is rejected before any worker is started."""
+        with pytest.raises(ValueError):
+            run_parallel_simulation(10, "unknown", master_seed=0)
@@ -0,0 +1,172 @@
+"""Module for testing the persistence module."""
+
+import os
+import shutil
+
+from hangman import persistence
+from hangman.models import HangmanGameData
+from hangman.persistence import GameJournal, decode_snapshot, encode_snapshot
+
+WORDS = ["ant", "baboon", "camel"]
+
+
+class TestSnapshot:
+    """Unit test the binary snapshot encoding."""
+
+    def test_round_trip_with_word_index(self) -> None:
+        """Test a game drawn from the corpus keeps its word index, unless the index points to another word."""
+        hangman_game_data = HangmanGameData(secret_word="camel", secret_word_index=2, correct_letters=["m", "a"])
+        hangman_game_data.add_missed_letter("z")
+        snapshot = encode_snapshot(hangman_game_data, WORDS)
+
+        changed_corpus = decode_snapshot(snapshot, ["ant", "baboon", "zebra"])
+        assert changed_corpus.secret_word == "camel"
+        assert changed_corpus.secret_word_index == -1
+        restored = decode_snapshot(snapshot, WORDS)
+        assert restored == hangman_game_data
+        assert restored.secret_word_index == 2
+        assert restored.secret_word_with_correct_letters == "_ a m _ _"
+        assert restored.is_letter_guessed("z") is True
+
+    def test_round_trip_inline_word(self) -> None:
+        """Test a secret word which is not in the corpus is stored inline."""
+        hangman_game_data = HangmanGameData(secret_word="café", correct_letters=["é"], game_finished=True)
+        snapshot = encode_snapshot(hangman_game_data, WORDS)
+        assert decode_snapshot(snapshot, WORDS) == hangman_game_data
+
+
+class TestGameJournal:
+    """Unit test the GameJournal class."""
+
+    def test_batched_writes(self, tmp_path) -> None:
+        """Test records are only written once the batch is full.
+
+        Args:
+            tmp_path: The pytest built-in temporary directory fixture.
+        """
+        under_test = GameJournal(str(tmp_path), WORDS, batch_size=3, flush_interval=3600, fsync=False)
+        header_size = os.path.getsize(under_test.journal_path)
+        under_test.record_new_game("s1", HangmanGameData(secret_word="ant", secret_word_index=0))
+        under_test.record_guess("s1", "a")
+        assert os.path.getsize(under_test.journal_path) == header_size
+        under_test.record_guess("s1", "n")
+        assert os.path.getsize(under_test.journal_path) > header_size
+        under_test.close()
+
+    def test_restore(self, tmp_path) -> None:
+        """Test games are rebuilt by replaying the journal after the checkpoint.
+
+        Args:
+            tmp_path: The pytest built-in temporary directory fixture.
+        """
+        under_test = GameJournal(str(tmp_path), WORDS, fsync=False)
+        under_test.record_new_game("s1", HangmanGameData(secret_word="ant", secret_word_index=0))
+        under_test.record_new_game("s2", HangmanGameData(secret_word="camel", secret_word_index=2))
+        under_test.record_guess("s1", "a")
+        under_test.checkpoint(under_test.restore())
+        for letter in "znt":
+            under_test.record_guess("s1", letter)
+        under_test.record_removed("s2")
+        under_test.close()
+
+        # Simulate a crash in the middle of writing a record.
+        with open(under_test.journal_path, mode="ab") as journal_file:
+            journal_file.write(b"\x02\x02")
+
+        games = GameJournal(str(tmp_path), WORDS, fsync=False).restore()
+        assert list(games) == ["s1"]
+        assert games["s1"].missed_letters == ["z"]
+        assert games["s1"].correct_letters == ["a", "n", "t"]
+        assert games["s1"].game_finished is True
+
+    def test_crash_before_journal_reset(self, tmp_path) -> None:
+        """Test the journal left over by a crash right after the checkpoint is swapped in is not replayed again.
+
+        Args:
+            tmp_path: The pytest built-in temporary directory fixture.
+        """
+        under_test = GameJournal(str(tmp_path), WORDS, fsync=False)
+        under_test.record_new_game("s1", HangmanGameData(secret_word="ant", secret_word_index=0))
+        for letter in "zyx":
+            under_test.record_guess("s1", letter)
+        under_test.flush()
+        stale_journal_path = str(tmp_path / "stale_journal.bin")
+        shutil.copyfile(under_test.journal_path, stale_journal_path)
+        under_test.checkpoint(under_test.restore())
+        under_test.close()
+        os.replace(stale_journal_path, under_test.journal_path)
+
+        reopened = GameJournal(str(tmp_path), WORDS, fsync=False)
+        assert reopened.restore()["s1"].missed_letters == ["z", "y", "x"]
+        reopened.record_guess("s1", "a")
+        reopened.close()
+        games = GameJournal(str(tmp_path), WORDS, fsync=False).restore()
+        assert games["s1"].missed_letters == ["z", "y", "x"]
+        assert games["s1"].correct_letters == ["a"]
+
+    def test_replay_skips_guessed_letters(self, tmp_path) -> None:
+        """Test a guess journaled twice only counts once.
+
+        Args:
+            tmp_path: The pytest built-in temporary directory fixture.
+        """
+        under_test = GameJournal(str(tmp_path), WORDS, fsync=False)
+        under_test.record_new_game("s1", HangmanGameData(secret_word="ant", secret_word_index=0))
+        for letter in "zz":
+            under_test.record_guess("s1", letter)
+        under_test.close()
+        assert GameJournal(str(tmp_path), WORDS, fsync=False).restore()["s1"].missed_letters == ["z"]
+
+    def test_restore_with_changed_corpus(self, tmp_path) -> None:
+        """Test games written for another corpus restore their own secret words, without word index.
+
+        Args:
+            tmp_path: The pytest built-in temporary directory fixture.
+        """
+        under_test = GameJournal(str(tmp_path), WORDS, fsync=False)
+        under_test.record_new_game("s1", HangmanGameData(secret_word="camel", secret_word_index=2))
+        under_test.checkpoint(under_test.restore())
+        under_test.close()
+
+        games = GameJournal(str(tmp_path), ["camel", "ant", "baboon"], fsync=False).restore()
+        assert games["s1"].secret_word == "camel"
+        assert games["s1"].secret_word_index == -1
+
+    def test_checkpoint_due(self, tmp_path, monkeypatch) -> None:
+        """Test a checkpoint is due after checkpoint_records records or checkpoint_interval seconds, and resets both.
+
+        Args:
+            tmp_path: The pytest built-in temporary directory fixture.
+            monkeypatch: Fixture for patching the clock of the journal.
+        """
+        clock = [0.0]
+        monkeypatch.setattr(persistence.time, "monotonic", lambda: clock[0])
+        under_test = GameJournal(str(tmp_path), WORDS, fsync=False, checkpoint_records=3, checkpoint_interval=60)
+        clock[0] = 120.0
+        assert under_test.is_checkpoint_due() is False
+        under_test.record_new_game("s1", HangmanGameData(secret_word="ant", secret_word_index=0))
+        assert under_test.is_checkpoint_due() is True
+        under_test.checkpoint(under_test.restore())
+        for letter in "za":
+            under_test.record_guess("s1", letter)
+        assert under_test.is_checkpoint_due() is False
+        under_test.record_guess("s1", "n")
+        assert under_test.is_checkpoint_due() is True
+        under_test.close()
+
+    def test_corpus_hashed_lazily(self, tmp_path, monkeypatch) -> None:
+        """Test opening a journal of the current generation does not hash the corpus, and restoring it hashes it once.
+
+        Args:
+            tmp_path: The pytest built-in temporary directory fixture.
+            monkeypatch: Fixture for patching the module attributes.
+        """
+        GameJournal(str(tmp_path), WORDS, fsync=False).close()
+        hashed = []
+        monkeypatch.setattr(persistence, "corpus_digest", lambda words: hashed.append(words) or bytes(32))
+        under_test = GameJournal(str(tmp_path), WORDS, fsync=False)
+        assert not hashed
+        under_test.restore()
+        under_test.checkpoint({})
+        assert hashed == [WORDS]
+        under_test.close()
@@ -0,0 +1,100 @@
+"""Module for testing the rules module."""
+
+import random
+import string
+
+from hangman.constants import MAX_MISSED_GUESSES
+from hangman.controllers import HangmanGameController
+from hangman.models import HangmanGameData
+from hangman.rules import (
+    EVENT_CORRECT_GUESS,
+    EVENT_GAME_LOST,
+    EVENT_GAME_OVER,
+    EVENT_GAME_WON,
+    EVENT_MISSED_GUESS,
+    EVENT_REPEATED_GUESS,
+    GameState,
+    step,
+)
+from hangman.views import HangmanGameView
+
+WORDS = ["ant", "baboon", "camel", "zebra", "jazz"]
+
+
+class TestStep:
+    """Unit test the step() transition function."""
+
+    def test_win(self) -> None:
+        """Test the events of the guesses of a won game, and that the previous states are left unchanged."""
+        state = GameState("ant")
+        state, events = step(state, "a")
+        assert events == (EVENT_CORRECT_GUESS,)
+        after_a = state
+        state, events = step(state, "x")
+        assert events == (EVENT_MISSED_GUESS,)
+        state, events = step(state, "x")
+        assert events == (EVENT_REPEATED_GUESS,)
+        state, events = step(state, "n")
+        state, events = step(state, "t")
+        assert events == (EVENT_CORRECT_GUESS, EVENT_GAME_WON)
+        assert state.game_finished is True
+        assert state.correct_letters == ("a", "n", "t")
+        assert state.missed_letters == ("x",)
+        assert step(state, "z") == (state, (EVENT_GAME_OVER,))
+        assert after_a.correct_letters == ("a",)
+        assert after_a.game_finished is False
+
+    def test_loss(self) -> None:
+        """Test the game is lost with the last allowed missed guess."""
+        state = GameState("ant")
+        for letter in string.ascii_lowercase[-MAX_MISSED_GUESSES:]:
+            state, events = step(state, letter)
+        assert events == (EVENT_MISSED_GUESS, EVENT_GAME_LOST)
+        assert state.game_finished is True
+
+    def test_same_rules_as_controller(self) -> None:
+        """Test random guesses lead to the same games with step() as with the controller."""
+        rng = random.Random(0)
+        hangman_game_view = HangmanGameView()
+        for secret_word in WORDS * 20:
+            hangman_game_data = HangmanGameData(secret_word=secret_word)
+            controller = HangmanGameController(hangman_game_data, hangman_game_view)
+            state = GameState(secret_word)
+            for letter in rng.sample(string.ascii_lowercase, len(string.ascii_lowercase)):
+                player_won = controller.evaluate_player_guess(letter)
+                state, events = step(state, letter)
+                assert (EVENT_GAME_WON in events, EVENT_GAME_LOST in events) == (
+                    player_won is True,
+                    player_won is False,
+                )
+                if player_won is not None:
+                    break
+            assert GameState.from_game_data(hangman_game_data) == state
+            assert state.to_game_data() == hangman_game_data
+
+    def test_other_letters(self) -> None:
+        """Test a secret word with a letter other than a-z is won by guessing it, with step() as with the controller."""
+        hangman_game_data = HangmanGameData(secret_word="café")
+        controller = HangmanGameController(hangman_game_data, HangmanGameView())
+        state = GameState("café")
+        for letter in "cafe":
+            assert controller.evaluate_player_guess(letter) is None
+            state, events = step(state, letter)
+        assert events == (EVENT_MISSED_GUESS,)
+        assert controller.evaluate_player_guess("é") is True
+        state, events = step(state, "é")
+        assert events == (EVENT_CORRECT_GUESS, EVENT_GAME_WON)
+        assert state.to_game_data() == hangman_game_data
+
+    def test_controller_ignores_repeated_guess(self) -> None:
+        """Test the controller leaves the game unchanged for a repeated guess and after the game end, as step()."""
+        hangman_game_data = HangmanGameData(secret_word="ant")
+        controller = HangmanGameController(hangman_game_data, HangmanGameView())
+        for letter in "xxaa":
+            assert controller.evaluate_player_guess(letter) is None
+        assert hangman_game_data.missed_letters == ["x"]
+        assert hangman_game_data.correct_letters == ["a"]
+        assert controller.evaluate_player_guess("n") is None
+        assert controller.evaluate_player_guess("t") is True
+        assert controller.evaluate_player_guess("z") is None
+        assert hangman_game_data.missed_letters == ["x"]
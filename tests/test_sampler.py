@@ -0,0 +1,86 @@
+"""Module for testing the sampler module."""
+
+import json
+
+import pytest
+
+from hangman.controllers import HangmanGameController
+from hangman.difficulty import get_difficulty_tiers
+from hangman.sampler import FeistelPermutation, WordSampler, derive_round_key
+
+WORDS = ["ant", "bat", "cat", "dog", "eel", "fox", "gnu"]
+
+
+class TestFeistelPermutation:
+    """Unit test the FeistelPermutation class."""
+
+    @pytest.mark.parametrize("size", [1, 2, 3, 7, 64, 65, 1000])
+    def test_bijection(self, size: int) -> None:
+        """Test every integer of the range is mapped to a distinct integer of the range.
+
+        Args:
+            size: The number of integers permuted.
+        """
+        permutation = FeistelPermutation(size, derive_round_key(seed=1, round_number=0))
+        assert sorted(permutation[idx] for idx in range(size)) == list(range(size))
+
+    def test_keys(self) -> None:
+        """Test different keys give different permutations, and an empty range is rejected."""
+        first = FeistelPermutation(1000, derive_round_key(seed=1, round_number=0))
+        second = FeistelPermutation(1000, derive_round_key(seed=2, round_number=0))
+        assert [first[idx] for idx in range(1000)] != [second[idx] for idx in range(1000)]
+        with pytest.raises(ValueError):
+            FeistelPermutation(0, derive_round_key(seed=1, round_number=0))
+
+
+class TestWordSampler:
+    """Unit test the WordSampler class."""
+
+    def test_no_repeats_per_round(self) -> None:
+        """Test every word is drawn once before any is drawn again, and each round is shuffled anew."""
+        word_sampler = WordSampler(seed=3, words=WORDS)
+        rounds = [[word_sampler.draw()[1] for _ in WORDS] for _ in range(4)]
+        assert all(sorted(words) == WORDS for words in rounds)
+        assert len({tuple(words) for words in rounds}) > 1
+        assert word_sampler.position == 4 * len(WORDS)
+
+    def test_seeded(self) -> None:
+        """Test the same seed draws the same words, and the indexes match the words."""
+        first = [WordSampler(seed=5, words=WORDS).draw() for _ in range(3)]
+        second = [WordSampler(seed=5, words=WORDS).draw() for _ in range(3)]
+        assert first == second
+        assert all(WORDS[idx] == word for idx, word in first)
+
+    def test_checkpoint(self) -> None:
+        """Test a sampler resumed from a JSON checkpoint draws the words the original sampler draws next."""
+        word_sampler = WordSampler(seed=9, words=WORDS)
+        for _ in range(10):
+            word_sampler.draw()
+        checkpoint = json.loads(json.dumps(word_sampler.checkpoint()))
+        resumed_sampler = WordSampler.from_checkpoint(checkpoint, words=WORDS)
+        assert [resumed_sampler.draw() for _ in range(10)] == [word_sampler.draw() for _ in range(10)]
+
+    def test_difficulty(self) -> None:
+        """Test a sampler of a difficulty tier draws every word of the tier once per round, and keeps its tier."""
+        tier_words = [WORDS[idx] for idx in get_difficulty_tiers(WORDS).tier_rows["hard"]]
+        word_sampler = WordSampler(seed=2, words=WORDS, difficulty="hard")
+        drawn = [word_sampler.draw() for _ in range(2 * len(tier_words))]
+        assert all(WORDS[idx] == word for idx, word in drawn)
+        assert sorted(word for _, word in drawn[: len(tier_words)]) == sorted(tier_words)
+        resumed_sampler = WordSampler.from_checkpoint(json.loads(json.dumps(word_sampler.checkpoint())), words=WORDS)
+        assert resumed_sampler.difficulty == "hard"
+        with pytest.raises(ValueError):
+            WordSampler(seed=1, words=WORDS, difficulty="nightmare").draw()
+
+    def test_empty_corpus(self) -> None:
+        """Test drawing from an empty corpus is rejected."""
+        with pytest.raises(ValueError):
+            WordSampler(seed=1, words=[]).draw()
+
+    def test_controller_new_games(self) -> None:
+        """Test the games of a controller draw their secret words from its sampler without repeats."""
+        controller = HangmanGameController(word_sampler=WordSampler(seed=1, words=WORDS))
+        secret_words = [controller.hangman_game_data.secret_word]
+        secret_words += [controller.new_game_data().secret_word for _ in range(len(WORDS) - 1)]
+        assert sorted(secret_words) == WORDS
+        assert controller.word_sampler.position == len(WORDS)
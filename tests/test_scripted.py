@@ -0,0 +1,112 @@
+"""Module for testing the scripted module."""
+
+import json
+from unittest import mock
+
+import pytest
+from click.testing import CliRunner
+
+from hangman.cli import cli
+from hangman.scripted import (
+    ScriptedGame,
+    ScriptedGamePlayer,
+    iter_game_results,
+    iter_scripted_games,
+    parse_scripted_game,
+)
+
+
+class TestScriptedGames:
+    """Unit test the parsing of scripted games."""
+
+    def test_iter_scripted_games(self) -> None:
+        """Test plain text and JSON lines are parsed, and blank lines are skipped."""
+        lines = ["cam\n", "\n", '{"guesses": ["a", "bc"], "secret_word": "Bat"}\n', '{"guesses": "xy"}']
+        assert list(iter_scripted_games(lines)) == [
+            ScriptedGame(guesses=["c", "a", "m"], line_number=1),
+            ScriptedGame(guesses=["a", "bc"], secret_word="bat", line_number=3),
+            ScriptedGame(guesses=["x", "y"], line_number=4),
+        ]
+
+    @pytest.mark.parametrize(
+        "line, expected_error",
+        [
+            ('{"guesses": ', "Line 1: invalid JSON"),
+            ('{"guesses": 1}', "Line 1: guesses must be"),
+            ('{"guesses": "a", "secret_word": 1}', "Line 1: secret_word must be"),
+        ],
+    )
+    def test_iter_scripted_games_invalid(self, line: str, expected_error: str) -> None:
+        """Test invalid JSON lines are reported with their line number, and the next lines are still parsed.
+
+        Args:
+            line: The invalid input line.
+            expected_error: The expected start of the error message.
+        """
+        with pytest.raises(ValueError, match=expected_error):
+            parse_scripted_game(line, 1)
+        invalid_game, next_game = iter_scripted_games([line, "ab"])
+        assert invalid_game.error.startswith(expected_error)
+        assert next_game == ScriptedGame(guesses=["a", "b"], line_number=2)
+
+    def test_iter_scripted_games_lazy(self) -> None:
+        """Test the input lines are only read as the games are consumed."""
+        lines = iter(["a", "b", "c"])
+        scripted_games = iter_scripted_games(lines)
+        next(scripted_games)
+        assert list(lines) == ["b", "c"]
+
+
+class TestScriptedGamePlayer:
+    """Unit test the ScriptedGamePlayer class."""
+
+    def test_play_won(self) -> None:
+        """Test invalid entries are rejected and the guesses after the end of the game are ignored."""
+        game_results = ScriptedGamePlayer().play(ScriptedGame(guesses=list("aA1tzbx"), secret_word="bat"))
+        assert game_results == {
+            "line": 0,
+            "secret_word": "bat",
+            "won": True,
+            "missed_letters": "z",
+            "correct_letters": "atb",
+            "invalid_guesses": ["A", "1"],
+            "guesses_used": 6,
+            "revealed": "b a t",
+        }
+
+    def test_play_lost(self) -> None:
+        """Test the game is lost after too many missed guesses."""
+        game_results = ScriptedGamePlayer().play(ScriptedGame(guesses=list("cdefghij"), secret_word="bat"))
+        assert game_results["won"] is False
+        assert game_results["missed_letters"] == "cdefgh"
+        assert game_results["guesses_used"] == 6
+
+    def test_play_unfinished(self) -> None:
+        """Test the game is unfinished when the guesses run out."""
+        game_results = ScriptedGamePlayer().play(ScriptedGame(guesses=["b"], secret_word="bat"))
+        assert game_results["won"] is None
+        assert game_results["revealed"] == "b _ _"
+
+    def test_iter_game_results_seeded(self) -> None:
+        """Test the random secret words are reproducible with a seed."""
+        with mock.patch("hangman.utils.WORDS_LIST", ["ant", "bat", "cat", "dog"]):
+            first_run = [game_results["secret_word"] for game_results in iter_game_results(["a"] * 10, seed=7)]
+            second_run = [game_results["secret_word"] for game_results in iter_game_results(["a"] * 10, seed=7)]
+        assert first_run == second_run
+
+    def test_play_script_command(self) -> None:
+        """Test the play-script command prints one JSON line per game read from stdin."""
+        script = 'bat\n{"guesses": "tab", "secret_word": "tab"}\n'
+        result = CliRunner().invoke(cli, ["play-script"], input=script)
+        assert result.exit_code == 0
+        assert [json.loads(line)["line"] for line in result.output.splitlines()] == [1, 2]
+
+    def test_play_script_command_invalid(self) -> None:
+        """Test the play-script command prints an error record for an invalid line, plays the next ones, and fails."""
+        result = CliRunner().invoke(cli, ["play-script"], input='{oops\nbat\n{"guesses": 1}\n')
+        assert result.exit_code == 1
+        records = [json.loads(line) for line in result.output.splitlines() if line.startswith("{")]
+        assert [record["line"] for record in records] == [1, 2, 3]
+        assert records[0]["error"].startswith("Line 1: invalid JSON")
+        assert "won" in records[1]
+        assert "2 invalid script line(s)." in result.output
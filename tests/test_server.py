@@ -0,0 +1,217 @@
+"""Module for testing the server module."""
+
+import asyncio
+from typing import List, Tuple
+
+from hangman.controllers import HangmanGameController
+from hangman.leaderboard import Leaderboard, LeaderboardWriter
+from hangman.persistence import GameJournal
+from hangman.sampler import WordSampler
+from hangman.server import MSG_BYE, MSG_SESSION_IN_USE, PROMPT_GUESS, PROMPT_PLAY_AGAIN, HangmanGameServer
+
+
+def cat_sampler() -> WordSampler:
+    """Create a sampler drawing 'cat' only.
+
+    Returns:
+        WordSampler: The sampler.
+    """
+    return WordSampler(seed=0, words=["cat"])
+
+
+async def read_reply(reader: asyncio.StreamReader) -> str:
+    """Read a reply of the server up to and including its prompt.
+
+    Args:
+        reader: Stream of the server replies.
+
+    Returns:
+        str: The reply.
+    """
+    reply = ""
+    while not reply.endswith((PROMPT_GUESS, PROMPT_PLAY_AGAIN)):
+        reply += (await reader.readuntil(b": ")).decode("utf-8")
+    return reply
+
+
+async def play_over_tcp(under_test: HangmanGameServer, lines: List[str], last_line: str) -> Tuple[List[str], int]:
+    """Connect to a server on localhost, send lines and collect the replies.
+
+    Args:
+        under_test: The game server to be tested.
+        lines: The lines to be sent by the player, each is replied with a prompt.
+        last_line: The last line to be sent by the player, after which the server closes the connection.
+
+    Returns:
+        List[str], int: The replies, and the number of active sessions while connected.
+    """
+    server = await under_test.start("127.0.0.1", 0)
+    async with server:
+        reader, writer = await asyncio.open_connection("127.0.0.1", under_test.port)
+        replies = [await read_reply(reader)]
+        active_sessions = under_test.active_sessions
+        for line in lines:
+            writer.write(f"{line}\r\n".encode("utf-8"))
+            replies.append(await read_reply(reader))
+        writer.write(f"{last_line}\r\n".encode("utf-8"))
+        replies.append((await reader.read()).decode("utf-8"))
+        writer.close()
+    return replies, active_sessions
+
+
+class TestHangmanGameServer:
+    """Unit test the HangmanGameServer class."""
+
+    def test_play_turn(self) -> None:
+        """Test the replies of a game played turn by turn without a connection."""
+        under_test = HangmanGameServer(sampler_factory=cat_sampler)
+        controller = HangmanGameController(under_test.new_game(), under_test.hangman_game_view)
+
+        assert "Please enter one letter." in under_test.play_turn(controller, "ab")
+        assert under_test.play_turn(controller, "c").endswith(PROMPT_GUESS)
+        assert "Correct letters: c _ _" in under_test.play_turn(controller, "x")
+        under_test.play_turn(controller, "a")
+        reply = under_test.play_turn(controller, "t")
+        assert "You won the game! The word is 'cat'." in reply
+        assert reply.endswith(PROMPT_PLAY_AGAIN)
+
+    def test_play_turn_records_finished_game(self, tmp_path) -> None:
+        """Test a finished game is recorded on the leaderboard with the session id as player name.
+
+        Args:
+            tmp_path: The pytest built-in temporary directory fixture.
+        """
+        db_path = str(tmp_path / "leaderboard.db")
+        under_test = HangmanGameServer(sampler_factory=cat_sampler, leaderboard=LeaderboardWriter(db_path))
+        controller = HangmanGameController(under_test.new_game(), under_test.hangman_game_view)
+        for letter in "cat":
+            under_test.play_turn(controller, letter, session_id="s1")
+        under_test.leaderboard.close()
+        assert [game.secret_word for game in Leaderboard(db_path).player_games("s1")] == ["cat"]
+
+    def test_session_over_tcp(self) -> None:
+        """Test a player wins a game, plays again, loses and quits over a localhost connection."""
+        under_test = HangmanGameServer(sampler_factory=cat_sampler)
+        lines = ["c", "a", "t", "y", "z", "b", "d", "e", "f", "g"]
+        replies, active_sessions = asyncio.run(play_over_tcp(under_test, lines, last_line="n"))
+
+        assert active_sessions == 1
+        assert "Correct letters: _ _ _" in replies[0]
+        assert "You won the game!" in replies[3]
+        assert replies[3].endswith(PROMPT_PLAY_AGAIN)
+        assert "Correct letters: _ _ _" in replies[4]
+        assert "Missed letters : z" in replies[5]
+        assert "You have run out of guesses!" in replies[10]
+        assert replies[11] == f"{MSG_BYE}\r\n"
+        assert under_test.active_sessions == 0
+
+    def test_session_draws_without_repeats(self) -> None:
+        """Test the games of a connected player draw every word once before any is drawn again."""
+        words = ["ant", "bee", "cat"]
+        under_test = HangmanGameServer(sampler_factory=lambda: WordSampler(seed=1, words=words))
+        lines = []
+        for _ in words:
+            lines += ["z", "x", "q", "j", "v", "w", "y"]
+        replies, _ = asyncio.run(play_over_tcp(under_test, lines[:-1], last_line="n"))
+        lost_words = [reply.split("'")[1] for reply in replies if "run out of guesses" in reply]
+        assert sorted(lost_words) == words
+
+    def test_resume_session_over_tcp(self) -> None:
+        """Test a player reconnects and resumes the game of a previous connection."""
+
+        async def play_two_connections() -> str:
+            server = await under_test.start("127.0.0.1", 0)
+            async with server:
+                reader, writer = await asyncio.open_connection("127.0.0.1", under_test.port)
+                session_id = (await read_reply(reader)).split()[2]
+                writer.write(b"c\r\n")
+                await read_reply(reader)
+                writer.close()
+
+                reader, writer = await asyncio.open_connection("127.0.0.1", under_test.port)
+                await read_reply(reader)
+                writer.write(f"resume {session_id}\r\n".encode("utf-8"))
+                reply = await read_reply(reader)
+                writer.close()
+            return reply
+
+        under_test = HangmanGameServer(sampler_factory=cat_sampler)
+        assert "Correct letters: c _ _" in asyncio.run(play_two_connections())
+
+    def test_resume_session_held_by_connection(self) -> None:
+        """Test a session played by a connected player cannot be resumed, and becomes resumable once it disconnects."""
+
+        async def resume_while_connected() -> Tuple[str, str, str]:
+            server = await under_test.start("127.0.0.1", 0)
+            async with server:
+                first_reader, first_writer = await asyncio.open_connection("127.0.0.1", under_test.port)
+                first_id = (await read_reply(first_reader)).split()[2]
+                reader, writer = await asyncio.open_connection("127.0.0.1", under_test.port)
+                second_id = (await read_reply(reader)).split()[2]
+                writer.write(f"resume {first_id}\r\n".encode("utf-8"))
+                refused = await read_reply(reader)
+
+                first_writer.close()
+                await first_reader.read()
+                await asyncio.sleep(0.01)
+                writer.write(f"resume {first_id}\r\n".encode("utf-8"))
+                await read_reply(reader)
+                writer.write(b"c\r\n")
+                resumed = await read_reply(reader)
+                writer.close()
+            return refused, resumed, second_id
+
+        under_test = HangmanGameServer(sampler_factory=cat_sampler)
+        refused, resumed, second_id = asyncio.run(resume_while_connected())
+        assert MSG_SESSION_IN_USE in refused
+        assert "Correct letters: c _ _" in resumed
+        # The session the second connection started is dropped once it resumes the first one.
+        assert second_id not in under_test.session_store
+        assert len(under_test.session_store) == 1
+
+    def test_games_survive_restart(self, tmp_path) -> None:
+        """Test a game is restored from the journal by a restarted server.
+
+        Args:
+            tmp_path: The pytest built-in temporary directory fixture.
+        """
+
+        async def play_and_stop() -> str:
+            game_server = HangmanGameServer(sampler_factory=cat_sampler, journal=GameJournal(str(tmp_path)))
+            server = await game_server.start("127.0.0.1", 0)
+            async with server:
+                reader, writer = await asyncio.open_connection("127.0.0.1", game_server.port)
+                session_id = (await read_reply(reader)).split()[2]
+                writer.write(b"a\r\n")
+                await read_reply(reader)
+                writer.close()
+            game_server.close_journal()
+            return session_id
+
+        session_id = asyncio.run(play_and_stop())
+        under_test = HangmanGameServer(journal=GameJournal(str(tmp_path)))
+        asyncio.run(under_test.start("127.0.0.1", 0))
+        assert under_test.session_store.get(session_id).secret_word_with_correct_letters == "_ a _"
+        under_test.close_journal()
+
+    def test_journal_checkpointed_periodically(self, tmp_path) -> None:
+        """Test the periodic flush of the journal checkpoints the games once a checkpoint is due.
+
+        Args:
+            tmp_path: The pytest built-in temporary directory fixture.
+        """
+
+        async def flush_for_a_while() -> None:
+            flush_task = asyncio.ensure_future(under_test.flush_journal_periodically())
+            await asyncio.sleep(0.05)
+            flush_task.cancel()
+
+        journal = GameJournal(str(tmp_path), fsync=False, flush_interval=0.01, checkpoint_records=2)
+        under_test = HangmanGameServer(sampler_factory=cat_sampler, journal=journal)
+        session_id, hangman_game_data = under_test.start_new_game(cat_sampler())
+        under_test.play_turn(HangmanGameController(hangman_game_data, under_test.hangman_game_view), "a", session_id)
+        asyncio.run(flush_for_a_while())
+        assert journal.generation == 1
+        assert journal.is_checkpoint_due() is False
+        assert GameJournal(str(tmp_path)).restore()[session_id].correct_letters == ["a"]
+        journal.close()
@@ -0,0 +1,104 @@
+"""Module for testing the sessions module."""
+
+from typing import List
+
+import pytest
+
+from hangman.models import HangmanGameData
+from hangman.sessions import SessionStore
+
+
+class FakeClock:  # pylint: disable=too-few-public-methods
+    """Manually advanced clock for unit testing the idle timeout."""
+
+    def __init__(self):
+        """Start the clock at zero.
+
+        Attributes:
+            now: The current time in seconds.
+        """
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Get the current time in seconds."""
+        return self.now
+
+
+class TestSessionStore:
+    """Unit test the SessionStore class."""
+
+    @pytest.fixture
+    def games(self) -> List[HangmanGameData]:
+        """Provide game data objects for unit testing.
+
+        Returns:
+            List[HangmanGameData]: Three games with distinct secret words.
+        """
+        return [HangmanGameData(secret_word=word) for word in ("ant", "bat", "cat")]
+
+    def test_lru_eviction(self, games: List[HangmanGameData]) -> None:
+        """Test the least recently used session is evicted when the store is full.
+
+        Args:
+            games: The game data objects from fixture.
+        """
+        under_test = SessionStore(max_sessions=2)
+        under_test.put("a", games[0])
+        under_test.put("b", games[1])
+        assert under_test.get("a") is games[0]
+        under_test.put("c", games[2])
+
+        assert len(under_test) == 2
+        assert "b" not in under_test
+        assert under_test.get("b") is None
+        assert under_test.stats.lru_evictions == 1
+
+    def test_idle_eviction(self, games: List[HangmanGameData]) -> None:
+        """Test sessions are evicted once they are idle for longer than the timeout.
+
+        Args:
+            games: The game data objects from fixture.
+        """
+        clock = FakeClock()
+        under_test = SessionStore(idle_timeout=10, clock=clock)
+        under_test.put("a", games[0])
+        clock.now = 5
+        under_test.put("b", games[1])
+        clock.now = 12
+
+        assert under_test.evict_idle() == 1
+        assert "a" not in under_test
+        assert under_test.get("b") is games[1]
+        assert under_test.stats.idle_evictions == 1
+
+    def test_spill_and_resume(self, games: List[HangmanGameData], tmp_path) -> None:
+        """Test evicted sessions are spilled to disk and resumed on access.
+
+        Args:
+            games: The game data objects from fixture.
+            tmp_path: The pytest built-in temporary directory fixture.
+        """
+        under_test = SessionStore(max_sessions=1, spill_dir=str(tmp_path))
+        games[0].add_correct_letter("a")
+        games[0].add_missed_letter("z")
+        session_id = under_test.create(games[0])
+        under_test.put("b", games[1])
+        assert under_test.stats.spilled == 1
+
+        resumed = under_test.get(session_id)
+        assert resumed == games[0]
+        assert resumed.secret_word_with_correct_letters == "a _ _"
+        assert under_test.stats.resumed == 1
+        assert "b" not in under_test
+
+        under_test.remove("b")
+        assert under_test.get("b") is None
+
+    def test_invalid_session_id(self, games: List[HangmanGameData]) -> None:
+        """Test session ids which are unsafe as file names are rejected.
+
+        Args:
+            games: The game data objects from fixture.
+        """
+        with pytest.raises(ValueError):
+            SessionStore().put("../escape", games[0])
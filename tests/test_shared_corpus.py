@@ -0,0 +1,98 @@
+"""Module for testing the shared_corpus module."""
+
+import multiprocessing
+
+import numpy as np
+
+from hangman.constants import WORDS_LIST
+from hangman.decision_tree import DECISION_TREE_CACHE_DIR_ENV, get_corpus_decision_tree, load_decision_tree
+from hangman.models import HangmanGameData
+from hangman.shared_corpus import SharedCorpus, attach_shared_corpus, view_array
+from hangman.simulation import DecisionTreeStrategy, LetterFrequencyStrategy
+from hangman.solver import SOLVER_ARRAYS, CandidateWordSolver, get_corpus_solver
+from hangman.word_index import get_corpus_index
+
+WORDS = ["bat", "cat", "hat", "tab", "ant", "bee", "camel", "tact"]
+
+
+def read_worker_corpus(_) -> tuple:
+    """Read the corpus and ask the corpus solver in a worker process.
+
+    Returns:
+        tuple: The words of WORDS_LIST, whether they are read from a compiled buffer, and the solver guess for 'camel'.
+    """
+    solver_guess = get_corpus_solver().next_letter(HangmanGameData(secret_word="camel"))
+    return list(WORDS_LIST), WORDS_LIST.is_compiled, solver_guess
+
+
+def read_worker_structures(_) -> tuple:
+    """Read the corpus index and the decision tree in a worker process.
+
+    Returns:
+        tuple: The 3-letter words with an 'a' in the middle, the states and guesses of the decision tree, and whether
+            the arrays of both are read in place rather than copied.
+    """
+    bucket = get_corpus_index().buckets[3]
+    policy = get_corpus_decision_tree().policy
+    in_place = not any(array.flags.owndata for array in (bucket.bit_sets, bucket.word_array, policy.state_keys))
+    return get_corpus_index().query(3, {1: "a"}), dict(policy), in_place
+
+
+class TestSharedCorpus:
+    """Unit test the SharedCorpus class."""
+
+    def test_solver_arrays(self) -> None:
+        """Test the solver matrices in the block are the same as those of a solver built from the words."""
+        solver = CandidateWordSolver(WORDS)
+        with SharedCorpus(WORDS, include_solver=True) as shared_corpus:
+            assert [shared_array.name for shared_array in shared_corpus.handle.arrays] == list(SOLVER_ARRAYS)
+            for shared_array in shared_corpus.handle.arrays:
+                assert shared_array.offset % 64 == 0
+                assert np.array_equal(view_array(shared_corpus.block, shared_array), getattr(solver, shared_array.name))
+
+    def test_without_solver(self) -> None:
+        """Test only the corpus is shared unless the solver is included."""
+        with SharedCorpus(WORDS) as shared_corpus:
+            assert not shared_corpus.handle.arrays
+            assert shared_corpus.block.size >= shared_corpus.handle.corpus_size
+
+    def test_attach_workers(self) -> None:
+        """Test worker processes read the corpus and the solver matrices from the block of their parent process."""
+        with SharedCorpus(WORDS, include_solver=True) as shared_corpus:
+            with multiprocessing.Pool(2, initializer=attach_shared_corpus, initargs=(shared_corpus.handle,)) as pool:
+                results = pool.map(read_worker_corpus, range(2))
+        # 'camel' is the only 5-letter word, so the solver of the shared words guesses its first letter alphabetically.
+        assert results == [(WORDS, True, "a")] * 2
+
+    def test_attach_index_and_decision_tree(self, tmp_path, monkeypatch) -> None:
+        """Test worker processes load the corpus index and the decision tree from the block of their parent process.
+
+        Args:
+            tmp_path: Temporary directory provided by pytest.
+            monkeypatch: Fixture for patching the module attributes.
+        """
+        monkeypatch.setenv(DECISION_TREE_CACHE_DIR_ENV, str(tmp_path))
+        with SharedCorpus(WORDS, include_index=True, include_decision_tree=True) as shared_corpus:
+            assert not shared_corpus.handle.arrays
+            # The workers do not read the tree cache, they do not even know where it is.
+            monkeypatch.setenv(DECISION_TREE_CACHE_DIR_ENV, str(tmp_path / "missing"))
+            with multiprocessing.Pool(2, initializer=attach_shared_corpus, initargs=(shared_corpus.handle,)) as pool:
+                results = pool.map(read_worker_structures, range(2))
+        policy = load_decision_tree(WORDS, str(tmp_path)).policy
+        assert results == [(["bat", "cat", "hat", "tab"], policy, True)] * 2
+        assert not (tmp_path / "missing").exists()
+
+    def test_for_strategies(self, tmp_path, monkeypatch) -> None:
+        """Test only the structures the strategies read are shared.
+
+        Args:
+            tmp_path: Temporary directory provided by pytest.
+            monkeypatch: Fixture for patching the module attributes.
+        """
+        monkeypatch.setenv(DECISION_TREE_CACHE_DIR_ENV, str(tmp_path))
+        with SharedCorpus.for_strategies([LetterFrequencyStrategy]) as shared_corpus:
+            assert (shared_corpus.handle.arrays, shared_corpus.handle.word_index) == ((), ())
+        with SharedCorpus.for_strategies([LetterFrequencyStrategy, DecisionTreeStrategy]) as shared_corpus:
+            assert shared_corpus.handle.word_index
+            assert shared_corpus.handle.decision_tree
+            assert not shared_corpus.handle.arrays
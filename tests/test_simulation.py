@@ -0,0 +1,110 @@
+"""Module for testing the simulation module."""
+
+import random
+import string
+
+import pytest
+
+from hangman.constants import MAX_MISSED_GUESSES
+from hangman.models import HangmanGameData
+from hangman.simulation import (
+    LETTERS_BY_FREQUENCY,
+    GameResult,
+    GuessingStrategy,
+    HeadlessGameEngine,
+    LetterFrequencyStrategy,
+    RandomLetterStrategy,
+    SimulationSummary,
+)
+
+
+class ScriptedStrategy(GuessingStrategy):  # pylint: disable=too-few-public-methods
+    """Guessing strategy returning predefined letters for unit testing."""
+
+    def __init__(self, rng: random.Random, letters: str):
+        """Create the scripted strategy.
+
+        Attributes:
+            rng: Random number generator of the simulation.
+            letters: The letters to be guessed in order.
+        """
+        super().__init__(rng)
+        self.letters = iter(letters)
+
+    def next_guess(self, hangman_game_data: HangmanGameData) -> str:
+        """Return the next predefined letter."""
+        return next(self.letters)
+
+
+class TestGuessingStrategies:
+    """Unit test the built-in guessing strategies."""
+
+    def test_letters_by_frequency(self) -> None:
+        """Test the frequency order covers each letter of the alphabet once."""
+        assert sorted(LETTERS_BY_FREQUENCY) == list(string.ascii_lowercase)
+
+    def test_letter_frequency_strategy(self) -> None:
+        """Test the most frequent letter which has not been guessed yet is chosen."""
+        hangman_game_data = HangmanGameData(secret_word="test", missed_letters=["i"], correct_letters=["e"])
+        assert LetterFrequencyStrategy(random.Random(0)).next_guess(hangman_game_data) == "s"
+
+    def test_random_letter_strategy(self) -> None:
+        """Test random guesses never repeat an already guessed letter."""
+        hangman_game_data = HangmanGameData(secret_word="test", missed_letters=list(string.ascii_lowercase[1:]))
+        assert RandomLetterStrategy(random.Random(0)).next_guess(hangman_game_data) == "a"
+
+
+class TestHeadlessGameEngine:
+    """Unit test the HeadlessGameEngine class."""
+
+    def test_play_game_won(self) -> None:
+        """Test a game is won when all letters of the secret word are guessed."""
+        under_test = HeadlessGameEngine(lambda rng: ScriptedStrategy(rng, "xtes"))
+        assert under_test.play_game("test") == GameResult("test", True, ["x"], ["t", "e", "s"])
+
+    def test_play_game_lost(self) -> None:
+        """Test a game is lost after the maximum number of missed guesses."""
+        under_test = HeadlessGameEngine(lambda rng: ScriptedStrategy(rng, "abcdfgh"))
+        game_result = under_test.play_game("test")
+        assert game_result.won is False
+        assert game_result.missed_letters == list("abcdfg")[:MAX_MISSED_GUESSES]
+
+    def test_play_game_invalid_guess(self) -> None:
+        """Test a repeated guess by the strategy is rejected."""
+        under_test = HeadlessGameEngine(lambda rng: ScriptedStrategy(rng, "aa"))
+        with pytest.raises(ValueError):
+            under_test.play_game("test")
+
+    def test_run_is_reproducible(self) -> None:
+        """Test the same seed produces the same summary results."""
+        words = ["ant", "baboon", "camel", "dog"]
+        first = HeadlessGameEngine(RandomLetterStrategy, seed=7, words=words).run(50)
+        second = HeadlessGameEngine(RandomLetterStrategy, seed=7, words=words).run(50)
+        assert first.games == 50
+        assert (first.wins, first.missed_guesses, first.correct_guesses) == (
+            second.wins,
+            second.missed_guesses,
+            second.correct_guesses,
+        )
+
+
+class TestSimulationSummary:
+    """Unit test the SimulationSummary class."""
+
+    def test_add_and_merge(self) -> None:
+        """Test outcomes are counted and summaries are merged."""
+        under_test = SimulationSummary()
+        under_test.add(GameResult("test", True, ["x"], ["t", "e", "s"]))
+        other = SimulationSummary()
+        other.add(GameResult("dog", False, list("abcefh"), []))
+        under_test.merge(other)
+
+        assert (under_test.games, under_test.wins, under_test.losses) == (2, 1, 1)
+        assert under_test.win_rate == 0.5
+        assert under_test.mean_missed_guesses == 3.5
+        assert under_test.to_dict()["correct_guesses"] == 3
+
+    def test_empty_summary(self) -> None:
+        """Test the derived figures of an empty summary are zero."""
+        under_test = SimulationSummary()
+        assert under_test.win_rate == under_test.mean_missed_guesses == under_test.games_per_second == 0.0
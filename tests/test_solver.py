@@ -0,0 +1,140 @@
+"""Module for testing the solver module."""
+
+import random
+
+import numpy as np
+import pytest
+
+from hangman.models import HangmanGameData
+from hangman.simulation import CandidateSolverStrategy, HeadlessGameEngine
+from hangman.solver import OTHER_CODE, PAD_CODE, CandidateWordSolver, get_letter_code, sum_squared_family_sizes
+
+
+@pytest.fixture(name="solver")
+def fixture_solver() -> CandidateWordSolver:
+    """Get a solver of a few short words.
+
+    Returns:
+        CandidateWordSolver: The solver.
+    """
+    return CandidateWordSolver(["bat", "cat", "hat", "tab", "ant", "bee", "camel", "café"])
+
+
+class TestCandidateWordSolver:
+    """Unit test the CandidateWordSolver class."""
+
+    def test_matrices(self, solver: CandidateWordSolver) -> None:
+        """Test the letter codes and letter presence matrices of the words.
+
+        Args:
+            solver: A solver of a few short words.
+        """
+        assert len(solver) == 8
+        assert solver.lengths.tolist() == [3, 3, 3, 3, 3, 3, 5, 4]
+        assert solver.letter_codes[0].tolist() == [1, 0, 19, PAD_CODE, PAD_CODE]
+        assert solver.letter_codes[7, 3] == OTHER_CODE
+        assert np.flatnonzero(solver.letter_presence[5]).tolist() == [get_letter_code("b"), get_letter_code("e")]
+
+    @pytest.mark.parametrize(
+        "revealed_letters, missed_letters, expected_candidates",
+        [
+            ("___", "", ["bat", "cat", "hat", "tab", "ant", "bee"]),
+            ("_at", "", ["bat", "cat", "hat"]),
+            ("_at", "c", ["bat", "hat"]),
+            ("_a_", "", ["bat", "cat", "hat", "tab"]),
+            ("b__", "", ["bat", "bee"]),
+            # A revealed 'e' would be shown at all of its positions, so 'bee' is excluded when its last 'e' is hidden.
+            ("_e_", "", []),
+            ("_____", "", ["camel"]),
+            ("caf_", "", ["café"]),
+            ("______", "", []),
+        ],
+    )
+    def test_candidate_rows(
+        self, solver: CandidateWordSolver, revealed_letters: str, missed_letters: str, expected_candidates: list
+    ) -> None:
+        """Test the words consistent with the revealed letters and missed letters are found.
+
+        Args:
+            solver: A solver of a few short words.
+            revealed_letters: The revealed letters, '_' where hidden.
+            missed_letters: The missed letters.
+            expected_candidates: The expected candidate words.
+        """
+        rows = solver.candidate_rows(list(revealed_letters), list(missed_letters))
+        assert solver.words[rows].tolist() == expected_candidates
+
+    def test_candidates(self, solver: CandidateWordSolver) -> None:
+        """Test the candidates of a game come from its revealed letters and missed letters, not its secret word.
+
+        Args:
+            solver: A solver of a few short words.
+        """
+        hangman_game_data = HangmanGameData(secret_word="hat", missed_letters=["b"], correct_letters=["t"])
+        assert solver.candidates(hangman_game_data) == ["cat", "hat", "ant"]
+
+    def test_next_letter(self, solver: CandidateWordSolver) -> None:
+        """Test the letter contained in the most candidates, which has not been guessed yet, is suggested.
+
+        Args:
+            solver: A solver of a few short words.
+        """
+        hangman_game_data = HangmanGameData(secret_word="hat", correct_letters=["t"])
+        counts = solver.letter_counts(hangman_game_data)
+        assert counts[get_letter_code("t")] == 0
+        assert counts[get_letter_code("a")] == 4
+        assert solver.next_letter(hangman_game_data) == "a"
+
+    def test_next_letter_best_split(self) -> None:
+        """Test the letter leaving the fewest candidates on average is preferred to the most common letter."""
+        solver = CandidateWordSolver(["cab", "cad", "cam", "dog"])
+        hangman_game_data = HangmanGameData(secret_word="cab")
+        assert int(np.argmax(solver.letter_counts(hangman_game_data))) == get_letter_code("a")
+        assert solver.next_letter(hangman_game_data) == "d"
+
+    def test_candidates_of_phrase(self) -> None:
+        """Test the revealed letters of a secret phrase are taken from the game, whatever the characters revealed."""
+        solver = CandidateWordSolver(["ab cd", "ab ce", "abcde", "xb cd"])
+        hangman_game_data = HangmanGameData(secret_word="ab cd", correct_letters=["a", " "])
+        assert hangman_game_data.revealed_letters == ["a", "_", " ", "_", "_"]
+        assert solver.candidates(hangman_game_data) == ["ab cd", "ab ce"]
+
+    def test_next_letter_no_candidate(self, solver: CandidateWordSolver) -> None:
+        """Test no letter is suggested when the secret word is not like any of the words.
+
+        Args:
+            solver: A solver of a few short words.
+        """
+        assert solver.next_letter(HangmanGameData(secret_word="zebras")) is None
+
+    def test_empty_word_list(self) -> None:
+        """Test a solver of no words has no candidates."""
+        solver = CandidateWordSolver([])
+        assert solver.next_letter(HangmanGameData(secret_word="ant")) is None
+
+
+@pytest.mark.parametrize("repeat", [1, 30])
+def test_sum_squared_family_sizes(repeat: int) -> None:
+    """Test the families of short words and of words too long for integer position masks.
+
+    Args:
+        repeat: Number of times the letters of the words are repeated.
+    """
+    codes = np.array([[0, 1, 0], [0, 2, 0], [1, 1, 1], [0, 0, 2]] * 2, dtype=np.uint8)
+    codes = np.tile(codes, repeat)
+    # 'a' and 'b' split the words into families of sizes 4, 2 and 2, 'd' leaves all of them in one family.
+    assert sum_squared_family_sizes(codes, np.array([0, 1, 3], dtype=np.uint8)).tolist() == [24, 24, 64]
+
+
+class TestCandidateSolverStrategy:
+    """Unit test the CandidateSolverStrategy class."""
+
+    def test_solver_strategy_wins_corpus_words(self) -> None:
+        """Test the solver strategy never loses a game of a word of the default corpus."""
+        summary = HeadlessGameEngine(CandidateSolverStrategy, seed=3).run(200)
+        assert summary.wins == 200
+
+    def test_solver_strategy_fallback(self) -> None:
+        """Test the most frequent English letter is guessed when the secret word is not in the corpus."""
+        hangman_game_data = HangmanGameData(secret_word="qqqqqqqqqqqqqqqqqqqq")
+        assert CandidateSolverStrategy(random.Random(0)).next_guess(hangman_game_data) == "e"
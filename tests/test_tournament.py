@@ -0,0 +1,111 @@
+"""Module for testing the tournament module."""
+
+import csv
+import json
+from unittest import mock
+
+import numpy as np
+import pytest
+from click.testing import CliRunner
+
+from hangman.cli import cli
+from hangman.constants import WORDS_LIST
+from hangman.parallel import derive_seed
+from hangman.simulation import STRATEGIES, HeadlessGameEngine, IndexedCandidateStrategy, LetterFrequencyStrategy
+from hangman.tournament import (
+    TournamentChunk,
+    iter_tournament_chunks,
+    play_tournament_chunk,
+    run_tournament,
+    wilson_interval,
+)
+
+
+class RepeatingStrategy(LetterFrequencyStrategy):  # pylint: disable=too-few-public-methods
+    """Guess the same letter again and again."""
+
+    def next_guess(self, hangman_game_data) -> str:
+        """Always guess 'e'."""
+        return "e"
+
+
+class TestTournament:
+    """Unit test the tournament runner."""
+
+    def test_iter_tournament_chunks(self) -> None:
+        """Test every strategy covers all the words, with the same seed for the same words."""
+        chunks = list(iter_tournament_chunks(["random", "frequency"], words=25, master_seed=3, chunk_size=10))
+        assert [(chunk.strategy, chunk.start, chunk.stop) for chunk in chunks] == [
+            ("random", 0, 10),
+            ("random", 10, 20),
+            ("random", 20, 25),
+            ("frequency", 0, 10),
+            ("frequency", 10, 20),
+            ("frequency", 20, 25),
+        ]
+        assert [chunk.seed for chunk in chunks] == [derive_seed(3, idx) for idx in range(3)] * 2
+
+    def test_wilson_interval(self) -> None:
+        """Test the interval contains the proportion and stays within [0, 1]."""
+        assert wilson_interval(0, 0) == (0.0, 1.0)
+        low, high = wilson_interval(5, 10)
+        assert low < 0.5 < high
+        assert low == pytest.approx(1 - high)
+        low, high = wilson_interval(64, 64)
+        assert 0.9 < low < high == 1.0
+
+    def test_results_independent_of_worker_count(self) -> None:
+        """Test the columns of the games are identical with one or several workers, whatever the chunk order."""
+        in_process = run_tournament(["random", "frequency"], master_seed=5, workers=1, chunk_size=10)
+        pooled = run_tournament(["random", "frequency"], master_seed=5, workers=2, chunk_size=10)
+        assert in_process.games == pooled.games == 2 * len(WORDS_LIST)
+        for strategy in ("random", "frequency"):
+            assert np.array_equal(in_process.won[strategy], pooled.won[strategy])
+            assert np.array_equal(in_process.missed_guesses[strategy], pooled.missed_guesses[strategy])
+            assert np.array_equal(in_process.correct_guesses[strategy], pooled.correct_guesses[strategy])
+
+    def test_same_games_as_headless_engine(self) -> None:
+        """Test the games played on the game data reset for each word are the same as on new game data."""
+        results = run_tournament(["index"], master_seed=5, workers=1, chunk_size=10)
+        engine = HeadlessGameEngine(IndexedCandidateStrategy)
+        missed_guesses = [len(engine.play_game(word).missed_letters) for word in WORDS_LIST]
+        assert results.missed_guesses["index"].tolist() == missed_guesses
+
+    def test_standings_and_csv(self, tmp_path) -> None:
+        """Test the strategies are ranked by win rate, and every game is written to the CSV file.
+
+        Args:
+            tmp_path: The pytest built-in temporary directory fixture.
+        """
+        results = run_tournament(["random", "index"], master_seed=5, workers=1)
+        standings = results.standings()
+        assert [standing.strategy for standing in standings] == ["index", "random"]
+        assert standings[0].wins == int(np.count_nonzero(results.won["index"]))
+        assert standings[0].win_rate_low <= standings[0].win_rate <= standings[0].win_rate_high
+
+        csv_path = str(tmp_path / "games.csv")
+        results.write_csv(csv_path)
+        with open(csv_path, encoding="utf-8", newline="") as csv_file:
+            rows = list(csv.DictReader(csv_file))
+        assert len(rows) == 2 * len(WORDS_LIST)
+        assert rows[0]["secret_word"] == WORDS_LIST[0]
+        assert sum(int(row["won"]) for row in rows if row["strategy"] == "index") == standings[0].wins
+
+    def test_invalid_strategies(self) -> None:
+        """Test unknown strategies are rejected, and a strategy repeating a guess fails its chunk."""
+        with pytest.raises(ValueError):
+            run_tournament(["unknown"], master_seed=0)
+        with mock.patch.dict(STRATEGIES, {"repeating": RepeatingStrategy}):
+            with pytest.raises(ValueError):
+                play_tournament_chunk(TournamentChunk(0, "repeating", 0, 1, seed=0))
+
+    def test_tournament_command(self) -> None:
+        """Test the tournament command prints the ranking as JSON."""
+        result = CliRunner().invoke(
+            cli,
+            ["tournament", "--strategy", "random", "--strategy", "solver", "--seed", "1", "--workers", "1", "--json"],
+        )
+        assert result.exit_code == 0
+        standings = json.loads(result.output)["standings"]
+        assert [standing["strategy"] for standing in standings] == ["solver", "random"]
+        assert all(standing["games"] == len(WORDS_LIST) for standing in standings)
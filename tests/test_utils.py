@@ -1,11 +1,12 @@
 """Module for testing the utils module."""
 
+import random
 from unittest import mock
 
-from hangman.utils import get_random_word
+from hangman.utils import get_random_word, letter_mask, letters_mask
 
 
-class TestUtils:  # pylint: disable=too-few-public-methods
+class TestUtils:
     """Unit test the utils module."""
 
     def test_get_random_word(self) -> None:
@@ -13,3 +14,19 @@ class TestUtils:  # pylint: disable=too-few-public-methods
         expected_word = "one"
         with mock.patch("hangman.utils.WORDS_LIST", [expected_word]):
             assert get_random_word() == expected_word
+
+    def test_get_random_word_with_rng(self) -> None:
+        """Test the get_random_word() method of utils module draws with the given random number generator."""
+        words = ["ant", "bat", "cat", "dog"]
+        with mock.patch("hangman.utils.WORDS_LIST", words):
+            first = [get_random_word(random.Random(3)) for _ in range(5)]
+            second = [get_random_word(random.Random(3)) for _ in range(5)]
+        assert first == second
+
+    def test_letter_mask(self) -> None:
+        """Test the letter_mask() and letters_mask() methods of utils module."""
+        assert letter_mask("a") == 1
+        assert letter_mask("z") == 1 << 25
+        assert letter_mask("é") > letters_mask("abcdefghijklmnopqrstuvwxyz")
+        assert letters_mask("abba") == 0b11
+        assert letters_mask("") == 0
@@ -1,11 +1,22 @@
 """Module for testing the views module."""
 
+import io
 from unittest import mock
+
+import click
 import pytest
 
 from hangman.models import HangmanGameData
 from hangman.constants import HANGMAN_PICS
-from hangman.views import HangmanGameView
+from hangman.views import (
+    ANSI_CLEAR_BELOW,
+    ANSI_CLEAR_LINE,
+    ANSI_CLEAR_SCREEN,
+    PROMPT_GUESS,
+    PROMPT_PLAY_AGAIN,
+    HangmanGameView,
+    ansi_move_cursor,
+)
 
 
 class TestHangmanGameView:
@@ -67,6 +78,19 @@ class TestHangmanGameView:
             mock_prompt.return_value = input_letter
             assert under_test.get_player_guess(HangmanGameData()) == input_letter
 
+    def test_prompts_written_to_output(self) -> None:
+        """Test the blank line and the prompts are written to the output of the board, after the error message too."""
+        output = io.StringIO()
+        under_test = HangmanGameView(output=output)
+        with mock.patch("click.prompt") as mock_prompt:
+            mock_prompt.side_effect = ["ab", "a", "", "n"]
+            assert under_test.get_player_guess(HangmanGameData()) == "a"
+            assert under_test.play_again() is False
+        assert output.getvalue().startswith(f"\n{PROMPT_GUESS}")
+        assert output.getvalue().endswith(
+            f"Please enter one letter.\n{PROMPT_GUESS}{PROMPT_PLAY_AGAIN}{PROMPT_PLAY_AGAIN}"
+        )
+
     def test_play_again_true(self, under_test: HangmanGameView) -> None:
         """Test normal case of the get_random_word() method of HangmanGameView class.
 
@@ -158,3 +182,36 @@ class TestHangmanGameView:
         hangman_game_data = HangmanGameData(secret_word="camel", correct_letters=["a", "e", "m"])
         expected_msg = "Correct letters: _ a m e _"
         assert under_test.get_secret_word_with_correct_letters_message(hangman_game_data) == expected_msg
+
+    def test_show_hangman_board_single_write(self) -> None:
+        """Test the board is written in one write, without clearing the screen when the output is not a terminal."""
+        output = io.StringIO()
+        under_test = HangmanGameView(output=output)
+        hangman_game_data = HangmanGameData(secret_word="camel", missed_letters=["z"], correct_letters=["a"])
+        with mock.patch.object(output, "write", wraps=output.write) as mock_write:
+            under_test.show_hangman_board(hangman_game_data, message="Oops")
+
+        assert mock_write.call_count == 1
+        frame = click.unstyle(output.getvalue())
+        assert frame.startswith(" H A N G M A N \n")
+        assert HANGMAN_PICS[1] in frame
+        assert frame.endswith("Missed letters : z\nCorrect letters: _ a _ _ _\nOops\n")
+        assert ANSI_CLEAR_SCREEN not in frame
+
+    def test_show_hangman_board_diff_mode(self) -> None:
+        """Test only the changed lines are redrawn in diff mode on a terminal."""
+        output = io.StringIO()
+        under_test = HangmanGameView(diff_mode=True, output=output)
+        hangman_game_data = HangmanGameData(secret_word="camel")
+        with mock.patch.object(output, "isatty", return_value=True):
+            under_test.show_hangman_board(hangman_game_data)
+            assert output.getvalue().startswith(ANSI_CLEAR_SCREEN)
+
+            output.truncate(0)
+            output.seek(0)
+            hangman_game_data.add_correct_letter("m")
+            under_test.show_hangman_board(hangman_game_data)
+
+        # Only the correct letters line (row 9, below the title, the picture and the missed letters) is redrawn.
+        expected_frame = f"{ansi_move_cursor(9)}{ANSI_CLEAR_LINE}Correct letters: _ _ m _ _"
+        assert output.getvalue() == f"{expected_frame}{ansi_move_cursor(10)}{ANSI_CLEAR_BELOW}"
@@ -0,0 +1,210 @@
+"""Module for testing the word_index module."""
+
+import random
+
+import pytest
+
+from hangman.models import HangmanGameData
+from hangman.simulation import CandidateSolverStrategy, HeadlessGameEngine, IndexedCandidateStrategy
+from hangman.solver import CandidateWordSolver
+from hangman.utils import letters_mask
+from hangman.word_index import (
+    GameCandidates,
+    LengthBucket,
+    PackedLengthBucket,
+    WordIndex,
+    count_rows,
+    iter_rows,
+    positions_mask,
+)
+
+WORDS = ["bat", "cat", "hat", "tab", "ant", "bee", "camel", "tact"]
+
+
+@pytest.fixture(name="word_index")
+def fixture_word_index() -> WordIndex:
+    """Get the index of a few short words.
+
+    Returns:
+        WordIndex: The index.
+    """
+    return WordIndex(WORDS)
+
+
+class TestBitSets:  # pylint: disable=too-few-public-methods
+    """Unit test the bit set helper functions."""
+
+    def test_bit_sets(self) -> None:
+        """Test the positions are set as bits and the rows are read back in ascending order."""
+        rows = positions_mask([0, 3, 64])
+        assert rows == 1 | 8 | 1 << 64
+        assert list(iter_rows(rows)) == [0, 3, 64]
+        assert count_rows(rows) == 3
+
+
+class TestLengthBucket:  # pylint: disable=too-few-public-methods
+    """Unit test the LengthBucket class."""
+
+    @pytest.mark.parametrize("length", [5, 70])
+    def test_same_bit_sets_as_row_by_row(self, length: int) -> None:
+        """Test the bit sets built at once are the same as the bit sets built by setting the rows one by one.
+
+        Args:
+            length: The length of the words, longer than the positions of a 64 bits integer for 70.
+        """
+        rng = random.Random(length)
+        words = ["".join(rng.choice("abcdé") for _ in range(length)) for _ in range(300)]
+        postings: dict = {}
+        letter_rows: dict = {}
+        letter_patterns: dict = {}
+        for row, word in enumerate(words):
+            for position, letter in enumerate(word):
+                postings[(position, letter)] = postings.get((position, letter), 0) | 1 << row
+            for letter in set(word):
+                letter_rows[letter] = letter_rows.get(letter, 0) | 1 << row
+                mask = positions_mask(position for position, other in enumerate(word) if other == letter)
+                patterns = letter_patterns.setdefault(letter, {})
+                patterns[mask] = patterns.get(mask, 0) | 1 << row
+
+        bucket = LengthBucket(words)
+        assert bucket.postings == postings
+        assert bucket.letter_rows == letter_rows
+        assert bucket.letter_patterns == letter_patterns
+        assert not LengthBucket([""]).postings
+
+
+class TestPackedLengthBucket:  # pylint: disable=too-few-public-methods
+    """Unit test the PackedLengthBucket class."""
+
+    @pytest.mark.parametrize("length", [0, 5, 70])
+    def test_same_rows_as_length_bucket(self, length: int) -> None:
+        """Test the packed bucket finds the same rows as the bucket it is packed from.
+
+        Args:
+            length: The length of the words, longer than the positions of a 64 bits integer for 70.
+        """
+        rng = random.Random(length)
+        words = ["".join(rng.choice("abcdé") for _ in range(length)) for _ in range(300 if length else 1)]
+        bucket = LengthBucket(words)
+        packed_bucket = PackedLengthBucket(bucket.to_arrays())
+        assert packed_bucket.words == words
+        assert packed_bucket.all_rows == bucket.all_rows
+        for letter in "abcdéz":
+            assert packed_bucket.rows_with_letter(letter) == bucket.rows_with_letter(letter)
+            assert packed_bucket.rows_with_letter_at(letter, []) == bucket.rows_with_letter_at(letter, [])
+            for mask, rows in bucket.letter_patterns.get(letter, {}).items():
+                assert packed_bucket.rows_with_letter_at(letter, iter_rows(mask)) == rows
+            assert packed_bucket.rows_with_letter_at(letter, [length + 1]) == 0
+        letters_at = {0: "a", length - 1: "é"} if length else {}
+        assert packed_bucket.query(letters_at, "bz") == bucket.query(letters_at, "bz")
+        assert packed_bucket.words_of(bucket.query(letters_at)) == bucket.words_of(bucket.query(letters_at))
+
+
+class TestWordIndex:
+    """Unit test the WordIndex class."""
+
+    def test_buckets(self, word_index: WordIndex) -> None:
+        """Test the words are bucketed by length in corpus order.
+
+        Args:
+            word_index: The index of a few short words.
+        """
+        assert sorted(word_index.buckets) == [3, 4, 5]
+        assert word_index.buckets[3].words == ["bat", "cat", "hat", "tab", "ant", "bee"]
+
+    @pytest.mark.parametrize(
+        "length, letters_at, excluded_letters, expected_words",
+        [
+            (3, {}, "", ["bat", "cat", "hat", "tab", "ant", "bee"]),
+            (3, {1: "a", 2: "t"}, "", ["bat", "cat", "hat"]),
+            (3, {1: "a", 2: "t"}, "bc", ["hat"]),
+            (3, {}, "a", ["bee"]),
+            (4, {0: "t", 3: "t"}, "", ["tact"]),
+            (6, {}, "", []),
+        ],
+    )
+    def test_query(
+        self, word_index: WordIndex, length: int, letters_at: dict, excluded_letters: str, expected_words: list
+    ) -> None:
+        """Test the words with letters at positions and without the excluded letters are found.
+
+        Args:
+            word_index: The index of a few short words.
+            length: The word length.
+            letters_at: The letter by position.
+            excluded_letters: The letters the words must not contain.
+            expected_words: The expected words.
+        """
+        assert word_index.query(length, letters_at, excluded_letters) == expected_words
+
+    def test_packed_index(self, word_index: WordIndex) -> None:
+        """Test the index read from its packed arrays finds the same words, without copying the arrays.
+
+        Args:
+            word_index: The index of a few short words.
+        """
+        arrays = word_index.to_arrays()
+        packed_index = WordIndex.from_arrays(arrays)
+        assert packed_index.buckets[3].bit_sets is arrays["3/bit_sets"]
+        assert packed_index.query(3, {2: "t"}, "c") == word_index.query(3, {2: "t"}, "c")
+        candidate_set = packed_index.candidate_set(3)
+        candidate_set.narrow("t", [2])
+        assert candidate_set.words == ["bat", "cat", "hat", "ant"]
+        assert candidate_set.best_letter(letters_mask("t")) == "a"
+
+    def test_candidate_set_narrow(self, word_index: WordIndex) -> None:
+        """Test each guess narrows the candidates to the words with the letter at exactly the revealed positions.
+
+        Args:
+            word_index: The index of a few short words.
+        """
+        candidate_set = word_index.candidate_set(3)
+        assert len(candidate_set) == 6
+        candidate_set.narrow("t", [2])
+        assert candidate_set.words == ["bat", "cat", "hat", "ant"]
+        candidate_set.narrow("c")
+        assert candidate_set.words == ["bat", "hat", "ant"]
+        assert candidate_set.best_letter(letters_mask("tc")) == "a"
+        candidate_set.narrow("a", [1])
+        assert candidate_set.words == ["bat", "hat"]
+        assert candidate_set.best_letter(letters_mask("tca")) == "b"
+
+    def test_candidate_set_letter_at_more_positions(self, word_index: WordIndex) -> None:
+        """Test a word with the letter at more positions than revealed is not a candidate.
+
+        Args:
+            word_index: The index of a few short words.
+        """
+        candidate_set = word_index.candidate_set(4)
+        candidate_set.narrow("t", [0])
+        assert not candidate_set.words
+
+    def test_game_candidates_matches_solver(self, word_index: WordIndex) -> None:
+        """Test the incrementally narrowed candidates are the same as the candidates of the NumPy solver.
+
+        Args:
+            word_index: The index of a few short words.
+        """
+        solver = CandidateWordSolver(WORDS)
+        hangman_game_data = HangmanGameData(secret_word="hat")
+        game_candidates = GameCandidates(word_index, hangman_game_data)
+        for letter in "etbha":
+            if hangman_game_data.is_letter_in_secret_word(letter):
+                hangman_game_data.add_correct_letter(letter)
+            else:
+                hangman_game_data.add_missed_letter(letter)
+            assert game_candidates.update().words == solver.candidates(hangman_game_data)
+
+
+class TestIndexedCandidateStrategy:  # pylint: disable=too-few-public-methods
+    """Unit test the IndexedCandidateStrategy class."""
+
+    def test_same_guesses_as_solver_strategy(self) -> None:
+        """Test the index strategy plays the same games as the NumPy solver strategy."""
+        index_summary = HeadlessGameEngine(IndexedCandidateStrategy, seed=5).run(100)
+        assert index_summary.wins == 100
+        solver_summary = HeadlessGameEngine(CandidateSolverStrategy, seed=5).run(100)
+        assert (index_summary.missed_guesses, index_summary.correct_guesses) == (
+            solver_summary.missed_guesses,
+            solver_summary.correct_guesses,
+        )
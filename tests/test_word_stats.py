@@ -0,0 +1,142 @@
+"""Module for testing the word_stats module."""
+
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from hangman.cli import cli
+from hangman.models import HangmanGameData
+from hangman.simulation import HeadlessGameEngine, LetterFrequencyStrategy
+from hangman.word_stats import GameRecord, WordStats, WordStatsAggregator, iter_game_records
+
+
+@pytest.fixture(name="aggregator")
+def fixture_aggregator() -> WordStatsAggregator:
+    """Get an aggregator with two won games and one lost game of 'bat', and one won game of 'ant'.
+
+    Returns:
+        WordStatsAggregator: The aggregator.
+    """
+    aggregator = WordStatsAggregator()
+    aggregator.consume(
+        [
+            HangmanGameData(secret_word="bat", correct_letters=list("bat")),
+            GameRecord("bat", "xy", "tab"),
+            GameRecord("bat", "cdefgh", "a"),
+            GameRecord("ant", "", "tna"),
+        ]
+    )
+    return aggregator
+
+
+class TestWordStats:
+    """Unit test the WordStats class."""
+
+    def test_statistics(self, aggregator: WordStatsAggregator) -> None:
+        """Test the derived statistics of a secret word.
+
+        Args:
+            aggregator: An aggregator with three games of 'bat' and one game of 'ant'.
+        """
+        assert aggregator.words["bat"].to_dict() == {
+            "games": 3,
+            "wins": 2,
+            "win_rate": pytest.approx(2 / 3),
+            "mean_missed_guesses": pytest.approx(8 / 3),
+            "mean_guesses": pytest.approx(15 / 3),
+            "guesses_p50": 5,
+            "guesses_p90": 7,
+            "guesses_p99": 7,
+        }
+
+    def test_empty(self) -> None:
+        """Test the statistics of no game are all zero."""
+        assert WordStats().to_dict() == dict.fromkeys(WordStats().to_dict(), 0)
+
+
+class TestWordStatsAggregator:
+    """Unit test the WordStatsAggregator class."""
+
+    def test_merge(self, aggregator: WordStatsAggregator) -> None:
+        """Test merging shards gives the same statistics as aggregating all games in one.
+
+        Args:
+            aggregator: An aggregator with three games of 'bat' and one game of 'ant'.
+        """
+        shard = WordStatsAggregator()
+        shard.add("cat", "z", "cat")
+        shard.add("bat", "", "bat")
+        shard.merge(aggregator)
+
+        assert len(shard) == 3
+        assert shard.words["bat"].games == 4
+        assert shard.words["bat"].wins == 3
+        assert shard.total().games == 6
+        # The shard which was merged is left unchanged.
+        assert aggregator.words["bat"].games == 3
+
+    def test_save_and_load(self, tmp_path, aggregator: WordStatsAggregator) -> None:
+        """Test the statistics are restored from a checkpoint file.
+
+        Args:
+            tmp_path: The pytest built-in temporary directory fixture.
+            aggregator: An aggregator with three games of 'bat' and one game of 'ant'.
+        """
+        path = str(tmp_path / "word_stats.json")
+        aggregator.save(path)
+        loaded = WordStatsAggregator.load(path)
+        assert loaded.words == aggregator.words
+        assert loaded.records_consumed == 4
+
+    def test_load_unsupported_version(self, tmp_path) -> None:
+        """Test a checkpoint of an unknown version is rejected.
+
+        Args:
+            tmp_path: The pytest built-in temporary directory fixture.
+        """
+        path = tmp_path / "word_stats.json"
+        path.write_text('{"version": 99, "words": {}}', encoding="utf-8")
+        with pytest.raises(ValueError, match="Unsupported word statistics checkpoint version 99"):
+            WordStatsAggregator.load(str(path))
+
+    def test_consume_simulated_games(self) -> None:
+        """Test the outcomes of simulated games are consumed as they are played."""
+        engine = HeadlessGameEngine(LetterFrequencyStrategy, seed=1, words=["ant", "bat"])
+        aggregator = WordStatsAggregator()
+        assert aggregator.consume(engine.iter_games(50)) == 50
+        assert set(aggregator.words) == {"ant", "bat"}
+        assert aggregator.total().games == 50
+
+    def test_iter_game_records(self) -> None:
+        """Test unfinished games are skipped when reading JSON lines."""
+        lines = [
+            '{"secret_word": "bat", "won": true, "missed_letters": "", "correct_letters": "bat"}',
+            "",
+            '{"secret_word": "bat", "won": null, "missed_letters": "x", "correct_letters": ""}',
+        ]
+        assert list(iter_game_records(lines)) == [GameRecord("bat", "", "bat")]
+
+    def test_word_stats_command(self, tmp_path) -> None:
+        """Test the word-stats command resumes after the records of its checkpoint file, and keeps merged shards out.
+
+        Args:
+            tmp_path: The pytest built-in temporary directory fixture.
+        """
+        checkpoint_path = str(tmp_path / "word_stats.json")
+        shard_path = str(tmp_path / "shard.json")
+        shard = WordStatsAggregator()
+        shard.add("ant", "", "ant")
+        shard.save(shard_path)
+        record = '{"secret_word": "bat", "won": true, "missed_letters": "x", "correct_letters": "bat"}\n'
+        args = ["word-stats", "--checkpoint", checkpoint_path, "--checkpoint-every", "1", "--merge", shard_path]
+        assert CliRunner().invoke(cli, args, input=record).exit_code == 0
+
+        # The same input is given again with one more record, only the new record is counted.
+        result = CliRunner().invoke(cli, args + ["--total"], input=record * 2)
+        assert result.exit_code == 0
+        assert json.loads(result.output)["games"] == 3
+        checkpoint = WordStatsAggregator.load(checkpoint_path)
+        assert checkpoint.records_consumed == 2
+        assert set(checkpoint.words) == {"bat"}
+        assert checkpoint.words["bat"].games == 2